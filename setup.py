@@ -19,5 +19,10 @@ setuptools.setup(
     package_dir={"": "src"},
     packages=setuptools.find_packages(where="src"),
     python_requires=">=3.6",
-    install_requires=requirements
+    install_requires=requirements,
+    extras_require={
+        "async": ["aiohttp"],
+        "fast-json": ["orjson"],
+        "cache-codecs": ["msgpack", "zstandard"]
+    }
 )
@@ -0,0 +1,459 @@
+from __future__ import absolute_import, annotations
+
+import asyncio
+import json
+import logging
+import time
+import weakref
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple, Union, Mapping
+
+from wenet.interface.client import Oauth2Client, RestClient, RetryPolicy
+from wenet.interface.exceptions import RefreshTokenExpiredError
+from wenet.interface.rate_limiter import RateLimiter
+from wenet.storage.cache import BaseCache, BoundedInMemoryCache
+from wenet.utils import json_codec
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+logger = logging.getLogger("wenet.interface.aio.client")
+
+TRANSPORT_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError) if aiohttp is not None else (asyncio.TimeoutError,)
+
+
+class AsyncResponse:
+
+    def __init__(self, status_code: int, content: bytes, headers: Optional[Mapping] = None, encoding: str = "utf-8") -> None:
+        """
+        The response of an asynchronous request, its body is entirely read before the response is returned
+
+        Args:
+            status_code: the status code of the response
+            content: the body of the response
+            headers: the headers of the response
+            encoding: the encoding of the body
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers if headers is not None else {}
+        self.encoding = encoding
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self, **kwargs):
+        if kwargs:
+            return json.loads(self.content, **kwargs)
+        return json_codec.loads(self.content)
+
+
+class AsyncRestClient(ABC):
+
+    _retry_policy_overrides: ContextVar[Dict[int, Optional[RetryPolicy]]] = ContextVar("wenet_retry_policy_overrides", default={})
+
+    def __init__(self,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 pool_maxsize: int = 100,
+                 pool_maxsize_per_host: int = 0,
+                 keep_alive: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 request_compression: Optional[str] = None,
+                 request_compression_threshold: int = 64 * 1024
+                 ) -> None:
+        """
+        Create a new asynchronous rest client backed by a pool of persistent connections.
+        Unless a session is specified, the session is created on the first request so that it is bound to the running event loop.
+
+        Args:
+            session: an existing aiohttp session to share among several clients, if not specified a dedicated one is going to be created (and closed together with the client)
+            pool_maxsize: the maximum number of simultaneous connections, 0 for no limit
+            pool_maxsize_per_host: the maximum number of simultaneous connections towards the same host, 0 for no limit
+            keep_alive: whether the connections should be kept open between the requests
+            retry_policy: the policy for retrying the requests failed because of transient errors, by default the requests are not retried
+            rate_limiter: the rate limiter for the requests, including the retried ones, by default the requests are not limited
+            request_compression: the content coding (gzip or deflate) for compressing the large request bodies, by default the bodies are not compressed since the server has to support it
+            request_compression_threshold: the size in bytes above which the request bodies are compressed
+        """
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._request_compression = request_compression
+        self._request_compression_threshold = request_compression_threshold
+        self._session = session
+        self._owns_session = session is None
+        self._pool_maxsize = pool_maxsize
+        self._pool_maxsize_per_host = pool_maxsize_per_host
+        self._keep_alive = keep_alive
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            if aiohttp is None:
+                raise ImportError("The asynchronous clients require aiohttp, install it with `pip install wenet-common[async]`")
+            connector = aiohttp.TCPConnector(limit=self._pool_maxsize, limit_per_host=self._pool_maxsize_per_host, force_close=not self._keep_alive)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Release the connections of the client, a shared session is left open for the other clients using it
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> AsyncRestClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @contextmanager
+    def override_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> Iterator[None]:
+        """
+        Replace the retry policy of the client for the requests performed by the current task within the context,
+        so that a component interface retrying its requests with its own policy does not retry each of its attempts again
+
+        Args:
+            retry_policy: the retry policy of the requests, None for not retrying them
+        """
+        overrides = dict(self._retry_policy_overrides.get())
+        overrides[id(self)] = retry_policy
+        token = self._retry_policy_overrides.set(overrides)
+        try:
+            yield
+        finally:
+            self._retry_policy_overrides.reset(token)
+
+    @staticmethod
+    def _prepare_query_params(query_params: Optional[dict]) -> Optional[dict]:
+        """
+        Drop the empty parameters and convert the others to strings, as done by the synchronous clients
+        """
+        if query_params is None:
+            return None
+        return {key: str(value) for key, value in query_params.items() if value is not None}
+
+    async def _send(self, method: str, url: str, body: Optional[Union[dict, list]] = None, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        data, headers = RestClient._prepare_request(body, headers, compression=self._request_compression, compression_threshold=self._request_compression_threshold)
+
+        async def request() -> AsyncResponse:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.check_async(method, url)
+            async with self.session.request(method, url, data=data, params=self._prepare_query_params(query_params), headers=headers) as response:
+                content = await response.read()
+                return AsyncResponse(response.status, content, headers=response.headers, encoding=response.get_encoding() if content else "utf-8")
+
+        retry_policy = self._retry_policy_overrides.get().get(id(self), self._retry_policy)
+        if retry_policy is not None:
+            return await retry_policy.call_async(method, request, retry_exceptions=TRANSPORT_ERRORS)
+        return await request()
+
+    @abstractmethod
+    def get_authentication(self, *args) -> dict:
+        pass
+
+    @abstractmethod
+    async def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        pass
+
+    @abstractmethod
+    async def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        pass
+
+    @abstractmethod
+    async def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        pass
+
+    @abstractmethod
+    async def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        pass
+
+    @abstractmethod
+    async def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        pass
+
+
+class AsyncNoAuthenticationClient(AsyncRestClient):
+
+    def get_authentication(self) -> dict:
+        pass
+
+    async def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("POST", url, body=body, headers=headers)
+
+    async def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("GET", url, query_params=query_params, headers=headers)
+
+    async def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("PUT", url, body=body, headers=headers)
+
+    async def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("PATCH", url, body=body, headers=headers)
+
+    async def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("DELETE", url, query_params=query_params, headers=headers)
+
+
+class AsyncApikeyClient(AsyncRestClient):
+
+    def __init__(self, apikey: str, component_authorization_apikey_header: str = "x-wenet-component-apikey", **kwargs) -> None:
+        """
+        Create a new asynchronous apikey client
+
+        Args:
+            apikey: the apikey to authenticate the requests
+            component_authorization_apikey_header: the component authorization header for the apikey
+            **kwargs: the connection pool and retry settings accepted by AsyncRestClient
+        """
+        super().__init__(**kwargs)
+        self._apikey = apikey
+        self._component_authorization_apikey_header = component_authorization_apikey_header
+
+    def get_authentication(self) -> dict:
+        return {
+            self._component_authorization_apikey_header: self._apikey
+        }
+
+    def _authenticated_headers(self, headers: Optional[dict]) -> dict:
+        if headers is None:
+            headers = {}
+
+        headers.update(self.get_authentication())
+        return headers
+
+    async def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("POST", url, body=body, headers=self._authenticated_headers(headers))
+
+    async def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("GET", url, query_params=query_params, headers=self._authenticated_headers(headers))
+
+    async def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("PUT", url, body=body, headers=self._authenticated_headers(headers))
+
+    async def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("PATCH", url, body=body, headers=self._authenticated_headers(headers))
+
+    async def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._send("DELETE", url, query_params=query_params, headers=self._authenticated_headers(headers))
+
+
+class AsyncOauth2Client(AsyncRestClient):
+
+    _refresh_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __init__(self, client_id: str, client_secret: str, resource_id: str, cache: Optional[BaseCache] = None,
+                 token_endpoint_url: str = "https://internetofus.u-hopper.com/prod/api/oauth2/token",
+                 refresh_margin: float = 60, refresh_lock_timeout: float = 30, credentials_memo_ttl: float = 30, **kwargs):
+        """
+        Create a new asynchronous oauth2 client, the credentials are stored in the same format used by the Oauth2Client.
+        Concurrent refreshes of the same resource are coalesced into a single call to the token endpoint, both among the tasks of the event loop, even if they use different clients,
+        and, when the cache supports locking (e.g. the RedisCache), among all the processes sharing the cache.
+        The credentials are memoized in the client for a short time, so that the cache is not read on every request:
+        the memo is replaced after each refresh and discarded as soon as the platform rejects the token.
+        The cache is accessed from the default executor of the event loop, since its operations (e.g. on Redis) are blocking.
+
+        Args:
+            client_id: the identifier of the client
+            client_secret: the client secret
+            resource_id: the identifier of the resource
+            cache: a cache to be used for storing client credentials, if not specified a dedicated BoundedInMemoryCache is going to be used
+            token_endpoint_url: the oauth2 token endpoint URL of the platform
+            refresh_margin: how many seconds before its expiration the access token is proactively refreshed
+            refresh_lock_timeout: the maximum number of seconds the lock shared by the processes refreshing the token is held
+            credentials_memo_ttl: for how many seconds the credentials read from the cache are reused, 0 to always read them from the cache
+            **kwargs: the connection pool and retry settings accepted by AsyncRestClient
+        """
+        super().__init__(**kwargs)
+        self.token_endpoint_url = token_endpoint_url
+        self._cache = cache if cache and isinstance(cache, BaseCache) else BoundedInMemoryCache()
+        self._resource_id = resource_id
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._refresh_margin = refresh_margin
+        self._refresh_lock_timeout = refresh_lock_timeout
+        self._credentials_memo_ttl = credentials_memo_ttl
+        self._credentials_memo: Optional[Tuple[Oauth2Client.ClientCredentials, float]] = None
+
+    @classmethod
+    def _refresh_lock_for(cls, resource_id: str) -> asyncio.Lock:
+        """
+        Get the lock of the refreshes of a resource among the tasks of the running event loop, kept as long as some task is using it
+        """
+        key = (id(asyncio.get_running_loop()), resource_id)
+        lock = cls._refresh_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            cls._refresh_locks[key] = lock
+        return lock
+
+    @property
+    def _client_credential(self) -> Oauth2Client.ClientCredentials:
+        memo = self._credentials_memo
+        if memo is not None and time.monotonic() < memo[1]:
+            return memo[0]
+        return self._load_client_credential()
+
+    async def _get_client_credential(self) -> Oauth2Client.ClientCredentials:
+        memo = self._credentials_memo
+        if memo is not None and time.monotonic() < memo[1]:
+            return memo[0]
+        return await asyncio.get_running_loop().run_in_executor(None, self._load_client_credential)
+
+    async def _store_client_credential(self, credentials: Oauth2Client.ClientCredentials) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, lambda: self._cache.cache(data=credentials.to_repr(), key=self._resource_id))
+        self._memoize_client_credential(credentials)
+
+    def _load_client_credential(self) -> Oauth2Client.ClientCredentials:
+        raw_credentials = self._cache.get(self._resource_id)
+        if raw_credentials is not None:
+            credentials = Oauth2Client.ClientCredentials.from_repr(raw_credentials)
+            self._memoize_client_credential(credentials)
+            return credentials
+        raise Exception(f"Credentials for resource [{self._resource_id}] do not exist")
+
+    def _memoize_client_credential(self, credentials: Oauth2Client.ClientCredentials) -> None:
+        """
+        Memoize the credentials, never beyond the moment they should be proactively refreshed
+        """
+        memo_ttl = self._credentials_memo_ttl
+        if credentials.expires_at is not None:
+            memo_ttl = min(memo_ttl, credentials.expires_at - self._refresh_margin - time.time())
+        self._credentials_memo = (credentials, time.monotonic() + memo_ttl) if memo_ttl > 0 else None
+
+    @property
+    def token(self) -> str:
+        return self._client_credential.access_token
+
+    @property
+    def refresh_token(self) -> str:
+        return self._client_credential.refresh_token
+
+    @staticmethod
+    async def initialize_with_code(client_id: str, client_secret: str, code: str, redirect_url: str, resource_id: str, cache: BaseCache,
+                                   token_endpoint_url: str = "https://internetofus.u-hopper.com/prod/api/oauth2/token", **kwargs) -> AsyncOauth2Client:
+        """
+        Initialize a new asynchronous oauth2 client with code
+
+        Args:
+            client_id: the identifier of the client
+            client_secret: the client secret
+            code: the oauth2 code of the client
+            redirect_url: the redirect URL
+            resource_id: the identifier of the resource
+            cache: a cache
+            token_endpoint_url: the oauth2 token endpoint URL of the platform
+            **kwargs: the connection pool and retry settings accepted by AsyncRestClient
+
+        Returns:
+            an asynchronous oauth2 client
+        """
+        client = AsyncOauth2Client(client_id, client_secret, resource_id, cache, token_endpoint_url=token_endpoint_url, **kwargs)
+        await client._initialize(code, redirect_url)
+        return client
+
+    async def refresh_access_token(self, stale_token: Optional[str] = None) -> None:
+        """
+        Refresh the access token.
+        Only one refresh at a time is performed for the resource, a refresh waiting for another one to complete is skipped
+        if the stale token has been replaced in the meanwhile.
+
+        Args:
+            stale_token: the access token that needs to be replaced, if not specified the token is always refreshed
+        """
+        async with self._refresh_lock_for(self._resource_id):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._refresh_access_token, stale_token, loop)
+
+    def _refresh_access_token(self, stale_token: Optional[str], loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Refresh the access token holding the lock of the cache, run in a thread of the executor.
+        The lock is entered, used and released by the same thread, since the caches may bind the reads made under the lock to the thread holding it (e.g. the NearCache bypasses its local copies only there),
+        while the request to the token endpoint is sent from the event loop.
+        """
+        with self._cache.lock(self._resource_id, timeout=self._refresh_lock_timeout):
+            credentials = self._load_client_credential()
+            if stale_token is not None and credentials.access_token != stale_token:
+                logger.debug(f"Oauth2 token for resource [{self._resource_id}] already refreshed")
+                return
+
+            logger.info(f"Refresh token for client [{self._client_id}]")
+            body = {
+                "client_id": self._client_id,
+                "client_secret": self._client_secret,
+                "grant_type": "refresh_token",
+                "refresh_token": credentials.refresh_token
+            }
+
+            response = asyncio.run_coroutine_threadsafe(self._send("POST", self.token_endpoint_url, body=body), loop).result()
+            logger.debug(f"Refresh token endpoint returned a code [{response.status_code}]")
+            if response.status_code == 200:
+                credentials = Oauth2Client.ClientCredentials.from_token_response(response.json())
+                self._cache.cache(data=credentials.to_repr(), key=self._resource_id)
+                self._memoize_client_credential(credentials)
+                logger.info(f"Refreshed oauth2 token for resource [{self._resource_id}]")
+            else:
+                logger.error(f"Unable to refresh the token for client ID [{self._client_id}]")
+                raise RefreshTokenExpiredError("Unable to refresh the token")
+
+    async def _initialize(self, code: str, redirect_url: str):
+        body = {
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "grant_type": "authorization_code",
+            "redirect_uri": redirect_url,
+            "code": code
+        }
+
+        response = await self._send("POST", self.token_endpoint_url, body=body)
+        if response.status_code == 200:
+            client_credentials = Oauth2Client.ClientCredentials.from_token_response(response.json())
+            await self._store_client_credential(client_credentials)
+        else:
+            raise Exception(f"Unable to retrieve the token, server respond with: [{response.status_code}], [{response.text}]")
+
+    @staticmethod
+    def get_authentication(token: str) -> dict:
+        return {
+            "authorization": f"bearer {token}"
+        }
+
+    async def _authenticated_request(self, method: str, url: str, body: Optional[Union[dict, list]] = None, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        if headers is None:
+            headers = {}
+
+        credentials = await self._get_client_credential()
+        if credentials.is_expiring(self._refresh_margin):
+            await self.refresh_access_token(stale_token=credentials.access_token)
+            credentials = await self._get_client_credential()
+
+        headers.update(self.get_authentication(credentials.access_token))
+        response = await self._send(method, url, body=body, query_params=query_params, headers=headers)
+        if response.status_code in [400, 401, 403]:
+            self._credentials_memo = None
+            await self.refresh_access_token(stale_token=credentials.access_token)
+            headers.update(self.get_authentication((await self._get_client_credential()).access_token))
+            response = await self._send(method, url, body=body, query_params=query_params, headers=headers)
+        return response
+
+    async def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._authenticated_request("POST", url, body=body, headers=headers)
+
+    async def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._authenticated_request("GET", url, query_params=query_params, headers=headers)
+
+    async def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._authenticated_request("PUT", url, body=body, headers=headers)
+
+    async def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._authenticated_request("PATCH", url, body=body, headers=headers)
+
+    async def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._authenticated_request("DELETE", url, query_params=query_params, headers=headers)
@@ -0,0 +1,132 @@
+from __future__ import absolute_import, annotations
+
+import logging
+from typing import Any, Awaitable, Callable, ContextManager, Optional, Union
+
+from wenet.interface.aio.client import AsyncResponse, AsyncRestClient, TRANSPORT_ERRORS
+from wenet.interface.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from wenet.interface.client import RetryPolicy
+from wenet.interface.component import BaseComponentInterface, ComponentRequest
+from wenet.interface.rate_limiter import RateLimiter
+
+logger = logging.getLogger("wenet.interface.aio.component")
+
+
+class AsyncComponentClient(AsyncRestClient):
+
+    def __init__(self,
+                 client: AsyncRestClient,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[RateLimiter] = None
+                 ) -> None:
+        """
+        An asynchronous client applying the policies of a component interface to the requests performed through another client
+
+        Args:
+            client: the client actually performing the requests
+            retry_policy: the policy for retrying the requests of the component failed because of transient errors, replacing the one of the client
+            circuit_breaker: the circuit breaker failing fast the requests while the component is degraded
+            rate_limiter: the rate limiter for the requests of the component
+        """
+        self.client = client
+        self._retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+
+    def __getattr__(self, name: str):
+        if name in ["client", "circuit_breaker", "rate_limiter"]:
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @property
+    def session(self):
+        return self.client.session
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    def override_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> ContextManager:
+        return self.client.override_retry_policy(retry_policy)
+
+    async def _perform(self, method: str, url: str, request: Callable[[], Awaitable[AsyncResponse]]) -> AsyncResponse:
+        async def limited_request() -> AsyncResponse:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.check_async(method, url)
+            return await request()
+
+        async def attempt() -> AsyncResponse:
+            if self._retry_policy is not None:
+                with self.client.override_retry_policy(None):
+                    return await self._retry_policy.call_async(method, limited_request, retry_exceptions=TRANSPORT_ERRORS)
+            return await limited_request()
+
+        if self.circuit_breaker is not None:
+            return await self.circuit_breaker.call_async(attempt, transport_errors=TRANSPORT_ERRORS)
+        return await attempt()
+
+    def get_authentication(self, *args) -> dict:
+        return self.client.get_authentication(*args)
+
+    async def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._perform("POST", url, lambda: self.client.post(url, body, headers=headers))
+
+    async def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._perform("GET", url, lambda: self.client.get(url, query_params=query_params, headers=headers))
+
+    async def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._perform("PUT", url, lambda: self.client.put(url, body, headers=headers))
+
+    async def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._perform("PATCH", url, lambda: self.client.patch(url, body, headers=headers))
+
+    async def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> AsyncResponse:
+        return await self._perform("DELETE", url, lambda: self.client.delete(url, query_params=query_params, headers=headers))
+
+
+class AsyncComponentInterface(BaseComponentInterface):
+
+    def __init__(self,
+                 client: AsyncRestClient,
+                 base_url: str,
+                 extra_headers: Optional[dict] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 rate_limiter: Optional[RateLimiter] = None
+                 ) -> None:
+        """
+        Create a new asynchronous interface for a component of the platform
+
+        Args:
+            client: the client performing the requests
+            base_url: the URL of the component
+            extra_headers: extra headers to add to all the requests
+            retry_policy: a policy for retrying the requests to this component, replacing the one of the client for its requests
+            circuit_breakers: the registry providing the circuit breaker of the component, by its base url
+            rate_limiter: a rate limiter for the requests to this component, in addition to the one of the client
+        """
+        super().__init__(base_url, extra_headers)
+        circuit_breaker = circuit_breakers.get(base_url) if circuit_breakers is not None else None
+        if retry_policy is not None or circuit_breaker is not None or rate_limiter is not None:
+            client = AsyncComponentClient(client, retry_policy=retry_policy, circuit_breaker=circuit_breaker, rate_limiter=rate_limiter)
+
+        self._client = client
+
+    async def _call(self, request: ComponentRequest) -> Any:
+        """
+        Perform a request and get its result
+        """
+        return self._get_result(request, await request.send(self._client))
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        The circuit breaker of the component, if any
+        """
+        return self._client.circuit_breaker if isinstance(self._client, AsyncComponentClient) else None
+
+    async def close(self) -> None:
+        """
+        Release the connections of the client used by the interface
+        """
+        await self._client.close()
@@ -0,0 +1,32 @@
+from __future__ import absolute_import, annotations
+
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from wenet.interface.aio.component import AsyncComponentInterface
+from wenet.interface.aio.client import AsyncRestClient
+from wenet.interface.hub import BaseHubInterface
+from wenet.model.app import App
+
+
+logger = logging.getLogger("wenet.interface.aio.hub")
+
+
+class AsyncHubInterface(BaseHubInterface, AsyncComponentInterface):
+
+    def __init__(self, client: AsyncRestClient, platform_url: str, component_path: str = "/hub/frontend", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    async def get_user_ids_for_app(self, app_id: str, from_datetime: Optional[datetime] = None, to_datetime: Optional[datetime] = None, headers: Optional[dict] = None) -> List[str]:
+        return await self._call(self._get_user_ids_for_app_request(app_id, from_datetime, to_datetime, headers))
+
+    async def get_app_details(self, app_id: str, headers: Optional[dict] = None) -> App:
+        return await self._call(self._get_app_details_request(app_id, headers))
+
+    async def get_app_developers(self, app_id: str, headers: Optional[dict] = None) -> List[str]:
+        return await self._call(self._get_app_developers_request(app_id, headers))
+
+    async def get_user_ids(self, headers: Optional[dict] = None) -> List[str]:
+        return await self._call(self._get_user_ids_request(headers))
@@ -0,0 +1,21 @@
+from __future__ import absolute_import, annotations
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+from wenet.interface.aio.client import AsyncRestClient
+from wenet.interface.aio.component import AsyncComponentInterface
+from wenet.interface.ilog import BaseIlogInterface
+
+logger = logging.getLogger("wenet.interface.aio.ilog")
+
+
+class AsyncIlogInterface(BaseIlogInterface, AsyncComponentInterface):
+
+    def __init__(self, client: AsyncRestClient, platform_url: str, component_path: str = "/streambase", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    async def delete_user_data(self, user_id: str, from_date: datetime, to_date: datetime, headers: Optional[dict] = None) -> None:
+        await self._call(self._delete_user_data_request(user_id, from_date, to_date, headers))
@@ -0,0 +1,23 @@
+from __future__ import absolute_import, annotations
+
+import logging
+from typing import Optional, List
+
+from wenet.interface.aio.component import AsyncComponentInterface
+from wenet.interface.aio.client import AsyncRestClient
+from wenet.interface.incentive_server import BaseIncentiveServerInterface
+
+logger = logging.getLogger("wenet.interface.aio.incentive_server")
+
+
+class AsyncIncentiveServerInterface(BaseIncentiveServerInterface, AsyncComponentInterface):
+
+    def __init__(self, client: AsyncRestClient, platform_url: str, component_path: str = "/incentive_server", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    async def get_cohorts(self, headers: Optional[dict] = None) -> List[dict]:
+        return await self._call(self._get_cohorts_request(headers))
+
+    async def delete_user_badges(self, user_id: str, headers: Optional[dict] = None) -> None:
+        await self._call(self._delete_user_badges_request(user_id, headers))
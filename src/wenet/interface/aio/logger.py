@@ -0,0 +1,29 @@
+from __future__ import absolute_import, annotations
+
+import logging
+from typing import List, Optional
+
+from wenet.interface.aio.component import AsyncComponentInterface
+from wenet.interface.aio.client import AsyncRestClient
+from wenet.interface.logger import BaseLoggerInterface
+from wenet.model.logging_message.message import BaseMessage
+
+
+logger = logging.getLogger("wenet.interface.aio.logger")
+
+
+class AsyncLoggerInterface(BaseLoggerInterface, AsyncComponentInterface):
+
+    def __init__(self, client: AsyncRestClient, platform_url: str, component_path: str = "/logger", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    async def post_messages(self, messages: List[BaseMessage], headers: Optional[dict] = None) -> List[str]:
+        return await self._call(self._post_messages_request(messages, headers))
+
+    async def delete_user_messages(self, user_id: Optional[str] = None,
+                                   message_id: Optional[str] = None,
+                                   project: Optional[str] = None,
+                                   trace_id: Optional[str] = None,
+                                   headers: Optional[dict] = None):
+        return await self._call(self._delete_user_messages_request(user_id, message_id, project, trace_id, headers))
@@ -0,0 +1,41 @@
+from __future__ import absolute_import, annotations
+
+import logging
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+from wenet.interface.pagination import get_next_offset
+
+logger = logging.getLogger("wenet.interface.aio.pagination")
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+async def fetch_all(fetch_page: Callable[[int, Optional[int]], Awaitable[P]],
+                    get_items: Callable[[P], List[T]],
+                    offset: int = 0,
+                    limit: Optional[int] = 100
+                    ) -> List[T]:
+    """
+    Fetch all the items of a paginated listing, one page after the other.
+    The listing ends as the synchronous ones do: with the first page that is not full, or, if the limit is not specified, when the total number of items has been reached.
+
+    Args:
+        fetch_page: the coroutine function fetching the page with the given offset and limit
+        get_items: the function getting the items of a page
+        offset: the index of the first item to fetch
+        limit: the number of items of each page, if not specified the page size of the server is used and the page must have the `total` number of items
+
+    Returns:
+        the items, in the order returned by the server
+    """
+    items = []
+    while offset is not None:
+        page = await fetch_page(offset, limit)
+        page_items = get_items(page)
+        if not page_items:
+            break
+
+        items.extend(page_items)
+        offset = get_next_offset(page, page_items, offset, limit)
+    return items
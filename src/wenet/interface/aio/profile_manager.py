@@ -0,0 +1,182 @@
+from __future__ import absolute_import, annotations
+
+import functools
+import logging
+from typing import List, Optional
+
+from wenet.interface.aio import pagination
+from wenet.interface.aio.component import AsyncComponentInterface
+from wenet.interface.aio.client import AsyncRestClient
+from wenet.interface.profile_manager import BaseProfileManagerInterface
+from wenet.model.user.profile import WeNetUserProfile, WeNetUserProfilesPage, UserIdentifiersPage, PatchWeNetUserProfile
+from wenet.model.user.relationship import RelationshipPage, Relationship
+
+logger = logging.getLogger("wenet.interface.aio.profile_manager")
+
+
+class AsyncProfileManagerInterface(BaseProfileManagerInterface, AsyncComponentInterface):
+
+    def __init__(self, client: AsyncRestClient, platform_url: str, component_path: str = "/profile_manager",
+                 extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    async def get_user_profile(self, user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
+        return await self._call(self._get_user_profile_request(user_id, headers))
+
+    async def update_user_profile(self, profile: WeNetUserProfile, headers: Optional[dict] = None) -> WeNetUserProfile:
+        return await self._call(self._update_user_profile_request(profile, headers))
+
+    async def patch_user_profile(self, profile_patch: PatchWeNetUserProfile,
+                                 headers: Optional[dict] = None) -> WeNetUserProfile:
+        """
+        Only the fields with value different from None in the profile_patch will be patched
+        """
+        return await self._call(self._patch_user_profile_request(profile_patch, headers))
+
+    async def create_empty_user_profile(self, user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
+        await self._call(self._create_empty_user_profile_request(user_id, headers))
+        return WeNetUserProfile.empty(user_id)
+
+    async def delete_user_profile(self, user_id: str, headers: Optional[dict] = None) -> None:
+        await self._call(self._delete_user_profile_request(user_id, headers))
+
+    async def get_profiles(self, headers: Optional[dict] = None, limit: Optional[int] = None) -> List[WeNetUserProfile]:
+        """
+        Get all the user profiles
+        :param headers: Additional headers to add in the http request
+        :param limit: The number of profiles of each page, if not specified the default of the component is used
+        :return: The list of profiles
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_profile_page, headers=headers)
+        return await pagination.fetch_all(fetch_page, lambda profiles_page: profiles_page.profiles, limit=limit)
+
+    async def get_profile_page(self, offset: int = 0, limit: Optional[int] = None, headers: Optional[dict] = None) -> WeNetUserProfilesPage:
+        """
+        Get a page of user profiles
+        :param offset: The index of the first profile to return
+        :param limit: The number maximum of profiles to return, if not specified the default of the component is used
+        :param headers: Additional headers to add in the http request
+        :return: An object representing a profiles page
+        """
+        return await self._call(self._get_profile_page_request(offset, limit, headers))
+
+    async def get_profile_user_ids(self, headers: Optional[dict] = None, limit: Optional[int] = None) -> List[str]:
+        """
+        Get the identifiers of all the users having a profile
+        :param headers: Additional headers to add in the http request
+        :param limit: The number of identifiers of each page, if not specified the default of the component is used
+        :return: The list of user identifiers
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_profile_user_id_page, headers=headers)
+        return await pagination.fetch_all(fetch_page, lambda user_ids_page: user_ids_page.user_ids, limit=limit)
+
+    async def get_profile_user_id_page(self, offset: int = 0, limit: Optional[int] = None, headers: Optional[dict] = None) -> UserIdentifiersPage:
+        """
+        Get a page of the identifiers of the users having a profile
+        :param offset: The index of the first identifier to return
+        :param limit: The number maximum of identifiers to return, if not specified the default of the component is used
+        :param headers: Additional headers to add in the http request
+        :return: An object representing a user identifiers page
+        """
+        return await self._call(self._get_profile_user_id_page_request(offset, limit, headers))
+
+    async def get_relationship_page(self,
+                                    app_id: Optional[str] = None,
+                                    source_id: Optional[str] = None,
+                                    target_id: Optional[str] = None,
+                                    relation_type: Optional[str] = None,
+                                    weight_from: Optional[float] = None,
+                                    weight_to: Optional[float] = None,
+                                    order: Optional[str] = None,
+                                    offset: int = 0,
+                                    limit: int = 10,
+                                    headers: Optional[dict] = None
+                                    ) -> RelationshipPage:
+        """
+        Get all the relationships that match the request parameters
+        :param app_id: An application identifier to be equals on the social network relationships to return.
+        You can use a Perl compatible regular expressions (PCRE) that has to match the application identifier of
+        the relationships if you write between '/'. For example to get the relationships for the applications '1' and '2' you must pass as 'appId' '/^[1|2]$/'.
+        :param source_id: A user identifier to be equals on the relationships source to return. You can use a Perl
+        compatible regular expressions (PCRE) that has to match the user identifier of the relationships source if you
+        write between '/'. For example to get the relationships with the source users '1' and '2' you must pass as 'source' '/^[1|2]$/'.
+        :param target_id: A user identifier to be equals on the relationships target to return. You can use a Perl compatible regular expressions (PCRE) that has to match the user identifier of the relationships target if you write between '/'. For example to get the relationships with the target users '1' and '2' you must pass as 'target' '/^[1|2]$/'.
+        :param relation_type: The type for the relationships to return. You can use a Perl compatible regular expressions (PCRE) that has to match the type of the relationships if you write between '/'. For example to get the relationships with the types 'friend' and 'colleague' you must pass as 'type' '/^[friend|colleague]$/'.
+        :param weight_from: The minimal weight, inclusive, of the relationships to return.
+        :param weight_to: The maximal weight, inclusive, of the relationships to return.
+        :param order: The order in witch the relationships has to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order.
+        :param offset: The index of the first social network relationship to return.
+        :param limit: The number maximum of social network relationships to return
+        :param headers: Additional headers to add in the http request
+        :return: An object representing a relationships page.
+        :raise: ApiException if the request does not return a 200 code. KeyError if the methods is not able to create a RelationshipPage object
+        """
+
+        return await self._call(self._get_relationship_page_request(app_id, source_id, target_id, relation_type, weight_from, weight_to, order, offset, limit, headers))
+
+    async def get_relationships(self,
+                                app_id: Optional[str] = None,
+                                source_id: Optional[str] = None,
+                                target_id: Optional[str] = None,
+                                relation_type: Optional[str] = None,
+                                weight_from: Optional[float] = None,
+                                weight_to: Optional[float] = None,
+                                order: Optional[str] = None,
+                                headers: Optional[dict] = None
+                                ) -> List[Relationship]:
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_relationship_page,
+            app_id=app_id,
+            source_id=source_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            weight_from=weight_from,
+            weight_to=weight_to,
+            order=order,
+            headers=headers
+        )
+        return await pagination.fetch_all(fetch_page, lambda relationship_page: relationship_page.relationships, limit=100)
+
+    async def update_relationship(self, relationship: Relationship, headers: Optional[dict] = None) -> Relationship:
+        """
+        Add or modify a relationship between WeNet users
+        :param relationship: The relationship to update/create
+        :param headers: Additional headers to add in the http request
+        :return: The updated relationship
+        """
+
+        return await self._call(self._update_relationship_request(relationship, headers))
+
+    async def update_relationship_batch(self, relationships: List[Relationship], headers: Optional[dict] = None) -> List[Relationship]:
+        """
+        Modify some relationships between WeNet users in batch
+        :param relationships: The list of relationship to update/create
+        :param headers: Additional headers to add in the http request
+        :return: The list of updated relationship
+        """
+
+        return await self._call(self._update_relationship_batch_request(relationships, headers))
+
+    async def delete_relationships(self,
+                                   app_id: Optional[str] = None,
+                                   source_id: Optional[str] = None,
+                                   target_id: Optional[str] = None,
+                                   relation_type: Optional[str] = None,
+                                   weight_from: Optional[float] = None,
+                                   weight_to: Optional[float] = None,
+                                   headers: Optional[dict] = None
+                                   ) -> None:
+        """
+        Allow to get all the relationships that match the request parameters
+        :param app_id: An application identifier to be equals on the social network relationships to delete. You can use a Perl compatible regular expressions (PCRE) that has to match the application identifier of the relationships if you write between '/'. For example to get the relationships for the applications '1' and '2' you must pass as 'appId' '/^[1|2]$/'.
+        :param source_id: A user identifier to be equals on the relationships source to delete. You can use a Perl compatible regular expressions (PCRE) that has to match the user identifier of the relationships source if you write between '/'. For example to delete the relationships with the source users '1' and '2' you must pass as 'source' '/^[1|2]$/'.
+        :param target_id: A user identifier to be equals on the relationships target to delete. You can use a Perl compatible regular expressions (PCRE) that has to match the user identifier of the relationships target if you write between '/'. For example to delete the relationships with the target users '1' and '2' you must pass as 'target' '/^[1|2]$/'.
+        :param relation_type: The type for the relationships to delete. You can use a Perl compatible regular expressions (PCRE) that has to match the type of the relationships if you write between '/'. For example to delete the relationships with the types 'friend' and 'colleague' you must pass as 'type' '/^[friend|colleague]$/'.
+        :param weight_from: The minimal weight, inclusive, of the relationships to return.
+        :param weight_to: The maximal weight, inclusive, of the relationships to return.
+        :param headers: Additional headers to add in the http request
+        """
+
+        await self._call(self._delete_relationships_request(app_id, source_id, target_id, relation_type, weight_from, weight_to, headers))
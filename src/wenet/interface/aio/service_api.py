@@ -0,0 +1,445 @@
+from __future__ import absolute_import, annotations
+
+import functools
+import logging
+from datetime import datetime
+from typing import List, Optional, Union
+
+from wenet.interface.aio import pagination
+from wenet.interface.aio.client import AsyncRestClient, AsyncOauth2Client
+from wenet.interface.aio.component import AsyncComponentInterface
+from wenet.interface.service_api import BaseServiceApiInterface
+from wenet.model.app import AppDTO
+from wenet.model.logging_message.message import BaseMessage
+from wenet.model.protocol_norm import ProtocolNorm
+from wenet.model.task.task import Task, TaskPage
+from wenet.model.task.transaction import TaskTransaction
+from wenet.model.user.competence import Competence
+from wenet.model.user.material import Material
+from wenet.model.user.meaning import Meaning
+from wenet.model.user.personal_behaviors import PersonalBehavior
+from wenet.model.user.planned_activity import PlannedActivity
+from wenet.model.user.relationship import Relationship, RelationshipPage
+from wenet.model.user.relevant_location import RelevantLocation
+from wenet.model.user.token import TokenDetails
+from wenet.model.user.profile import WeNetUserProfile, CoreWeNetUserProfile
+
+
+logger = logging.getLogger("wenet.interface.aio.service_api")
+
+
+class AsyncServiceApiInterface(BaseServiceApiInterface, AsyncComponentInterface):
+
+    def __init__(self, client: AsyncRestClient, platform_url: str, component_path: str = "/service", component_path_oauth: str = "/api/service", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        if isinstance(client, AsyncOauth2Client):
+            base_url = platform_url + component_path_oauth
+        else:
+            base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    async def get_token_details(self, headers: Optional[dict] = None) -> TokenDetails:
+        return await self._call(self._get_token_details_request(headers))
+
+    async def get_app_details(self, app_id: str, headers: Optional[dict] = None) -> AppDTO:
+        return await self._call(self._get_app_details_request(app_id, headers))
+
+    async def get_app_users(self, app_id: str, headers: Optional[dict] = None) -> List[str]:
+        return await self._call(self._get_app_users_request(app_id, headers))
+
+    async def create_task(self, task: Task, headers: Optional[dict] = None) -> Task:
+        return await self._call(self._create_task_request(task, headers))
+
+    async def get_task(self, task_id: str, headers: Optional[dict] = None) -> Task:
+        return await self._call(self._get_task_request(task_id, headers))
+
+    async def create_task_transaction(self, transaction: TaskTransaction, headers: Optional[dict] = None) -> None:
+        await self._call(self._create_task_transaction_request(transaction, headers))
+
+    async def get_user_profile(self, wenet_user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
+        return await self._call(self._get_user_profile_request(wenet_user_id, headers))
+
+    async def create_user_profile(self, wenet_user_id: str, headers: Optional[dict] = None) -> None:
+        await self._call(self._create_user_profile_request(wenet_user_id, headers))
+
+    async def update_user_profile(self, wenet_user_id: str, profile: CoreWeNetUserProfile, headers: Optional[dict] = None) -> WeNetUserProfile:
+        return await self._call(self._update_user_profile_request(wenet_user_id, profile, headers))
+
+    async def get_user_competences(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
+        """
+        Get all the competences defined into a profile
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            headers: Additional headers to add to the call
+
+        Returns:
+            The competences defined into the profile
+        """
+        return await self._call(self._get_user_profile_field_request(wenet_user_id, "competences", headers))
+
+    async def update_user_competences(self, wenet_user_id: str, competences: Union[List[dict], List[Competence]], headers: Optional[dict] = None) -> List[dict]:
+        """
+        Update all the competences of a profile overwriting the existing ones
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            competences: The new competences
+            headers: Additional headers to add to the call
+
+        Returns:
+            The updated competences of the profile
+        """
+        return await self._call(self._update_user_profile_field_request(wenet_user_id, "competences", competences, Competence, headers))
+
+    async def get_user_materials(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
+        """
+        Get all the materials defined into a profile
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            headers: Additional headers to add to the call
+
+        Returns:
+            The materials defined into the profile
+        """
+        return await self._call(self._get_user_profile_field_request(wenet_user_id, "materials", headers))
+
+    async def update_user_materials(self, wenet_user_id: str, materials: Union[List[dict], List[Material]], headers: Optional[dict] = None) -> List[dict]:
+        """
+        Update all the materials of a profile overwriting the existing ones
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            materials: The new materials
+            headers: Additional headers to add to the call
+
+        Returns:
+            The updated materials of the profile
+        """
+        return await self._call(self._update_user_profile_field_request(wenet_user_id, "materials", materials, Material, headers))
+
+    async def get_user_meanings(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
+        """
+        Get all the meanings defined into a profile
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            headers: Additional headers to add to the call
+
+        Returns:
+            The meanings defined into the profile
+        """
+        return await self._call(self._get_user_profile_field_request(wenet_user_id, "meanings", headers))
+
+    async def update_user_meanings(self, wenet_user_id: str, meanings: Union[List[dict], List[Meaning]], headers: Optional[dict] = None) -> List[dict]:
+        """
+        Update all the meanings of a profile overwriting the existing ones
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            meanings: The new meanings
+            headers: Additional headers to add to the call
+
+        Returns:
+            The updated meanings of the profile
+        """
+        return await self._call(self._update_user_profile_field_request(wenet_user_id, "meanings", meanings, Meaning, headers))
+
+    async def get_user_norms(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
+        """
+        Get all the norms defined into a profile
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            headers: Additional headers to add to the call
+
+        Returns:
+            The norms defined into the profile
+        """
+        return await self._call(self._get_user_profile_field_request(wenet_user_id, "norms", headers))
+
+    async def update_user_norms(self, wenet_user_id: str, norms: Union[List[dict], List[ProtocolNorm]], headers: Optional[dict] = None) -> List[dict]:
+        """
+        Update all the norms of a profile overwriting the existing ones
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            norms: The new norms
+            headers: Additional headers to add to the call
+
+        Returns:
+            The updated norms of the profile
+        """
+        return await self._call(self._update_user_profile_field_request(wenet_user_id, "norms", norms, ProtocolNorm, headers))
+
+    async def get_user_personal_behaviors(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
+        """
+        Get all the personal behaviors defined into a profile
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            headers: Additional headers to add to the call
+
+        Returns:
+            The personal behaviors defined into the profile
+        """
+        return await self._call(self._get_user_profile_field_request(wenet_user_id, "personalBehaviors", headers))
+
+    async def update_user_personal_behaviors(self, wenet_user_id: str, personal_behaviors: Union[List[dict], List[PersonalBehavior]], headers: Optional[dict] = None) -> List[dict]:
+        """
+        Update all the personal behaviors of a profile overwriting the existing ones
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            personal_behaviors: The new personal behaviors
+            headers: Additional headers to add to the call
+
+        Returns:
+            The updated personal behaviors of the profile
+        """
+        return await self._call(self._update_user_profile_field_request(wenet_user_id, "personalBehaviors", personal_behaviors, PersonalBehavior, headers))
+
+    async def get_user_planned_activities(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
+        """
+        Get all the planned activities defined into a profile
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            headers: Additional headers to add to the call
+
+        Returns:
+            The planned activities defined into the profile
+        """
+        return await self._call(self._get_user_profile_field_request(wenet_user_id, "plannedActivities", headers))
+
+    async def update_user_planned_activities(self, wenet_user_id: str, planned_activities: Union[List[dict], List[PlannedActivity]], headers: Optional[dict] = None) -> List[dict]:
+        """
+        Update all the planned activities of a profile overwriting the existing ones
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            planned_activities: The new planned activities
+            headers: Additional headers to add to the call
+
+        Returns:
+            The updated planned activities of the profile
+        """
+        return await self._call(self._update_user_profile_field_request(wenet_user_id, "plannedActivities", planned_activities, PlannedActivity, headers))
+
+    async def get_relationship_page(self,
+                                    wenet_user_id: str,
+                                    target_id: Optional[str] = None,
+                                    relation_type: Optional[str] = None,
+                                    weight_from: Optional[float] = None,
+                                    weight_to: Optional[float] = None,
+                                    order: Optional[str] = None,
+                                    offset: int = 0,
+                                    limit: int = 100,
+                                    headers: Optional[dict] = None) -> RelationshipPage:
+        """
+
+        :param wenet_user_id: The Id of the wenet user
+        :param target_id: A user identifier to be equals on the relationships target to return. You can use a Perl compatible regular expressions (PCRE) that has to match the user identifier of the relationships target if you write between '/'. For example to get the relationships with the target users '1' and '2' you must pass as 'target' '/^[1|2]$/'.
+        :param relation_type: The type for the relationships to return. You can use a Perl compatible regular expressions (PCRE) that has to match the type of the relationships if you write between '/'. For example to get the relationships with the types 'friend' and 'colleague' you must pass as 'type' '/^[friend|colleague]$/'.
+        :param weight_from: The minimal weight, inclusive, of the relationships to return.
+        :param weight_to: The maximal weight, inclusive, of the relationships to return.
+        :param order: The order in witch the relationships has to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order.
+        :param offset: The index of the first social network relationship to return.
+        :param limit: The number maximum of social network relationships to return
+        :param headers: Additional headers to add to the call
+        :return: An object representing a relationships page.
+        """
+        return await self._call(self._get_relationship_page_request(wenet_user_id, target_id, relation_type, weight_from, weight_to, order, offset, limit, headers))
+
+    async def get_user_relationships(self,
+                                     wenet_user_id: str,
+                                     target_id: Optional[str] = None,
+                                     relation_type: Optional[str] = None,
+                                     weight_from: Optional[float] = None,
+                                     weight_to: Optional[float] = None,
+                                     order: Optional[str] = None,
+                                     headers: Optional[dict] = None) -> List[Relationship]:
+        """
+        Get all the relationships defined into a profile
+
+        :param wenet_user_id: The Id of the wenet user
+        :param target_id: A user identifier to be equals on the relationships target to return. You can use a Perl compatible regular expressions (PCRE) that has to match the user identifier of the relationships target if you write between '/'. For example to get the relationships with the target users '1' and '2' you must pass as 'target' '/^[1|2]$/'.
+        :param relation_type: The type for the relationships to return. You can use a Perl compatible regular expressions (PCRE) that has to match the type of the relationships if you write between '/'. For example to get the relationships with the types 'friend' and 'colleague' you must pass as 'type' '/^[friend|colleague]$/'.
+        :param weight_from: The minimal weight, inclusive, of the relationships to return.
+        :param weight_to: The maximal weight, inclusive, of the relationships to return.
+        :param order: The order in witch the relationships has to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order.
+        :param headers: Additional headers to add to the call
+        :return: The list of relationships of the given user
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_relationship_page,
+            wenet_user_id=wenet_user_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            weight_from=weight_from,
+            weight_to=weight_to,
+            order=order,
+            headers=headers
+        )
+        return await pagination.fetch_all(fetch_page, lambda relationship_page: relationship_page.relationships, limit=100)
+
+    async def update_user_relationships(self, wenet_user_id: str, relationships: List[Relationship], headers: Optional[dict] = None) -> List[Relationship]:
+        """
+        Update The user relationships in batch
+        :param wenet_user_id: The id of the user
+        :param relationships: The list of relationships to update
+        :param headers: Additional headers to add to the call
+        :return:
+        """
+        return await self._call(self._update_user_relationships_request(wenet_user_id, relationships, headers))
+
+    async def get_user_relevant_locations(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
+        """
+        Get all the relevant locations defined into a profile
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            headers: Additional headers to add to the call
+
+        Returns:
+            The relevant locations defined into the profile
+        """
+        return await self._call(self._get_user_profile_field_request(wenet_user_id, "relevantLocations", headers))
+
+    async def update_user_relevant_locations(self, wenet_user_id: str, relevant_locations: Union[List[dict], List[RelevantLocation]], headers: Optional[dict] = None) -> List[dict]:
+        """
+        Update all the relevant locations of a profile overwriting the existing ones
+
+        Args:
+            wenet_user_id: The Id of the wenet user
+            relevant_locations: The new relevant locations
+            headers: Additional headers to add to the call
+
+        Returns:
+            The updated relevant locations of the profile
+        """
+        return await self._call(self._update_user_profile_field_request(wenet_user_id, "relevantLocations", relevant_locations, RelevantLocation, headers))
+
+    async def get_opened_tasks_of_user(self, wenet_user_id: str, app_id: str, headers: Optional[dict] = None) -> List[Task]:
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, app_id=app_id, requester_id=wenet_user_id, has_close_ts=False, headers=headers)
+        return await pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, limit=None)
+
+    async def get_all_tasks(self,
+                            app_id: Optional[str] = None,
+                            requester_id: Optional[str] = None,
+                            task_type_id: Optional[str] = None,
+                            goal_name: Optional[str] = None,
+                            goal_description: Optional[str] = None,
+                            creation_from: Optional[datetime] = None,
+                            creation_to: Optional[datetime] = None,
+                            update_from: Optional[datetime] = None,
+                            update_to: Optional[datetime] = None,
+                            has_close_ts: Optional[bool] = None,
+                            closed_from: Optional[datetime] = None,
+                            closed_to: Optional[datetime] = None,
+                            order: Optional[str] = None,
+                            offset: int = 0,
+                            headers: Optional[dict] = None
+                            ) -> List[Task]:
+        """
+        Get the tasks specifying parameters
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            creation_from: the minimum creation date time of the tasks to return
+            creation_to: the maximum creation date time of the tasks to return
+            update_from: the minimum update date time of the tasks to return
+            update_to: the maximum update date time of the tasks to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first task to return. Default value is set to 0
+            headers: additional headers
+
+        Returns:
+            The list of tasks
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_task_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            order=order,
+            headers=headers
+        )
+        return await pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, offset=offset, limit=100)
+
+    async def get_task_page(self,
+                            app_id: Optional[str] = None,
+                            requester_id: Optional[str] = None,
+                            task_type_id: Optional[str] = None,
+                            goal_name: Optional[str] = None,
+                            goal_description: Optional[str] = None,
+                            creation_from: Optional[datetime] = None,
+                            creation_to: Optional[datetime] = None,
+                            update_from: Optional[datetime] = None,
+                            update_to: Optional[datetime] = None,
+                            has_close_ts: Optional[bool] = None,
+                            closed_from: Optional[datetime] = None,
+                            closed_to: Optional[datetime] = None,
+                            order: Optional[str] = None,
+                            offset: int = 0,
+                            limit: int = 100,
+                            headers: Optional[dict] = None
+                            ) -> TaskPage:
+        """
+        Get a page of tasks specifying parameters
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            creation_from: the minimum creation date time of the tasks to return
+            creation_to: the maximum creation date time of the tasks to return
+            update_from: the minimum update date time of the tasks to return
+            update_to: the maximum update date time of the tasks to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first task to return. Default value is set to 0
+            limit: the number maximum of tasks to return. Default value is set to 100
+            headers: additional headers
+
+        Returns:
+            A page of tasks
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        return await self._call(self._get_task_page_request(app_id, requester_id, task_type_id, goal_name, goal_description, creation_from, creation_to, update_from, update_to, has_close_ts, closed_from, closed_to, order, offset, limit, headers))
+
+    async def get_all_tasks_of_application(self, app_id: str, headers: Optional[dict] = None) -> List[Task]:
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, app_id=app_id, has_close_ts=False, headers=headers)
+        return await pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, limit=None)
+
+    async def log_message(self, message: BaseMessage, headers: Optional[dict] = None) -> None:
+        await self._call(self._log_message_request(message, headers))
@@ -0,0 +1,351 @@
+from __future__ import absolute_import, annotations
+
+import functools
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from wenet.interface.aio import pagination
+from wenet.interface.aio.component import AsyncComponentInterface
+from wenet.interface.aio.client import AsyncRestClient
+from wenet.interface.task_manager import BaseTaskManagerInterface
+from wenet.model.task.task import TaskPage, Task
+from wenet.model.task.transaction import TaskTransaction, TaskTransactionPage
+
+
+logger = logging.getLogger("wenet.interface.aio.task_manager")
+
+
+class AsyncTaskManagerInterface(BaseTaskManagerInterface, AsyncComponentInterface):
+
+    def __init__(self, client: AsyncRestClient, platform_url: str, component_path: str = "/task_manager", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    async def get_all_tasks(self,
+                            app_id: Optional[str] = None,
+                            requester_id: Optional[str] = None,
+                            task_type_id: Optional[str] = None,
+                            goal_name: Optional[str] = None,
+                            goal_description: Optional[str] = None,
+                            creation_from: Optional[datetime] = None,
+                            creation_to: Optional[datetime] = None,
+                            update_from: Optional[datetime] = None,
+                            update_to: Optional[datetime] = None,
+                            has_close_ts: Optional[bool] = None,
+                            closed_from: Optional[datetime] = None,
+                            closed_to: Optional[datetime] = None,
+                            order: Optional[str] = None,
+                            offset: int = 0,
+                            headers: Optional[dict] = None
+                            ) -> List[Task]:
+        """
+        Get the tasks specifying query parameters
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            creation_from: the minimum creation date time of the tasks to return
+            creation_to: the maximum creation date time of the tasks to return
+            update_from: the minimum update date time of the tasks to return
+            update_to: the maximum update date time of the tasks to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first task to return. Default value is set to 0
+            headers: additional headers
+
+        Returns:
+            The list of tasks
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_task_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            order=order,
+            headers=headers
+        )
+        return await pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, offset=offset, limit=100)
+
+    async def get_all_transactions(self,
+                                   app_id: Optional[str] = None,
+                                   requester_id: Optional[str] = None,
+                                   task_type_id: Optional[str] = None,
+                                   goal_name: Optional[str] = None,
+                                   goal_description: Optional[str] = None,
+                                   goal_keywords: Optional[str] = None,
+                                   task_creation_from: Optional[datetime] = None,
+                                   task_creation_to: Optional[datetime] = None,
+                                   task_update_from: Optional[datetime] = None,
+                                   task_update_to: Optional[datetime] = None,
+                                   has_close_ts: Optional[bool] = None,
+                                   closed_from: Optional[datetime] = None,
+                                   closed_to: Optional[datetime] = None,
+                                   task_id: Optional[str] = None,
+                                   transaction_id: Optional[str] = None,
+                                   transaction_label: Optional[str] = None,
+                                   actioneer_id: Optional[str] = None,
+                                   creation_from: Optional[datetime] = None,
+                                   creation_to: Optional[datetime] = None,
+                                   update_from: Optional[datetime] = None,
+                                   update_to: Optional[datetime] = None,
+                                   order: Optional[str] = None,
+                                   offset: int = 0,
+                                   headers: Optional[dict] = None
+                                   ) -> List[TaskTransaction]:
+        """
+        Get the transactions specifying query parameters
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            goal_keywords: a set of keywords to be defined on the task where are the transactions to return
+            task_creation_from: the minimum creation date time of the task where are the transaction to return
+            task_creation_to: the maximum creation date time of the task where are the transaction to return
+            task_update_from: the minimum update date time of the task where are the transaction to return
+            task_update_to: the maximum update date time of the task where are the transaction to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            task_id: a task identifier to be equals on the task where are the transactions to return
+            transaction_id: an identifier to be equals on the transactions to return
+            transaction_label: a label to be equals on the transactions to return
+            actioneer_id: an user identifier that has done the transactions to return
+            creation_from: the minimum creation date time of the transactions to return
+            creation_to: the maximum creation date time of the transactions to return
+            update_from: the minimum update date time of the transactions to return
+            update_to: the maximum update date time of the transactions to return
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first task to return. Default value is set to 0
+            headers: additional headers
+
+        Returns:
+            The list of transactions
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_transaction_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            goal_keywords=goal_keywords,
+            task_creation_from=task_creation_from,
+            task_creation_to=task_creation_to,
+            task_update_from=task_update_from,
+            task_update_to=task_update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            task_id=task_id,
+            transaction_id=transaction_id,
+            transaction_label=transaction_label,
+            actioneer_id=actioneer_id,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            order=order,
+            headers=headers
+        )
+        return await pagination.fetch_all(fetch_page, lambda transaction_page: transaction_page.transactions, offset=offset, limit=100)
+
+    async def get_task(self, task_id: str, headers: Optional[dict] = None) -> Task:
+        """
+        Get a task with an specific identifier
+
+        Args:
+            task_id: the identifier of the task to get
+            headers: additional headers
+
+        Returns:
+            The task
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        return await self._call(self._get_task_request(task_id, headers))
+
+    async def get_task_page(self,
+                            app_id: Optional[str] = None,
+                            requester_id: Optional[str] = None,
+                            task_type_id: Optional[str] = None,
+                            goal_name: Optional[str] = None,
+                            goal_description: Optional[str] = None,
+                            creation_from: Optional[datetime] = None,
+                            creation_to: Optional[datetime] = None,
+                            update_from: Optional[datetime] = None,
+                            update_to: Optional[datetime] = None,
+                            has_close_ts: Optional[bool] = None,
+                            closed_from: Optional[datetime] = None,
+                            closed_to: Optional[datetime] = None,
+                            order: Optional[str] = None,
+                            offset: int = 0,
+                            limit: int = 100,
+                            headers: Optional[dict] = None
+                            ) -> TaskPage:
+        """
+        Get a page of tasks specifying query parameters
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            creation_from: the minimum creation date time of the tasks to return
+            creation_to: the maximum creation date time of the tasks to return
+            update_from: the minimum update date time of the tasks to return
+            update_to: the maximum update date time of the tasks to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first task to return. Default value is set to 0
+            limit: the number maximum of tasks to return. Default value is set to 100
+            headers: additional headers
+
+        Returns:
+            A page of tasks
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        return await self._call(self._get_task_page_request(app_id, requester_id, task_type_id, goal_name, goal_description, creation_from, creation_to, update_from, update_to, has_close_ts, closed_from, closed_to, order, offset, limit, headers))
+
+    async def get_transaction_page(self,
+                                   app_id: Optional[str] = None,
+                                   requester_id: Optional[str] = None,
+                                   task_type_id: Optional[str] = None,
+                                   goal_name: Optional[str] = None,
+                                   goal_description: Optional[str] = None,
+                                   goal_keywords: Optional[str] = None,
+                                   task_creation_from: Optional[datetime] = None,
+                                   task_creation_to: Optional[datetime] = None,
+                                   task_update_from: Optional[datetime] = None,
+                                   task_update_to: Optional[datetime] = None,
+                                   has_close_ts: Optional[bool] = None,
+                                   closed_from: Optional[datetime] = None,
+                                   closed_to: Optional[datetime] = None,
+                                   task_id: Optional[str] = None,
+                                   transaction_id: Optional[str] = None,
+                                   transaction_label: Optional[str] = None,
+                                   actioneer_id: Optional[str] = None,
+                                   creation_from: Optional[datetime] = None,
+                                   creation_to: Optional[datetime] = None,
+                                   update_from: Optional[datetime] = None,
+                                   update_to: Optional[datetime] = None,
+                                   order: Optional[str] = None,
+                                   offset: int = 0,
+                                   limit: int = 100,
+                                   headers: Optional[dict] = None
+                                   ) -> TaskTransactionPage:
+        """
+        Get a page of transactions specifying query parameters
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            goal_keywords: a set of keywords to be defined on the task where are the transactions to return
+            task_creation_from: the minimum creation date time of the task where are the transaction to return
+            task_creation_to: the maximum creation date time of the task where are the transaction to return
+            task_update_from: the minimum update date time of the task where are the transaction to return
+            task_update_to: the maximum update date time of the task where are the transaction to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            task_id: a task identifier to be equals on the task where are the transactions to return
+            transaction_id: an identifier to be equals on the transactions to return
+            transaction_label: a label to be equals on the transactions to return
+            actioneer_id: an user identifier that has done the transactions to return
+            creation_from: the minimum creation date time of the transactions to return
+            creation_to: the maximum creation date time of the transactions to return
+            update_from: the minimum update date time of the transactions to return
+            update_to: the maximum update date time of the transactions to return
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first task to return. Default value is set to 0
+            limit: the number maximum of tasks to return. Default value is set to 100
+            headers: additional headers
+
+        Returns:
+            A page of transactions
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        return await self._call(self._get_transaction_page_request(app_id, requester_id, task_type_id, goal_name, goal_description, goal_keywords, task_creation_from, task_creation_to, task_update_from, task_update_to, has_close_ts, closed_from, closed_to, task_id, transaction_id, transaction_label, actioneer_id, creation_from, creation_to, update_from, update_to, order, offset, limit, headers))
+
+    async def create_task(self, task: Task, headers: Optional[dict] = None) -> Task:
+        """
+        Create a new task
+
+        Args:
+            task: the new task to create
+            headers: additional headers
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        return await self._call(self._create_task_request(task, headers))
+
+    async def update_task(self, task: Task, headers: Optional[dict] = None) -> Task:
+        """
+        Update a task
+
+        Args:
+            task: the updated task
+            headers: additional headers
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        return await self._call(self._update_task_request(task, headers))
+
+    async def create_task_transaction(self, task_transaction: TaskTransaction, headers: Optional[dict] = None) -> None:
+        """
+        Create a task transaction
+
+        Args:
+            task_transaction: the new task transaction to create
+            headers: additional headers
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        await self._call(self._create_task_transaction_request(task_transaction, headers))
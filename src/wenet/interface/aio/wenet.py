@@ -0,0 +1,79 @@
+from __future__ import absolute_import, annotations
+
+from typing import Optional
+
+from wenet.interface.aio.client import AsyncRestClient
+from wenet.interface.aio.hub import AsyncHubInterface
+from wenet.interface.aio.ilog import AsyncIlogInterface
+from wenet.interface.aio.incentive_server import AsyncIncentiveServerInterface
+from wenet.interface.aio.logger import AsyncLoggerInterface
+from wenet.interface.aio.profile_manager import AsyncProfileManagerInterface
+from wenet.interface.aio.service_api import AsyncServiceApiInterface
+from wenet.interface.aio.task_manager import AsyncTaskManagerInterface
+from wenet.interface.circuit_breaker import CircuitBreakerRegistry, default_circuit_breakers
+
+
+class AsyncWeNet:
+
+    def __init__(self,
+                 service_api: AsyncServiceApiInterface,
+                 profile_manager: AsyncProfileManagerInterface,
+                 incentive_server: AsyncIncentiveServerInterface,
+                 task_manager: AsyncTaskManagerInterface,
+                 logger: AsyncLoggerInterface,
+                 hub: AsyncHubInterface,
+                 ilog: AsyncIlogInterface
+                 ):
+        self.service_api = service_api
+        self.profile_manager = profile_manager
+        self.incentive_server = incentive_server
+        self.task_manager = task_manager
+        self.logger = logger
+        self.hub = hub
+        self.ilog = ilog
+
+    async def close(self) -> None:
+        """
+        Release the connections of the clients used by the platform interfaces
+        """
+        for interface in [self.service_api, self.profile_manager, self.incentive_server, self.task_manager, self.logger, self.hub, self.ilog]:
+            await interface.close()
+
+    async def __aenter__(self) -> AsyncWeNet:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @staticmethod
+    def build(client: AsyncRestClient,
+              platform_url: str = "https://internetofus.u-hopper.com/prod",
+              extra_headers: Optional[dict] = None,
+              circuit_breakers: Optional[CircuitBreakerRegistry] = default_circuit_breakers,
+              **kwargs
+              ) -> AsyncWeNet:
+        """
+        Build an asynchronous WeNet collector with all the platform interfaces.
+        All the interfaces share the given client and therefore its pool of connections.
+        Each interface has a circuit breaker failing fast its requests while its component is degraded.
+
+        Args:
+            client: the client for authenticate requests: AsyncApikeyClient for an internal usage, AsyncOauth2Client for an external usage.
+            platform_url: the URL of the platform
+            extra_headers: extra heather to add to all the requests
+            circuit_breakers: the registry of the circuit breakers of the components, by default the one shared by all the collectors of the process; if None the interfaces will not have circuit breakers
+            **kwargs: other settings of the interfaces, such as the retry_policy
+
+        Returns:
+            an asynchronous WeNet collector with all the platform interfaces
+        """
+        kwargs.update(platform_url=platform_url, extra_headers=extra_headers, circuit_breakers=circuit_breakers)
+        return AsyncWeNet(
+            service_api=AsyncServiceApiInterface(client, **kwargs),
+            profile_manager=AsyncProfileManagerInterface(client, **kwargs),
+            incentive_server=AsyncIncentiveServerInterface(client, **kwargs),
+            task_manager=AsyncTaskManagerInterface(client, **kwargs),
+            logger=AsyncLoggerInterface(client, **kwargs),
+            hub=AsyncHubInterface(client, **kwargs),
+            ilog=AsyncIlogInterface(client, **kwargs)
+        )
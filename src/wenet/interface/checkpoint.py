@@ -0,0 +1,189 @@
+from __future__ import absolute_import, annotations
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from wenet.interface import pagination
+from wenet.storage.state import StateStore
+from wenet.utils import json_codec
+
+logger = logging.getLogger("wenet.interface.checkpoint")
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+class Checkpoint:
+
+    def __init__(self, state_store: StateStore, key: str) -> None:
+        """
+        The checkpoint of a bulk crawl, storing how far the crawl went together with the fingerprint of its query, so that an interrupted crawl can be resumed
+
+        Args:
+            state_store: the store of the checkpoint, such as a `CacheStateStore` or a `FileStateStore`
+            key: the key of the checkpoint
+        """
+        self.state_store = state_store
+        self.key = key
+
+    @staticmethod
+    def fingerprint(query: dict) -> str:
+        """
+        Compute the fingerprint of the query of a crawl, the query parameters that are not set are ignored
+        """
+        def to_repr(value: Any) -> Any:
+            if isinstance(value, datetime):
+                return int(value.timestamp())
+            if isinstance(value, timedelta):
+                return value.total_seconds()
+            if isinstance(value, Enum):
+                return value.value
+            return value
+
+        parameters = {name: to_repr(value) for name, value in sorted(query.items()) if value is not None}
+        return hashlib.sha256(json_codec.dumps(parameters)).hexdigest()
+
+    def load(self, fingerprint: str) -> Optional[dict]:
+        """
+        Load the cursor of the crawl with the given fingerprint
+
+        Returns:
+            the cursor, or None if the crawl has not been started, or if the checkpoint belongs to a crawl with a different query
+        """
+        state = self.state_store.load(self.key)
+        if state is None:
+            return None
+        if state.get("fingerprint") != fingerprint:
+            logger.warning(f"Ignoring the checkpoint [{self.key}] of a crawl with a different query")
+            return None
+        return state.get("cursor")
+
+    def save(self, fingerprint: str, cursor: dict) -> None:
+        self.state_store.save(self.key, {"fingerprint": fingerprint, "cursor": cursor})
+
+    def clear(self) -> None:
+        self.state_store.clear(self.key)
+
+
+def export_all(fetch_page: Callable[[int, int], P],
+               get_items: Callable[[P], List[T]],
+               sink: Callable[[List[T]], None],
+               checkpoint: Checkpoint,
+               fingerprint: str,
+               offset: int = 0,
+               limit: int = 100
+               ) -> int:
+    """
+    Pass all the items of a paginated listing to a sink one page after the other, saving after each page the offset of the next one.
+    If the checkpoint has an offset for the same query, the crawl resumes from it instead of starting from the beginning, and the checkpoint is cleared once the crawl is complete.
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit
+        get_items: the function getting the items of a page
+        sink: the function receiving the items of each page
+        checkpoint: the checkpoint of the crawl
+        fingerprint: the fingerprint of the query of the crawl
+        offset: the index of the first item to fetch when the crawl is not resumed
+        limit: the number of items of each page
+
+    Returns:
+        the number of items passed to the sink, by this call
+    """
+    cursor = checkpoint.load(fingerprint)
+    if cursor is not None:
+        offset = cursor["offset"]
+        logger.info(f"Resuming the crawl [{checkpoint.key}] from the offset [{offset}]")
+
+    exported = 0
+    for page in pagination.iter_pages(fetch_page, get_items, offset=offset, limit=limit):
+        items = get_items(page)
+        sink(items)
+        exported += len(items)
+        checkpoint.save(fingerprint, {"offset": offset + exported})
+
+    checkpoint.clear()
+    return exported
+
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge the overlapping or adjacent intervals of seconds, the bounds are inclusive
+    """
+    merged = []
+    for interval_from, interval_to in sorted(intervals):
+        if merged and interval_from <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], interval_to))
+        else:
+            merged.append((interval_from, interval_to))
+    return merged
+
+
+def subtract_intervals(start: int, end: int, intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Get the parts of an interval of seconds not covered by other intervals, the bounds are inclusive
+    """
+    remaining = []
+    for interval_from, interval_to in merge_intervals(intervals):
+        if interval_from > start:
+            remaining.append((start, min(interval_from - 1, end)))
+        start = max(start, interval_to + 1)
+        if start > end:
+            return remaining
+    remaining.append((start, end))
+    return remaining
+
+
+def export_all_in_windows(fetch_page: Callable[[datetime, datetime, int, int], P],
+                          get_items: Callable[[P], List[T]],
+                          sink: Callable[[List[T]], None],
+                          checkpoint: Checkpoint,
+                          fingerprint: str,
+                          start: datetime,
+                          end: datetime,
+                          window: timedelta,
+                          max_window_items: int = 1000,
+                          limit: int = 100,
+                          max_workers: int = 4
+                          ) -> int:
+    """
+    Pass all the items of a paginated listing created in a time range to a sink, splitting the range in windows fetched concurrently as `pagination.fetch_all_in_windows` does.
+    The items of each window are passed to the sink as soon as the window has been fetched, and the window is saved among the completed ones.
+    If the checkpoint has completed windows for the same query, only the rest of the time range is fetched, and the checkpoint is cleared once the crawl is complete.
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit of the items created between the bounds of a window
+        get_items: the function getting the items of a page
+        sink: the function receiving the items of each window, always called from the calling thread
+        checkpoint: the checkpoint of the crawl
+        fingerprint: the fingerprint of the query of the crawl
+        start: the beginning of the time range
+        end: the end of the time range
+        window: the initial duration of the windows
+        max_window_items: the number of items above which a window is split
+        limit: the number of items of each page
+        max_workers: the maximum number of windows fetched concurrently
+
+    Returns:
+        the number of items passed to the sink, by this call
+    """
+    cursor = checkpoint.load(fingerprint)
+    completed = [tuple(interval) for interval in cursor["completed"]] if cursor is not None else []
+    if completed:
+        logger.info(f"Resuming the crawl [{checkpoint.key}], [{len(completed)}] intervals already completed")
+
+    windows = []
+    for interval_from, interval_to in subtract_intervals(int(start.timestamp()), int(end.timestamp()), completed):
+        windows.extend(pagination.split_in_windows(datetime.fromtimestamp(interval_from, start.tzinfo), datetime.fromtimestamp(interval_to, start.tzinfo), window))
+
+    exported = 0
+    for (window_from, window_to), items in pagination.iter_window_items(fetch_page, get_items, windows, max_window_items=max_window_items, limit=limit, max_workers=max_workers):
+        sink(items)
+        exported += len(items)
+        completed = merge_intervals(completed + [(int(window_from.timestamp()), int(window_to.timestamp()))])
+        checkpoint.save(fingerprint, {"completed": [list(interval) for interval in completed]})
+
+    checkpoint.clear()
+    return exported
@@ -0,0 +1,270 @@
+from __future__ import absolute_import, annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import requests
+from requests import Response
+
+from wenet.interface.exceptions import ApiException, CircuitOpenError
+
+logger = logging.getLogger("wenet.interface.circuit_breaker")
+
+
+class CircuitBreaker:
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self,
+                 name: str,
+                 failure_rate_threshold: float = 0.5,
+                 minimum_calls: int = 10,
+                 window_size: int = 20,
+                 open_timeout: float = 30,
+                 half_open_max_calls: int = 1
+                 ) -> None:
+        """
+        A circuit breaker failing fast the requests to a component while it is degraded
+
+        Args:
+            name: the name of the protected component, usually its base url
+            failure_rate_threshold: the rate of failed requests, among the last ones, above which the circuit opens
+            minimum_calls: the minimum number of requests in the window before the failure rate is considered
+            window_size: the number of the last requests considered for computing the failure rate
+            open_timeout: the number of seconds the circuit stays open before letting probe requests through
+            half_open_max_calls: the number of successful probe requests needed to close the circuit again
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        with self._lock:
+            return self._get_failure_rate()
+
+    def _get_failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _update_state(self) -> None:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_timeout:
+            logger.info(f"Circuit of [{self.name}] half open, probing the component")
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+            self._half_open_successes = 0
+
+    def _open(self) -> None:
+        logger.warning(f"Circuit of [{self.name}] open for [{self.open_timeout}] seconds, failure rate [{self._get_failure_rate():.2f}]")
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self) -> None:
+        logger.info(f"Circuit of [{self.name}] closed")
+        self._state = self.CLOSED
+        self._opened_at = None
+        self._outcomes.clear()
+
+    def allow_request(self) -> None:
+        """
+        Check whether a request can be performed
+
+        Raises:
+            CircuitOpenError: if the circuit is open, or it is half open and enough probe requests are already in progress
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == self.OPEN:
+                raise CircuitOpenError(self.name, self.open_timeout - (time.monotonic() - self._opened_at))
+            if self._state == self.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, 0)
+                self._half_open_calls += 1
+
+    def release(self) -> None:
+        """
+        Release the permission of a request that has not been performed
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.half_open_max_calls:
+                    self._close()
+                else:
+                    self._half_open_calls -= 1
+            else:
+                self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open()
+            elif self._state == self.CLOSED:
+                self._outcomes.append(False)
+                if len(self._outcomes) >= self.minimum_calls and self._get_failure_rate() >= self.failure_rate_threshold:
+                    self._open()
+
+    @staticmethod
+    def is_failure(response: Response) -> bool:
+        """
+        Whether the response shows that the component is failing
+        """
+        return response.status_code >= 500
+
+    @staticmethod
+    def is_failure_error(error: BaseException, transport_errors: Optional[Tuple[type, ...]] = None) -> bool:
+        """
+        Whether the error of a request shows that the component is failing: only the transport errors and the server errors count,
+        the errors raised on the client side (such as an expired refresh token, missing credentials or a client side rate limit) do not
+
+        Args:
+            error: the error of the request
+            transport_errors: the transport errors of the client, by default the connection errors and timeouts of requests
+        """
+        if isinstance(error, transport_errors if transport_errors is not None else (requests.ConnectionError, requests.Timeout)):
+            return True
+        return isinstance(error, ApiException) and not isinstance(error, CircuitOpenError) and error.http_status_code >= 500
+
+    def call(self, request: Callable[[], Response]) -> Response:
+        """
+        Perform a request through the circuit breaker, recording its outcome.
+        The requests that failed on the client side are not recorded, and their permission is released.
+
+        Raises:
+            CircuitOpenError: if the circuit does not allow the request
+        """
+        self.allow_request()
+        recorded = False
+        try:
+            response = request()
+            if self.is_failure(response):
+                self.record_failure()
+            else:
+                self.record_success()
+            recorded = True
+            return response
+        except Exception as e:
+            if self.is_failure_error(e):
+                self.record_failure()
+                recorded = True
+            raise
+        finally:
+            if not recorded:
+                self.release()
+
+    async def call_async(self, request: Callable[[], Awaitable], transport_errors: Optional[Tuple[type, ...]] = None):
+        """
+        Perform an asynchronous request through the circuit breaker, recording its outcome.
+        The requests that failed on the client side are not recorded, and their permission is released.
+
+        Args:
+            request: the function returning the awaitable performing the request
+            transport_errors: the transport errors of the client, by default the connection errors and timeouts of requests
+
+        Raises:
+            CircuitOpenError: if the circuit does not allow the request
+        """
+        self.allow_request()
+        recorded = False
+        try:
+            response = await request()
+            if self.is_failure(response):
+                self.record_failure()
+            else:
+                self.record_success()
+            recorded = True
+            return response
+        except Exception as e:
+            if self.is_failure_error(e, transport_errors=transport_errors):
+                self.record_failure()
+                recorded = True
+            raise
+        finally:
+            if not recorded:
+                self.release()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._close()
+
+    def to_repr(self) -> dict:
+        with self._lock:
+            self._update_state()
+            return {
+                "name": self.name,
+                "state": self._state,
+                "failureRate": self._get_failure_rate(),
+                "calls": len(self._outcomes),
+                "openedAt": self._opened_at
+            }
+
+
+class CircuitBreakerRegistry:
+
+    def __init__(self, **kwargs) -> None:
+        """
+        The circuit breakers of the components, one for each base url
+
+        Args:
+            **kwargs: the settings of the created circuit breakers
+        """
+        self._settings = kwargs
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of a component, creating it if it does not exist yet
+
+        Args:
+            name: the name of the component, usually its base url
+        """
+        with self._lock:
+            circuit_breaker = self._circuit_breakers.get(name)
+            if circuit_breaker is None:
+                circuit_breaker = CircuitBreaker(name, **self._settings)
+                self._circuit_breakers[name] = circuit_breaker
+            return circuit_breaker
+
+    def get_states(self) -> Dict[str, str]:
+        """
+        Get the state of the circuit of each component
+        """
+        with self._lock:
+            circuit_breakers = list(self._circuit_breakers.values())
+        return {circuit_breaker.name: circuit_breaker.state for circuit_breaker in circuit_breakers}
+
+    def reset(self) -> None:
+        with self._lock:
+            circuit_breakers = list(self._circuit_breakers.values())
+        for circuit_breaker in circuit_breakers:
+            circuit_breaker.reset()
+
+
+default_circuit_breakers = CircuitBreakerRegistry()
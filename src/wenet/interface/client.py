@@ -1,20 +1,354 @@
 from __future__ import absolute_import, annotations
 
+import asyncio
+import gzip
 import logging
+import random
+import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Iterable, Iterator, Optional, Tuple, Union
 
 import requests
-from requests import Response
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 
 from wenet.interface.exceptions import RefreshTokenExpiredError
-from wenet.storage.cache import BaseCache, InMemoryCache
+from wenet.interface.rate_limiter import RateLimiter
+from wenet.storage.cache import BaseCache, BoundedInMemoryCache
+from wenet.utils import json_codec
 
 logger = logging.getLogger("wenet.interface.client")
 
 
+class CodecResponse(Response):
+    """
+    A response decoding its JSON body with the JSON codec of the package
+    """
+
+    def json(self, **kwargs):
+        if kwargs or (self.encoding is not None and self.encoding.lower().replace("-", "") != "utf8"):
+            return super().json(**kwargs)
+        return json_codec.loads(self.content)
+
+
+class RetryPolicy:
+
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+    RETRYABLE_STATUS_CODES = frozenset([429, 502, 503, 504])
+    RETRYABLE_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30,
+                 jitter: bool = True,
+                 retry_status_codes: Optional[Iterable[int]] = None,
+                 retry_methods: Optional[Iterable[str]] = None,
+                 respect_retry_after: bool = True,
+                 total_timeout: Optional[float] = None
+                 ) -> None:
+        """
+        A policy for retrying the requests that failed because of a transient error, waiting an exponential backoff between the attempts
+
+        Args:
+            max_attempts: the maximum number of attempts for a request, including the first one
+            backoff_factor: the backoff, in seconds, after the first failed attempt, doubled after each further failure
+            max_backoff: the maximum backoff, in seconds, between two attempts
+            jitter: whether to wait a random time between 0 and the backoff, so that clients failing together do not retry together
+            retry_status_codes: the status codes of the responses to retry, by default 429, 502, 503 and 504
+            retry_methods: the methods of the requests that can be retried, by default only the idempotent ones
+            respect_retry_after: whether to wait at least the time required by the Retry-After header of the response
+            total_timeout: the maximum number of seconds to spend on a request including all the attempts and backoffs, no limit if not specified
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes) if retry_status_codes is not None else self.RETRYABLE_STATUS_CODES
+        self.retry_methods = frozenset(method.upper() for method in retry_methods) if retry_methods is not None else self.IDEMPOTENT_METHODS
+        self.respect_retry_after = respect_retry_after
+        self.total_timeout = total_timeout
+
+    def is_retryable_method(self, method: str) -> bool:
+        return method.upper() in self.retry_methods
+
+    def is_retryable_response(self, response: Response) -> bool:
+        return response.status_code in self.retry_status_codes
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Get the time to wait after the given number of failed attempts
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def get_retry_after(response: Response) -> Optional[float]:
+        """
+        Get the number of seconds required by the Retry-After header of the response, if any
+        """
+        retry_after = response.headers.get("Retry-After") if response.headers else None
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring the invalid Retry-After header [{retry_after}]")
+            return None
+
+    def _get_delay(self, attempt: int, response: Optional[Response], deadline: Optional[float]) -> Optional[float]:
+        """
+        Get the time to wait before the next attempt, None if the request should not be attempted again
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.get_backoff(attempt)
+        if response is not None and self.respect_retry_after:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+        if deadline is not None and time.monotonic() + delay > deadline:
+            return None
+        return delay
+
+    def call(self, method: str, request: Callable[[], Response], retry_exceptions: Optional[Tuple[type, ...]] = None) -> Response:
+        """
+        Perform a request, attempting it again as long as it fails with a transient error and the policy allows it
+
+        Args:
+            method: the method of the request
+            request: the function performing the request
+            retry_exceptions: the exceptions to be considered transient errors, by default the connection errors and timeouts of requests
+
+        Returns:
+            the response of the last attempt
+        """
+        if not self.is_retryable_method(method):
+            return request()
+
+        retry_exceptions = retry_exceptions if retry_exceptions is not None else self.RETRYABLE_EXCEPTIONS
+        deadline = time.monotonic() + self.total_timeout if self.total_timeout is not None else None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = request()
+            except retry_exceptions as e:
+                delay = self._get_delay(attempt, None, deadline)
+                if delay is None:
+                    raise
+                logger.warning(f"Attempt [{attempt}] of a {method} request failed with [{e}], retrying in [{delay:.2f}] seconds")
+            else:
+                if not self.is_retryable_response(response):
+                    return response
+                delay = self._get_delay(attempt, response, deadline)
+                if delay is None:
+                    return response
+                logger.warning(f"Attempt [{attempt}] of a {method} request returned a code [{response.status_code}], retrying in [{delay:.2f}] seconds")
+            time.sleep(delay)
+
+    async def call_async(self, method: str, request: Callable[[], Awaitable], retry_exceptions: Optional[Tuple[type, ...]] = None):
+        """
+        Perform an asynchronous request, attempting it again as long as it fails with a transient error and the policy allows it
+
+        Args:
+            method: the method of the request
+            request: the function returning the awaitable performing the request
+            retry_exceptions: the exceptions to be considered transient errors
+
+        Returns:
+            the response of the last attempt
+        """
+        if not self.is_retryable_method(method):
+            return await request()
+
+        retry_exceptions = retry_exceptions if retry_exceptions is not None else self.RETRYABLE_EXCEPTIONS
+        deadline = time.monotonic() + self.total_timeout if self.total_timeout is not None else None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await request()
+            except retry_exceptions as e:
+                delay = self._get_delay(attempt, None, deadline)
+                if delay is None:
+                    raise
+                logger.warning(f"Attempt [{attempt}] of a {method} request failed with [{e}], retrying in [{delay:.2f}] seconds")
+            else:
+                if not self.is_retryable_response(response):
+                    return response
+                delay = self._get_delay(attempt, response, deadline)
+                if delay is None:
+                    return response
+                logger.warning(f"Attempt [{attempt}] of a {method} request returned a code [{response.status_code}], retrying in [{delay:.2f}] seconds")
+            await asyncio.sleep(delay)
+
+
 class RestClient(ABC):
 
+    def __init__(self,
+                 session: Optional[Session] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 request_compression: Optional[str] = None,
+                 request_compression_threshold: int = 64 * 1024
+                 ) -> None:
+        """
+        Create a new rest client backed by a pool of persistent connections
+
+        Args:
+            session: an existing session to share among several clients, if not specified a dedicated one is going to be created (and closed together with the client)
+            pool_connections: the number of per-host connection pools to keep
+            pool_maxsize: the maximum number of connections to keep open towards the same host
+            pool_block: whether the requests should wait for a free connection when the pool is full instead of opening a throwaway one
+            keep_alive: whether the connections should be kept open between the requests
+            retry_policy: the policy for retrying the requests failed because of transient errors, by default the requests are not retried
+            rate_limiter: the rate limiter for the requests, including the retried ones, by default the requests are not limited
+            request_compression: the content coding (gzip or deflate) for compressing the large request bodies, by default the bodies are not compressed since the server has to support it
+            request_compression_threshold: the size in bytes above which the request bodies are compressed
+        """
+        self._retry_policy = retry_policy
+        self._retry_policy_overrides = threading.local()
+        self._rate_limiter = rate_limiter
+        self._request_compression = request_compression
+        self._request_compression_threshold = request_compression_threshold
+        if session is not None:
+            self._session = session
+            self._owns_session = False
+        else:
+            self._session = self.build_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block, keep_alive=keep_alive)
+            self._owns_session = True
+
+    @staticmethod
+    def build_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True) -> Session:
+        """
+        Build a session with a pool of connections mounted for both http and https
+
+        Args:
+            pool_connections: the number of per-host connection pools to keep
+            pool_maxsize: the maximum number of connections to keep open towards the same host
+            pool_block: whether the requests should wait for a free connection when the pool is full instead of opening a throwaway one
+            keep_alive: whether the connections should be kept open between the requests
+
+        Returns:
+            the session
+        """
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @property
+    def session(self) -> Session:
+        return self._session
+
+    def close(self) -> None:
+        """
+        Release the connections of the client, a shared session is left open for the other clients using it
+        """
+        if getattr(self, "_owns_session", False):
+            self._session.close()
+
+    def __enter__(self) -> RestClient:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @contextmanager
+    def override_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> Iterator[None]:
+        """
+        Replace the retry policy of the client for the requests performed by the current thread within the context,
+        so that a component interface retrying its requests with its own policy does not retry each of its attempts again
+
+        Args:
+            retry_policy: the retry policy of the requests, None for not retrying them
+        """
+        overrides = getattr(self._retry_policy_overrides, "policies", None)
+        if overrides is None:
+            overrides = []
+            self._retry_policy_overrides.policies = overrides
+        overrides.append(retry_policy)
+        try:
+            yield
+        finally:
+            overrides.pop()
+
+    @staticmethod
+    def compress(data: bytes, compression: str, level: int = 6) -> bytes:
+        """
+        Compress a request body
+
+        Args:
+            data: the body to compress
+            compression: the content coding, either gzip or deflate
+            level: the compression level, from 1 (fastest) to 9 (smallest)
+
+        Returns:
+            the compressed body
+        """
+        if compression == "gzip":
+            return gzip.compress(data, compresslevel=level)
+        if compression == "deflate":
+            return zlib.compress(data, level)
+        raise ValueError(f"Unsupported request compression [{compression}], supported ones are gzip and deflate")
+
+    @staticmethod
+    def _prepare_request(body: Optional[Union[dict, list]],
+                         headers: Optional[dict],
+                         compression: Optional[str] = None,
+                         compression_threshold: Optional[int] = None
+                         ) -> Tuple[Optional[bytes], dict]:
+        """
+        Encode the body with the JSON codec, and compress it if larger than the threshold, once, so that it is not encoded again when the request is retried
+        """
+        headers = dict(headers) if headers else {}
+        header_names = {header.lower() for header in headers}
+        if body is None:
+            return None, headers
+
+        if "content-type" not in header_names:
+            headers["Content-Type"] = "application/json"
+        data = json_codec.dumps(body)
+        if compression is not None and compression_threshold is not None and len(data) >= compression_threshold:
+            data = RestClient.compress(data, compression)
+            headers["Content-Encoding"] = compression
+        return data, headers
+
+    def _send(self, method: str, url: str, body: Optional[Union[dict, list]] = None, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
+        data, headers = self._prepare_request(body, headers, compression=self._request_compression, compression_threshold=self._request_compression_threshold)
+
+        def request() -> Response:
+            if self._rate_limiter is not None:
+                self._rate_limiter.check(method, url)
+            response = self._session.request(method, url, data=data, params=query_params, headers=headers)
+            if type(response) is Response:
+                response.__class__ = CodecResponse
+            return response
+
+        overrides = getattr(self._retry_policy_overrides, "policies", None)
+        retry_policy = overrides[-1] if overrides else self._retry_policy
+        if retry_policy is not None:
+            return retry_policy.call(method, request)
+        return request()
+
     @abstractmethod
     def get_authentication(self, *args) -> dict:
         pass
@@ -46,31 +380,33 @@ class NoAuthenticationClient(RestClient):
         pass
 
     def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
-        return requests.post(url, json=body, headers=headers)
+        return self._send("POST", url, body=body, headers=headers)
 
     def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
-        return requests.get(url, params=query_params, headers=headers)
+        return self._send("GET", url, query_params=query_params, headers=headers)
 
     def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
-        return requests.put(url, json=body, headers=headers)
+        return self._send("PUT", url, body=body, headers=headers)
 
     def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
-        return requests.patch(url, json=body, headers=headers)
+        return self._send("PATCH", url, body=body, headers=headers)
 
     def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
-        return requests.delete(url, params=query_params, headers=headers)
+        return self._send("DELETE", url, query_params=query_params, headers=headers)
 
 
 class ApikeyClient(RestClient):
 
-    def __init__(self, apikey: str, component_authorization_apikey_header: str = "x-wenet-component-apikey") -> None:
+    def __init__(self, apikey: str, component_authorization_apikey_header: str = "x-wenet-component-apikey", **kwargs) -> None:
         """
         Create a new apikey client
 
         Args:
             apikey: the apikey to authenticate the requests
             component_authorization_apikey_header: the component authorization header for the apikey
+            **kwargs: the connection pool and retry settings accepted by RestClient
         """
+        super().__init__(**kwargs)
         self._apikey = apikey
         self._component_authorization_apikey_header = component_authorization_apikey_header
 
@@ -85,7 +421,7 @@ class ApikeyClient(RestClient):
 
         headers.update(self.get_authentication())
 
-        return requests.post(url, json=body, headers=headers)
+        return self._send("POST", url, body=body, headers=headers)
 
     def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
         if headers is None:
@@ -93,7 +429,7 @@ class ApikeyClient(RestClient):
 
         headers.update(self.get_authentication())
 
-        return requests.get(url, params=query_params, headers=headers)
+        return self._send("GET", url, query_params=query_params, headers=headers)
 
     def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
         if headers is None:
@@ -101,7 +437,7 @@ class ApikeyClient(RestClient):
 
         headers.update(self.get_authentication())
 
-        return requests.put(url, json=body, headers=headers)
+        return self._send("PUT", url, body=body, headers=headers)
 
     def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
         if headers is None:
@@ -109,7 +445,7 @@ class ApikeyClient(RestClient):
 
         headers.update(self.get_authentication())
 
-        return requests.patch(url, json=body, headers=headers)
+        return self._send("PATCH", url, body=body, headers=headers)
 
     def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
         if headers is None:
@@ -117,52 +453,119 @@ class ApikeyClient(RestClient):
 
         headers.update(self.get_authentication())
 
-        return requests.delete(url, params=query_params, headers=headers)
+        return self._send("DELETE", url, query_params=query_params, headers=headers)
 
 
 class Oauth2Client(RestClient):
 
     class ClientCredentials:
 
-        def __init__(self, access_token: str, refresh_token: str):
+        def __init__(self, access_token: str, refresh_token: str, expires_at: Optional[float] = None):
+            """
+            The credentials of an oauth2 client
+
+            Args:
+                access_token: the access token
+                refresh_token: the refresh token
+                expires_at: the timestamp (in seconds) when the access token expires, if known
+            """
             self.access_token = access_token
             self.refresh_token = refresh_token
+            self.expires_at = expires_at
+
+        def is_expiring(self, margin: float) -> bool:
+            """
+            Check whether the access token expires within the given margin, a token without a known expiration never expires
+            """
+            return self.expires_at is not None and time.time() >= self.expires_at - margin
 
         def to_repr(self) -> dict:
-            return {
+            raw_credentials = {
                 "accessToken": self.access_token,
                 "refreshToken": self.refresh_token
             }
+            if self.expires_at is not None:
+                raw_credentials["expiresAt"] = self.expires_at
+            return raw_credentials
 
         @staticmethod
         def from_repr(raw_data: dict) -> Oauth2Client.ClientCredentials:
-            return Oauth2Client.ClientCredentials(raw_data["accessToken"], raw_data["refreshToken"])
+            return Oauth2Client.ClientCredentials(raw_data["accessToken"], raw_data["refreshToken"], raw_data.get("expiresAt"))
+
+        @staticmethod
+        def from_token_response(raw_data: dict) -> Oauth2Client.ClientCredentials:
+            """
+            Build the credentials from the body returned by the oauth2 token endpoint
+            """
+            expires_in = raw_data.get("expires_in")
+            return Oauth2Client.ClientCredentials(raw_data["access_token"], raw_data["refresh_token"], time.time() + expires_in if expires_in is not None else None)
+
+    REFRESH_LOCK_STRIPES = 64
+    _refresh_locks = [threading.Lock() for _ in range(REFRESH_LOCK_STRIPES)]
 
     def __init__(self, client_id: str, client_secret: str, resource_id: str, cache: Optional[BaseCache] = None,
-                 token_endpoint_url: str = "https://internetofus.u-hopper.com/prod/api/oauth2/token"):
+                 token_endpoint_url: str = "https://internetofus.u-hopper.com/prod/api/oauth2/token",
+                 refresh_margin: float = 60, refresh_lock_timeout: float = 30, credentials_memo_ttl: float = 30, **kwargs):
         """
-        Create a new oauth2 client
+        Create a new oauth2 client.
+        Concurrent refreshes of the same resource are coalesced into a single call to the token endpoint, both among the threads of the process
+        and, when the cache supports locking (e.g. the RedisCache), among all the processes sharing the cache.
+        The credentials are memoized in the client for a short time, so that the cache is not read on every request:
+        the memo is replaced after each refresh and discarded as soon as the platform rejects the token.
 
         Args:
             client_id: the identifier of the client
             client_secret: the client secret
             resource_id: the identifier of the resource
-            cache: a cache to be used for storing client credentials, if not specified dedicated in memory cache is going to be used
+            cache: a cache to be used for storing client credentials, if not specified a dedicated BoundedInMemoryCache is going to be used
             token_endpoint_url: the oauth2 token endpoint URL of the platform
+            refresh_margin: how many seconds before its expiration the access token is proactively refreshed
+            refresh_lock_timeout: the maximum number of seconds the lock shared by the processes refreshing the token is held
+            credentials_memo_ttl: for how many seconds the credentials read from the cache are reused, 0 to always read them from the cache
+            **kwargs: the connection pool and retry settings accepted by RestClient
         """
+        super().__init__(**kwargs)
         self.token_endpoint_url = token_endpoint_url
-        self._cache = cache if cache and isinstance(cache, BaseCache) else InMemoryCache()
+        self._cache = cache if cache and isinstance(cache, BaseCache) else BoundedInMemoryCache()
         self._resource_id = resource_id
         self._client_id = client_id
         self._client_secret = client_secret
+        self._refresh_margin = refresh_margin
+        self._refresh_lock_timeout = refresh_lock_timeout
+        self._credentials_memo_ttl = credentials_memo_ttl
+        self._credentials_memo: Optional[Tuple[Oauth2Client.ClientCredentials, float]] = None
+
+    @classmethod
+    def _refresh_lock_for(cls, resource_id: str) -> threading.Lock:
+        """
+        Get the lock of the refreshes of a resource among the threads of the process, one of a fixed set of locks so that the locks do not grow with the number of resources
+        """
+        return cls._refresh_locks[hash(resource_id) % len(cls._refresh_locks)]
 
     @property
     def _client_credential(self) -> Oauth2Client.ClientCredentials:
+        memo = self._credentials_memo
+        if memo is not None and time.monotonic() < memo[1]:
+            return memo[0]
+        return self._load_client_credential()
+
+    def _load_client_credential(self) -> Oauth2Client.ClientCredentials:
         raw_credentials = self._cache.get(self._resource_id)
         if raw_credentials is not None:
-            return Oauth2Client.ClientCredentials.from_repr(raw_credentials)
+            credentials = Oauth2Client.ClientCredentials.from_repr(raw_credentials)
+            self._memoize_client_credential(credentials)
+            return credentials
         raise Exception(f"Credentials for resource [{self._resource_id}] do not exist")
 
+    def _memoize_client_credential(self, credentials: Oauth2Client.ClientCredentials) -> None:
+        """
+        Memoize the credentials, never beyond the moment they should be proactively refreshed
+        """
+        memo_ttl = self._credentials_memo_ttl
+        if credentials.expires_at is not None:
+            memo_ttl = min(memo_ttl, credentials.expires_at - self._refresh_margin - time.time())
+        self._credentials_memo = (credentials, time.monotonic() + memo_ttl) if memo_ttl > 0 else None
+
     @property
     def token(self) -> str:
         return self._client_credential.access_token
@@ -173,7 +576,7 @@ class Oauth2Client(RestClient):
 
     @staticmethod
     def initialize_with_code(client_id: str, client_secret: str, code: str, redirect_url: str, resource_id: str, cache: BaseCache,
-                             token_endpoint_url: str = "https://internetofus.u-hopper.com/prod/api/oauth2/token") -> Oauth2Client:
+                             token_endpoint_url: str = "https://internetofus.u-hopper.com/prod/api/oauth2/token", **kwargs) -> Oauth2Client:
         """
         Initialize a new oauth2 client with code
 
@@ -185,37 +588,49 @@ class Oauth2Client(RestClient):
             resource_id: the identifier of the resource
             cache: a cache
             token_endpoint_url: the oauth2 token endpoint URL of the platform
+            **kwargs: the other settings accepted by the Oauth2Client
 
         Returns:
             an oauth2 client
         """
-        client = Oauth2Client(client_id, client_secret, resource_id, cache, token_endpoint_url=token_endpoint_url)
+        client = Oauth2Client(client_id, client_secret, resource_id, cache, token_endpoint_url=token_endpoint_url, **kwargs)
         client._initialize(code, redirect_url)
         return client
 
-    def refresh_access_token(self) -> None:
-        logger.info(f"Refresh token for client [{self._client_id}]")
-        body = {
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "grant_type": "refresh_token",
-            "refresh_token": self.refresh_token
-        }
+    def refresh_access_token(self, stale_token: Optional[str] = None) -> None:
+        """
+        Refresh the access token.
+        Only one refresh at a time is performed for the resource, a refresh waiting for another one to complete is skipped
+        if the stale token has been replaced in the meanwhile.
 
-        response = requests.post(self.token_endpoint_url, json=body)
-        logger.debug(f"Refresh token endpoint returned a code [{response.status_code}]")
-        logger.debug(f"Refresh token endpoint returned: {response.text}")
-        if response.status_code == 200:
-            body = response.json()
-            refresh_token = body["refresh_token"]
-            token = body["access_token"]
+        Args:
+            stale_token: the access token that needs to be replaced, if not specified the token is always refreshed
+        """
+        with self._refresh_lock_for(self._resource_id), self._cache.lock(self._resource_id, timeout=self._refresh_lock_timeout):
+            credentials = self._load_client_credential()
+            if stale_token is not None and credentials.access_token != stale_token:
+                logger.debug(f"Oauth2 token for resource [{self._resource_id}] already refreshed")
+                return
+
+            logger.info(f"Refresh token for client [{self._client_id}]")
+            body = {
+                "client_id": self._client_id,
+                "client_secret": self._client_secret,
+                "grant_type": "refresh_token",
+                "refresh_token": credentials.refresh_token
+            }
 
-            credentials = Oauth2Client.ClientCredentials(token, refresh_token)
-            self._cache.cache(data=credentials.to_repr(), key=self._resource_id)
-            logger.info(f"Refreshed oauth2 token for resource [{self._resource_id}]")
-        else:
-            logger.error(f"Unable to refresh the token for client ID [{self._client_id}]")
-            raise RefreshTokenExpiredError("Unable to refresh the token")
+            response = self._session.post(self.token_endpoint_url, json=body)
+            logger.debug(f"Refresh token endpoint returned a code [{response.status_code}]")
+            logger.debug(f"Refresh token endpoint returned: {response.text}")
+            if response.status_code == 200:
+                credentials = Oauth2Client.ClientCredentials.from_token_response(response.json())
+                self._cache.cache(data=credentials.to_repr(), key=self._resource_id)
+                self._memoize_client_credential(credentials)
+                logger.info(f"Refreshed oauth2 token for resource [{self._resource_id}]")
+            else:
+                logger.error(f"Unable to refresh the token for client ID [{self._client_id}]")
+                raise RefreshTokenExpiredError("Unable to refresh the token")
 
     def _initialize(self, code: str, redirect_url: str):
         body = {
@@ -226,15 +641,11 @@ class Oauth2Client(RestClient):
             "code": code
         }
 
-        response = requests.post(self.token_endpoint_url, json=body)
+        response = self._session.post(self.token_endpoint_url, json=body)
         if response.status_code == 200:
-            body = response.json()
-            refresh_token = body["refresh_token"]
-            token = body["access_token"]
-
-            client_credentials = Oauth2Client.ClientCredentials(token, refresh_token)
-
+            client_credentials = Oauth2Client.ClientCredentials.from_token_response(response.json())
             self._cache.cache(data=client_credentials.to_repr(), key=self._resource_id)
+            self._memoize_client_credential(client_credentials)
         else:
             raise Exception(f"Unable to retrieve the token, server respond with: [{response.status_code}], [{response.text}]")
 
@@ -244,97 +655,37 @@ class Oauth2Client(RestClient):
             "authorization": f"bearer {token}"
         }
 
-    def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
+    def _authenticated_request(self, method: str, url: str, body: Optional[Union[dict, list]] = None, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
         if headers is None:
             headers = {}
 
-        def post_request(client: Optional, retry: bool):
-            logger.debug(f"Performing post request with token {client.token} {client.refresh_token}")
-            headers.update(client.get_authentication(client.token))
-            response = requests.post(url, json=body, headers=headers)
-            if response.status_code in [400, 401, 403]:
-                if retry:
-                    client.refresh_access_token()
-                    return post_request(client, False)
-                else:
-                    return response
-            else:
-                return response
+        credentials = self._client_credential
+        if credentials.is_expiring(self._refresh_margin):
+            self.refresh_access_token(stale_token=credentials.access_token)
+            credentials = self._client_credential
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Performing {method.lower()} request with token {credentials.access_token} {credentials.refresh_token}")
+        headers.update(self.get_authentication(credentials.access_token))
+        response = self._send(method, url, body=body, query_params=query_params, headers=headers)
+        if response.status_code in [400, 401, 403]:
+            self._credentials_memo = None
+            self.refresh_access_token(stale_token=credentials.access_token)
+            headers.update(self.get_authentication(self.token))
+            response = self._send(method, url, body=body, query_params=query_params, headers=headers)
+        return response
 
-        return post_request(self, True)
+    def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
+        return self._authenticated_request("POST", url, body=body, headers=headers)
 
     def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
-        if headers is None:
-            headers = {}
-
-        def get_request(client: Optional, retry: bool):
-            logger.debug(f"Performing get request with token {client.token} {client.refresh_token}")
-            headers.update(client.get_authentication(client.token))
-            response = requests.get(url, params=query_params, headers=headers)
-            if response.status_code in [400, 401, 403]:
-                if retry:
-                    client.refresh_access_token()
-                    return get_request(client, False)
-                else:
-                    return response
-            else:
-                return response
-
-        return get_request(self, True)
+        return self._authenticated_request("GET", url, query_params=query_params, headers=headers)
 
     def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
-        if headers is None:
-            headers = {}
-
-        def put_request(client: Optional, retry: bool):
-            logger.debug(f"Performing put request with token {client.token} {client.refresh_token}")
-            headers.update(client.get_authentication(client.token))
-            response = requests.put(url, json=body, headers=headers)
-            if response.status_code in [400, 401, 403]:
-                if retry:
-                    self.refresh_access_token()
-                    return put_request(client, False)
-                else:
-                    return response
-            else:
-                return response
-
-        return put_request(self, True)
+        return self._authenticated_request("PUT", url, body=body, headers=headers)
 
     def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
-        if headers is None:
-            headers = {}
-
-        def patch_request(client: Optional, retry: bool):
-            logger.debug(f"Performing patch request with token {client.token} {client.refresh_token}")
-            headers.update(client.get_authentication(client.token))
-            response = requests.patch(url, json=body, headers=headers)
-            if response.status_code in [400, 401, 403]:
-                if retry:
-                    self.refresh_access_token()
-                    return patch_request(client, False)
-                else:
-                    return response
-            else:
-                return response
-
-        return patch_request(self, True)
+        return self._authenticated_request("PATCH", url, body=body, headers=headers)
 
     def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
-        if headers is None:
-            headers = {}
-
-        def delete_request(client: Optional, retry: bool):
-            logger.debug(f"Performing delete request with token {client.token} {client.refresh_token}")
-            headers.update(client.get_authentication(client.token))
-            response = requests.delete(url, params=query_params, headers=headers)
-            if response.status_code in [400, 401, 403]:
-                if retry:
-                    client.refresh_access_token()
-                    return delete_request(client, False)
-                else:
-                    return response
-            else:
-                return response
-
-        return delete_request(self, True)
+        return self._authenticated_request("DELETE", url, query_params=query_params, headers=headers)
@@ -0,0 +1,94 @@
+from __future__ import absolute_import, annotations
+
+import functools
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger("wenet.interface.coalescer")
+
+
+class _InFlightCall:
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Coalesce identical concurrent calls, so that only the first one is actually performed and the others wait for its outcome.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Call the function, unless an identical call is already in progress, in which case its outcome is shared
+
+        Args:
+            key: the key identifying identical calls
+            function: the function to call
+
+        Returns:
+            the result of the function, shared among all the identical calls
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+
+        if not is_leader:
+            logger.debug(f"Waiting for the in-flight call [{key}]")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def coalesced(method: Callable) -> Callable:
+    """
+    Coalesce the identical concurrent calls of a read method of a component interface, if the interface coalesces the requests.
+    The calls are identical when they have the same arguments and are performed with the same client, therefore with the same authentication.
+    The result, including the decoded model, is shared among the identical calls and should not be modified.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        coalescer = getattr(self, "_coalescer", None)
+        if coalescer is None:
+            return method(self, *args, **kwargs)
+
+        try:
+            key = (method.__name__, id(self._client), _freeze(args), _freeze(kwargs))
+        except TypeError:
+            return method(self, *args, **kwargs)
+        return coalescer.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
@@ -2,20 +2,151 @@ from __future__ import absolute_import, annotations
 
 import logging
 from abc import ABC
-from typing import Optional
+from typing import Any, Callable, ContextManager, Iterable, Optional, Union
 
 from requests import Response
 
-from wenet.interface.client import RestClient
+from wenet.interface.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from wenet.interface.client import RestClient, RetryPolicy
+from wenet.interface.coalescer import RequestCoalescer
+from wenet.interface.rate_limiter import RateLimiter
 from wenet.interface.exceptions import AuthenticationException, NotFound, BadRequest, BadGateway, ApiException
 
 logger = logging.getLogger("wenet.interface.component")
 
 
-class ComponentInterface(ABC):
+class ComponentClient(RestClient):
 
-    def __init__(self, client: RestClient, base_url: str, extra_headers: Optional[dict] = None) -> None:
-        self._client = client
+    def __init__(self,
+                 client: RestClient,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[RateLimiter] = None
+                 ) -> None:
+        """
+        A client applying the policies of a component interface to the requests performed through another client
+
+        Args:
+            client: the client actually performing the requests
+            retry_policy: the policy for retrying the requests of the component failed because of transient errors, replacing the one of the client
+            circuit_breaker: the circuit breaker failing fast the requests while the component is degraded
+            rate_limiter: the rate limiter for the requests of the component
+        """
+        self.client = client
+        self._retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+
+    def __getattr__(self, name: str):
+        if name in ["client", "circuit_breaker", "rate_limiter"]:
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @property
+    def session(self):
+        return self.client.session
+
+    def close(self) -> None:
+        self.client.close()
+
+    def override_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> ContextManager:
+        return self.client.override_retry_policy(retry_policy)
+
+    def _perform(self, method: str, url: str, request: Callable[[], Response]) -> Response:
+        def limited_request() -> Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.check(method, url)
+            return request()
+
+        def attempt() -> Response:
+            if self._retry_policy is not None:
+                with self.client.override_retry_policy(None):
+                    return self._retry_policy.call(method, limited_request)
+            return limited_request()
+
+        if self.circuit_breaker is not None:
+            return self.circuit_breaker.call(attempt)
+        return attempt()
+
+    def get_authentication(self, *args) -> dict:
+        return self.client.get_authentication(*args)
+
+    def post(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
+        return self._perform("POST", url, lambda: self.client.post(url, body, headers=headers))
+
+    def get(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
+        return self._perform("GET", url, lambda: self.client.get(url, query_params=query_params, headers=headers))
+
+    def put(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
+        return self._perform("PUT", url, lambda: self.client.put(url, body, headers=headers))
+
+    def patch(self, url: str, body: Union[dict, list], headers: Optional[dict] = None) -> Response:
+        return self._perform("PATCH", url, lambda: self.client.patch(url, body, headers=headers))
+
+    def delete(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
+        return self._perform("DELETE", url, lambda: self.client.delete(url, query_params=query_params, headers=headers))
+
+
+class ComponentRequest:
+
+    BODY_METHODS = frozenset(["POST", "PUT", "PATCH"])
+
+    def __init__(self,
+                 method: str,
+                 url: str,
+                 headers: dict,
+                 query_params: Optional[dict] = None,
+                 body: Optional[Union[dict, list]] = None,
+                 success_codes: Iterable[int] = (200,),
+                 parse: Optional[Callable[[Any], Any]] = None
+                 ) -> None:
+        """
+        A request to a component, built and parsed in the same way by the synchronous and the asynchronous interfaces, which only perform it
+
+        Args:
+            method: the method of the request
+            url: the URL of the request
+            headers: the headers of the request
+            query_params: the query parameters of the request, the ones set to None are dropped
+            body: the body of the request, for the POST, PUT and PATCH requests
+            success_codes: the status codes of the successful responses
+            parse: the function building the result of the request from the JSON content of a successful response, by default the result is None
+        """
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.query_params = {key: value for key, value in query_params.items() if value is not None} if query_params is not None else None
+        self.body = body
+        self.success_codes = success_codes
+        self.parse = parse
+
+    def send(self, client: Any) -> Any:
+        """
+        Send the request with a client
+
+        Args:
+            client: a RestClient or an AsyncRestClient
+
+        Returns:
+            the response, or an awaitable of the response if the client is asynchronous
+        """
+        send = getattr(client, self.method.lower())
+        if self.method in self.BODY_METHODS:
+            return send(self.url, self.body, headers=self.headers)
+        return send(self.url, query_params=self.query_params, headers=self.headers)
+
+
+class BaseComponentInterface(ABC):
+
+    def __init__(self, base_url: str, extra_headers: Optional[dict] = None) -> None:
+        """
+        The part of the interfaces for the components of the platform shared by the synchronous and the asynchronous ones:
+        the requests are built, and their responses parsed, here, while the subclasses only perform them
+
+        Args:
+            base_url: the URL of the component
+            extra_headers: extra headers to add to all the requests with a body
+        """
         self._base_url = base_url
 
         self._base_headers = {
@@ -31,6 +162,34 @@ class ComponentInterface(ABC):
         if extra_headers:
             self._json_body_headers.update(extra_headers)
 
+    def _get_headers(self, headers: Optional[dict], json_body: bool = False) -> dict:
+        """
+        Add the default headers, the ones of the requests with a body if json_body, to the headers of a request
+        """
+        default_headers = self._json_body_headers if json_body else self._base_headers
+        if headers is not None:
+            headers.update(default_headers)
+            return headers
+        return default_headers
+
+    @staticmethod
+    def _fetch_page(get_page: Callable, offset: int, limit: Optional[int], headers: Optional[dict] = None, **kwargs):
+        """
+        Fetch a page of a listing with a copy of the headers, since the methods getting a page update them and the pages could be fetched concurrently
+        """
+        return get_page(offset=offset, limit=limit, headers=dict(headers) if headers is not None else None, **kwargs)
+
+    def _get_result(self, request: ComponentRequest, response: Any) -> Any:
+        """
+        Get the result of a request from its response
+
+        Raises:
+            ApiException: if the status code of the response is not a successful one
+        """
+        if response.status_code in request.success_codes:
+            return request.parse(response.json()) if request.parse is not None else None
+        raise self.get_api_exception_for_response(response)
+
     @staticmethod
     def get_api_exception_for_response(response: Response) -> ApiException:
         if response.status_code in [401, 403]:
@@ -43,3 +202,54 @@ class ComponentInterface(ABC):
             return BadGateway(response.text)
         else:
             return ApiException(response.status_code, response.text)
+
+
+class ComponentInterface(BaseComponentInterface):
+
+    def __init__(self,
+                 client: RestClient,
+                 base_url: str,
+                 extra_headers: Optional[dict] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 coalesce_requests: bool = False
+                 ) -> None:
+        """
+        Create a new interface for a component of the platform
+
+        Args:
+            client: the client performing the requests
+            base_url: the URL of the component
+            extra_headers: extra headers to add to all the requests
+            retry_policy: a policy for retrying the requests to this component, replacing the one of the client for its requests
+            circuit_breakers: the registry providing the circuit breaker of the component, by its base url
+            rate_limiter: a rate limiter for the requests to this component, in addition to the one of the client
+            coalesce_requests: whether the identical concurrent calls of the read methods should share a single request and its result
+        """
+        super().__init__(base_url, extra_headers)
+        circuit_breaker = circuit_breakers.get(base_url) if circuit_breakers is not None else None
+        if retry_policy is not None or circuit_breaker is not None or rate_limiter is not None:
+            client = ComponentClient(client, retry_policy=retry_policy, circuit_breaker=circuit_breaker, rate_limiter=rate_limiter)
+
+        self._client = client
+        self._coalescer = RequestCoalescer() if coalesce_requests else None
+
+    def _call(self, request: ComponentRequest) -> Any:
+        """
+        Perform a request and get its result
+        """
+        return self._get_result(request, request.send(self._client))
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        The circuit breaker of the component, if any
+        """
+        return self._client.circuit_breaker if isinstance(self._client, ComponentClient) else None
+
+    def close(self) -> None:
+        """
+        Release the connections of the client used by the interface
+        """
+        self._client.close()
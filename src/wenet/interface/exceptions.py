@@ -37,3 +37,19 @@ class RefreshTokenExpiredError(Exception):
 
     def __init__(self, *args) -> None:
         super().__init__(*args)
+
+
+class CircuitOpenError(ApiException):
+
+    def __init__(self, component: str, retry_in: float, status_code: int = 503) -> None:
+        self.component = component
+        self.retry_in = max(0.0, retry_in)
+        super().__init__(status_code, f"Circuit open for [{component}], retry in [{self.retry_in:.2f}] seconds")
+
+
+class RateLimitExceeded(ApiException):
+
+    def __init__(self, method: str, url: str, status_code: int = 429) -> None:
+        self.method = method
+        self.url = url
+        super().__init__(status_code, f"Client side rate limit exceeded for [{method} {url}]")
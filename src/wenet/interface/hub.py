@@ -4,7 +4,8 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 
-from wenet.interface.component import ComponentInterface
+from wenet.interface.coalescer import coalesced
+from wenet.interface.component import BaseComponentInterface, ComponentInterface, ComponentRequest
 from wenet.interface.client import RestClient
 from wenet.model.app import App
 
@@ -12,69 +13,49 @@ from wenet.model.app import App
 logger = logging.getLogger("wenet.interface.hub")
 
 
-class HubInterface(ComponentInterface):
+class BaseHubInterface(BaseComponentInterface):
+    """
+    The requests to the hub, shared by the synchronous and the asynchronous interfaces
+    """
 
-    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/hub/frontend", extra_headers: Optional[dict] = None) -> None:
-        base_url = platform_url + component_path
-        super().__init__(client, base_url, extra_headers)
-
-    def get_user_ids_for_app(self, app_id: str, from_datetime: Optional[datetime] = None, to_datetime: Optional[datetime] = None, headers: Optional[dict] = None) -> List[str]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def _get_user_ids_for_app_request(self, app_id: str, from_datetime: Optional[datetime], to_datetime: Optional[datetime], headers: Optional[dict]) -> ComponentRequest:
+        query_params = {
+            "fromTs": int(from_datetime.timestamp()) if from_datetime is not None else None,
+            "toTs": int(to_datetime.timestamp()) if to_datetime is not None else None
+        }
+        return ComponentRequest("GET", f"{self._base_url}/data/app/{app_id}/user", self._get_headers(headers, json_body=True), query_params=query_params, parse=lambda content: content)
 
-        query_params = {}
-        if from_datetime is not None:
-            query_params["fromTs"] = int(from_datetime.timestamp())
-        if to_datetime is not None:
-            query_params["toTs"] = int(to_datetime.timestamp())
+    def _get_app_details_request(self, app_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/data/app/{app_id}", self._get_headers(headers, json_body=True), parse=App.from_repr)
 
-        response = self._client.get(f"{self._base_url}/data/app/{app_id}/user", query_params=query_params, headers=headers)
+    def _get_app_developers_request(self, app_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/data/app/{app_id}/developer", self._get_headers(headers, json_body=True), parse=lambda content: content)
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+    def _get_user_ids_request(self, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/data/user", self._get_headers(headers, json_body=True), parse=lambda content: content)
 
-    def get_app_details(self, app_id: str, headers: Optional[dict] = None) -> App:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
 
-        response = self._client.get(f"{self._base_url}/data/app/{app_id}", headers=headers)
+class HubInterface(BaseHubInterface, ComponentInterface):
 
-        if response.status_code == 200:
-            return App.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/hub/frontend", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
 
-    def get_app_developers(self, app_id: str, headers: Optional[dict] = None) -> List[str]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    @coalesced
+    def get_user_ids_for_app(self, app_id: str, from_datetime: Optional[datetime] = None, to_datetime: Optional[datetime] = None, headers: Optional[dict] = None) -> List[str]:
+        return self._call(self._get_user_ids_for_app_request(app_id, from_datetime, to_datetime, headers))
 
-        response = self._client.get(f"{self._base_url}/data/app/{app_id}/developer", headers=headers)
+    @coalesced
+    def get_app_details(self, app_id: str, headers: Optional[dict] = None) -> App:
+        return self._call(self._get_app_details_request(app_id, headers))
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+    @coalesced
+    def get_app_developers(self, app_id: str, headers: Optional[dict] = None) -> List[str]:
+        return self._call(self._get_app_developers_request(app_id, headers))
 
+    @coalesced
     def get_user_ids(self, headers: Optional[dict] = None) -> List[str]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.get(f"{self._base_url}/data/user", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_ids_request(headers))
 
     # def delete_user(self, user_id: str, headers: Optional[dict] = None) -> None:
     #     if headers is not None:
@@ -3,40 +3,32 @@ from __future__ import absolute_import, annotations
 import logging
 from typing import Optional, List
 
-from wenet.interface.component import ComponentInterface
+from wenet.interface.component import BaseComponentInterface, ComponentInterface, ComponentRequest
 from wenet.interface.client import RestClient
 
 logger = logging.getLogger("wenet.interface.incentive_server")
 
 
-class IncentiveServerInterface(ComponentInterface):
+class BaseIncentiveServerInterface(BaseComponentInterface):
+    """
+    The requests to the incentive server, shared by the synchronous and the asynchronous interfaces
+    """
 
-    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/incentive_server", extra_headers: Optional[dict] = None) -> None:
-        base_url = platform_url + component_path
-        super().__init__(client, base_url, extra_headers)
+    def _get_cohorts_request(self, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/api/UsersCohorts/", self._get_headers(headers, json_body=True), parse=lambda content: content)
 
-    def get_cohorts(self, headers: Optional[dict] = None) -> List[dict]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def _delete_user_badges_request(self, user_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("DELETE", f"{self._base_url}/messages/Issued/{user_id}", self._get_headers(headers, json_body=True))
 
-        response = self._client.get(f"{self._base_url}/api/UsersCohorts/", headers=headers)
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+class IncentiveServerInterface(BaseIncentiveServerInterface, ComponentInterface):
 
-    def delete_user_badges(self, user_id: str, headers: Optional[dict] = None) -> None:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/incentive_server", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
 
-        response = self._client.delete(f"{self._base_url}/messages/Issued/{user_id}", headers=headers)
+    def get_cohorts(self, headers: Optional[dict] = None) -> List[dict]:
+        return self._call(self._get_cohorts_request(headers))
 
-        if response.status_code == 200:
-            return
-        else:
-            raise self.get_api_exception_for_response(response)
+    def delete_user_badges(self, user_id: str, headers: Optional[dict] = None) -> None:
+        self._call(self._delete_user_badges_request(user_id, headers))
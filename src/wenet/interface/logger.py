@@ -3,7 +3,7 @@ from __future__ import absolute_import, annotations
 import logging
 from typing import List, Optional
 
-from wenet.interface.component import ComponentInterface
+from wenet.interface.component import BaseComponentInterface, ComponentInterface, ComponentRequest
 from wenet.interface.client import RestClient
 from wenet.model.logging_message.message import BaseMessage
 
@@ -11,44 +11,37 @@ from wenet.model.logging_message.message import BaseMessage
 logger = logging.getLogger("wenet.interface.logger")
 
 
-class LoggerInterface(ComponentInterface):
+class BaseLoggerInterface(BaseComponentInterface):
+    """
+    The requests to the logger, shared by the synchronous and the asynchronous interfaces
+    """
 
-    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/logger", extra_headers: Optional[dict] = None) -> None:
-        base_url = platform_url + component_path
-        super().__init__(client, base_url, extra_headers)
+    def _post_messages_request(self, messages: List[BaseMessage], headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("POST", f"{self._base_url}/messages", self._get_headers(headers, json_body=True), body=[message.to_repr() for message in messages],
+                                success_codes=(200, 201), parse=lambda content: content["traceIds"])
+
+    def _delete_user_messages_request(self, user_id: Optional[str], message_id: Optional[str], project: Optional[str], trace_id: Optional[str], headers: Optional[dict]) -> ComponentRequest:
+        query_params = {
+            "userId": user_id,
+            "messageId": message_id,
+            "project": project,
+            "traceId": trace_id
+        }
+        return ComponentRequest("DELETE", f"{self._base_url}/messages", self._get_headers(headers, json_body=True), query_params=query_params, success_codes=(200, 201))
 
-    def post_messages(self, messages: List[BaseMessage], headers: Optional[dict] = None) -> List[str]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
 
-        response = self._client.post(f"{self._base_url}/messages", body=[message.to_repr() for message in messages], headers=headers)
+class LoggerInterface(BaseLoggerInterface, ComponentInterface):
+
+    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/logger", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
 
-        if response.status_code in [200, 201]:
-            return response.json()["traceIds"]
-        else:
-            raise self.get_api_exception_for_response(response)
+    def post_messages(self, messages: List[BaseMessage], headers: Optional[dict] = None) -> List[str]:
+        return self._call(self._post_messages_request(messages, headers))
 
     def delete_user_messages(self, user_id: Optional[str] = None,
                              message_id: Optional[str] = None,
                              project: Optional[str] = None,
                              trace_id: Optional[str] = None,
                              headers: Optional[dict] = None):
-
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        parmas = {
-            "userId": user_id,
-            "messageId": message_id,
-            "project": project,
-            "traceId": trace_id
-        }
-
-        response = self._client.delete(f"{self._base_url}/messages", query_params=parmas, headers=headers)
-
-        if response.status_code not in [200, 201]:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._delete_user_messages_request(user_id, message_id, project, trace_id, headers))
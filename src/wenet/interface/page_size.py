@@ -0,0 +1,141 @@
+from __future__ import absolute_import, annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+import requests
+
+from wenet.interface.exceptions import ApiException, CircuitOpenError
+
+logger = logging.getLogger("wenet.interface.page_size")
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+class AdaptivePageSize:
+
+    def __init__(self,
+                 initial_size: int = 100,
+                 min_size: int = 10,
+                 max_size: int = 1000,
+                 target_latency: float = 1.0,
+                 max_page_bytes: int = 1024 * 1024,
+                 max_growth: float = 2.0,
+                 get_size: Optional[Callable[[Any], Optional[int]]] = None
+                 ) -> None:
+        """
+        A controller of the page size of the paginated listings, tuned after each page from the observed latency, weight of the items and errors:
+        the page size is the largest one that is expected to be fetched within the target latency and with a body lighter than the maximum size,
+        so that the pages are small when the items are fat (such as tasks with many transactions) and large when they are thin (such as relationships or user identifiers).
+        A page failed because of a timeout, a connection error or a server error is fetched again with half the size, down to the minimum one.
+        The same controller can be shared by several listings of the same kind, so that the following ones start from the learned size.
+
+        Args:
+            initial_size: the size of the first page
+            min_size: the minimum page size
+            max_size: the maximum page size
+            target_latency: the number of seconds the fetch of a page should last
+            max_page_bytes: the maximum size of the body of a page, bounded only when the size of the pages is measured by get_size
+            max_growth: the maximum factor by which the page size can grow after a page
+            get_size: the function measuring the size in bytes of a fetched page, None when it is unknown; by default the pages are not measured, since encoding them again would cost more than their fetch
+        """
+        if not 0 < min_size <= initial_size <= max_size:
+            raise ValueError("The page sizes should satisfy 0 < min_size <= initial_size <= max_size")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_page_bytes = max_page_bytes
+        self.max_growth = max_growth
+        self.get_size = get_size
+        self._size = initial_size
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the next page
+        """
+        with self._lock:
+            return self._size
+
+    def _set_size(self, size: float) -> None:
+        size = max(self.min_size, min(self.max_size, int(size)))
+        if size != self._size:
+            logger.debug(f"Page size changed from [{self._size}] to [{size}]")
+        self._size = size
+
+    def record_page(self, items: int, latency: float, size_bytes: Optional[int] = None) -> None:
+        """
+        Tune the page size according to a fetched page
+
+        Args:
+            items: the number of items of the page
+            latency: the number of seconds the fetch of the page lasted
+            size_bytes: the size of the body of the page, if known
+        """
+        if items == 0:
+            return
+
+        candidates = [self.max_size]
+        if latency > 0:
+            candidates.append(items * self.target_latency / latency)
+        if size_bytes:
+            candidates.append(items * self.max_page_bytes / size_bytes)
+
+        with self._lock:
+            self._set_size(min(min(candidates), self._size * self.max_growth))
+
+    def record_failure(self) -> bool:
+        """
+        Halve the page size after a failed page
+
+        Returns:
+            whether the page size has been reduced, that is whether it is worth fetching the page again
+        """
+        with self._lock:
+            previous_size = self._size
+            self._set_size(self._size / 2)
+            return self._size < previous_size
+
+    @staticmethod
+    def is_size_failure(error: Exception) -> bool:
+        """
+        Whether the error of a page could be caused by the size of the page
+        """
+        if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+            return True
+        return isinstance(error, ApiException) and not isinstance(error, CircuitOpenError) and error.http_status_code >= 500
+
+    def fetch(self, fetch_page: Callable[[int, int], P], get_items: Callable[[P], List[T]], offset: int) -> Tuple[P, int]:
+        """
+        Fetch a page with the current page size, tuning the page size afterwards
+
+        Args:
+            fetch_page: the function fetching the page with the given offset and limit
+            get_items: the function getting the items of a page
+            offset: the index of the first item to fetch
+
+        Returns:
+            the page and the limit it has been fetched with
+
+        Raises:
+            Exception: the error of the page, if it is not caused by its size or the page size cannot be reduced any more
+        """
+        while True:
+            limit = self.size
+            started = time.monotonic()
+            try:
+                page = fetch_page(offset, limit)
+            except Exception as e:
+                if self.is_size_failure(e) and self.record_failure():
+                    logger.warning(f"Fetching again with a smaller page size the page at offset [{offset}] failed with [{limit}] items: {e}")
+                    continue
+                raise
+
+            latency = time.monotonic() - started
+            self.record_page(len(get_items(page)), latency, self.get_size(page) if self.get_size is not None else None)
+            return page, limit
@@ -0,0 +1,436 @@
+from __future__ import absolute_import, annotations
+
+import functools
+import logging
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from wenet.interface.page_size import AdaptivePageSize
+
+logger = logging.getLogger("wenet.interface.pagination")
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+def get_next_offset(page: P, page_items: List[T], offset: int, limit: Optional[int]) -> Optional[int]:
+    """
+    Get the offset of the page following a non empty one, shared by the synchronous and the asynchronous listings
+
+    Args:
+        page: the page
+        page_items: the items of the page
+        offset: the offset the page has been fetched with
+        limit: the limit the page has been fetched with, if not specified the page must have the `total` number of items
+
+    Returns:
+        the offset of the next page, None if the listing ends with the page: the page is not full, or, without a limit, the total number of items has been reached
+    """
+    offset += len(page_items)
+    if (limit is not None and len(page_items) < limit) or (limit is None and offset >= page.total):
+        return None
+    return offset
+
+
+def _iter_pages(fetch_page: Callable[[int, Optional[int]], P], get_items: Callable[[P], List[T]], offset: int, limit: Optional[int], page_size: Optional[AdaptivePageSize]) -> Iterator[P]:
+    while offset is not None:
+        if page_size is not None:
+            page, limit = page_size.fetch(fetch_page, get_items, offset)
+        else:
+            page = fetch_page(offset, limit)
+        page_items = get_items(page)
+        if not page_items:
+            return
+
+        yield page
+        offset = get_next_offset(page, page_items, offset, limit)
+
+
+_END = object()
+
+
+def _iter_prefetched_pages(pages: Iterator[P], prefetch: int) -> Iterator[P]:
+    """
+    Consume the pages in a background thread, keeping at most `prefetch` pages fetched, or being fetched, ahead of the one being processed by the caller
+    """
+    fetched = queue.Queue()
+    slots = threading.Semaphore(prefetch)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            while True:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                page = next(pages, _END)
+                fetched.put((page, None))
+                if page is _END:
+                    return
+        except BaseException as e:
+            fetched.put((_END, e))
+
+    producer = threading.Thread(target=produce, name="wenet-pagination-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            page, error = fetched.get()
+            if error is not None:
+                raise error
+            if page is _END:
+                return
+            slots.release()
+            yield page
+    finally:
+        stopped.set()
+        slots.release()
+
+
+def iter_pages(fetch_page: Callable[[int, Optional[int]], P],
+               get_items: Callable[[P], List[T]],
+               offset: int = 0,
+               limit: Optional[int] = 100,
+               prefetch: int = 0,
+               page_size: Optional[AdaptivePageSize] = None
+               ) -> Iterator[P]:
+    """
+    Lazily fetch the pages of a paginated listing, a page is fetched only when the previous one has been consumed.
+    The listing ends with the first page that is not full, or, if the limit is not specified, when the total number of items has been reached.
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit
+        get_items: the function getting the items of a page
+        offset: the index of the first item to fetch
+        limit: the number of items of each page, if not specified the page size of the server is used and the page must have the `total` number of items
+        prefetch: the number of pages fetched in a background thread while the current one is being processed, 0 for fetching a page only when it is needed
+        page_size: the controller tuning the size of each page, if specified the limit is ignored
+
+    Returns:
+        an iterator over the non empty pages
+    """
+    pages = _iter_pages(fetch_page, get_items, offset, limit, page_size)
+    if prefetch > 0:
+        return _iter_prefetched_pages(pages, prefetch)
+    return pages
+
+
+def iter_items(fetch_page: Callable[[int, Optional[int]], P],
+               get_items: Callable[[P], List[T]],
+               offset: int = 0,
+               limit: Optional[int] = 100,
+               prefetch: int = 0,
+               page_size: Optional[AdaptivePageSize] = None
+               ) -> Iterator[T]:
+    """
+    Lazily fetch the items of a paginated listing, a page is fetched only when the items of the previous one have been consumed
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit
+        get_items: the function getting the items of a page
+        offset: the index of the first item to fetch
+        limit: the number of items of each page, if not specified the page size of the server is used and the page must have the `total` number of items
+        prefetch: the number of pages fetched in a background thread while the items of the current one are being processed, 0 for fetching a page only when it is needed
+        page_size: the controller tuning the size of each page, if specified the limit is ignored
+
+    Returns:
+        an iterator over the items, in the order returned by the server
+    """
+    for page in iter_pages(fetch_page, get_items, offset=offset, limit=limit, prefetch=prefetch, page_size=page_size):
+        yield from get_items(page)
+
+
+def iter_keyset(fetch_page: Callable[[Optional[int], int, int], P],
+                get_items: Callable[[P], List[T]],
+                get_key: Callable[[T], int],
+                get_id: Callable[[T], Hashable],
+                key_from: Optional[int] = None,
+                limit: int = 100
+                ) -> Iterator[T]:
+    """
+    Lazily fetch the items of a listing ordered by an integer key, such as a timestamp, moving the lower bound of the key forward instead of the offset, so that the cost of a page does not grow with the depth of the crawl
+    and no item is skipped or repeated when other items are added meanwhile before the current position.
+    Since the lower bound is inclusive, the items with the same key of the last one are fetched again and they are deduplicated by identifier;
+    when a whole page has the same key, the following one is fetched with an offset from the beginning of that key.
+
+    Args:
+        fetch_page: the function fetching the page with the given lower bound of the key, offset and limit of the items ordered by ascending key
+        get_items: the function getting the items of a page
+        get_key: the function getting the key of an item
+        get_id: the function getting the identifier of an item
+        key_from: the minimum key of the items to fetch, by default all the items are fetched
+        limit: the number of items of each page
+
+    Returns:
+        an iterator over the items, in order of key
+    """
+    seen_ids = set()
+    tie_offset = 0
+    while True:
+        page_items = get_items(fetch_page(key_from, tie_offset, limit))
+        if not page_items:
+            return
+
+        page_key_from = key_from
+        for item in page_items:
+            key = get_key(item)
+            if key != key_from:
+                key_from = key
+                seen_ids = set()
+            elif get_id(item) in seen_ids:
+                continue
+            seen_ids.add(get_id(item))
+            yield item
+
+        if len(page_items) < limit:
+            return
+        tie_offset = tie_offset + len(page_items) if key_from == page_key_from else 0
+
+
+def take(items: Iterable[T], n: int, predicate: Optional[Callable[[T], bool]] = None) -> List[T]:
+    """
+    Take the first items matching a predicate from a lazy listing, no further page is fetched once enough items have been found
+
+    Args:
+        items: the items, such as the iterator returned by `iter_items`
+        n: the maximum number of items to take
+        predicate: the condition the items have to match, by default all the items match
+
+    Returns:
+        at most n matching items, in the order of the listing
+    """
+    taken = []
+    try:
+        if n <= 0:
+            return taken
+        for item in items:
+            if predicate is None or predicate(item):
+                taken.append(item)
+                if len(taken) >= n:
+                    break
+    finally:
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+    return taken
+
+
+def find_first(items: Iterable[T], predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+    """
+    Find the first item matching a predicate in a lazy listing, no further page is fetched once the item has been found
+
+    Args:
+        items: the items, such as the iterator returned by `iter_items`
+        predicate: the condition the item has to match, by default the first item is returned
+
+    Returns:
+        the first matching item, if any
+    """
+    found = take(items, 1, predicate=predicate)
+    return found[0] if found else None
+
+
+def fetch_all_sequentially(fetch_page: Callable[[int, Optional[int]], P], get_items: Callable[[P], List[T]], offset: int = 0, limit: Optional[int] = 100, page_size: Optional[AdaptivePageSize] = None) -> List[T]:
+    """
+    Fetch all the items of a paginated listing one page after the other, until a page is not full, or, if the limit is not specified, until the total number of items has been reached
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit
+        get_items: the function getting the items of a page
+        offset: the index of the first item to fetch
+        limit: the number of items of each page, if not specified the page size of the server is used and the page must have the `total` number of items
+        page_size: the controller tuning the size of each page, if specified the limit is ignored
+
+    Returns:
+        the items, in the order returned by the server
+    """
+    return list(iter_items(fetch_page, get_items, offset=offset, limit=limit, page_size=page_size))
+
+
+def fetch_all_in_parallel(fetch_page: Callable[[int, Optional[int]], P], get_items: Callable[[P], List[T]], offset: int = 0, limit: Optional[int] = 100, max_workers: int = 4) -> List[T]:
+    """
+    Fetch all the items of a paginated listing, fetching concurrently the pages following the first one according to the total it reports.
+    If the total changes during the crawl, because items have been added or removed meanwhile, the listing is fetched again sequentially.
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit, the page must have the `total` number of items
+        get_items: the function getting the items of a page
+        offset: the index of the first item to fetch
+        limit: the number of items of each page, if not specified the page size of the server, that is the size of the first page, is used
+        max_workers: the maximum number of pages fetched concurrently
+
+    Returns:
+        the items, in the order returned by the server
+    """
+    first_page = fetch_page(offset, limit)
+    items = list(get_items(first_page))
+    total = first_page.total
+    if not items or (limit is not None and len(items) < limit) or (limit is None and offset + len(items) >= total):
+        return items
+
+    page_size = limit if limit is not None else len(items)
+    offsets = range(offset + page_size, total, page_size)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = list(executor.map(lambda page_offset: fetch_page(page_offset, limit), offsets))
+
+        for page_offset, page in zip(offsets, pages):
+            page_items = get_items(page)
+            if page.total != total or len(page_items) != min(page_size, total - page_offset):
+                logger.warning(f"The total of the listing changed from [{total}] to [{page.total}] during the crawl, fetching it again sequentially")
+                return fetch_all_sequentially(fetch_page, get_items, offset=offset, limit=limit)
+            items.extend(page_items)
+
+    if limit is not None and len(items) % limit == 0:
+        # as in the sequential crawl, a full last page does not tell whether there are other items
+        items.extend(fetch_all_sequentially(fetch_page, get_items, offset=offset + len(items), limit=limit))
+    return items
+
+
+def fetch_all(fetch_page: Callable[[int, Optional[int]], P],
+              get_items: Callable[[P], List[T]],
+              offset: int = 0,
+              limit: Optional[int] = 100,
+              max_workers: int = 1,
+              page_size: Optional[AdaptivePageSize] = None
+              ) -> List[T]:
+    """
+    Fetch all the items of a paginated listing
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit
+        get_items: the function getting the items of a page
+        offset: the index of the first item to fetch
+        limit: the number of items of each page, if not specified the page size of the server is used and the page must have the `total` number of items
+        max_workers: the maximum number of pages fetched concurrently, 1 for fetching them one after the other
+        page_size: the controller tuning the size of each page, if specified the limit is ignored; the pages fetched concurrently all have its current size
+
+    Returns:
+        the items, in the order returned by the server
+    """
+    if max_workers > 1:
+        return fetch_all_in_parallel(fetch_page, get_items, offset=offset, limit=page_size.size if page_size is not None else limit, max_workers=max_workers)
+    return fetch_all_sequentially(fetch_page, get_items, offset=offset, limit=limit, page_size=page_size)
+
+
+def split_in_windows(start: datetime, end: datetime, window: timedelta) -> List[Tuple[datetime, datetime]]:
+    """
+    Split a time range in consecutive windows, the bounds are inclusive and the windows do not overlap at the granularity of the seconds, that is the one of the timestamps of the platform
+
+    Args:
+        start: the beginning of the range
+        end: the end of the range
+        window: the duration of each window
+
+    Returns:
+        the bounds of the windows, in chronological order
+    """
+    if window < timedelta(seconds=1):
+        raise ValueError("The windows should last at least one second")
+
+    windows = []
+    window_from = start
+    while window_from <= end:
+        window_to = min(window_from + window - timedelta(seconds=1), end)
+        windows.append((window_from, window_to))
+        window_from = window_to + timedelta(seconds=1)
+    return windows
+
+
+def iter_window_items(fetch_page: Callable[[datetime, datetime, int, int], P],
+                      get_items: Callable[[P], List[T]],
+                      windows: List[Tuple[datetime, datetime]],
+                      max_window_items: int = 1000,
+                      limit: int = 100,
+                      max_workers: int = 4
+                      ) -> Iterator[Tuple[Tuple[datetime, datetime], List[T]]]:
+    """
+    Fetch concurrently the windows of a paginated listing, splitting the ones with more than `max_window_items` items, and yield the items of each window as soon as it has been fetched
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit of the items created between the bounds of a window
+        get_items: the function getting the items of a page
+        windows: the bounds of the windows to fetch
+        max_window_items: the number of items above which a window is split
+        limit: the number of items of each page
+        max_workers: the maximum number of windows fetched concurrently
+
+    Returns:
+        an iterator over the bounds of the fetched windows, or of their parts if they have been split, with their items, in order of completion
+    """
+    def crawl_window(window_from: datetime, window_to: datetime) -> Tuple[List[Tuple[datetime, datetime]], List[T]]:
+        fetch_window_page = functools.partial(fetch_page, window_from, window_to)
+        first_page = fetch_window_page(0, limit)
+        duration = int((window_to - window_from).total_seconds())
+        if first_page.total > max_window_items and duration >= 1:
+            middle = window_from + timedelta(seconds=duration // 2)
+            logger.debug(f"Splitting the window [{window_from}, {window_to}] of [{first_page.total}] items")
+            return [(window_from, middle), (middle + timedelta(seconds=1), window_to)], []
+
+        items = list(get_items(first_page))
+        if len(items) == limit:
+            items.extend(fetch_all_sequentially(fetch_window_page, get_items, offset=limit, limit=limit))
+        return [], items
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(crawl_window, *bounds): bounds for bounds in windows}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    bounds = pending.pop(future)
+                    sub_windows, items = future.result()
+                    for sub_window in sub_windows:
+                        pending[executor.submit(crawl_window, *sub_window)] = sub_window
+                    if not sub_windows:
+                        yield bounds, items
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def fetch_all_in_windows(fetch_page: Callable[[datetime, datetime, int, int], P],
+                         get_items: Callable[[P], List[T]],
+                         get_id: Callable[[T], Hashable],
+                         start: datetime,
+                         end: datetime,
+                         window: timedelta,
+                         max_window_items: int = 1000,
+                         limit: int = 100,
+                         max_workers: int = 4
+                         ) -> List[T]:
+    """
+    Fetch all the items of a paginated listing created in a time range, splitting the range in windows fetched concurrently, so that each window is crawled with shallow offsets.
+    A window reporting more than `max_window_items` items is split in two halves, down to windows of one second.
+    The items of the windows are merged in chronological order, dropping the duplicated ones.
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit of the items created between the bounds of a window
+        get_items: the function getting the items of a page
+        get_id: the function getting the identifier of an item
+        start: the beginning of the time range
+        end: the end of the time range
+        window: the initial duration of the windows
+        max_window_items: the number of items above which a window is split
+        limit: the number of items of each page
+        max_workers: the maximum number of windows fetched concurrently
+
+    Returns:
+        the items, without duplicates
+    """
+    window_items: Dict[Tuple[datetime, datetime], List[T]] = {}
+    for bounds, items in iter_window_items(fetch_page, get_items, split_in_windows(start, end, window), max_window_items=max_window_items, limit=limit, max_workers=max_workers):
+        window_items[bounds] = items
+
+    items = []
+    ids = set()
+    for bounds in sorted(window_items):
+        for item in window_items[bounds]:
+            item_id = get_id(item)
+            if item_id is None or item_id not in ids:
+                ids.add(item_id)
+                items.append(item)
+    return items
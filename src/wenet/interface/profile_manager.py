@@ -1,9 +1,13 @@
 from __future__ import absolute_import, annotations
 
+import functools
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 
-from wenet.interface.component import ComponentInterface
+from wenet.interface.coalescer import coalesced
+from wenet.interface import pagination
+from wenet.interface.component import BaseComponentInterface, ComponentInterface, ComponentRequest
+from wenet.interface.page_size import AdaptivePageSize
 from wenet.interface.client import RestClient
 from wenet.model.user.profile import WeNetUserProfile, WeNetUserProfilesPage, UserIdentifiersPage, PatchWeNetUserProfile
 from wenet.model.user.relationship import RelationshipPage, Relationship
@@ -11,138 +15,199 @@ from wenet.model.user.relationship import RelationshipPage, Relationship
 logger = logging.getLogger("wenet.interface.profile_manager")
 
 
-class ProfileManagerInterface(ComponentInterface):
+class BaseProfileManagerInterface(BaseComponentInterface):
+    """
+    The requests to the profile manager, shared by the synchronous and the asynchronous interfaces
+    """
 
-    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/profile_manager",
-                 extra_headers: Optional[dict] = None) -> None:
-        base_url = platform_url + component_path
-        super().__init__(client, base_url, extra_headers)
+    def _get_user_profile_request(self, user_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/profiles/{user_id}", self._get_headers(headers, json_body=True), success_codes=(200, 202), parse=WeNetUserProfile.from_repr)
 
-    def get_user_profile(self, user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def _update_user_profile_request(self, profile: WeNetUserProfile, headers: Optional[dict]) -> ComponentRequest:
+        profile_repr = profile.to_repr()
+        profile_repr.pop("_creationTs", None)
+        profile_repr.pop("_lastUpdateTs", None)
 
-        response = self._client.get(f"{self._base_url}/profiles/{user_id}", headers=headers)
+        return ComponentRequest("PUT", f"{self._base_url}/profiles/{profile.profile_id}", self._get_headers(headers, json_body=True), body=profile_repr,
+                                success_codes=(200, 202), parse=WeNetUserProfile.from_repr)
 
-        if response.status_code in [200, 202]:
-            return WeNetUserProfile.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    def _patch_user_profile_request(self, profile_patch: PatchWeNetUserProfile, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("PATCH", f"{self._base_url}/profiles/{profile_patch.profile_id}", self._get_headers(headers, json_body=True), body=profile_patch.to_patch(),
+                                success_codes=(200, 202), parse=WeNetUserProfile.from_repr)
 
-    def update_user_profile(self, profile: WeNetUserProfile, headers: Optional[dict] = None) -> WeNetUserProfile:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def _create_empty_user_profile_request(self, user_id: str, headers: Optional[dict]) -> ComponentRequest:
+        profile_repr = {
+            "id": user_id
+        }
 
-        profile_repr = profile.to_repr()
-        profile_repr.pop("_creationTs", None)
-        profile_repr.pop("_lastUpdateTs", None)
+        return ComponentRequest("POST", f"{self._base_url}/profiles", self._get_headers(headers, json_body=True), body=profile_repr,
+                                success_codes=(200, 201, 202))
+
+    def _delete_user_profile_request(self, user_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("DELETE", f"{self._base_url}/profiles/{user_id}", self._get_headers(headers, json_body=True), success_codes=(200, 204))
+
+    def _get_profile_page_request(self, offset: int, limit: Optional[int], headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/profiles", self._get_headers(headers, json_body=True), query_params={"offset": offset, "limit": limit},
+                                success_codes=(200, 202), parse=WeNetUserProfilesPage.from_repr)
+
+    def _get_profile_user_id_page_request(self, offset: int, limit: Optional[int], headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/userIdentifiers", self._get_headers(headers, json_body=True), query_params={"offset": offset, "limit": limit},
+                                success_codes=(200, 202), parse=UserIdentifiersPage.from_repr)
+
+    def _get_relationship_page_request(self,
+                                       app_id: Optional[str],
+                                       source_id: Optional[str],
+                                       target_id: Optional[str],
+                                       relation_type: Optional[str],
+                                       weight_from: Optional[float],
+                                       weight_to: Optional[float],
+                                       order: Optional[str],
+                                       offset: int,
+                                       limit: int,
+                                       headers: Optional[dict]
+                                       ) -> ComponentRequest:
+        query_params = {
+            "appId": app_id,
+            "sourceId": source_id,
+            "targetId": target_id,
+            "type": relation_type,
+            "weightFrom": weight_from,
+            "weightTo": weight_to,
+            "order": order,
+            "offset": offset,
+            "limit": limit
+        }
+        return ComponentRequest("GET", f"{self._base_url}/relationships", self._get_headers(headers, json_body=True), query_params=query_params, parse=RelationshipPage.from_repr)
+
+    def _update_relationship_request(self, relationship: Relationship, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("PUT", f"{self._base_url}/relationships", self._get_headers(headers, json_body=True), body=relationship.to_repr(),
+                                success_codes=(200, 202), parse=Relationship.from_repr)
+
+    def _update_relationship_batch_request(self, relationships: List[Relationship], headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("PUT", f"{self._base_url}/relationships/batch", self._get_headers(headers, json_body=True), body=[x.to_repr() for x in relationships],
+                                success_codes=(200, 202), parse=lambda content: [Relationship.from_repr(x) for x in content])
+
+    def _delete_relationships_request(self,
+                                      app_id: Optional[str],
+                                      source_id: Optional[str],
+                                      target_id: Optional[str],
+                                      relation_type: Optional[str],
+                                      weight_from: Optional[float],
+                                      weight_to: Optional[float],
+                                      headers: Optional[dict]
+                                      ) -> ComponentRequest:
+        query_params = {
+            "appId": app_id,
+            "sourceId": source_id,
+            "targetId": target_id,
+            "type": relation_type,
+            "weightFrom": weight_from,
+            "weightTo": weight_to
+        }
+        return ComponentRequest("DELETE", f"{self._base_url}/relationships", self._get_headers(headers, json_body=True), query_params=query_params, success_codes=(204,))
 
-        response = self._client.put(f"{self._base_url}/profiles/{profile.profile_id}", body=profile_repr,
-                                    headers=headers)
 
-        if response.status_code in [200, 202]:
-            return WeNetUserProfile.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+class ProfileManagerInterface(BaseProfileManagerInterface, ComponentInterface):
+
+    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/profile_manager",
+                 extra_headers: Optional[dict] = None, **kwargs) -> None:
+        base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
+
+    @coalesced
+    def get_user_profile(self, user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
+        return self._call(self._get_user_profile_request(user_id, headers))
+
+    def update_user_profile(self, profile: WeNetUserProfile, headers: Optional[dict] = None) -> WeNetUserProfile:
+        return self._call(self._update_user_profile_request(profile, headers))
 
     def patch_user_profile(self, profile_patch: PatchWeNetUserProfile,
                            headers: Optional[dict] = None) -> WeNetUserProfile:
         """
         Only the fields with value different from None in the profile_patch will be patched
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+        return self._call(self._patch_user_profile_request(profile_patch, headers))
 
-        response = self._client.patch(f"{self._base_url}/profiles/{profile_patch.profile_id}",
-                                      body=profile_patch.to_patch(), headers=headers)
+    def create_empty_user_profile(self, user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
+        self._call(self._create_empty_user_profile_request(user_id, headers))
+        return WeNetUserProfile.empty(user_id)
 
-        if response.status_code in [200, 202]:
-            return WeNetUserProfile.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    def delete_user_profile(self, user_id: str, headers: Optional[dict] = None) -> None:
+        self._call(self._delete_user_profile_request(user_id, headers))
 
-    def create_empty_user_profile(self, user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def get_profiles(self, headers: Optional[dict] = None, limit: Optional[int] = None, max_workers: int = 1) -> List[WeNetUserProfile]:
+        """
+        Get all the user profiles
+        :param headers: Additional headers to add in the http request
+        :param limit: The number of profiles of each page, if not specified the default of the component is used
+        :param max_workers: The maximum number of pages fetched concurrently, by default the pages are fetched one after the other
+        :return: The list of profiles
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_profile_page, headers=headers)
+        return pagination.fetch_all(fetch_page, lambda profiles_page: profiles_page.profiles, limit=limit, max_workers=max_workers)
 
-        profile_repr = {
-            "id": user_id
-        }
+    @coalesced
+    def get_profile_page(self, offset: int = 0, limit: Optional[int] = None, headers: Optional[dict] = None) -> WeNetUserProfilesPage:
+        """
+        Get a page of user profiles
+        :param offset: The index of the first profile to return
+        :param limit: The number maximum of profiles to return, if not specified the default of the component is used
+        :param headers: Additional headers to add in the http request
+        :return: An object representing a profiles page
+        """
+        return self._call(self._get_profile_page_request(offset, limit, headers))
 
-        response = self._client.post(f"{self._base_url}/profiles", body=profile_repr, headers=headers)
-        if response.status_code in [200, 201, 202]:
-            return WeNetUserProfile.empty(user_id)
-        else:
-            raise self.get_api_exception_for_response(response)
+    def iter_profiles(self, offset: int = 0, limit: Optional[int] = None, pages: bool = False, prefetch: int = 0, headers: Optional[dict] = None) -> Iterator[Union[WeNetUserProfile, WeNetUserProfilesPage]]:
+        """
+        Lazily iterate over the user profiles, a page is fetched only when the previous one has been consumed
+        :param offset: The index of the first profile to return
+        :param limit: The number of profiles of each page, if not specified the default of the component is used
+        :param pages: Whether to yield the pages of profiles instead of the single profiles
+        :param prefetch: The number of pages of profiles fetched in background while the current one is being processed, by default a page is fetched only when it is needed
+        :param headers: Additional headers to add in the http request
+        :return: An iterator over the profiles, or over their pages
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_profile_page, headers=headers)
+        iterate = pagination.iter_pages if pages else pagination.iter_items
+        return iterate(fetch_page, lambda profiles_page: profiles_page.profiles, offset=offset, limit=limit, prefetch=prefetch)
 
-    def delete_user_profile(self, user_id: str, headers: Optional[dict] = None) -> None:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.delete(f"{self._base_url}/profiles/{user_id}", headers=headers)
-
-        if response.status_code not in [200, 204]:
-            raise self.get_api_exception_for_response(response)
-
-    def get_profiles(self, headers: Optional[dict] = None) -> List[WeNetUserProfile]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        profiles = []
-        has_got_all_profiles = False
-        offset = 0
-        while not has_got_all_profiles:
-            response = self._client.get(f"{self._base_url}/profiles", query_params={"offset": offset}, headers=headers)
-
-            if response.status_code in [200, 202]:
-                profiles_page = WeNetUserProfilesPage.from_repr(response.json())
-            else:
-                raise self.get_api_exception_for_response(response)
-
-            profiles.extend(profiles_page.profiles)
-            offset = len(profiles)
-            if len(profiles) >= profiles_page.total:
-                has_got_all_profiles = True
-
-        return profiles
-
-    def get_profile_user_ids(self, headers: Optional[dict] = None) -> List[str]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        user_ids = []
-        has_got_all_user_ids = False
-        offset = 0
-        while not has_got_all_user_ids:
-            response = self._client.get(f"{self._base_url}/userIdentifiers", query_params={"offset": offset},
-                                        headers=headers)
-
-            if response.status_code in [200, 202]:
-                user_ids_page = UserIdentifiersPage.from_repr(response.json())
-            else:
-                raise self.get_api_exception_for_response(response)
-
-            user_ids.extend(user_ids_page.user_ids)
-            offset = len(user_ids)
-            if len(user_ids) >= user_ids_page.total:
-                has_got_all_user_ids = True
-
-        return user_ids
+    def get_profile_user_ids(self, headers: Optional[dict] = None, limit: Optional[int] = None, max_workers: int = 1) -> List[str]:
+        """
+        Get the identifiers of all the users having a profile
+        :param headers: Additional headers to add in the http request
+        :param limit: The number of identifiers of each page, if not specified the default of the component is used
+        :param max_workers: The maximum number of pages fetched concurrently, by default the pages are fetched one after the other
+        :return: The list of user identifiers
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_profile_user_id_page, headers=headers)
+        return pagination.fetch_all(fetch_page, lambda user_ids_page: user_ids_page.user_ids, limit=limit, max_workers=max_workers)
+
+    @coalesced
+    def get_profile_user_id_page(self, offset: int = 0, limit: Optional[int] = None, headers: Optional[dict] = None) -> UserIdentifiersPage:
+        """
+        Get a page of the identifiers of the users having a profile
+        :param offset: The index of the first identifier to return
+        :param limit: The number maximum of identifiers to return, if not specified the default of the component is used
+        :param headers: Additional headers to add in the http request
+        :return: An object representing a user identifiers page
+        """
+        return self._call(self._get_profile_user_id_page_request(offset, limit, headers))
 
+    def iter_profile_user_ids(self, offset: int = 0, limit: Optional[int] = None, pages: bool = False, prefetch: int = 0, headers: Optional[dict] = None) -> Iterator[Union[str, UserIdentifiersPage]]:
+        """
+        Lazily iterate over the identifiers of the users having a profile, a page is fetched only when the previous one has been consumed
+        :param offset: The index of the first identifier to return
+        :param limit: The number of identifiers of each page, if not specified the default of the component is used
+        :param pages: Whether to yield the pages of identifiers instead of the single identifiers
+        :param prefetch: The number of pages of identifiers fetched in background while the current one is being processed, by default a page is fetched only when it is needed
+        :param headers: Additional headers to add in the http request
+        :return: An iterator over the user identifiers, or over their pages
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_profile_user_id_page, headers=headers)
+        iterate = pagination.iter_pages if pages else pagination.iter_items
+        return iterate(fetch_page, lambda user_ids_page: user_ids_page.user_ids, offset=offset, limit=limit, prefetch=prefetch)
+
+    @coalesced
     def get_relationship_page(self,
                               app_id: Optional[str] = None,
                               source_id: Optional[str] = None,
@@ -174,35 +239,7 @@ class ProfileManagerInterface(ComponentInterface):
         :return: An object representing a relationships page.
         :raise: ApiException if the request does not return a 200 code. KeyError if the methods is not able to create a RelationshipPage object
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        query_params_temp = {
-            "appId": app_id,
-            "sourceId": source_id,
-            "targetId": target_id,
-            "type": relation_type,
-            "weightFrom": weight_from,
-            "weightTo": weight_to,
-            "order": order,
-            "offset": offset,
-            "limit": limit
-        }
-
-        query_params = {}
-
-        for param, value in query_params_temp.items():
-            if value is not None:
-                query_params[param] = value
-
-        response = self._client.get(f"{self._base_url}/relationships", query_params=query_params, headers=headers)
-
-        if response.status_code == 200:
-            return RelationshipPage.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_relationship_page_request(app_id, source_id, target_id, relation_type, weight_from, weight_to, order, offset, limit, headers))
 
     def get_relationships(self,
                           app_id: Optional[str] = None,
@@ -212,32 +249,80 @@ class ProfileManagerInterface(ComponentInterface):
                           weight_from: Optional[float] = None,
                           weight_to: Optional[float] = None,
                           order: Optional[str] = None,
-                          headers: Optional[dict] = None
+                          headers: Optional[dict] = None,
+                          page_size: Optional[AdaptivePageSize] = None
                           ) -> List[Relationship]:
-        relationships = []
-        has_got_all_relationships = False
-        offset = 0
-        limit = 100
-        while not has_got_all_relationships:
-            relationship_page = self.get_relationship_page(
-                app_id=app_id,
-                source_id=source_id,
-                target_id=target_id,
-                relation_type=relation_type,
-                weight_from=weight_from,
-                weight_to=weight_to,
-                order=order,
-                headers=headers,
-                offset=offset,
-                limit=limit
-            )
-
-            relationships.extend(relationship_page.relationships)
-            offset += len(relationship_page.relationships)
-            if len(relationship_page.relationships) < limit:
-                has_got_all_relationships = True
-
-        return relationships
+        """
+        Get all the relationships that match the request parameters
+        :param app_id: An application identifier to be equals on the social network relationships to return
+        :param source_id: A user identifier to be equals on the relationships source to return
+        :param target_id: A user identifier to be equals on the relationships target to return
+        :param relation_type: The type for the relationships to return
+        :param weight_from: The minimal weight, inclusive, of the relationships to return.
+        :param weight_to: The maximal weight, inclusive, of the relationships to return.
+        :param order: The order in witch the relationships has to be returned
+        :param headers: Additional headers to add in the http request
+        :param page_size: The controller tuning the number of relationships of each page from the observed latency, weight and errors, by default the pages have 100 relationships
+        :return: The list of relationships
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_relationship_page,
+            app_id=app_id,
+            source_id=source_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            weight_from=weight_from,
+            weight_to=weight_to,
+            order=order,
+            headers=headers
+        )
+        return pagination.fetch_all(fetch_page, lambda relationship_page: relationship_page.relationships, limit=100, page_size=page_size)
+
+    def iter_relationships(self,
+                           app_id: Optional[str] = None,
+                           source_id: Optional[str] = None,
+                           target_id: Optional[str] = None,
+                           relation_type: Optional[str] = None,
+                           weight_from: Optional[float] = None,
+                           weight_to: Optional[float] = None,
+                           order: Optional[str] = None,
+                           offset: int = 0,
+                           limit: int = 100,
+                           pages: bool = False,
+                           prefetch: int = 0,
+                           headers: Optional[dict] = None
+                           ) -> Iterator[Union[Relationship, RelationshipPage]]:
+        """
+        Lazily iterate over the relationships that match the request parameters, a page is fetched only when the previous one has been consumed
+        :param app_id: An application identifier to be equals on the social network relationships to return
+        :param source_id: A user identifier to be equals on the relationships source to return
+        :param target_id: A user identifier to be equals on the relationships target to return
+        :param relation_type: The type for the relationships to return
+        :param weight_from: The minimal weight, inclusive, of the relationships to return.
+        :param weight_to: The maximal weight, inclusive, of the relationships to return.
+        :param order: The order in witch the relationships has to be returned
+        :param offset: The index of the first social network relationship to return
+        :param limit: The number of relationships of each page
+        :param pages: Whether to yield the pages of relationships instead of the single relationships
+        :param prefetch: The number of pages of relationships fetched in background while the current one is being processed, by default a page is fetched only when it is needed
+        :param headers: Additional headers to add in the http request
+        :return: An iterator over the relationships, or over their pages
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_relationship_page,
+            app_id=app_id,
+            source_id=source_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            weight_from=weight_from,
+            weight_to=weight_to,
+            order=order,
+            headers=headers
+        )
+        iterate = pagination.iter_pages if pages else pagination.iter_items
+        return iterate(fetch_page, lambda relationship_page: relationship_page.relationships, offset=offset, limit=limit, prefetch=prefetch)
 
     def update_relationship(self, relationship: Relationship, headers: Optional[dict] = None) -> Relationship:
         """
@@ -246,16 +331,7 @@ class ProfileManagerInterface(ComponentInterface):
         :param headers: Additional headers to add in the http request
         :return: The updated relationship
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.put(f"{self._base_url}/relationships", body=relationship.to_repr(), headers=headers)
-        if response.status_code in [200, 202]:
-            return Relationship.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_relationship_request(relationship, headers))
 
     def update_relationship_batch(self, relationships: List[Relationship], headers: Optional[dict] = None) -> List[Relationship]:
         """
@@ -264,18 +340,7 @@ class ProfileManagerInterface(ComponentInterface):
         :param headers: Additional headers to add in the http request
         :return: The list of updated relationship
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.put(f"{self._base_url}/relationships/batch", body=[x.to_repr() for x in relationships],
-                                    headers=headers)
-
-        if response.status_code in [200, 202]:
-            return [Relationship.from_repr(x) for x in response.json()]
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_relationship_batch_request(relationships, headers))
 
     def delete_relationships(self,
                              app_id: Optional[str] = None,
@@ -296,27 +361,4 @@ class ProfileManagerInterface(ComponentInterface):
         :param weight_to: The maximal weight, inclusive, of the relationships to return.
         :param headers: Additional headers to add in the http request
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        query_params_temp = {
-            "appId": app_id,
-            "sourceId": source_id,
-            "targetId": target_id,
-            "type": relation_type,
-            "weightFrom": weight_from,
-            "weightTo": weight_to
-        }
-
-        query_params = {}
-
-        for param, value in query_params_temp.items():
-            if value is not None:
-                query_params[param] = value
-
-        response = self._client.delete(f"{self._base_url}/relationships", query_params=query_params, headers=headers)
-
-        if response.status_code != 204:
-            raise self.get_api_exception_for_response(response)
+        self._call(self._delete_relationships_request(app_id, source_id, target_id, relation_type, weight_from, weight_to, headers))
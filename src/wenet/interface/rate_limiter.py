@@ -0,0 +1,263 @@
+from __future__ import absolute_import, annotations
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple, Union
+
+import redis
+
+from wenet.interface.exceptions import RateLimitExceeded
+
+logger = logging.getLogger("wenet.interface.rate_limiter")
+
+
+class TokenBucket:
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        A bucket of tokens refilled at a constant rate, living in the current process
+
+        Args:
+            rate: the number of tokens added to the bucket each second
+            capacity: the maximum number of tokens in the bucket, that is the allowed burst, by default equal to the rate
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """
+        Try to take the tokens from the bucket
+
+        Args:
+            tokens: the number of tokens to take
+
+        Returns:
+            0 if the tokens have been taken, otherwise the number of seconds after which they will be available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+
+class RedisTokenBucket:
+
+    SCRIPT = """
+        redis.replicate_commands()
+        local capacity = tonumber(ARGV[1])
+        local rate = tonumber(ARGV[2])
+        local requested = tonumber(ARGV[3])
+        local time = redis.call('TIME')
+        local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+        local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updatedAt')
+        local tokens = tonumber(bucket[1]) or capacity
+        local updated_at = tonumber(bucket[2]) or now
+        tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+        local wait = 0
+        if tokens >= requested then
+            tokens = tokens - requested
+        else
+            wait = (requested - tokens) / rate
+        end
+        redis.call('HMSET', KEYS[1], 'tokens', tostring(tokens), 'updatedAt', tostring(now))
+        redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+        return tostring(wait)
+    """
+
+    def __init__(self, r: redis.Redis, key: str, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        A bucket of tokens refilled at a constant rate, stored in Redis and therefore shared by all the processes using the same Redis instance
+
+        Args:
+            r: the Redis connection
+            key: the key of the bucket
+            rate: the number of tokens added to the bucket each second
+            capacity: the maximum number of tokens in the bucket, that is the allowed burst, by default equal to the rate
+        """
+        self.key = key
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._script = r.register_script(self.SCRIPT)
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """
+        Try to take the tokens from the bucket
+
+        Args:
+            tokens: the number of tokens to take
+
+        Returns:
+            0 if the tokens have been taken, otherwise the number of seconds after which they will be available
+        """
+        return float(self._script(keys=[self.key], args=[self.capacity, self.rate, tokens]))
+
+
+class RateLimitRule:
+
+    def __init__(self, pattern: str, rate: float, capacity: Optional[float] = None, methods: Optional[Iterable[str]] = None) -> None:
+        """
+        A budget for the requests to the endpoints matching a pattern
+
+        Args:
+            pattern: the regular expression searched in the url of the requests
+            rate: the number of requests allowed each second
+            capacity: the number of requests allowed in a burst, by default equal to the rate
+            methods: the methods of the requests subject to the budget, by default all of them
+        """
+        self.pattern = pattern
+        self.rate = rate
+        self.capacity = capacity
+        self.methods = frozenset(method.upper() for method in methods) if methods is not None else None
+        self._regex = re.compile(pattern)
+
+    def matches(self, method: str, url: str) -> bool:
+        return (self.methods is None or method.upper() in self.methods) and self._regex.search(url) is not None
+
+
+class RateLimiter:
+
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 capacity: Optional[float] = None,
+                 rules: Optional[List[RateLimitRule]] = None,
+                 blocking: bool = True,
+                 timeout: Optional[float] = None,
+                 r: Optional[redis.Redis] = None,
+                 key_prefix: str = "wenet:rate_limit"
+                 ) -> None:
+        """
+        A client side rate limiter based on token buckets.
+        Each request consumes a token from the budget of the first rule matching it, or from the default budget if no rule matches.
+
+        Args:
+            rate: the number of requests allowed each second by the default budget, the requests not matching any rule are not limited if not specified
+            capacity: the number of requests allowed in a burst by the default budget, by default equal to the rate
+            rules: the budgets of specific endpoints
+            blocking: whether to wait for the budget to allow a request, or to fail immediately
+            timeout: the maximum number of seconds to wait for the budget when blocking, no limit if not specified
+            r: a Redis connection for sharing the budgets among several processes, if not specified the budgets are local to the process
+            key_prefix: the prefix of the Redis keys of the budgets
+        """
+        self.blocking = blocking
+        self.timeout = timeout
+        self._buckets: List[Tuple[Optional[RateLimitRule], Union[TokenBucket, RedisTokenBucket]]] = []
+        for rule in rules or []:
+            self._buckets.append((rule, self._build_bucket(r, f"{key_prefix}:{rule.pattern}", rule.rate, rule.capacity)))
+        if rate is not None:
+            self._buckets.append((None, self._build_bucket(r, f"{key_prefix}:default", rate, capacity)))
+
+    @staticmethod
+    def _build_bucket(r: Optional[redis.Redis], key: str, rate: float, capacity: Optional[float]) -> Union[TokenBucket, RedisTokenBucket]:
+        if r is not None:
+            return RedisTokenBucket(r, key, rate, capacity=capacity)
+        return TokenBucket(rate, capacity=capacity)
+
+    def _get_bucket(self, method: str, url: str) -> Optional[Union[TokenBucket, RedisTokenBucket]]:
+        for rule, bucket in self._buckets:
+            if rule is None or rule.matches(method, url):
+                return bucket
+        return None
+
+    def _get_deadline(self, blocking: Optional[bool], timeout: Optional[float]) -> Tuple[bool, Optional[float]]:
+        blocking = self.blocking if blocking is None else blocking
+        timeout = self.timeout if timeout is None else timeout
+        return blocking, time.monotonic() + timeout if blocking and timeout is not None else None
+
+    @staticmethod
+    def _get_wait(bucket: Union[TokenBucket, RedisTokenBucket], blocking: bool, deadline: Optional[float]) -> Optional[float]:
+        """
+        Try to take a token, returning 0 if it has been taken, the time to wait before trying again, or None if the request is not allowed
+        """
+        wait = bucket.try_acquire()
+        if wait == 0:
+            return 0
+        if not blocking:
+            return None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            wait = min(wait, remaining)
+        return wait
+
+    def acquire(self, method: str, url: str, blocking: Optional[bool] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire the permission to perform a request
+
+        Args:
+            method: the method of the request
+            url: the url of the request
+            blocking: whether to wait for the budget to allow the request, by default the mode of the rate limiter
+            timeout: the maximum number of seconds to wait, by default the one of the rate limiter
+
+        Returns:
+            whether the request is allowed
+        """
+        bucket = self._get_bucket(method, url)
+        if bucket is None:
+            return True
+
+        blocking, deadline = self._get_deadline(blocking, timeout)
+        while True:
+            wait = self._get_wait(bucket, blocking, deadline)
+            if wait is None:
+                return False
+            if wait == 0:
+                return True
+            time.sleep(wait)
+
+    async def acquire_async(self, method: str, url: str, blocking: Optional[bool] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire the permission to perform a request, waiting without blocking the event loop
+
+        Args:
+            method: the method of the request
+            url: the url of the request
+            blocking: whether to wait for the budget to allow the request, by default the mode of the rate limiter
+            timeout: the maximum number of seconds to wait, by default the one of the rate limiter
+
+        Returns:
+            whether the request is allowed
+        """
+        bucket = self._get_bucket(method, url)
+        if bucket is None:
+            return True
+
+        blocking, deadline = self._get_deadline(blocking, timeout)
+        while True:
+            wait = self._get_wait(bucket, blocking, deadline)
+            if wait is None:
+                return False
+            if wait == 0:
+                return True
+            await asyncio.sleep(wait)
+
+    def check(self, method: str, url: str) -> None:
+        """
+        Acquire the permission to perform a request according to the mode of the rate limiter
+
+        Raises:
+            RateLimitExceeded: if the request is not allowed
+        """
+        if not self.acquire(method, url):
+            raise RateLimitExceeded(method, url)
+
+    async def check_async(self, method: str, url: str) -> None:
+        """
+        Acquire the permission to perform a request according to the mode of the rate limiter, waiting without blocking the event loop
+
+        Raises:
+            RateLimitExceeded: if the request is not allowed
+        """
+        if not await self.acquire_async(method, url):
+            raise RateLimitExceeded(method, url)
@@ -1,11 +1,15 @@
 from __future__ import absolute_import, annotations
 
+import functools
 import logging
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Callable, Iterator, List, Optional, Union
 
+from wenet.interface import pagination
 from wenet.interface.client import RestClient, Oauth2Client
-from wenet.interface.component import ComponentInterface
+from wenet.interface.coalescer import coalesced
+from wenet.interface.component import BaseComponentInterface, ComponentInterface, ComponentRequest
+from wenet.interface.page_size import AdaptivePageSize
 from wenet.model.app import AppDTO
 from wenet.model.logging_message.message import BaseMessage
 from wenet.model.protocol_norm import ProtocolNorm
@@ -25,7 +29,10 @@ from wenet.model.user.profile import WeNetUserProfile, CoreWeNetUserProfile
 logger = logging.getLogger("wenet.interface.service_api")
 
 
-class ServiceApiInterface(ComponentInterface):
+class BaseServiceApiInterface(BaseComponentInterface):
+    """
+    The requests to the service API, shared by the synchronous and the asynchronous interfaces
+    """
 
     APP_ENDPOINT = "/app"
     USER_ENDPOINT = "/user"
@@ -33,128 +40,158 @@ class ServiceApiInterface(ComponentInterface):
     TOKEN_ENDPOINT = "/token"
     LOG_ENDPOINT = "/log/messages"
 
-    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/service", component_path_oauth: str = "/api/service", extra_headers: Optional[dict] = None) -> None:
-        if isinstance(client, Oauth2Client):
-            base_url = platform_url + component_path_oauth
-        else:
-            base_url = platform_url + component_path
-        super().__init__(client, base_url, extra_headers)
+    def _get_token_details_request(self, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}{self.TOKEN_ENDPOINT}", self._get_headers(headers), parse=TokenDetails.from_repr)
 
-    def get_token_details(self, headers: Optional[dict] = None) -> TokenDetails:
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
+    def _get_app_details_request(self, app_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}{self.APP_ENDPOINT}/{app_id}", self._get_headers(headers), parse=AppDTO.from_repr)
 
-        response = self._client.get(f"{self._base_url}{self.TOKEN_ENDPOINT}", headers=headers)
+    def _get_app_users_request(self, app_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}{self.APP_ENDPOINT}/{app_id}/users", self._get_headers(headers), parse=lambda content: content)
 
-        if response.status_code == 200:
-            return TokenDetails.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    def _create_task_request(self, task: Task, headers: Optional[dict]) -> ComponentRequest:
+        task_repr = task.to_repr()
+        task_repr.pop("id", None)
+        return ComponentRequest("POST", f"{self._base_url}{self.TASK_ENDPOINT}", self._get_headers(headers, json_body=True), body=task_repr, success_codes=(200, 201), parse=Task.from_repr)
 
-    def get_app_details(self, app_id: str, headers: Optional[dict] = None) -> AppDTO:
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
+    def _get_task_request(self, task_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}{self.TASK_ENDPOINT}/{task_id}", self._get_headers(headers), parse=lambda content: Task.from_repr(content, task_id))
 
-        response = self._client.get(f"{self._base_url}{self.APP_ENDPOINT}/{app_id}", headers=headers)
+    def _create_task_transaction_request(self, transaction: TaskTransaction, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("POST", f"{self._base_url}{self.TASK_ENDPOINT}/transaction", self._get_headers(headers), body=transaction.to_repr(), success_codes=(200, 201))
 
-        if response.status_code == 200:
-            return AppDTO.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    def _get_user_profile_request(self, wenet_user_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}", self._get_headers(headers), parse=WeNetUserProfile.from_repr)
 
-    def get_app_users(self, app_id: str, headers: Optional[dict] = None) -> List[str]:
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
+    def _create_user_profile_request(self, wenet_user_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("POST", f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}", self._get_headers(headers, json_body=True), body={}, success_codes=(200, 201))
 
-        response = self._client.get(f"{self._base_url}{self.APP_ENDPOINT}/{app_id}/users", headers=headers)
+    def _update_user_profile_request(self, wenet_user_id: str, profile: CoreWeNetUserProfile, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("PUT", f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}", self._get_headers(headers, json_body=True), body=profile.to_repr(), parse=WeNetUserProfile.from_repr)
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+    def _get_user_profile_field_request(self, wenet_user_id: str, field: str, headers: Optional[dict]) -> ComponentRequest:
+        """
+        Build the request getting a field of a profile, e.g. its competences, as raw representations
+        """
+        return ComponentRequest("GET", f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/{field}", self._get_headers(headers), parse=lambda content: content)
 
-    def create_task(self, task: Task, headers: Optional[dict] = None) -> Task:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def _update_user_profile_field_request(self, wenet_user_id: str, field: str, values: list, value_type: type, headers: Optional[dict]) -> ComponentRequest:
+        """
+        Build the request overwriting a field of a profile, e.g. its competences, with values that are either raw representations or instances of the value_type model
+        """
+        raw_values = [value.to_repr() if isinstance(value, value_type) else value for value in values]
+        return ComponentRequest("PUT", f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/{field}", self._get_headers(headers, json_body=True), body=raw_values, parse=lambda content: content)
 
-        task_repr = task.to_repr()
-        task_repr.pop("id", None)
-        response = self._client.post(f"{self._base_url}{self.TASK_ENDPOINT}", body=task_repr, headers=headers)
+    def _get_relationship_page_request(self,
+                                       wenet_user_id: str,
+                                       target_id: Optional[str],
+                                       relation_type: Optional[str],
+                                       weight_from: Optional[float],
+                                       weight_to: Optional[float],
+                                       order: Optional[str],
+                                       offset: int,
+                                       limit: int,
+                                       headers: Optional[dict]
+                                       ) -> ComponentRequest:
+        query_params = {
+            "targetId": target_id,
+            "type": relation_type,
+            "weightFrom": weight_from,
+            "weightTo": weight_to,
+            "order": order,
+            "offset": offset,
+            "limit": limit
+        }
+        return ComponentRequest("GET", f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/relationships", self._get_headers(headers), query_params=query_params, parse=RelationshipPage.from_repr)
 
-        if response.status_code in [200, 201]:
-            return Task.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    def _update_user_relationships_request(self, wenet_user_id: str, relationships: List[Relationship], headers: Optional[dict]) -> ComponentRequest:
+        raw_relationships = [relationship.to_repr() for relationship in relationships]
+        return ComponentRequest("PUT", f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/relationships", self._get_headers(headers, json_body=True), body=raw_relationships,
+                                parse=lambda content: [Relationship.from_repr(x) for x in content])
+
+    def _get_task_page_request(self,
+                               app_id: Optional[str],
+                               requester_id: Optional[str],
+                               task_type_id: Optional[str],
+                               goal_name: Optional[str],
+                               goal_description: Optional[str],
+                               creation_from: Optional[datetime],
+                               creation_to: Optional[datetime],
+                               update_from: Optional[datetime],
+                               update_to: Optional[datetime],
+                               has_close_ts: Optional[bool],
+                               closed_from: Optional[datetime],
+                               closed_to: Optional[datetime],
+                               order: Optional[str],
+                               offset: int,
+                               limit: Optional[int],
+                               headers: Optional[dict]
+                               ) -> ComponentRequest:
+        query_params = {
+            "appId": app_id,
+            "requesterId": requester_id,
+            "taskTypeId": task_type_id,
+            "goalName": goal_name,
+            "goalDescription": goal_description,
+            "creationFrom": int(creation_from.timestamp()) if creation_from is not None else None,
+            "creationTo": int(creation_to.timestamp()) if creation_to is not None else None,
+            "updateFrom": int(update_from.timestamp()) if update_from is not None else None,
+            "updateTo": int(update_to.timestamp()) if update_to is not None else None,
+            "hasCloseTs": has_close_ts,
+            "closeFrom": int(closed_from.timestamp()) if closed_from is not None else None,
+            "closeTo": int(closed_to.timestamp()) if closed_to is not None else None,
+            "order": order,
+            "offset": offset,
+            "limit": limit
+        }
+        return ComponentRequest("GET", f"{self._base_url}{self.TASK_ENDPOINT}s", self._get_headers(headers), query_params=query_params, parse=TaskPage.from_repr)
 
-    def get_task(self, task_id: str, headers: Optional[dict] = None) -> Task:
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
+    def _log_message_request(self, message: BaseMessage, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("POST", f"{self._base_url}{self.LOG_ENDPOINT}", self._get_headers(headers, json_body=True), body=message.to_repr(), success_codes=(200, 201))
 
-        response = self._client.get(f"{self._base_url}{self.TASK_ENDPOINT}/{task_id}", headers=headers)
 
-        if response.status_code == 200:
-            return Task.from_repr(response.json(), task_id)
-        else:
-            raise self.get_api_exception_for_response(response)
+class ServiceApiInterface(BaseServiceApiInterface, ComponentInterface):
 
-    def create_task_transaction(self, transaction: TaskTransaction, headers: Optional[dict] = None) -> None:
-        if headers is not None:
-            headers.update(self._base_headers)
+    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/service", component_path_oauth: str = "/api/service", extra_headers: Optional[dict] = None, **kwargs) -> None:
+        if isinstance(client, Oauth2Client):
+            base_url = platform_url + component_path_oauth
         else:
-            headers = self._base_headers
+            base_url = platform_url + component_path
+        super().__init__(client, base_url, extra_headers, **kwargs)
 
-        response = self._client.post(f"{self._base_url}{self.TASK_ENDPOINT}/transaction", body=transaction.to_repr(), headers=headers)
+    @coalesced
+    def get_token_details(self, headers: Optional[dict] = None) -> TokenDetails:
+        return self._call(self._get_token_details_request(headers))
 
-        if response.status_code not in [200, 201]:
-            raise self.get_api_exception_for_response(response)
+    @coalesced
+    def get_app_details(self, app_id: str, headers: Optional[dict] = None) -> AppDTO:
+        return self._call(self._get_app_details_request(app_id, headers))
 
-    def get_user_profile(self, wenet_user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
+    @coalesced
+    def get_app_users(self, app_id: str, headers: Optional[dict] = None) -> List[str]:
+        return self._call(self._get_app_users_request(app_id, headers))
 
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}", headers=headers)
+    def create_task(self, task: Task, headers: Optional[dict] = None) -> Task:
+        return self._call(self._create_task_request(task, headers))
 
-        if response.status_code == 200:
-            return WeNetUserProfile.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    @coalesced
+    def get_task(self, task_id: str, headers: Optional[dict] = None) -> Task:
+        return self._call(self._get_task_request(task_id, headers))
 
-    def create_user_profile(self, wenet_user_id: str, headers: Optional[dict] = None) -> None:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+    def create_task_transaction(self, transaction: TaskTransaction, headers: Optional[dict] = None) -> None:
+        self._call(self._create_task_transaction_request(transaction, headers))
 
-        response = self._client.post(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}", {}, headers=headers)
+    @coalesced
+    def get_user_profile(self, wenet_user_id: str, headers: Optional[dict] = None) -> WeNetUserProfile:
+        return self._call(self._get_user_profile_request(wenet_user_id, headers))
 
-        if response.status_code not in [200, 201]:
-            raise self.get_api_exception_for_response(response)
+    def create_user_profile(self, wenet_user_id: str, headers: Optional[dict] = None) -> None:
+        self._call(self._create_user_profile_request(wenet_user_id, headers))
 
     def update_user_profile(self, wenet_user_id: str, profile: CoreWeNetUserProfile, headers: Optional[dict] = None) -> WeNetUserProfile:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}", profile.to_repr(), headers=headers)
-
-        if response.status_code == 200:
-            return WeNetUserProfile.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_request(wenet_user_id, profile, headers))
 
+    @coalesced
     def get_user_competences(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
         """
         Get all the competences defined into a profile
@@ -166,17 +203,7 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The competences defined into the profile
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/competences", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_profile_field_request(wenet_user_id, "competences", headers))
 
     def update_user_competences(self, wenet_user_id: str, competences: Union[List[dict], List[Competence]], headers: Optional[dict] = None) -> List[dict]:
         """
@@ -190,19 +217,9 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The updated competences of the profile
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_competences = [competence.to_repr() if isinstance(competence, Competence) else competence for competence in competences]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/competences", raw_competences, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_field_request(wenet_user_id, "competences", competences, Competence, headers))
 
+    @coalesced
     def get_user_materials(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
         """
         Get all the materials defined into a profile
@@ -214,17 +231,7 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The materials defined into the profile
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/materials", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_profile_field_request(wenet_user_id, "materials", headers))
 
     def update_user_materials(self, wenet_user_id: str, materials: Union[List[dict], List[Material]], headers: Optional[dict] = None) -> List[dict]:
         """
@@ -238,19 +245,9 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The updated materials of the profile
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_materials = [material.to_repr() if isinstance(material, Material) else material for material in materials]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/materials", raw_materials, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_field_request(wenet_user_id, "materials", materials, Material, headers))
 
+    @coalesced
     def get_user_meanings(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
         """
         Get all the meanings defined into a profile
@@ -262,17 +259,7 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The meanings defined into the profile
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/meanings", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_profile_field_request(wenet_user_id, "meanings", headers))
 
     def update_user_meanings(self, wenet_user_id: str, meanings: Union[List[dict], List[Meaning]], headers: Optional[dict] = None) -> List[dict]:
         """
@@ -286,19 +273,9 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The updated meanings of the profile
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_meanings = [meaning.to_repr() if isinstance(meaning, Meaning) else meaning for meaning in meanings]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/meanings", raw_meanings, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_field_request(wenet_user_id, "meanings", meanings, Meaning, headers))
 
+    @coalesced
     def get_user_norms(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
         """
         Get all the norms defined into a profile
@@ -310,17 +287,7 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The norms defined into the profile
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/norms", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_profile_field_request(wenet_user_id, "norms", headers))
 
     def update_user_norms(self, wenet_user_id: str, norms: Union[List[dict], List[ProtocolNorm]], headers: Optional[dict] = None) -> List[dict]:
         """
@@ -334,19 +301,9 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The updated norms of the profile
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_norms = [norm.to_repr() if isinstance(norm, ProtocolNorm) else norm for norm in norms]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/norms", raw_norms, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_field_request(wenet_user_id, "norms", norms, ProtocolNorm, headers))
 
+    @coalesced
     def get_user_personal_behaviors(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
         """
         Get all the personal behaviors defined into a profile
@@ -358,17 +315,7 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The personal behaviors defined into the profile
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/personalBehaviors", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_profile_field_request(wenet_user_id, "personalBehaviors", headers))
 
     def update_user_personal_behaviors(self, wenet_user_id: str, personal_behaviors: Union[List[dict], List[PersonalBehavior]], headers: Optional[dict] = None) -> List[dict]:
         """
@@ -382,19 +329,9 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The updated personal behaviors of the profile
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_personal_behaviors = [personal_behavior.to_repr() if isinstance(personal_behavior, PersonalBehavior) else personal_behavior for personal_behavior in personal_behaviors]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/personalBehaviors", raw_personal_behaviors, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_field_request(wenet_user_id, "personalBehaviors", personal_behaviors, PersonalBehavior, headers))
 
+    @coalesced
     def get_user_planned_activities(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
         """
         Get all the planned activities defined into a profile
@@ -406,17 +343,7 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The planned activities defined into the profile
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/plannedActivities", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_profile_field_request(wenet_user_id, "plannedActivities", headers))
 
     def update_user_planned_activities(self, wenet_user_id: str, planned_activities: Union[List[dict], List[PlannedActivity]], headers: Optional[dict] = None) -> List[dict]:
         """
@@ -430,19 +357,9 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The updated planned activities of the profile
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_planned_activities = [planned_activity.to_repr() if isinstance(planned_activity, PlannedActivity) else planned_activity for planned_activity in planned_activities]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/plannedActivities", raw_planned_activities, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_field_request(wenet_user_id, "plannedActivities", planned_activities, PlannedActivity, headers))
 
+    @coalesced
     def get_relationship_page(self,
                               wenet_user_id: str,
                               target_id: Optional[str] = None,
@@ -466,34 +383,7 @@ class ServiceApiInterface(ComponentInterface):
         :param headers: Additional headers to add to the call
         :return: An object representing a relationships page.
         """
-        query_params_temp = {
-            "targetId": target_id,
-            "type": relation_type,
-            "weightFrom": weight_from,
-            "weightTo": weight_to,
-            "order": order,
-            "offset": offset,
-            "limit": limit
-        }
-
-        query_params = {}
-
-        for param, value in query_params_temp.items():
-            if value is not None:
-                query_params[param] = value
-
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/relationships",
-                                    query_params=query_params, headers=headers)
-
-        if response.status_code == 200:
-            return RelationshipPage.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_relationship_page_request(wenet_user_id, target_id, relation_type, weight_from, weight_to, order, offset, limit, headers))
 
     def get_user_relationships(self,
                                wenet_user_id: str,
@@ -502,7 +392,8 @@ class ServiceApiInterface(ComponentInterface):
                                weight_from: Optional[float] = None,
                                weight_to: Optional[float] = None,
                                order: Optional[str] = None,
-                               headers: Optional[dict] = None) -> List[Relationship]:
+                               headers: Optional[dict] = None,
+                               page_size: Optional[AdaptivePageSize] = None) -> List[Relationship]:
         """
         Get all the relationships defined into a profile
 
@@ -513,31 +404,64 @@ class ServiceApiInterface(ComponentInterface):
         :param weight_to: The maximal weight, inclusive, of the relationships to return.
         :param order: The order in witch the relationships has to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order.
         :param headers: Additional headers to add to the call
+        :param page_size: The controller tuning the number of relationships of each page from the observed latency, weight and errors, by default the pages have 100 relationships
         :return: The list of relationships of the given user
         """
-        relationships: List[Relationship] = []
-        has_got_all_relationships = False
-        offset = 0
-        limit = 100
-        while not has_got_all_relationships:
-            relationship_page = self.get_relationship_page(
-                wenet_user_id=wenet_user_id,
-                target_id=target_id,
-                relation_type=relation_type,
-                weight_from=weight_from,
-                weight_to=weight_to,
-                order=order,
-                headers=headers,
-                offset=offset,
-                limit=limit
-            )
-
-            relationships.extend(relationship_page.relationships)
-            offset += len(relationship_page.relationships)
-            if len(relationship_page.relationships) < limit:
-                has_got_all_relationships = True
-
-        return relationships
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_relationship_page,
+            wenet_user_id=wenet_user_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            weight_from=weight_from,
+            weight_to=weight_to,
+            order=order,
+            headers=headers
+        )
+        return pagination.fetch_all(fetch_page, lambda relationship_page: relationship_page.relationships, limit=100, page_size=page_size)
+
+    def iter_user_relationships(self,
+                                wenet_user_id: str,
+                                target_id: Optional[str] = None,
+                                relation_type: Optional[str] = None,
+                                weight_from: Optional[float] = None,
+                                weight_to: Optional[float] = None,
+                                order: Optional[str] = None,
+                                offset: int = 0,
+                                limit: int = 100,
+                                pages: bool = False,
+                                prefetch: int = 0,
+                                headers: Optional[dict] = None
+                                ) -> Iterator[Union[Relationship, RelationshipPage]]:
+        """
+        Lazily iterate over the relationships defined into a profile, a page is fetched only when the previous one has been consumed
+
+        :param wenet_user_id: The Id of the wenet user
+        :param target_id: A user identifier to be equals on the relationships target to return
+        :param relation_type: The type for the relationships to return
+        :param weight_from: The minimal weight, inclusive, of the relationships to return.
+        :param weight_to: The maximal weight, inclusive, of the relationships to return.
+        :param order: The order in witch the relationships has to be returned
+        :param offset: The index of the first social network relationship to return
+        :param limit: The number of relationships of each page
+        :param pages: Whether to yield the pages of relationships instead of the single relationships
+        :param prefetch: The number of pages of relationships fetched in background while the current one is being processed, by default a page is fetched only when it is needed
+        :param headers: Additional headers to add to the call
+        :return: An iterator over the relationships of the given user, or over their pages
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_relationship_page,
+            wenet_user_id=wenet_user_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            weight_from=weight_from,
+            weight_to=weight_to,
+            order=order,
+            headers=headers
+        )
+        iterate = pagination.iter_pages if pages else pagination.iter_items
+        return iterate(fetch_page, lambda relationship_page: relationship_page.relationships, offset=offset, limit=limit, prefetch=prefetch)
 
     def update_user_relationships(self, wenet_user_id: str, relationships: List[Relationship], headers: Optional[dict] = None) -> List[Relationship]:
         """
@@ -547,19 +471,9 @@ class ServiceApiInterface(ComponentInterface):
         :param headers: Additional headers to add to the call
         :return:
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_relationships = [relationship.to_repr() for relationship in relationships]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/relationships", raw_relationships, headers=headers)
-
-        if response.status_code == 200:
-            return [Relationship.from_repr(x) for x in response.json()]
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_relationships_request(wenet_user_id, relationships, headers))
 
+    @coalesced
     def get_user_relevant_locations(self, wenet_user_id: str, headers: Optional[dict] = None) -> List[dict]:
         """
         Get all the relevant locations defined into a profile
@@ -571,17 +485,7 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The relevant locations defined into the profile
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        response = self._client.get(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/relevantLocations", headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_user_profile_field_request(wenet_user_id, "relevantLocations", headers))
 
     def update_user_relevant_locations(self, wenet_user_id: str, relevant_locations: Union[List[dict], List[RelevantLocation]], headers: Optional[dict] = None) -> List[dict]:
         """
@@ -595,43 +499,12 @@ class ServiceApiInterface(ComponentInterface):
         Returns:
             The updated relevant locations of the profile
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        raw_relevant_locations = [relevant_location.to_repr() if isinstance(relevant_location, RelevantLocation) else relevant_location for relevant_location in relevant_locations]
-        response = self._client.put(f"{self._base_url}{self.USER_ENDPOINT}/profile/{wenet_user_id}/relevantLocations", raw_relevant_locations, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_user_profile_field_request(wenet_user_id, "relevantLocations", relevant_locations, RelevantLocation, headers))
 
+    @coalesced
     def get_opened_tasks_of_user(self, wenet_user_id: str, app_id: str, headers: Optional[dict] = None) -> List[Task]:
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
-
-        tasks = []
-        response = self._client.get(f"{self._base_url}{self.TASK_ENDPOINT}s",
-                                    query_params={"appId": app_id, "requesterId": wenet_user_id, "hasCloseTs": False},
-                                    headers=headers)
-
-        if response.status_code == 200:
-            task_page = TaskPage.from_repr(response.json())
-            tasks.extend(task_page.tasks)
-            while len(tasks) < task_page.total:
-                offset = len(tasks)
-                response = self._client.get(f"{self._base_url}{self.TASK_ENDPOINT}s",
-                                            query_params={"appId": app_id, "requesterId": wenet_user_id, "hasCloseTs": False, "offset": offset},
-                                            headers=headers)
-                task_page = TaskPage.from_repr(response.json())
-                tasks.extend(task_page.tasks)
-            return tasks
-        else:
-            raise self.get_api_exception_for_response(response)
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, app_id=app_id, requester_id=wenet_user_id, has_close_ts=False, headers=headers)
+        return pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, limit=None)
 
     def get_all_tasks(self,
                       app_id: Optional[str] = None,
@@ -677,35 +550,27 @@ class ServiceApiInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        tasks = []
-        limit = 100
-        has_got_all_tasks = False
-        while not has_got_all_tasks:
-            task_page = self.get_task_page(
-                app_id=app_id,
-                requester_id=requester_id,
-                task_type_id=task_type_id,
-                goal_name=goal_name,
-                goal_description=goal_description,
-                creation_from=creation_from,
-                creation_to=creation_to,
-                update_from=update_from,
-                update_to=update_to,
-                has_close_ts=has_close_ts,
-                closed_from=closed_from,
-                closed_to=closed_to,
-                order=order,
-                offset=offset,
-                limit=limit,
-                headers=headers
-            )
-            tasks.extend(task_page.tasks)
-            offset += len(task_page.tasks)
-            if len(task_page.tasks) < limit:
-                has_got_all_tasks = True
-
-        return tasks
-
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_task_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            order=order,
+            headers=headers
+        )
+        return pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, offset=offset, limit=100)
+
+    @coalesced
     def get_task_page(self,
                       app_id: Optional[str] = None,
                       requester_id: Optional[str] = None,
@@ -752,74 +617,55 @@ class ServiceApiInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        if headers is not None:
-            headers.update(self._base_headers)
-        else:
-            headers = self._base_headers
+        return self._call(self._get_task_page_request(app_id, requester_id, task_type_id, goal_name, goal_description, creation_from, creation_to, update_from, update_to, has_close_ts, closed_from, closed_to, order, offset, limit, headers))
 
-        query_params_temp = {
-            "appId": app_id,
-            "requesterId": requester_id,
-            "taskTypeId": task_type_id,
-            "goalName": goal_name,
-            "goalDescription": goal_description,
-            "creationFrom": int(creation_from.timestamp()) if creation_from is not None else None,
-            "creationTo": int(creation_to.timestamp()) if creation_to is not None else None,
-            "updateFrom": int(update_from.timestamp()) if update_from is not None else None,
-            "updateTo": int(update_to.timestamp()) if update_to is not None else None,
-            "hasCloseTs": has_close_ts,
-            "closeFrom": int(closed_from.timestamp()) if closed_from is not None else None,
-            "closeTo": int(closed_to.timestamp()) if closed_to is not None else None,
-            "order": order,
-            "offset": offset,
-            "limit": limit
-        }
+    def take_tasks(self, n: int, predicate: Optional[Callable[[Task], bool]] = None, limit: int = 100, headers: Optional[dict] = None, **kwargs) -> List[Task]:
+        """
+        Get the first tasks matching the query parameters and a predicate, fetching the pages only until enough tasks have been found.
+        The query parameters are applied by the service, while the predicate is evaluated on each page as soon as it is received, so the query should be as selective as possible.
 
-        query_params = {}
+        Args:
+            n: the maximum number of tasks to return
+            predicate: the condition the tasks have to match, besides the query parameters
+            limit: the number of tasks of each page, without a predicate the pages are not larger than n
+            headers: additional headers
+            **kwargs: the query parameters of `get_task_page`, such as `app_id`, `requester_id`, `task_type_id` or `has_close_ts`
 
-        for key in query_params_temp:
-            if query_params_temp[key] is not None:
-                query_params[key] = query_params_temp[key]
+        Returns:
+            At most n tasks, in the order returned by the service
 
-        response = self._client.get(f"{self._base_url}{self.TASK_ENDPOINT}s", query_params=query_params, headers=headers)
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, headers=headers, **kwargs)
+        page_limit = limit if predicate is not None else max(1, min(n, limit))
+        return pagination.take(pagination.iter_items(fetch_page, lambda task_page: task_page.tasks, limit=page_limit), n, predicate=predicate)
 
-        if response.status_code == 200:
-            return TaskPage.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+    def find_first_task(self, predicate: Optional[Callable[[Task], bool]] = None, limit: int = 100, headers: Optional[dict] = None, **kwargs) -> Optional[Task]:
+        """
+        Get the first task matching the query parameters and a predicate, fetching the pages only until it has been found.
+        For example the first open task of a type created by a user is `find_first_task(app_id=app_id, requester_id=user_id, task_type_id=task_type_id, has_close_ts=False)`.
 
-    def get_all_tasks_of_application(self, app_id: str, headers: Optional[dict] = None) -> List[Task]:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        tasks = []
-        response = self._client.get(f"{self._base_url}{self.TASK_ENDPOINT}s",
-                                    query_params={"appId": app_id, "hasCloseTs": False},
-                                    headers=headers)
-
-        if response.status_code == 200:
-            task_page = TaskPage.from_repr(response.json())
-            tasks.extend(task_page.tasks)
-            while len(tasks) < task_page.total:
-                offset = len(tasks)
-                response = self._client.get(f"{self._base_url}{self.TASK_ENDPOINT}s",
-                                            query_params={"appId": app_id, "hasCloseTs": False, "offset": offset},
-                                            headers=headers)
-                task_page = TaskPage.from_repr(response.json())
-                tasks.extend(task_page.tasks)
-            return tasks
-        else:
-            raise self.get_api_exception_for_response(response)
+        Args:
+            predicate: the condition the task has to match, besides the query parameters
+            limit: the number of tasks of each page, without a predicate only a task is requested
+            headers: additional headers
+            **kwargs: the query parameters of `get_task_page`, such as `app_id`, `requester_id`, `task_type_id` or `has_close_ts`
 
-    def log_message(self, message: BaseMessage, headers: Optional[dict] = None) -> None:
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
+        Returns:
+            The first matching task, if any
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        tasks = self.take_tasks(1, predicate=predicate, limit=limit, headers=headers, **kwargs)
+        return tasks[0] if tasks else None
 
-        response = self._client.post(f"{self._base_url}{self.LOG_ENDPOINT}", body=message.to_repr(), headers=headers)
+    def get_all_tasks_of_application(self, app_id: str, headers: Optional[dict] = None) -> List[Task]:
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, app_id=app_id, has_close_ts=False, headers=headers)
+        return pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, limit=None)
 
-        if response.status_code not in [200, 201]:
-            raise self.get_api_exception_for_response(response)
+    def log_message(self, message: BaseMessage, headers: Optional[dict] = None) -> None:
+        self._call(self._log_message_request(message, headers))
@@ -0,0 +1,91 @@
+from __future__ import absolute_import, annotations
+
+import logging
+from datetime import datetime
+from numbers import Number
+from typing import Callable, Hashable, List, Optional, TypeVar
+
+from wenet.interface import pagination
+from wenet.storage.state import StateStore
+
+logger = logging.getLogger("wenet.interface.sync")
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+def sync_changes(fetch_page: Callable[[Optional[datetime], datetime, int, int], P],
+                 get_items: Callable[[P], List[T]],
+                 get_update_ts: Callable[[T], Optional[Number]],
+                 get_id: Callable[[T], Hashable],
+                 sink: Callable[[List[T]], None],
+                 state_store: StateStore,
+                 key: str,
+                 since: Optional[datetime] = None,
+                 until: Optional[datetime] = None,
+                 limit: int = 100
+                 ) -> int:
+    """
+    Synchronize the items changed since the last synchronization, according to the high-water mark of their update time kept in a state store.
+    The changed items are fetched in ascending order of update time moving forward the lower bound of the update time, as `pagination.iter_keyset` does, instead of the offset,
+    so that no item is skipped when the items already fetched are updated again during the synchronization.
+    The items are passed to the sink in batches of at most `limit` items, and after each batch the mark is moved to the greatest update time passed to the sink,
+    so that an interrupted synchronization restarts from the last batch passed to the sink.
+    The bounds of the update time are inclusive, so the sink may receive again the items updated exactly at the mark and it should upsert them.
+
+    Args:
+        fetch_page: the function fetching the page with the given offset and limit of the items updated between the bounds, ordered by update time and identifier, the lower bound is None for fetching all the items
+        get_items: the function getting the items of a page
+        get_update_ts: the function getting the update timestamp of an item
+        get_id: the function getting the identifier of an item
+        sink: the function upserting a list of changed items
+        state_store: the store of the high-water mark
+        key: the key of the state of the synchronization
+        since: the update time from which to synchronize the items if there is no mark yet, by default all the items are synchronized
+        until: the maximum update time of the items to synchronize, by default the current time
+        limit: the number of items of each page
+
+    Returns:
+        the number of items passed to the sink
+    """
+    state = state_store.load(key)
+    if state is not None and state.get("lastUpdateTs") is not None:
+        update_from = datetime.fromtimestamp(state["lastUpdateTs"])
+    else:
+        update_from = since
+    update_to = until if until is not None else datetime.now()
+    logger.info(f"Synchronizing [{key}] from [{update_from}] to [{update_to}]")
+
+    def fetch_keyset_page(update_ts_from: Optional[int], offset: int, page_limit: int) -> P:
+        page_update_from = datetime.fromtimestamp(update_ts_from) if update_ts_from is not None else None
+        return fetch_page(page_update_from, update_to, offset, page_limit)
+
+    def sink_batch(batch: List[T]) -> None:
+        sink(batch)
+        update_timestamps = [update_ts for update_ts in map(get_update_ts, batch) if update_ts is not None]
+        if update_timestamps:
+            state_store.save(key, {"lastUpdateTs": int(max(update_timestamps))})
+
+    synced = 0
+    batch = []
+    items = pagination.iter_keyset(
+        fetch_keyset_page,
+        get_items,
+        lambda item: int(get_update_ts(item) or 0),
+        get_id,
+        key_from=int(update_from.timestamp()) if update_from is not None else None,
+        limit=limit
+    )
+    for item in items:
+        batch.append(item)
+        if len(batch) == limit:
+            sink_batch(batch)
+            synced += len(batch)
+            batch = []
+
+    if batch:
+        sink_batch(batch)
+        synced += len(batch)
+
+    logger.info(f"Synchronized [{synced}] items of [{key}]")
+    return synced
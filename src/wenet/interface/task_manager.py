@@ -1,23 +1,141 @@
 from __future__ import absolute_import, annotations
 
+import functools
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Optional, Union
 
-from wenet.interface.component import ComponentInterface
+from wenet.interface.coalescer import coalesced
+from wenet.interface import checkpoint as checkpoints, pagination, sync
+from wenet.interface.checkpoint import Checkpoint
+from wenet.interface.component import BaseComponentInterface, ComponentInterface, ComponentRequest
+from wenet.interface.page_size import AdaptivePageSize
 from wenet.interface.client import RestClient
 from wenet.model.task.task import TaskPage, Task
 from wenet.model.task.transaction import TaskTransaction, TaskTransactionPage
+from wenet.storage.state import StateStore
 
 
 logger = logging.getLogger("wenet.interface.task_manager")
 
 
-class TaskManagerInterface(ComponentInterface):
+class BaseTaskManagerInterface(BaseComponentInterface):
+    """
+    The requests to the task manager, shared by the synchronous and the asynchronous interfaces
+    """
 
-    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/task_manager", extra_headers: Optional[dict] = None) -> None:
+    def _get_task_request(self, task_id: str, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("GET", f"{self._base_url}/tasks/{task_id}", self._get_headers(headers, json_body=True), parse=Task.from_repr)
+
+    def _get_task_page_request(self,
+                               app_id: Optional[str],
+                               requester_id: Optional[str],
+                               task_type_id: Optional[str],
+                               goal_name: Optional[str],
+                               goal_description: Optional[str],
+                               creation_from: Optional[datetime],
+                               creation_to: Optional[datetime],
+                               update_from: Optional[datetime],
+                               update_to: Optional[datetime],
+                               has_close_ts: Optional[bool],
+                               closed_from: Optional[datetime],
+                               closed_to: Optional[datetime],
+                               order: Optional[str],
+                               offset: int,
+                               limit: int,
+                               headers: Optional[dict]
+                               ) -> ComponentRequest:
+        query_params = {
+            "appId": app_id,
+            "requesterId": requester_id,
+            "taskTypeId": task_type_id,
+            "goalName": goal_name,
+            "goalDescription": goal_description,
+            "creationFrom": int(creation_from.timestamp()) if creation_from is not None else None,
+            "creationTo": int(creation_to.timestamp()) if creation_to is not None else None,
+            "updateFrom": int(update_from.timestamp()) if update_from is not None else None,
+            "updateTo": int(update_to.timestamp()) if update_to is not None else None,
+            "hasCloseTs": has_close_ts,
+            "closeFrom": int(closed_from.timestamp()) if closed_from is not None else None,
+            "closeTo": int(closed_to.timestamp()) if closed_to is not None else None,
+            "order": order,
+            "offset": offset,
+            "limit": limit
+        }
+        return ComponentRequest("GET", f"{self._base_url}/tasks", self._get_headers(headers, json_body=True), query_params=query_params, parse=TaskPage.from_repr)
+
+    def _get_transaction_page_request(self,
+                                      app_id: Optional[str],
+                                      requester_id: Optional[str],
+                                      task_type_id: Optional[str],
+                                      goal_name: Optional[str],
+                                      goal_description: Optional[str],
+                                      goal_keywords: Optional[str],
+                                      task_creation_from: Optional[datetime],
+                                      task_creation_to: Optional[datetime],
+                                      task_update_from: Optional[datetime],
+                                      task_update_to: Optional[datetime],
+                                      has_close_ts: Optional[bool],
+                                      closed_from: Optional[datetime],
+                                      closed_to: Optional[datetime],
+                                      task_id: Optional[str],
+                                      transaction_id: Optional[str],
+                                      transaction_label: Optional[str],
+                                      actioneer_id: Optional[str],
+                                      creation_from: Optional[datetime],
+                                      creation_to: Optional[datetime],
+                                      update_from: Optional[datetime],
+                                      update_to: Optional[datetime],
+                                      order: Optional[str],
+                                      offset: int,
+                                      limit: int,
+                                      headers: Optional[dict]
+                                      ) -> ComponentRequest:
+        query_params = {
+            "appId": app_id,
+            "requesterId": requester_id,
+            "taskTypeId": task_type_id,
+            "goalName": goal_name,
+            "goalDescription": goal_description,
+            "goalKeywords": goal_keywords,
+            "taskCreationFrom": int(task_creation_from.timestamp()) if task_creation_from is not None else None,
+            "taskCreationTo": int(task_creation_to.timestamp()) if task_creation_to is not None else None,
+            "taskUpdateFrom": int(task_update_from.timestamp()) if task_update_from is not None else None,
+            "taskUpdateTo": int(task_update_to.timestamp()) if task_update_to is not None else None,
+            "hasCloseTs": has_close_ts,
+            "closeFrom": int(closed_from.timestamp()) if closed_from is not None else None,
+            "closeTo": int(closed_to.timestamp()) if closed_to is not None else None,
+            "taskId": task_id,
+            "id": transaction_id,
+            "label": transaction_label,
+            "actioneerId": actioneer_id,
+            "creationFrom": int(creation_from.timestamp()) if creation_from is not None else None,
+            "creationTo": int(creation_to.timestamp()) if creation_to is not None else None,
+            "updateFrom": int(update_from.timestamp()) if update_from is not None else None,
+            "updateTo": int(update_to.timestamp()) if update_to is not None else None,
+            "order": order,
+            "offset": offset,
+            "limit": limit
+        }
+        return ComponentRequest("GET", f"{self._base_url}/taskTransactions", self._get_headers(headers, json_body=True), query_params=query_params, parse=TaskTransactionPage.from_repr)
+
+    def _create_task_request(self, task: Task, headers: Optional[dict]) -> ComponentRequest:
+        task_repr = task.prepare_task()
+        task_repr.pop("id", None)
+        return ComponentRequest("POST", f"{self._base_url}/tasks", self._get_headers(headers, json_body=True), body=task_repr, success_codes=(200, 201, 202), parse=Task.from_repr)
+
+    def _update_task_request(self, task: Task, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("PUT", f"{self._base_url}/tasks/{task.task_id}", self._get_headers(headers, json_body=True), body=task.prepare_task(), success_codes=(200, 201, 202), parse=Task.from_repr)
+
+    def _create_task_transaction_request(self, task_transaction: TaskTransaction, headers: Optional[dict]) -> ComponentRequest:
+        return ComponentRequest("POST", f"{self._base_url}/tasks/transactions", self._get_headers(headers, json_body=True), body=task_transaction.to_repr(), success_codes=(200, 201, 202))
+
+
+class TaskManagerInterface(BaseTaskManagerInterface, ComponentInterface):
+
+    def __init__(self, client: RestClient, platform_url: str, component_path: str = "/task_manager", extra_headers: Optional[dict] = None, **kwargs) -> None:
         base_url = platform_url + component_path
-        super().__init__(client, base_url, extra_headers)
+        super().__init__(client, base_url, extra_headers, **kwargs)
 
     def get_all_tasks(self,
                       app_id: Optional[str] = None,
@@ -34,7 +152,9 @@ class TaskManagerInterface(ComponentInterface):
                       closed_to: Optional[datetime] = None,
                       order: Optional[str] = None,
                       offset: int = 0,
-                      headers: Optional[dict] = None
+                      headers: Optional[dict] = None,
+                      max_workers: int = 1,
+                      page_size: Optional[AdaptivePageSize] = None
                       ) -> List[Task]:
         """
         Get the tasks specifying query parameters
@@ -55,6 +175,8 @@ class TaskManagerInterface(ComponentInterface):
             order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
             offset: The index of the first task to return. Default value is set to 0
             headers: additional headers
+            max_workers: the maximum number of pages fetched concurrently, by default the pages are fetched one after the other
+            page_size: the controller tuning the number of tasks of each page from the observed latency, weight and errors, by default the pages have 100 tasks
 
         Returns:
             The list of tasks
@@ -63,34 +185,25 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        tasks = []
-        limit = 100
-        has_got_all_tasks = False
-        while not has_got_all_tasks:
-            task_page = self.get_task_page(
-                app_id=app_id,
-                requester_id=requester_id,
-                task_type_id=task_type_id,
-                goal_name=goal_name,
-                goal_description=goal_description,
-                creation_from=creation_from,
-                creation_to=creation_to,
-                update_from=update_from,
-                update_to=update_to,
-                has_close_ts=has_close_ts,
-                closed_from=closed_from,
-                closed_to=closed_to,
-                order=order,
-                offset=offset,
-                limit=limit,
-                headers=headers
-            )
-            tasks.extend(task_page.tasks)
-            offset += len(task_page.tasks)
-            if len(task_page.tasks) < limit:
-                has_got_all_tasks = True
-
-        return tasks
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_task_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            order=order,
+            headers=headers
+        )
+        return pagination.fetch_all(fetch_page, lambda task_page: task_page.tasks, offset=offset, limit=100, max_workers=max_workers, page_size=page_size)
 
     def get_all_transactions(self,
                              app_id: Optional[str] = None,
@@ -116,7 +229,9 @@ class TaskManagerInterface(ComponentInterface):
                              update_to: Optional[datetime] = None,
                              order: Optional[str] = None,
                              offset: int = 0,
-                             headers: Optional[dict] = None
+                             headers: Optional[dict] = None,
+                             max_workers: int = 1,
+                             page_size: Optional[AdaptivePageSize] = None
                              ) -> List[TaskTransaction]:
         """
         Get the transactions specifying query parameters
@@ -146,6 +261,8 @@ class TaskManagerInterface(ComponentInterface):
             order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
             offset: The index of the first task to return. Default value is set to 0
             headers: additional headers
+            max_workers: the maximum number of pages fetched concurrently, by default the pages are fetched one after the other
+            page_size: the controller tuning the number of transactions of each page from the observed latency, weight and errors, by default the pages have 100 transactions
 
         Returns:
             The list of transactions
@@ -154,44 +271,585 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        transactions = []
-        has_got_all_transactions = False
-        limit = 100
-        while not has_got_all_transactions:
-            transaction_page = self.get_transaction_page(
-                app_id=app_id,
-                requester_id=requester_id,
-                task_type_id=task_type_id,
-                goal_name=goal_name,
-                goal_description=goal_description,
-                goal_keywords=goal_keywords,
-                task_creation_from=task_creation_from,
-                task_creation_to=task_creation_to,
-                task_update_from=task_update_from,
-                task_update_to=task_update_to,
-                has_close_ts=has_close_ts,
-                closed_from=closed_from,
-                closed_to=closed_to,
-                task_id=task_id,
-                transaction_id=transaction_id,
-                transaction_label=transaction_label,
-                actioneer_id=actioneer_id,
-                creation_from=creation_from,
-                creation_to=creation_to,
-                update_from=update_from,
-                update_to=update_to,
-                order=order,
-                offset=offset,
-                limit=limit,
-                headers=headers
-            )
-            transactions.extend(transaction_page.transactions)
-            offset += len(transaction_page.transactions)
-            if len(transaction_page.transactions) < limit:
-                has_got_all_transactions = True
-
-        return transactions
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_transaction_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            goal_keywords=goal_keywords,
+            task_creation_from=task_creation_from,
+            task_creation_to=task_creation_to,
+            task_update_from=task_update_from,
+            task_update_to=task_update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            task_id=task_id,
+            transaction_id=transaction_id,
+            transaction_label=transaction_label,
+            actioneer_id=actioneer_id,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            order=order,
+            headers=headers
+        )
+        return pagination.fetch_all(fetch_page, lambda transaction_page: transaction_page.transactions, offset=offset, limit=100, max_workers=max_workers, page_size=page_size)
+
+    def iter_tasks(self,
+                   app_id: Optional[str] = None,
+                   requester_id: Optional[str] = None,
+                   task_type_id: Optional[str] = None,
+                   goal_name: Optional[str] = None,
+                   goal_description: Optional[str] = None,
+                   creation_from: Optional[datetime] = None,
+                   creation_to: Optional[datetime] = None,
+                   update_from: Optional[datetime] = None,
+                   update_to: Optional[datetime] = None,
+                   has_close_ts: Optional[bool] = None,
+                   closed_from: Optional[datetime] = None,
+                   closed_to: Optional[datetime] = None,
+                   order: Optional[str] = None,
+                   offset: int = 0,
+                   limit: int = 100,
+                   pages: bool = False,
+                   prefetch: int = 0,
+                   headers: Optional[dict] = None
+                   ) -> Iterator[Union[Task, TaskPage]]:
+        """
+        Lazily iterate over the tasks specifying query parameters, a page is fetched only when the previous one has been consumed, so that only a page at a time is kept in memory
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            creation_from: the minimum creation date time of the tasks to return
+            creation_to: the maximum creation date time of the tasks to return
+            update_from: the minimum update date time of the tasks to return
+            update_to: the maximum update date time of the tasks to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first task to return. Default value is set to 0
+            limit: the number of tasks of each page. Default value is set to 100
+            pages: whether to yield the pages of tasks instead of the single tasks
+            prefetch: the number of pages of tasks fetched in background while the current one is being processed, by default a page is fetched only when it is needed
+            headers: additional headers
+
+        Returns:
+            An iterator over the tasks, or over their pages
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_task_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            order=order,
+            headers=headers
+        )
+        iterate = pagination.iter_pages if pages else pagination.iter_items
+        return iterate(fetch_page, lambda task_page: task_page.tasks, offset=offset, limit=limit, prefetch=prefetch)
+
+    def iter_transactions(self,
+                          app_id: Optional[str] = None,
+                          requester_id: Optional[str] = None,
+                          task_type_id: Optional[str] = None,
+                          goal_name: Optional[str] = None,
+                          goal_description: Optional[str] = None,
+                          goal_keywords: Optional[str] = None,
+                          task_creation_from: Optional[datetime] = None,
+                          task_creation_to: Optional[datetime] = None,
+                          task_update_from: Optional[datetime] = None,
+                          task_update_to: Optional[datetime] = None,
+                          has_close_ts: Optional[bool] = None,
+                          closed_from: Optional[datetime] = None,
+                          closed_to: Optional[datetime] = None,
+                          task_id: Optional[str] = None,
+                          transaction_id: Optional[str] = None,
+                          transaction_label: Optional[str] = None,
+                          actioneer_id: Optional[str] = None,
+                          creation_from: Optional[datetime] = None,
+                          creation_to: Optional[datetime] = None,
+                          update_from: Optional[datetime] = None,
+                          update_to: Optional[datetime] = None,
+                          order: Optional[str] = None,
+                          offset: int = 0,
+                          limit: int = 100,
+                          pages: bool = False,
+                          prefetch: int = 0,
+                          headers: Optional[dict] = None
+                          ) -> Iterator[Union[TaskTransaction, TaskTransactionPage]]:
+        """
+        Lazily iterate over the transactions specifying query parameters, a page is fetched only when the previous one has been consumed, so that only a page at a time is kept in memory
+
+        Args:
+            app_id: an application identifier to be equals on the tasks to return
+            requester_id: an user identifier to be equals on the tasks to return
+            task_type_id: a task type identifier to be equals on the tasks to return
+            goal_name: a goal name to be equals on the tasks to return
+            goal_description: a goal description to be equals on the tasks to return
+            goal_keywords: a set of keywords to be defined on the task where are the transactions to return
+            task_creation_from: the minimum creation date time of the task where are the transaction to return
+            task_creation_to: the maximum creation date time of the task where are the transaction to return
+            task_update_from: the minimum update date time of the task where are the transaction to return
+            task_update_to: the maximum update date time of the task where are the transaction to return
+            has_close_ts: get the closed or open tasks
+            closed_from: the minimum close date time of the task
+            closed_to: the maximum close date time of the task
+            task_id: a task identifier to be equals on the task where are the transactions to return
+            transaction_id: an identifier to be equals on the transactions to return
+            transaction_label: a label to be equals on the transactions to return
+            actioneer_id: an user identifier that has done the transactions to return
+            creation_from: the minimum creation date time of the transactions to return
+            creation_to: the maximum creation date time of the transactions to return
+            update_from: the minimum update date time of the transactions to return
+            update_to: the maximum update date time of the transactions to return
+            order: the order in witch the tasks have to be returned. For each field it has be separated by a ',' and each field can start with '+' (or without it) to order on ascending order, or with the prefix '-' to do on descendant order
+            offset: The index of the first transaction to return. Default value is set to 0
+            limit: the number of transactions of each page. Default value is set to 100
+            pages: whether to yield the pages of transactions instead of the single transactions
+            prefetch: the number of pages of transactions fetched in background while the current one is being processed, by default a page is fetched only when it is needed
+            headers: additional headers
 
+        Returns:
+            An iterator over the transactions, or over their pages
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        fetch_page = functools.partial(
+            self._fetch_page,
+            self.get_transaction_page,
+            app_id=app_id,
+            requester_id=requester_id,
+            task_type_id=task_type_id,
+            goal_name=goal_name,
+            goal_description=goal_description,
+            goal_keywords=goal_keywords,
+            task_creation_from=task_creation_from,
+            task_creation_to=task_creation_to,
+            task_update_from=task_update_from,
+            task_update_to=task_update_to,
+            has_close_ts=has_close_ts,
+            closed_from=closed_from,
+            closed_to=closed_to,
+            task_id=task_id,
+            transaction_id=transaction_id,
+            transaction_label=transaction_label,
+            actioneer_id=actioneer_id,
+            creation_from=creation_from,
+            creation_to=creation_to,
+            update_from=update_from,
+            update_to=update_to,
+            order=order,
+            headers=headers
+        )
+        iterate = pagination.iter_pages if pages else pagination.iter_items
+        return iterate(fetch_page, lambda transaction_page: transaction_page.transactions, offset=offset, limit=limit, prefetch=prefetch)
+
+    def iter_tasks_by_creation(self,
+                               creation_from: Optional[datetime] = None,
+                               limit: int = 100,
+                               headers: Optional[dict] = None,
+                               **kwargs
+                               ) -> Iterator[Task]:
+        """
+        Lazily iterate over the tasks in order of creation, fetching each page from the creation time of the last task received instead of from an offset.
+        The cost of each page does not grow with the depth of the crawl, and no task is skipped or repeated when tasks are created or deleted meanwhile.
+
+        Args:
+            creation_from: the minimum creation date time of the tasks to return
+            limit: the number of tasks of each page
+            headers: additional headers
+            **kwargs: the other query parameters of `get_task_page`, such as `creation_to`
+
+        Returns:
+            An iterator over the tasks, in order of creation
+
+        Raises:
+            ValueError: if an order other than `_creationTs` is required
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        self._check_fixed_order(kwargs, "_creationTs")
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, order="_creationTs", headers=headers, **kwargs)
+        return pagination.iter_keyset(
+            lambda key_from, offset, page_limit: fetch_page(offset, page_limit, creation_from=datetime.fromtimestamp(key_from) if key_from is not None else None),
+            lambda task_page: task_page.tasks,
+            lambda task: task.creation_ts,
+            lambda task: task.task_id,
+            key_from=int(creation_from.timestamp()) if creation_from is not None else None,
+            limit=limit
+        )
+
+    def iter_transactions_by_creation(self,
+                                      creation_from: Optional[datetime] = None,
+                                      limit: int = 100,
+                                      headers: Optional[dict] = None,
+                                      **kwargs
+                                      ) -> Iterator[TaskTransaction]:
+        """
+        Lazily iterate over the transactions in order of creation, fetching each page from the creation time of the last transaction received instead of from an offset.
+        The cost of each page does not grow with the depth of the crawl, and no transaction is skipped or repeated when transactions are created meanwhile.
+
+        Args:
+            creation_from: the minimum creation date time of the transactions to return
+            limit: the number of transactions of each page
+            headers: additional headers
+            **kwargs: the other query parameters of `get_transaction_page`, such as `creation_to`
+
+        Returns:
+            An iterator over the transactions, in order of creation
+
+        Raises:
+            ValueError: if an order other than `_creationTs` is required
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        self._check_fixed_order(kwargs, "_creationTs")
+        fetch_page = functools.partial(self._fetch_page, self.get_transaction_page, order="_creationTs", headers=headers, **kwargs)
+        return pagination.iter_keyset(
+            lambda key_from, offset, page_limit: fetch_page(offset, page_limit, creation_from=datetime.fromtimestamp(key_from) if key_from is not None else None),
+            lambda transaction_page: transaction_page.transactions,
+            lambda transaction: transaction.creation_ts,
+            lambda transaction: transaction.id,
+            key_from=int(creation_from.timestamp()) if creation_from is not None else None,
+            limit=limit
+        )
+
+    def crawl_tasks(self,
+                    creation_from: datetime,
+                    creation_to: Optional[datetime] = None,
+                    window: timedelta = timedelta(days=1),
+                    max_window_size: int = 1000,
+                    limit: int = 100,
+                    max_workers: int = 4,
+                    headers: Optional[dict] = None,
+                    **kwargs
+                    ) -> List[Task]:
+        """
+        Get the tasks created in a time range, splitting the range in windows of creation time fetched concurrently, so that no page is fetched with a deep offset.
+        The windows with more than `max_window_size` tasks are split again, and the tasks are returned in order of creation window without duplicates.
+
+        Args:
+            creation_from: the minimum creation date time of the tasks to return
+            creation_to: the maximum creation date time of the tasks to return, by default the current time
+            window: the initial duration of the windows of creation time
+            max_window_size: the number of tasks above which a window is split
+            limit: the number of tasks of each page
+            max_workers: the maximum number of windows fetched concurrently
+            headers: additional headers
+            **kwargs: the other query parameters of `get_task_page`
+
+        Returns:
+            The tasks created in the time range
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, headers=headers, **kwargs)
+        return pagination.fetch_all_in_windows(
+            lambda window_from, window_to, offset, page_limit: fetch_page(offset, page_limit, creation_from=window_from, creation_to=window_to),
+            lambda task_page: task_page.tasks,
+            lambda task: task.task_id,
+            creation_from,
+            creation_to if creation_to is not None else datetime.now(creation_from.tzinfo),
+            window,
+            max_window_items=max_window_size,
+            limit=limit,
+            max_workers=max_workers
+        )
+
+    def crawl_transactions(self,
+                           creation_from: datetime,
+                           creation_to: Optional[datetime] = None,
+                           by_task_creation: bool = False,
+                           window: timedelta = timedelta(days=1),
+                           max_window_size: int = 1000,
+                           limit: int = 100,
+                           max_workers: int = 4,
+                           headers: Optional[dict] = None,
+                           **kwargs
+                           ) -> List[TaskTransaction]:
+        """
+        Get the transactions created in a time range, splitting the range in windows of creation time fetched concurrently, so that no page is fetched with a deep offset.
+        The windows with more than `max_window_size` transactions are split again, and the transactions are returned in order of creation window without duplicates.
+
+        Args:
+            creation_from: the minimum creation date time of the transactions to return
+            creation_to: the maximum creation date time of the transactions to return, by default the current time
+            by_task_creation: whether the time range applies to the creation time of the tasks of the transactions instead of to the one of the transactions
+            window: the initial duration of the windows of creation time
+            max_window_size: the number of transactions above which a window is split
+            limit: the number of transactions of each page
+            max_workers: the maximum number of windows fetched concurrently
+            headers: additional headers
+            **kwargs: the other query parameters of `get_transaction_page`
+
+        Returns:
+            The transactions created in the time range
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        from_parameter, to_parameter = ("task_creation_from", "task_creation_to") if by_task_creation else ("creation_from", "creation_to")
+        fetch_page = functools.partial(self._fetch_page, self.get_transaction_page, headers=headers, **kwargs)
+        return pagination.fetch_all_in_windows(
+            lambda window_from, window_to, offset, page_limit: fetch_page(offset, page_limit, **{from_parameter: window_from, to_parameter: window_to}),
+            lambda transaction_page: transaction_page.transactions,
+            lambda transaction: transaction.id,
+            creation_from,
+            creation_to if creation_to is not None else datetime.now(creation_from.tzinfo),
+            window,
+            max_window_items=max_window_size,
+            limit=limit,
+            max_workers=max_workers
+        )
+
+    def export_tasks(self,
+                     sink: Callable[[List[Task]], None],
+                     checkpoint: Checkpoint,
+                     window: Optional[timedelta] = None,
+                     max_window_size: int = 1000,
+                     max_workers: int = 4,
+                     limit: int = 100,
+                     headers: Optional[dict] = None,
+                     **kwargs
+                     ) -> int:
+        """
+        Pass all the tasks matching the query parameters to a sink, saving in the checkpoint how far the crawl went.
+        If a crawl with the same query parameters has been interrupted, calling again this method resumes it where it stopped, without fetching again the pages already passed to the sink.
+
+        By default the tasks are fetched one page after the other, saving the offset of the next page.
+        If a window is specified, the creation time range between `creation_from` and `creation_to` (by default the current time) is split in windows fetched concurrently as in `crawl_tasks`, saving the windows completed.
+
+        Args:
+            sink: the function receiving the lists of tasks, always called from the calling thread
+            checkpoint: the checkpoint of the crawl
+            window: the initial duration of the windows of creation time, if the crawl is split in windows
+            max_window_size: the number of tasks above which a window is split
+            max_workers: the maximum number of windows fetched concurrently
+            limit: the number of tasks of each page
+            headers: additional headers
+            **kwargs: the query parameters of `get_task_page`
+
+        Returns:
+            The number of tasks passed to the sink by this call
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        return self._export(self.get_task_page, lambda task_page: task_page.tasks, "creation_from", "creation_to", sink, checkpoint, window, max_window_size, max_workers, limit, headers, kwargs)
+
+    def export_transactions(self,
+                            sink: Callable[[List[TaskTransaction]], None],
+                            checkpoint: Checkpoint,
+                            window: Optional[timedelta] = None,
+                            by_task_creation: bool = False,
+                            max_window_size: int = 1000,
+                            max_workers: int = 4,
+                            limit: int = 100,
+                            headers: Optional[dict] = None,
+                            **kwargs
+                            ) -> int:
+        """
+        Pass all the transactions matching the query parameters to a sink, saving in the checkpoint how far the crawl went.
+        If a crawl with the same query parameters has been interrupted, calling again this method resumes it where it stopped, without fetching again the pages already passed to the sink.
+
+        By default the transactions are fetched one page after the other, saving the offset of the next page.
+        If a window is specified, the creation time range between `creation_from` and `creation_to` (by default the current time) is split in windows fetched concurrently as in `crawl_transactions`, saving the windows completed.
+
+        Args:
+            sink: the function receiving the lists of transactions, always called from the calling thread
+            checkpoint: the checkpoint of the crawl
+            window: the initial duration of the windows of creation time, if the crawl is split in windows
+            by_task_creation: whether the windows are on the creation time of the tasks of the transactions, between `task_creation_from` and `task_creation_to`
+            max_window_size: the number of transactions above which a window is split
+            max_workers: the maximum number of windows fetched concurrently
+            limit: the number of transactions of each page
+            headers: additional headers
+            **kwargs: the query parameters of `get_transaction_page`
+
+        Returns:
+            The number of transactions passed to the sink by this call
+
+        Raises:
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        from_parameter, to_parameter = ("task_creation_from", "task_creation_to") if by_task_creation else ("creation_from", "creation_to")
+        return self._export(self.get_transaction_page, lambda transaction_page: transaction_page.transactions, from_parameter, to_parameter, sink, checkpoint, window, max_window_size, max_workers, limit, headers, kwargs)
+
+    @staticmethod
+    def _check_fixed_order(kwargs: dict, order: str) -> None:
+        """
+        Remove from the query parameters the order of a listing that can only be iterated in a given order
+
+        Raises:
+            ValueError: if a different order is required
+        """
+        if kwargs.pop("order", order) != order:
+            raise ValueError(f"The listing can only be iterated in the [{order}] order")
+
+    def _export(self,
+                get_page: Callable,
+                get_items: Callable,
+                from_parameter: str,
+                to_parameter: str,
+                sink: Callable[[list], None],
+                checkpoint: Checkpoint,
+                window: Optional[timedelta],
+                max_window_size: int,
+                max_workers: int,
+                limit: int,
+                headers: Optional[dict],
+                query: dict
+                ) -> int:
+        if window is None:
+            fetch_page = functools.partial(self._fetch_page, get_page, headers=headers, **query)
+            return checkpoints.export_all(fetch_page, get_items, sink, checkpoint, Checkpoint.fingerprint(query), limit=limit)
+
+        start = query.pop(from_parameter, None)
+        if start is None:
+            raise ValueError(f"The parameter [{from_parameter}] is required for splitting the crawl in windows")
+        end = query.pop(to_parameter, None) or datetime.now(start.tzinfo)
+        # the completed windows do not depend on the time range, which can be extended when resuming the crawl
+        fingerprint = Checkpoint.fingerprint(dict(query, window_on=from_parameter))
+        fetch_page = functools.partial(self._fetch_page, get_page, headers=headers, **query)
+        return checkpoints.export_all_in_windows(
+            lambda window_from, window_to, offset, page_limit: fetch_page(offset, page_limit, **{from_parameter: window_from, to_parameter: window_to}),
+            get_items,
+            sink,
+            checkpoint,
+            fingerprint,
+            start,
+            end,
+            window,
+            max_window_items=max_window_size,
+            limit=limit,
+            max_workers=max_workers
+        )
+
+    def sync_tasks(self,
+                   sink: Callable[[List[Task]], None],
+                   state_store: StateStore,
+                   key: str = "task_manager:tasks",
+                   since: Optional[datetime] = None,
+                   until: Optional[datetime] = None,
+                   limit: int = 100,
+                   headers: Optional[dict] = None,
+                   **kwargs
+                   ) -> int:
+        """
+        Incrementally synchronize the tasks updated since the last synchronization, according to the `_lastUpdateTs` high-water mark kept in the state store.
+        The updated tasks are fetched by moving forward their update time, and passed to the sink in batches of at most `limit` tasks; the sink should upsert them since the tasks updated exactly at the mark can be received again.
+
+        Args:
+            sink: the function upserting a list of updated tasks
+            state_store: the store of the high-water mark, such as a `CacheStateStore` or a `FileStateStore`
+            key: the key of the state of the synchronization, different synchronizations, for example with different filters, should have different keys
+            since: the update time from which to synchronize the tasks on the first synchronization, by default all the tasks are synchronized
+            until: the maximum update time of the tasks to synchronize, by default the current time
+            limit: the number of tasks of each page
+            headers: additional headers
+            **kwargs: the other query parameters of `get_task_page`
+
+        Returns:
+            The number of tasks passed to the sink
+
+        Raises:
+            ValueError: if an order other than `_lastUpdateTs,id` is required
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        self._check_fixed_order(kwargs, "_lastUpdateTs,id")
+        fetch_page = functools.partial(self._fetch_page, self.get_task_page, order="_lastUpdateTs,id", headers=headers, **kwargs)
+        return sync.sync_changes(
+            lambda update_from, update_to, offset, page_limit: fetch_page(offset, page_limit, update_from=update_from, update_to=update_to),
+            lambda task_page: task_page.tasks,
+            lambda task: task.last_update_ts,
+            lambda task: task.task_id,
+            sink,
+            state_store,
+            key,
+            since=since,
+            until=until,
+            limit=limit
+        )
+
+    def sync_transactions(self,
+                          sink: Callable[[List[TaskTransaction]], None],
+                          state_store: StateStore,
+                          key: str = "task_manager:transactions",
+                          since: Optional[datetime] = None,
+                          until: Optional[datetime] = None,
+                          limit: int = 100,
+                          headers: Optional[dict] = None,
+                          **kwargs
+                          ) -> int:
+        """
+        Incrementally synchronize the transactions updated since the last synchronization, according to the `_lastUpdateTs` high-water mark kept in the state store.
+        The updated transactions are fetched by moving forward their update time, and passed to the sink in batches of at most `limit` transactions; the sink should upsert them since the transactions updated exactly at the mark can be received again.
+
+        Args:
+            sink: the function upserting a list of updated transactions
+            state_store: the store of the high-water mark, such as a `CacheStateStore` or a `FileStateStore`
+            key: the key of the state of the synchronization, different synchronizations, for example with different filters, should have different keys
+            since: the update time from which to synchronize the transactions on the first synchronization, by default all the transactions are synchronized
+            until: the maximum update time of the transactions to synchronize, by default the current time
+            limit: the number of transactions of each page
+            headers: additional headers
+            **kwargs: the other query parameters of `get_transaction_page`
+
+        Returns:
+            The number of transactions passed to the sink
+
+        Raises:
+            ValueError: if an order other than `_lastUpdateTs,id` is required
+            AuthenticationException: if unauthorized for the request
+            Exception: if response from the component returns an unexpected code
+        """
+        self._check_fixed_order(kwargs, "_lastUpdateTs,id")
+        fetch_page = functools.partial(self._fetch_page, self.get_transaction_page, order="_lastUpdateTs,id", headers=headers, **kwargs)
+        return sync.sync_changes(
+            lambda update_from, update_to, offset, page_limit: fetch_page(offset, page_limit, update_from=update_from, update_to=update_to),
+            lambda transaction_page: transaction_page.transactions,
+            lambda transaction: transaction.last_update_ts,
+            lambda transaction: transaction.id,
+            sink,
+            state_store,
+            key,
+            since=since,
+            until=until,
+            limit=limit
+        )
+
+    @coalesced
     def get_task(self, task_id: str, headers: Optional[dict] = None) -> Task:
         """
         Get a task with an specific identifier
@@ -207,18 +865,9 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.get(f"{self._base_url}/tasks/{task_id}", headers=headers)
-
-        if response.status_code == 200:
-            return Task.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_task_request(task_id, headers))
 
+    @coalesced
     def get_task_page(self,
                       app_id: Optional[str] = None,
                       requester_id: Optional[str] = None,
@@ -265,42 +914,9 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        query_params_temp = {
-            "appId": app_id,
-            "requesterId": requester_id,
-            "taskTypeId": task_type_id,
-            "goalName": goal_name,
-            "goalDescription": goal_description,
-            "creationFrom": int(creation_from.timestamp()) if creation_from is not None else None,
-            "creationTo": int(creation_to.timestamp()) if creation_to is not None else None,
-            "updateFrom": int(update_from.timestamp()) if update_from is not None else None,
-            "updateTo": int(update_to.timestamp()) if update_to is not None else None,
-            "hasCloseTs": has_close_ts,
-            "closeFrom": int(closed_from.timestamp()) if closed_from is not None else None,
-            "closeTo": int(closed_to.timestamp()) if closed_to is not None else None,
-            "order": order,
-            "offset": offset,
-            "limit": limit
-        }
-
-        query_params = {}
-
-        for key in query_params_temp:
-            if query_params_temp[key] is not None:
-                query_params[key] = query_params_temp[key]
-
-        response = self._client.get(f"{self._base_url}/tasks", query_params=query_params, headers=headers)
-
-        if response.status_code == 200:
-            return TaskPage.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_task_page_request(app_id, requester_id, task_type_id, goal_name, goal_description, creation_from, creation_to, update_from, update_to, has_close_ts, closed_from, closed_to, order, offset, limit, headers))
 
+    @coalesced
     def get_transaction_page(self,
                              app_id: Optional[str] = None,
                              requester_id: Optional[str] = None,
@@ -365,50 +981,7 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        query_params_temp = {
-            "appId": app_id,
-            "requesterId": requester_id,
-            "taskTypeId": task_type_id,
-            "goalName": goal_name,
-            "goalDescription": goal_description,
-            "goalKeywords": goal_keywords,
-            "taskCreationFrom": int(task_creation_from.timestamp()) if task_creation_from is not None else None,
-            "taskCreationTo": int(task_creation_to.timestamp()) if task_creation_to is not None else None,
-            "taskUpdateFrom": int(task_update_from.timestamp()) if task_update_from is not None else None,
-            "taskUpdateTo": int(task_update_to.timestamp()) if task_update_to is not None else None,
-            "hasCloseTs": has_close_ts,
-            "closeFrom": int(closed_from.timestamp()) if closed_from is not None else None,
-            "closeTo": int(closed_to.timestamp()) if closed_to is not None else None,
-            "taskId": task_id,
-            "id": transaction_id,
-            "label": transaction_label,
-            "actioneerId": actioneer_id,
-            "creationFrom": int(creation_from.timestamp()) if creation_from is not None else None,
-            "creationTo": int(creation_to.timestamp()) if creation_to is not None else None,
-            "updateFrom": int(update_from.timestamp()) if update_from is not None else None,
-            "updateTo": int(update_to.timestamp()) if update_to is not None else None,
-            "order": order,
-            "offset": offset,
-            "limit": limit
-        }
-
-        query_params = {}
-
-        for key in query_params_temp:
-            if query_params_temp[key] is not None:
-                query_params[key] = query_params_temp[key]
-
-        response = self._client.get(f"{self._base_url}/taskTransactions", query_params=query_params, headers=headers)
-
-        if response.status_code == 200:
-            return TaskTransactionPage.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._get_transaction_page_request(app_id, requester_id, task_type_id, goal_name, goal_description, goal_keywords, task_creation_from, task_creation_to, task_update_from, task_update_to, has_close_ts, closed_from, closed_to, task_id, transaction_id, transaction_label, actioneer_id, creation_from, creation_to, update_from, update_to, order, offset, limit, headers))
 
     def create_task(self, task: Task, headers: Optional[dict] = None) -> Task:
         """
@@ -422,19 +995,7 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        task_repr = task.prepare_task()
-        task_repr.pop("id", None)
-        response = self._client.post(f"{self._base_url}/tasks", body=task_repr, headers=headers)
-
-        if response.status_code in [200, 201, 202]:
-            return Task.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._create_task_request(task, headers))
 
     def update_task(self, task: Task, headers: Optional[dict] = None) -> Task:
         """
@@ -448,17 +1009,7 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.put(f"{self._base_url}/tasks/{task.task_id}", body=task.prepare_task(), headers=headers)
-
-        if response.status_code in [200, 201, 202]:
-            return Task.from_repr(response.json())
-        else:
-            raise self.get_api_exception_for_response(response)
+        return self._call(self._update_task_request(task, headers))
 
     def create_task_transaction(self, task_transaction: TaskTransaction, headers: Optional[dict] = None) -> None:
         """
@@ -472,12 +1023,4 @@ class TaskManagerInterface(ComponentInterface):
             AuthenticationException: if unauthorized for the request
             Exception: if response from the component returns an unexpected code
         """
-        if headers is not None:
-            headers.update(self._json_body_headers)
-        else:
-            headers = self._json_body_headers
-
-        response = self._client.post(f"{self._base_url}/tasks/transactions", body=task_transaction.to_repr(), headers=headers)
-
-        if response.status_code not in [200, 201, 202]:
-            raise self.get_api_exception_for_response(response)
+        self._call(self._create_task_transaction_request(task_transaction, headers))
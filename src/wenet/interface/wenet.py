@@ -2,6 +2,7 @@ from __future__ import absolute_import, annotations
 
 from typing import Optional
 
+from wenet.interface.circuit_breaker import CircuitBreakerRegistry, default_circuit_breakers
 from wenet.interface.client import RestClient
 from wenet.interface.hub import HubInterface
 from wenet.interface.ilog import IlogInterface
@@ -31,25 +32,48 @@ class WeNet:
         self.hub = hub
         self.ilog = ilog
 
+    def close(self) -> None:
+        """
+        Release the connections of the clients used by the platform interfaces
+        """
+        for interface in [self.service_api, self.profile_manager, self.incentive_server, self.task_manager, self.logger, self.hub, self.ilog]:
+            interface.close()
+
+    def __enter__(self) -> WeNet:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     @staticmethod
-    def build(client: RestClient, platform_url: str = "https://internetofus.u-hopper.com/prod", extra_headers: Optional[dict] = None) -> WeNet:
+    def build(client: RestClient,
+              platform_url: str = "https://internetofus.u-hopper.com/prod",
+              extra_headers: Optional[dict] = None,
+              circuit_breakers: Optional[CircuitBreakerRegistry] = default_circuit_breakers,
+              **kwargs
+              ) -> WeNet:
         """
-        Build a WeNet collector with all the platform interfaces
+        Build a WeNet collector with all the platform interfaces.
+        All the interfaces share the given client and therefore its pool of connections.
+        Each interface has a circuit breaker failing fast its requests while its component is degraded.
 
         Args:
             client: the client for authenticate requests: ApikeyClient for an internal usage, Oauth2Client for an external usage.
             platform_url: the URL of the platform
             extra_headers: extra heather to add to all the requests
+            circuit_breakers: the registry of the circuit breakers of the components, by default the one shared by all the collectors of the process; if None the interfaces will not have circuit breakers
+            **kwargs: other settings of the interfaces, such as the retry_policy
 
         Returns:
             a WeNet collector with all the platform interfaces
         """
+        kwargs.update(platform_url=platform_url, extra_headers=extra_headers, circuit_breakers=circuit_breakers)
         return WeNet(
-            service_api=ServiceApiInterface(client, platform_url=platform_url, extra_headers=extra_headers),
-            profile_manager=ProfileManagerInterface(client, platform_url=platform_url, extra_headers=extra_headers),
-            incentive_server=IncentiveServerInterface(client, platform_url=platform_url, extra_headers=extra_headers),
-            task_manager=TaskManagerInterface(client, platform_url=platform_url, extra_headers=extra_headers),
-            logger=LoggerInterface(client, platform_url=platform_url, extra_headers=extra_headers),
-            hub=HubInterface(client, platform_url=platform_url, extra_headers=extra_headers),
-            ilog=IlogInterface(client, platform_url=platform_url, extra_headers=extra_headers)
+            service_api=ServiceApiInterface(client, **kwargs),
+            profile_manager=ProfileManagerInterface(client, **kwargs),
+            incentive_server=IncentiveServerInterface(client, **kwargs),
+            task_manager=TaskManagerInterface(client, **kwargs),
+            logger=LoggerInterface(client, **kwargs),
+            hub=HubInterface(client, **kwargs),
+            ilog=IlogInterface(client, **kwargs)
         )
@@ -1,15 +1,21 @@
 from __future__ import absolute_import, annotations
 
-import json
 import logging
 import os
+import threading
+import time
 import uuid
 from abc import ABC
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from json import JSONDecodeError
-from typing import Optional
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import redis
 
+from wenet.storage.codec import ValueCodec
+from wenet.utils import json_codec
+
 logger = logging.getLogger("wenet.storage.cache")
 
 
@@ -34,6 +40,75 @@ class BaseCache(ABC):
         """
         pass
 
+    def get_with_ttl(self, key: str) -> Tuple[Optional[dict], Optional[float]]:
+        """
+        Get cached data associated to the specified key, together with its remaining time to live.
+
+        :param str key: the data key
+        :return: the requested data, if it exists, and the number of seconds before it expires, None if it does not expire or the cache does not know it
+        """
+        return self.get(key), None
+
+    def get_many_with_ttl(self, keys: Iterable[str]) -> Dict[str, Tuple[dict, Optional[float]]]:
+        """
+        Get the cached data associated to several keys at once, together with their remaining time to live.
+
+        :param keys: the data keys
+        :return: the requested data and the number of seconds before it expires (None if it does not expire or the cache does not know it), by key, the keys without data are missing from the result
+        """
+        return {key: (data, None) for key, data in self.get_many(keys).items()}
+
+    def delete(self, key: str) -> None:
+        """
+        Remove the cached data associated to the specified key, if any.
+
+        :param str key: the data key
+        """
+        pass
+
+    def cache_many(self, data: Dict[str, dict], **kwargs) -> List[str]:
+        """
+        Cache several data entries at once, by default one after the other.
+
+        :param data: the data to cache, by key
+        :return: the keys of the cached data entries
+        """
+        return [self.cache(entry, key=key, **kwargs) for key, entry in data.items()]
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        """
+        Get the cached data associated to several keys at once, by default one after the other.
+
+        :param keys: the data keys
+        :return: the requested data, by key, the keys without data are missing from the result
+        """
+        result = {}
+        for key in keys:
+            data = self.get(key)
+            if data is not None:
+                result[key] = data
+        return result
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Remove the cached data associated to several keys at once, by default one after the other.
+
+        :param keys: the data keys
+        """
+        for key in keys:
+            self.delete(key)
+
+    def lock(self, key: str, timeout: float = 30) -> ContextManager:
+        """
+        Get a lock on the specified key shared by all the users of the cache.
+        Caches living in a single process do not need any lock among processes, and by default the returned lock does nothing.
+
+        :param str key: the key to lock
+        :param float timeout: the maximum number of seconds the lock can be held
+        :return: the lock, as a context manager
+        """
+        return nullcontext()
+
     @staticmethod
     def _generate_id():
         return str(uuid.uuid4())
@@ -56,6 +131,143 @@ class InMemoryCache(BaseCache):
     def get(self, key: str) -> Optional[dict]:
         return self._cache.get(key, None)
 
+    def delete(self, key: str) -> None:
+        self._cache.pop(key, None)
+
+    def cache_many(self, data: Dict[str, dict], **kwargs) -> List[str]:
+        self._cache.update(data)
+        return list(data)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        return {key: self._cache[key] for key in keys if key in self._cache}
+
+
+class BoundedInMemoryCache(BaseCache):
+    """
+    Cache storing data in the memory of the process, bounded in number of entries and approximate size.
+    When a bound is exceeded the least recently used entries are evicted, and the entries expire after their time to live.
+    All the operations take constant time and the cache can be shared among threads.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 10000, max_bytes: Optional[int] = None, default_ttl: Optional[float] = None) -> None:
+        """
+        :param max_entries: the maximum number of entries, no limit if None
+        :param max_bytes: the maximum approximate size of the entries, measured as the size of their JSON encoding, no limit if None
+        :param default_ttl: the time to live in seconds of the entries cached without a ttl, they do not expire if None
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._cache: OrderedDict[str, Tuple[dict, Optional[float], int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def cache(self, data: dict, key: Optional[str] = None, **kwargs) -> str:
+        """
+        Cache data in dictionary format.
+
+        Among the kwargs:
+
+        * ttl: the time to live of the data entry (expressed in seconds), by default the one of the cache
+
+        :param dict data: the data to cache
+        :param key: the key to save the data
+        :return: the identifier associated to the data entry
+        """
+        if key is None:
+            key = self._generate_id()
+
+        ttl = kwargs.get("ttl") or self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = len(json_codec.dumps(data)) if self.max_bytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            self._cache[key] = (data, expires_at, size)
+            self._bytes += size
+            self._evict()
+
+        return key
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._get(key, time.monotonic())
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[dict], Optional[float]]:
+        with self._lock:
+            now = time.monotonic()
+            return self._get(key, now), self._get_ttl(key, now)
+
+    def _get(self, key: str, now: float) -> Optional[dict]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        data, expires_at, _ = entry
+        if expires_at is not None and expires_at <= now:
+            self._remove(key)
+            return None
+        self._cache.move_to_end(key)
+        return data
+
+    def _get_ttl(self, key: str, now: float) -> Optional[float]:
+        entry = self._cache.get(key)
+        return entry[1] - now if entry is not None and entry[1] is not None else None
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def cache_many(self, data: Dict[str, dict], **kwargs) -> List[str]:
+        ttl = kwargs.get("ttl") or self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        entries = {key: (entry, expires_at, len(json_codec.dumps(entry)) if self.max_bytes is not None else 0) for key, entry in data.items()}
+        with self._lock:
+            for key, entry in entries.items():
+                self._remove(key)
+                self._cache[key] = entry
+                self._bytes += entry[2]
+            self._evict()
+
+        return list(data)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        result = {}
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                data = self._get(key, now)
+                if data is not None:
+                    result[key] = data
+        return result
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _evict(self) -> None:
+        while self._cache and ((self.max_entries is not None and len(self._cache) > self.max_entries) or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            key, (_, _, size) = self._cache.popitem(last=False)
+            self._bytes -= size
+            logger.debug(f"Evicted the least recently used entry [{key}]")
+
+    def clear(self) -> None:
+        """
+        Remove all the entries.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
 
 class RedisCache(BaseCache):
     """
@@ -63,8 +275,16 @@ class RedisCache(BaseCache):
     Cached data will only be available for a limited and specified amount of time.
     """
 
-    def __init__(self, r: redis.Redis) -> None:
+    _connection_pools: Dict[tuple, redis.ConnectionPool] = {}
+    _connection_pools_lock = threading.Lock()
+
+    def __init__(self, r: redis.Redis, codec: Optional[ValueCodec] = None) -> None:
+        """
+        :param r: the Redis connection
+        :param codec: the codec of the cached values, by default they are stored in JSON; the values written with any codec can be read
+        """
         self._r = r
+        self._codec = codec if codec is not None else ValueCodec()
 
     def cache(self, data: dict, key: Optional[str] = None, **kwargs) -> str:
         """
@@ -81,10 +301,10 @@ class RedisCache(BaseCache):
         if key is None:
             key = self._generate_id()
 
-        self._set(key, json.dumps(data), kwargs.get("ttl", None))
+        self._set(key, self._codec.encode(data), kwargs.get("ttl", None))
         return key
 
-    def _set(self, key: str, value: str, ttl: Optional[int]) -> None:
+    def _set(self, key: str, value: Union[str, bytes], ttl: Optional[int]) -> None:
         logger.debug(f"Caching data for key [{key}] and ttl [{ttl}]")
         if ttl:
             self._r.set(key, value, ex=ttl)
@@ -96,8 +316,8 @@ class RedisCache(BaseCache):
         result = self._get(key)
         if result is not None:
             try:
-                result = json.loads(result)
-            except JSONDecodeError as e:
+                result = self._codec.decode(result)
+            except ValueError as e:
                 logger.exception(f"Could not parse cached data for key [{key}]", exc_info=e)
                 raise e
         else:
@@ -105,38 +325,420 @@ class RedisCache(BaseCache):
 
         return result
 
-    def _get(self, key) -> str:
+    def _get(self, key) -> Optional[bytes]:
         return self._r.get(key)
 
+    def delete(self, key: str) -> None:
+        logger.debug(f"Deleting cached data for key [{key}]")
+        self._r.delete(key)
+
+    def cache_many(self, data: Dict[str, dict], **kwargs) -> List[str]:
+        """
+        Cache several data entries at once, in a single round trip.
+
+        Among the kwargs:
+
+        * ttl: the time to live of the data entries (expressed in seconds)
+
+        :param data: the data to cache, by key
+        :return: the keys of the cached data entries
+        """
+        if not data:
+            return []
+
+        ttl = kwargs.get("ttl", None)
+        logger.debug(f"Caching data for [{len(data)}] keys and ttl [{ttl}]")
+        pipeline = self._r.pipeline(transaction=False)
+        for key, entry in data.items():
+            if ttl:
+                pipeline.set(key, self._codec.encode(entry), ex=ttl)
+            else:
+                pipeline.set(key, self._codec.encode(entry))
+        pipeline.execute()
+        return list(data)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        """
+        Get the cached data associated to several keys at once, in a single round trip.
+
+        :param keys: the data keys
+        :return: the requested data, by key, the keys without data are missing from the result
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        result = {}
+        for key, value in zip(keys, self._get_many(keys)):
+            if value is None:
+                continue
+            try:
+                result[key] = self._codec.decode(value)
+            except ValueError as e:
+                logger.exception(f"Could not parse cached data for key [{key}]", exc_info=e)
+                raise e
+
+        if len(result) < len(keys):
+            logger.debug(f"No data for [{len(keys) - len(result)}] keys out of [{len(keys)}]")
+        return result
+
+    def _get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return self._r.mget(keys)
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[dict], Optional[float]]:
+        return self.get_many_with_ttl([key]).get(key, (None, None))
+
+    def get_many_with_ttl(self, keys: Iterable[str]) -> Dict[str, Tuple[dict, Optional[float]]]:
+        """
+        Get the cached data associated to several keys at once together with their remaining time to live, in a single round trip.
+
+        :param keys: the data keys
+        :return: the requested data and the number of seconds before it expires (None if it does not expire), by key, the keys without data are missing from the result
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        pipeline = self._r.pipeline(transaction=False)
+        for key in keys:
+            pipeline.get(key)
+            pipeline.pttl(key)
+        replies = pipeline.execute()
+
+        result = {}
+        for key, value, ttl in zip(keys, replies[::2], replies[1::2]):
+            if value is None:
+                continue
+            try:
+                result[key] = (self._codec.decode(value), ttl / 1000 if ttl is not None and ttl >= 0 else None)
+            except ValueError as e:
+                logger.exception(f"Could not parse cached data for key [{key}]", exc_info=e)
+                raise e
+        return result
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            logger.debug(f"Deleting cached data for [{len(keys)}] keys")
+            self._r.delete(*keys)
+
+    def lock(self, key: str, timeout: float = 30) -> ContextManager:
+        """
+        Get a Redis lock on the specified key, shared by all the processes using the same Redis instance.
+        The lock is not bound to the acquiring thread, so that it can be released from an executor thread.
+
+        :param str key: the key to lock
+        :param float timeout: the maximum number of seconds the lock can be held, and waited for
+        :return: the lock, as a context manager
+        """
+        return self._r.lock(f"{key}:lock", timeout=timeout, blocking_timeout=timeout, thread_local=False)
+
     @staticmethod
-    def _build_redis_from_env() -> redis.Redis:
+    def _get_env_int(name: str) -> Optional[int]:
+        value = os.getenv(name)
+        return int(value) if value else None
+
+    @staticmethod
+    def _get_env_float(name: str) -> Optional[float]:
+        value = os.getenv(name)
+        return float(value) if value else None
+
+    @staticmethod
+    def _get_env_bool(name: str) -> Optional[bool]:
+        value = os.getenv(name)
+        return value.lower() in ("1", "true", "yes", "on") if value else None
+
+    @staticmethod
+    def _connection_pool_kwargs_from_env() -> dict:
+        """
+        Get the configuration of the Redis connection pool from the environment variables, the ones that are not set are left to the defaults of redis-py.
+
+        :return: the keyword arguments of the connection pool
         """
-        Build the Redis connection using environment variables.
+        kwargs = {
+            "db": int(os.getenv("REDIS_DB", 0)),
+            "password": os.getenv("REDIS_PASSWORD") or None,
+            "max_connections": RedisCache._get_env_int("REDIS_MAX_CONNECTIONS"),
+            "socket_timeout": RedisCache._get_env_float("REDIS_SOCKET_TIMEOUT"),
+            "socket_connect_timeout": RedisCache._get_env_float("REDIS_SOCKET_CONNECT_TIMEOUT"),
+            "retry_on_timeout": RedisCache._get_env_bool("REDIS_RETRY_ON_TIMEOUT"),
+            "health_check_interval": RedisCache._get_env_int("REDIS_HEALTH_CHECK_INTERVAL")
+        }
+
+        if os.getenv("REDIS_URL"):
+            kwargs["url"] = os.getenv("REDIS_URL")
+            del kwargs["db"]
+        elif os.getenv("REDIS_UNIX_SOCKET_PATH"):
+            kwargs["connection_class"] = redis.UnixDomainSocketConnection
+            kwargs["path"] = os.getenv("REDIS_UNIX_SOCKET_PATH")
+        else:
+            kwargs["host"] = os.getenv("REDIS_HOST", "localhost")
+            kwargs["port"] = int(os.getenv("REDIS_PORT", 6379))
+            kwargs["socket_keepalive"] = RedisCache._get_env_bool("REDIS_SOCKET_KEEPALIVE")
+
+        return {name: value for name, value in kwargs.items() if value is not None}
 
-        Required environment variables are:
+    @staticmethod
+    def build_connection_pool_from_env(shared: bool = True) -> redis.ConnectionPool:
+        """
+        Build the Redis connection pool using environment variables.
+
+        The connection is configured with:
+          - REDIS_URL - a redis://, rediss:// or unix:// url, taking precedence over the following variables
+          - REDIS_UNIX_SOCKET_PATH - the path of the unix socket, taking precedence over the host and port
           - REDIS_HOST - default to 'localhost'
           - REDIS_PORT - default to '6379'
           - REDIS_DB - default to '0'
+          - REDIS_PASSWORD - optional
+
+        The pool is tuned with the optional:
+          - REDIS_MAX_CONNECTIONS - the maximum number of connections of the pool
+          - REDIS_SOCKET_TIMEOUT - the timeout in seconds of the commands
+          - REDIS_SOCKET_CONNECT_TIMEOUT - the timeout in seconds of the connection
+          - REDIS_SOCKET_KEEPALIVE - whether to enable TCP keepalive on the connections (true or false)
+          - REDIS_RETRY_ON_TIMEOUT - whether to retry the commands that timed out (true or false)
+          - REDIS_HEALTH_CHECK_INTERVAL - the number of seconds after which an idle connection is checked before being used
+
+        :param shared: whether to reuse the pool already built with the same configuration in the process, so that all the caches and clients built from the environment share the same connections
+        :return: the connection pool
+        """
+        kwargs = RedisCache._connection_pool_kwargs_from_env()
+        if not shared:
+            return RedisCache._build_connection_pool(kwargs)
+
+        pool_key = tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+        with RedisCache._connection_pools_lock:
+            if pool_key not in RedisCache._connection_pools:
+                RedisCache._connection_pools[pool_key] = RedisCache._build_connection_pool(kwargs)
+            return RedisCache._connection_pools[pool_key]
+
+    @staticmethod
+    def _build_connection_pool(kwargs: dict) -> redis.ConnectionPool:
+        kwargs = dict(kwargs)
+        url = kwargs.pop("url", None)
+        logger.debug(f"Building a Redis connection pool with [{kwargs.get('max_connections')}] maximum connections")
+        if url is not None:
+            return redis.ConnectionPool.from_url(url, **kwargs)
+        return redis.ConnectionPool(**kwargs)
+
+    @staticmethod
+    def _build_redis_from_env() -> redis.Redis:
+        """
+        Build the Redis connection using environment variables, on the connection pool shared by the process (see `build_connection_pool_from_env`).
 
         :return: the redis connection
         """
-        return redis.Redis(
-            host=os.getenv("REDIS_HOST", "localhost"),
-            port=int(os.getenv("REDIS_PORT", 6379)),
-            db=int(os.getenv("REDIS_DB", 0))
-        )
+        return redis.Redis(connection_pool=RedisCache.build_connection_pool_from_env())
 
     @staticmethod
-    def build_from_env() -> RedisCache:
+    def build_from_env(codec: Optional[ValueCodec] = None) -> RedisCache:
         """
-        Build the Redis cache using environment variables.
+        Build the Redis cache using environment variables, the caches built in the same process share the same connection pool.
+        Pass the cache to the `Oauth2Client`s for sharing the pool with them as well.
 
-        Required environment variables are:
-          - REDIS_HOST - default to 'localhost'
-          - REDIS_PORT - default to '6379'
-          - REDIS_DB - default to '0'
+        The environment variables are described in `build_connection_pool_from_env`.
 
+        :param codec: the codec of the cached values, by default they are stored in JSON
         :return: the redis cache
         """
         r = RedisCache._build_redis_from_env()
-        return RedisCache(r)
+        return RedisCache(r, codec=codec)
+
+
+class NearCache(BaseCache):
+    """
+    Two-tier cache keeping a small in-process copy (L1) of the entries of a shared cache (L2), such as a RedisCache, so that the hot entries are read from the local memory.
+    The changes made through a near cache are published on a Redis channel, and the near caches subscribed to it (usually one in each process) drop their copy of the changed entries.
+    The local copies also expire after a short time to live, which bounds how long an entry can stay stale when it is changed without going through a near cache or when an invalidation is lost.
+    """
+
+    def __init__(self,
+                 l2: BaseCache,
+                 l1: Optional[BoundedInMemoryCache] = None,
+                 r: Optional[redis.Redis] = None,
+                 channel: str = "wenet:cache:invalidation"
+                 ) -> None:
+        """
+        :param l2: the shared cache
+        :param l1: the in-process cache, by default one with 1000 entries expiring after 60 seconds
+        :param r: the Redis connection used for publishing and receiving the invalidations, if not specified the changes are not propagated to the other near caches
+        :param channel: the Redis channel of the invalidations
+        """
+        self.l2 = l2
+        self.l1 = l1 if l1 is not None else BoundedInMemoryCache(max_entries=1000, default_ttl=60)
+        self.channel = channel
+        self._r = r
+        self._id = self._generate_id()
+        self._epoch = 0
+        self._epoch_lock = threading.Lock()
+        self._locked_keys = threading.local()
+        self._pubsub = None
+        self._listener = None
+        if r is not None:
+            self._pubsub = r.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{channel: self._on_invalidation})
+            self._listener = self._pubsub.run_in_thread(sleep_time=1, daemon=True, exception_handler=self._on_listener_error)
+        super().__init__()
+
+    def cache(self, data: dict, key: Optional[str] = None, **kwargs) -> str:
+        """
+        Cache data in dictionary format, in both the tiers.
+
+        Among the kwargs:
+
+        * ttl: the time to live of the data entry (expressed in seconds), the local copy does not outlive it
+
+        :param dict data: the data to cache
+        :param key: the key to save the data
+        :return: the identifier associated to the data entry
+        """
+        key = self.l2.cache(data, key=key, **kwargs)
+        self._publish([key])
+        with self._epoch_lock:
+            self._epoch += 1
+            self.l1.cache(data, key=key, **self._l1_kwargs(kwargs.get("ttl")))
+        return key
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get cached data associated to the specified key, from the local copy if any.
+        Within the lock of the key (see `lock`), the data is always read from the shared cache.
+
+        :param str key: the data key
+        :return: the requested data, if it exists
+        """
+        if key not in self._get_locked_keys():
+            data = self.l1.get(key)
+            if data is not None:
+                return data
+
+        epoch = self._epoch
+        data, ttl = self.l2.get_with_ttl(key)
+        if data is not None:
+            self._fill({key: (data, ttl)}, epoch)
+        return data
+
+    def delete(self, key: str) -> None:
+        self.delete_many([key])
+
+    def cache_many(self, data: Dict[str, dict], **kwargs) -> List[str]:
+        keys = self.l2.cache_many(data, **kwargs)
+        self._publish(keys)
+        with self._epoch_lock:
+            self._epoch += 1
+            self.l1.cache_many(data, **self._l1_kwargs(kwargs.get("ttl")))
+        return keys
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        keys = list(keys)
+        locked_keys = self._get_locked_keys()
+        result = self.l1.get_many([key for key in keys if key not in locked_keys])
+        missing_keys = [key for key in keys if key not in result]
+        if missing_keys:
+            epoch = self._epoch
+            missing_data = self.l2.get_many_with_ttl(missing_keys)
+            self._fill(missing_data, epoch)
+            result.update({key: data for key, (data, _) in missing_data.items()})
+        return result
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        self.l2.delete_many(keys)
+        self._publish(keys)
+        self._invalidate(keys)
+
+    def lock(self, key: str, timeout: float = 30) -> ContextManager:
+        """
+        Get the lock of the shared cache on the specified key.
+        While the lock is held, the reads of the key by the current thread bypass the local copy, which could still miss an invalidation published by another process.
+
+        :param str key: the key to lock
+        :param float timeout: the maximum number of seconds the lock can be held, and waited for
+        :return: the lock, as a context manager
+        """
+        return self._locked(key, self.l2.lock(key, timeout=timeout))
+
+    @contextmanager
+    def _locked(self, key: str, lock: ContextManager) -> Iterator[None]:
+        with lock:
+            locked_keys = self._get_locked_keys()
+            locked_keys.append(key)
+            try:
+                yield
+            finally:
+                locked_keys.remove(key)
+
+    def _get_locked_keys(self) -> List[str]:
+        locked_keys = getattr(self._locked_keys, "keys", None)
+        if locked_keys is None:
+            locked_keys = []
+            self._locked_keys.keys = locked_keys
+        return locked_keys
+
+    def _fill(self, entries: Dict[str, Tuple[dict, Optional[float]]], epoch: int) -> None:
+        """
+        Copy in the local cache the entries read from the shared cache, unless an invalidation or a change happened since the read began, the copies do not outlive the entries
+        """
+        with self._epoch_lock:
+            if self._epoch != epoch:
+                logger.debug(f"Not copying locally [{len(entries)}] entries changed while being read")
+                return
+            for key, (data, ttl) in entries.items():
+                if ttl is None or ttl > 0:
+                    self.l1.cache(data, key=key, **self._l1_kwargs(ttl))
+
+    def _invalidate(self, keys: List[str]) -> None:
+        with self._epoch_lock:
+            self._epoch += 1
+            self.l1.delete_many(keys)
+
+    def _l1_kwargs(self, ttl: Optional[float]) -> dict:
+        if ttl and (self.l1.default_ttl is None or ttl < self.l1.default_ttl):
+            return {"ttl": ttl}
+        return {}
+
+    def _publish(self, keys: List[str]) -> None:
+        if self._r is not None and keys:
+            self._r.publish(self.channel, json_codec.dumps({"source": self._id, "keys": keys}))
+
+    def _on_invalidation(self, message: dict) -> None:
+        try:
+            invalidation = json_codec.loads(message["data"])
+        except (JSONDecodeError, TypeError) as e:
+            logger.warning(f"Ignoring a malformed invalidation on [{self.channel}]: {e}")
+            return
+
+        if invalidation.get("source") != self._id:
+            logger.debug(f"Invalidating the local copy of [{len(invalidation.get('keys', []))}] keys")
+            self._invalidate(invalidation.get("keys", []))
+
+    def _on_listener_error(self, error: Exception, pubsub, thread) -> None:
+        logger.warning(f"Dropping the local copies, the invalidations on [{self.channel}] could have been lost: {error}")
+        with self._epoch_lock:
+            self._epoch += 1
+            self.l1.clear()
+        time.sleep(1)
+
+    def close(self) -> None:
+        """
+        Stop receiving the invalidations.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+    @staticmethod
+    def build_from_env(l1: Optional[BoundedInMemoryCache] = None, channel: str = "wenet:cache:invalidation", codec: Optional[ValueCodec] = None) -> NearCache:
+        """
+        Build a near cache in front of the Redis cache built using environment variables (see `RedisCache.build_from_env`), receiving the invalidations through the same Redis.
+
+        :param l1: the in-process cache, by default one with 1000 entries expiring after 60 seconds
+        :param channel: the Redis channel of the invalidations
+        :param codec: the codec of the values cached in Redis, by default they are stored in JSON
+        :return: the near cache
+        """
+        r = RedisCache._build_redis_from_env()
+        return NearCache(RedisCache(r, codec=codec), l1=l1, r=r, channel=channel)
@@ -0,0 +1,157 @@
+from __future__ import absolute_import, annotations
+
+import logging
+import zlib
+from typing import List, Optional, Union
+
+from wenet.utils import json_codec
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger("wenet.storage.codec")
+
+
+class ValueCodec:
+    """
+    Codec of the values stored in a cache.
+
+    The values are serialized in JSON or in msgpack, and compressed with zlib or zstd (optionally with a dictionary trained on similar values) when they are larger than a threshold.
+    The values that are not plain JSON start with a header byte marking their serialization and compression, so that the values written by any codec can be read by all the others.
+    A header byte always has the highest bit set, which never happens for a JSON document: the values without it, such as the ones written by the previous versions, are decoded as JSON.
+    """
+
+    SERIALIZERS = {"json": 1, "msgpack": 2}
+    COMPRESSIONS = {None: 0, "zlib": 1, "zstd": 2, "zstd-dictionary": 3}
+
+    def __init__(self,
+                 serializer: str = "json",
+                 compression: Optional[str] = None,
+                 compression_threshold: int = 1024,
+                 compression_level: Optional[int] = None,
+                 zstd_dictionary: Optional[bytes] = None
+                 ) -> None:
+        """
+        :param serializer: the serialization of the values, json or msgpack (requires the msgpack library)
+        :param compression: the compression of the values larger than the threshold, zlib or zstd (requires the zstandard library), by default the values are not compressed
+        :param compression_threshold: the size in bytes of the serialized values above which they are compressed
+        :param compression_level: the compression level, by default the one of the compression library
+        :param zstd_dictionary: a zstd dictionary (see `train_zstd_dictionary`) used for compressing and decompressing the values with zstd, all the processes reading the values must use the same dictionary
+        :raise ValueError: if the serialization or the compression is unknown or its library is not installed
+        """
+        if serializer not in self.SERIALIZERS:
+            raise ValueError(f"Unknown serializer [{serializer}], available serializers are {list(self.SERIALIZERS)}")
+        if compression not in ("zlib", "zstd", None):
+            raise ValueError(f"Unknown compression [{compression}], available compressions are ['zlib', 'zstd']")
+        if serializer == "msgpack" and msgpack is None:
+            raise ValueError("The msgpack serializer requires the msgpack library to be installed")
+        if (compression == "zstd" or zstd_dictionary is not None) and zstandard is None:
+            raise ValueError("The zstd compression requires the zstandard library to be installed")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self._zstd_dictionary = zstandard.ZstdCompressionDict(zstd_dictionary) if zstd_dictionary is not None else None
+
+    def encode(self, data: dict) -> bytes:
+        """
+        Encode a value
+
+        :param data: the value
+        :return: the encoded value
+        """
+        value = self._serialize(data)
+        compression = self.compression if self.compression is not None and len(value) > self.compression_threshold else None
+        if compression == "zstd" and self._zstd_dictionary is not None:
+            compression = "zstd-dictionary"
+        if self.serializer == "json" and compression is None:
+            return value
+
+        header = 0x80 | self.COMPRESSIONS[compression] << 3 | self.SERIALIZERS[self.serializer]
+        return bytes([header]) + self._compress(value, compression)
+
+    def decode(self, value: Union[bytes, bytearray, str]) -> dict:
+        """
+        Decode a value written by any codec
+
+        :param value: the encoded value
+        :return: the value
+        :raise ValueError: if the value is malformed, such as a JSONDecodeError for a malformed JSON value, or it requires a library or a dictionary that is not available
+        """
+        if isinstance(value, str) or not value or value[0] < 0x80:
+            return json_codec.loads(value)
+
+        serializer = self._get_name(self.SERIALIZERS, value[0] & 0x07)
+        compression = self._get_name(self.COMPRESSIONS, value[0] >> 3 & 0x0F)
+        return self._deserialize(self._decompress(bytes(value[1:]), compression), serializer)
+
+    @staticmethod
+    def _get_name(names: dict, name_id: int) -> Optional[str]:
+        for name, known_id in names.items():
+            if known_id == name_id:
+                return name
+        raise ValueError(f"Unknown value header [{name_id}]")
+
+    def _serialize(self, data: dict) -> bytes:
+        if self.serializer == "msgpack":
+            return msgpack.packb(data, use_bin_type=True)
+        return json_codec.dumps(data)
+
+    @staticmethod
+    def _deserialize(value: bytes, serializer: str) -> dict:
+        if serializer == "msgpack":
+            if msgpack is None:
+                raise ValueError("Decoding a msgpack value requires the msgpack library to be installed")
+            return msgpack.unpackb(value, raw=False)
+        return json_codec.loads(value)
+
+    def _compress(self, value: bytes, compression: Optional[str]) -> bytes:
+        if compression == "zlib":
+            return zlib.compress(value, self.compression_level if self.compression_level is not None else -1)
+        if compression in ("zstd", "zstd-dictionary"):
+            level = self.compression_level if self.compression_level is not None else 3
+            return zstandard.ZstdCompressor(level=level, dict_data=self._zstd_dictionary).compress(value)
+        return value
+
+    def _decompress(self, value: bytes, compression: Optional[str]) -> bytes:
+        try:
+            if compression == "zlib":
+                return zlib.decompress(value)
+            if compression in ("zstd", "zstd-dictionary"):
+                if zstandard is None:
+                    raise ValueError("Decoding a zstd value requires the zstandard library to be installed")
+                if compression == "zstd-dictionary" and self._zstd_dictionary is None:
+                    raise ValueError("Decoding the value requires the zstd dictionary it has been compressed with")
+                return zstandard.ZstdDecompressor(dict_data=self._zstd_dictionary).decompress(value)
+        except zlib.error as e:
+            raise ValueError(f"Could not decompress the value: {e}") from e
+        except Exception as e:
+            if zstandard is not None and isinstance(e, zstandard.ZstdError):
+                raise ValueError(f"Could not decompress the value: {e}") from e
+            raise
+        return value
+
+
+def train_zstd_dictionary(samples: List[dict], size: int = 16 * 1024, serializer: str = "json") -> bytes:
+    """
+    Train a zstd dictionary on sample values, such as the reprs of a few hundreds of profiles, improving the compression of small values with a similar shape
+
+    :param samples: the sample values
+    :param size: the maximum size in bytes of the dictionary
+    :param serializer: the serialization of the values, the same of the codec using the dictionary
+    :return: the dictionary, to be passed to the codecs as `zstd_dictionary`
+    :raise ValueError: if the zstandard library is not installed
+    """
+    if zstandard is None:
+        raise ValueError("Training a zstd dictionary requires the zstandard library to be installed")
+
+    codec = ValueCodec(serializer=serializer)
+    return zstandard.train_dictionary(size, [codec._serialize(sample) for sample in samples]).as_bytes()
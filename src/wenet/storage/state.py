@@ -0,0 +1,133 @@
+from __future__ import absolute_import, annotations
+
+import logging
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from wenet.storage.cache import BaseCache
+from wenet.utils import json_codec
+
+logger = logging.getLogger("wenet.storage.state")
+
+
+class StateStore(ABC):
+    """
+    A store of the states of the long running jobs, such as the watermarks of the synchronizations, that must survive the end of the process.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[dict]:
+        """
+        Load a state.
+
+        :param str key: the key of the state
+        :return: the state, if it exists
+        """
+        pass
+
+    @abstractmethod
+    def save(self, key: str, state: dict) -> None:
+        """
+        Save a state, replacing the previous one.
+
+        :param str key: the key of the state
+        :param dict state: the state
+        """
+        pass
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        """
+        Remove a state.
+
+        :param str key: the key of the state
+        """
+        pass
+
+
+class CacheStateStore(StateStore):
+
+    def __init__(self, cache: BaseCache, key_prefix: str = "wenet:state:") -> None:
+        """
+        A store keeping the states in a cache, the states never expire
+
+        :param cache: the cache, a RedisCache for sharing the states among processes and hosts
+        :param key_prefix: the prefix of the keys of the states in the cache
+        """
+        self._cache = cache
+        self._key_prefix = key_prefix
+
+    def load(self, key: str) -> Optional[dict]:
+        state = self._cache.get(f"{self._key_prefix}{key}")
+        return state if state else None
+
+    def save(self, key: str, state: dict) -> None:
+        self._cache.cache(state, key=f"{self._key_prefix}{key}")
+
+    def clear(self, key: str) -> None:
+        self._cache.delete(f"{self._key_prefix}{key}")
+
+
+class FileStateStore(StateStore):
+
+    def __init__(self, path: str) -> None:
+        """
+        A store keeping the states in a local JSON file, replaced atomically on each save and flushed to the disk so that it is never left corrupted or lost
+
+        :param path: the path of the file, created on the first save
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        if not os.path.isfile(self.path):
+            return {}
+        with open(self.path, "rb") as file:
+            return json_codec.loads(file.read())
+
+    def _write(self, states: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".wenet-state-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(json_codec.dumps(states))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self._fsync_directory(directory)
+
+    @staticmethod
+    def _fsync_directory(directory: str) -> None:
+        """
+        Flush the entry of the replaced file to the disk, so that the new state survives a crash of the host; the directories cannot be opened on Windows, where it is skipped
+        """
+        if os.name == "nt":
+            return
+        directory_descriptor = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_descriptor)
+        finally:
+            os.close(directory_descriptor)
+
+    def load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, state: dict) -> None:
+        logger.debug(f"Saving the state [{key}] in [{self.path}]")
+        with self._lock:
+            states = self._read()
+            states[key] = state
+            self._write(states)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            states = self._read()
+            if states.pop(key, None) is not None:
+                self._write(states)
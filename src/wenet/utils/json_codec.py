@@ -0,0 +1,148 @@
+from __future__ import absolute_import, annotations
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from json import JSONDecodeError
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+logger = logging.getLogger("wenet.utils.json_codec")
+
+
+class JsonCodec(ABC):
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """
+        Encode the data in JSON
+
+        :param data: the data to encode
+        :return: the UTF-8 encoded JSON document
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, document: Union[bytes, bytearray, str]) -> Any:
+        """
+        Decode a JSON document
+
+        :param document: the JSON document
+        :return: the decoded data
+        :raise JSONDecodeError: if the document is not a valid JSON document
+        """
+        pass
+
+
+class StdlibJsonCodec(JsonCodec):
+
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, document: Union[bytes, bytearray, str]) -> Any:
+        return json.loads(document)
+
+
+class OrjsonCodec(JsonCodec):
+
+    name = "orjson"
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, document: Union[bytes, bytearray, str]) -> Any:
+        return orjson.loads(document)
+
+
+class UjsonCodec(JsonCodec):
+
+    name = "ujson"
+
+    def dumps(self, data: Any) -> bytes:
+        return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    def loads(self, document: Union[bytes, bytearray, str]) -> Any:
+        try:
+            return ujson.loads(document)
+        except ValueError as e:
+            if isinstance(document, (bytes, bytearray)):
+                document = document.decode("utf-8", errors="replace")
+            raise JSONDecodeError(str(e), document, 0) from e
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    StdlibJsonCodec.name: StdlibJsonCodec
+}
+
+
+def _is_available(name: str) -> bool:
+    return {OrjsonCodec.name: orjson, UjsonCodec.name: ujson}.get(name, json) is not None
+
+
+def build_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Build a JSON codec.
+
+    :param name: the name of the codec (orjson, ujson or json), by default the fastest available one, unless the WENET_JSON_CODEC environment variable specifies it
+    :return: the codec
+    :raise ValueError: if the required codec is unknown or its library is not installed
+    """
+    name = name or os.getenv("WENET_JSON_CODEC")
+    if name is None:
+        name = next(codec_name for codec_name in CODECS if _is_available(codec_name))
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec [{name}], available codecs are {list(CODECS)}")
+    if not _is_available(name):
+        raise ValueError(f"The JSON codec [{name}] requires the {name} library to be installed")
+    return CODECS[name]()
+
+
+_codec = build_codec()
+logger.debug(f"Using the JSON codec [{_codec.name}]")
+
+
+def get_codec() -> JsonCodec:
+    """
+    Get the JSON codec used by the clients, the interfaces and the caches
+    """
+    return _codec
+
+
+def set_codec(codec: Union[JsonCodec, str]) -> None:
+    """
+    Set the JSON codec used by the clients, the interfaces and the caches
+
+    :param codec: the codec, or its name
+    """
+    global _codec
+    _codec = build_codec(codec) if isinstance(codec, str) else codec
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Encode the data in JSON with the current codec
+    """
+    return _codec.dumps(data)
+
+
+def loads(document: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decode a JSON document with the current codec
+    """
+    return _codec.loads(document)
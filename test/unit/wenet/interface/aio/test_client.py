@@ -0,0 +1,180 @@
+from __future__ import absolute_import, annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase, TestCase, skipIf
+from unittest.mock import AsyncMock, patch
+
+from wenet.interface.aio.client import AsyncApikeyClient, AsyncNoAuthenticationClient, AsyncOauth2Client, AsyncResponse, AsyncRestClient, aiohttp
+from wenet.interface.client import Oauth2Client, RetryPolicy
+from wenet.interface.exceptions import RefreshTokenExpiredError
+from wenet.storage.cache import InMemoryCache, NearCache
+
+
+class TestAsyncResponse(TestCase):
+
+    def test_json(self):
+        response = AsyncResponse(200, b'{"key": "value"}')
+        self.assertEqual({"key": "value"}, response.json())
+        self.assertEqual('{"key": "value"}', response.text)
+
+
+class TestAsyncRestClient(TestCase):
+
+    def test_prepare_query_params(self):
+        self.assertIsNone(AsyncRestClient._prepare_query_params(None))
+        self.assertEqual({"appId": "app_id", "hasCloseTs": "False", "offset": "0"}, AsyncRestClient._prepare_query_params({"appId": "app_id", "hasCloseTs": False, "offset": 0, "goalName": None}))
+
+
+class TestAsyncApikeyClient(IsolatedAsyncioTestCase):
+
+    async def test_get(self):
+        client = AsyncApikeyClient("apikey")
+        client._send = AsyncMock(return_value=AsyncResponse(200, b"{}"))
+
+        response = await client.get("url", query_params={"offset": 0})
+
+        self.assertEqual(200, response.status_code)
+        client._send.assert_awaited_once_with("GET", "url", query_params={"offset": 0}, headers={"x-wenet-component-apikey": "apikey"})
+
+
+class TestAsyncRetryPolicy(IsolatedAsyncioTestCase):
+
+    @patch("wenet.interface.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_call_async(self, mock_sleep):
+        request = AsyncMock(side_effect=[AsyncResponse(503, b""), asyncio.TimeoutError(), AsyncResponse(200, b"{}")])
+
+        response = await RetryPolicy(max_attempts=3, jitter=False).call_async("GET", request, retry_exceptions=(asyncio.TimeoutError,))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, request.await_count)
+        self.assertEqual([0.5, 1], [call[0][0] for call in mock_sleep.await_args_list])
+
+
+class ThreadPerCallExecutor(ThreadPoolExecutor):
+    """
+    An executor running each call in a new thread, as a busy default executor of the event loop could do
+    """
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run).start()
+        return future
+
+
+class TestAsyncOauth2Client(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = InMemoryCache()
+        self.cache.cache(Oauth2Client.ClientCredentials("token", "refresh_token").to_repr(), key="resource_id")
+        self.client = AsyncOauth2Client("client_id", "client_secret", "resource_id", self.cache, token_endpoint_url="token_endpoint_url")
+
+    async def test_refresh_on_unauthorized(self):
+        self.client._send = AsyncMock(side_effect=[
+            AsyncResponse(401, b""),
+            AsyncResponse(200, b'{"access_token": "new_token", "refresh_token": "new_refresh_token"}'),
+            AsyncResponse(200, b"{}")
+        ])
+
+        response = await self.client.get("url")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("new_token", self.client.token)
+        self.assertEqual({"authorization": "bearer new_token"}, self.client._send.call_args_list[2][1]["headers"])
+
+    async def test_concurrent_refreshes_are_coalesced(self):
+        async def send(method, url, body=None, query_params=None, headers=None):
+            await asyncio.sleep(0.01)
+            return AsyncResponse(200, b'{"access_token": "new_token", "refresh_token": "new_refresh_token", "expires_in": 3600}')
+
+        self.client._send = AsyncMock(side_effect=send)
+
+        await asyncio.gather(*[self.client.refresh_access_token(stale_token="token") for _ in range(10)])
+
+        self.client._send.assert_awaited_once()
+        self.assertEqual("new_token", self.client.token)
+
+    async def test_concurrent_refreshes_of_different_clients_are_coalesced(self):
+        async def send(method, url, body=None, query_params=None, headers=None):
+            await asyncio.sleep(0.01)
+            return AsyncResponse(200, b'{"access_token": "new_token", "refresh_token": "new_refresh_token", "expires_in": 3600}')
+
+        clients = [AsyncOauth2Client("client_id", "client_secret", "resource_id", self.cache, token_endpoint_url="token_endpoint_url") for _ in range(3)]
+        for client in clients:
+            client._send = AsyncMock(side_effect=send)
+
+        await asyncio.gather(*[client.refresh_access_token(stale_token="token") for client in clients])
+
+        self.assertEqual(1, sum(client._send.await_count for client in clients))
+
+    async def test_cache_is_accessed_outside_the_event_loop(self):
+        threads = []
+        cache_get = self.cache.get
+
+        def get(key):
+            threads.append(threading.current_thread())
+            return cache_get(key)
+
+        self.cache.get = get
+        self.client._send = AsyncMock(return_value=AsyncResponse(200, b"{}"))
+
+        await self.client.get("url")
+
+        self.assertEqual(1, len(threads))
+        self.assertIsNot(threading.current_thread(), threads[0])
+
+    async def test_refresh_reads_the_credentials_of_the_near_cache_under_lock(self):
+        cache = NearCache(InMemoryCache())
+        cache.cache(Oauth2Client.ClientCredentials("token", "refresh_token").to_repr(), key="resource_id")
+        cache.l2.cache(Oauth2Client.ClientCredentials("rotated_token", "rotated_refresh_token").to_repr(), key="resource_id")
+        client = AsyncOauth2Client("client_id", "client_secret", "resource_id", cache, token_endpoint_url="token_endpoint_url", credentials_memo_ttl=0)
+        client._send = AsyncMock(return_value=AsyncResponse(200, b'{"access_token": "new_token", "refresh_token": "new_refresh_token"}'))
+        asyncio.get_running_loop().set_default_executor(ThreadPerCallExecutor())
+
+        await client.refresh_access_token(stale_token="token")
+        client._send.assert_not_awaited()
+
+        await client.refresh_access_token()
+        self.assertEqual("rotated_refresh_token", client._send.call_args[1]["body"]["refresh_token"])
+        self.assertEqual("new_token", Oauth2Client.ClientCredentials.from_repr(cache.l2.get("resource_id")).access_token)
+
+    async def test_refresh_token_expired(self):
+        self.client._send = AsyncMock(return_value=AsyncResponse(400, b""))
+
+        with self.assertRaises(RefreshTokenExpiredError):
+            await self.client.refresh_access_token()
+
+
+@skipIf(aiohttp is None, "aiohttp is not installed")
+class TestAsyncClientSession(IsolatedAsyncioTestCase):
+
+    async def test_round_trip(self):
+        from aiohttp import web
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response({"query": dict(request.query), "body": await request.json()})
+
+        app = web.Application()
+        app.router.add_put("/resource", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        try:
+            async with AsyncNoAuthenticationClient() as client:
+                response = await client._send("PUT", f"http://127.0.0.1:{port}/resource", body={"key": "value"}, query_params={"flag": True})
+                self.assertEqual(200, response.status_code)
+                self.assertEqual({"query": {"flag": "True"}, "body": {"key": "value"}}, response.json())
+        finally:
+            await runner.cleanup()
@@ -0,0 +1,107 @@
+from __future__ import absolute_import, annotations
+
+from typing import List, Union
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+
+from wenet.interface.aio.client import AsyncApikeyClient
+from wenet.interface.aio.component import AsyncComponentClient, AsyncComponentInterface
+from wenet.interface.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from wenet.interface.client import RetryPolicy
+from wenet.interface.component import ComponentRequest
+from wenet.interface.exceptions import CircuitOpenError, NotFound, RateLimitExceeded
+from wenet.interface.rate_limiter import RateLimiter
+
+
+class MockAiohttpResponse:
+
+    def __init__(self, status: int, content: bytes = b"{}") -> None:
+        self.status = status
+        self.content = content
+        self.headers = {}
+
+    async def read(self) -> bytes:
+        return self.content
+
+    def get_encoding(self) -> str:
+        return "utf-8"
+
+    async def __aenter__(self) -> MockAiohttpResponse:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+def mock_session(outcomes: List[Union[MockAiohttpResponse, Exception]]) -> Mock:
+    """
+    A mocked aiohttp session whose requests have the given outcomes, one after the other
+    """
+    return Mock(request=Mock(side_effect=outcomes))
+
+
+class TestAsyncComponentInterface(IsolatedAsyncioTestCase):
+
+    async def test_call(self):
+        client = AsyncApikeyClient("apikey", session=mock_session([MockAiohttpResponse(200, b'{"id": "task_id"}'), MockAiohttpResponse(404, b"not found")]))
+        interface = AsyncComponentInterface(client, "base_url")
+        request = ComponentRequest("GET", "base_url/tasks/task_id", {}, query_params={"offset": 0, "limit": None}, parse=lambda content: content["id"])
+
+        self.assertEqual("task_id", await interface._call(request))
+        self.assertEqual({"offset": "0"}, client.session.request.call_args[1]["params"])
+        with self.assertRaises(NotFound):
+            await interface._call(request)
+
+    @patch("wenet.interface.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_policy(self, mock_sleep):
+        client = AsyncApikeyClient("apikey", session=mock_session([MockAiohttpResponse(503), aiohttp.ClientConnectionError(), MockAiohttpResponse(200)]))
+
+        interface = AsyncComponentInterface(client, "base_url", retry_policy=RetryPolicy(max_attempts=3))
+        self.assertIsInstance(interface._client, AsyncComponentClient)
+        self.assertIs(client.session, interface._client.session)
+        self.assertEqual({"x-wenet-component-apikey": "apikey"}, interface._client.get_authentication())
+
+        response = await interface._client.get("base_url/tasks")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, client.session.request.call_count)
+
+        self.assertIs(client, AsyncComponentInterface(client, "base_url")._client)
+
+    @patch("wenet.interface.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_policy_replaces_the_one_of_the_client(self, mock_sleep):
+        client = AsyncApikeyClient("apikey", retry_policy=RetryPolicy(max_attempts=3), session=mock_session([MockAiohttpResponse(503) for _ in range(5)]))
+
+        interface = AsyncComponentInterface(client, "base_url", retry_policy=RetryPolicy(max_attempts=2))
+        self.assertEqual(503, (await interface._client.get("base_url/tasks")).status_code)
+        self.assertEqual(2, client.session.request.call_count)
+
+        client.session.request.reset_mock()
+        self.assertEqual(503, (await client.get("base_url/tasks")).status_code)
+        self.assertEqual(3, client.session.request.call_count)
+
+    async def test_circuit_breaker(self):
+        client = AsyncApikeyClient("apikey", session=mock_session([MockAiohttpResponse(502), aiohttp.ClientConnectionError()]))
+
+        registry = CircuitBreakerRegistry(minimum_calls=2, window_size=2)
+        interface = AsyncComponentInterface(client, "base_url", circuit_breakers=registry)
+        self.assertIs(registry.get("base_url"), interface.circuit_breaker)
+        self.assertIsNone(AsyncComponentInterface(client, "base_url").circuit_breaker)
+
+        await interface._client.get("base_url/tasks")
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await interface._client.post("base_url/tasks", body={})
+        self.assertEqual(CircuitBreaker.OPEN, interface.circuit_breaker.state)
+        with self.assertRaises(CircuitOpenError):
+            await interface._client.get("base_url/tasks")
+        self.assertEqual(2, client.session.request.call_count)
+
+    async def test_rate_limiter(self):
+        client = AsyncApikeyClient("apikey", session=mock_session([MockAiohttpResponse(200)]))
+
+        interface = AsyncComponentInterface(client, "base_url", rate_limiter=RateLimiter(rate=1, blocking=False))
+        self.assertEqual(200, (await interface._client.get("base_url/tasks")).status_code)
+        with self.assertRaises(RateLimitExceeded):
+            await interface._client.get("base_url/tasks")
+        self.assertEqual(1, client.session.request.call_count)
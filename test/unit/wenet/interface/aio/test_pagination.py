@@ -0,0 +1,35 @@
+from __future__ import absolute_import, annotations
+
+from unittest import IsolatedAsyncioTestCase
+
+from test.unit.wenet.interface.test_pagination import MockListing, MockPage
+from wenet.interface.aio import pagination
+
+
+class TestAsyncFetchAll(IsolatedAsyncioTestCase):
+
+    async def test_fetch_all(self):
+        listing = MockListing(list(range(25)))
+
+        async def fetch_page(offset: int, limit: int) -> MockPage:
+            return listing.fetch_page(offset, limit)
+
+        self.assertEqual(list(range(5, 25)), await pagination.fetch_all(fetch_page, lambda page: page.items, offset=5, limit=10))
+        self.assertEqual([5, 15, 25], listing.offsets)
+
+    async def test_fetch_all_without_limit(self):
+        listing = MockListing(list(range(25)))
+
+        async def fetch_page(offset: int, limit: int) -> MockPage:
+            return listing.fetch_page(offset, 10)
+
+        self.assertEqual(list(range(25)), await pagination.fetch_all(fetch_page, lambda page: page.items, limit=None))
+        self.assertEqual([0, 10, 20], listing.offsets)
+
+    async def test_fetch_all_empty(self):
+        listing = MockListing([])
+
+        async def fetch_page(offset: int, limit: int) -> MockPage:
+            return listing.fetch_page(offset, limit)
+
+        self.assertEqual([], await pagination.fetch_all(fetch_page, lambda page: page.items))
@@ -0,0 +1,53 @@
+from __future__ import absolute_import, annotations
+
+import json
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from wenet.interface.aio.client import AsyncOauth2Client, AsyncResponse
+from wenet.interface.aio.service_api import AsyncServiceApiInterface
+from wenet.interface.exceptions import BadRequest
+from wenet.model.app import AppDTO
+from wenet.model.task.task import Task, TaskGoal, TaskPage
+from wenet.model.user.profile import WeNetUserProfile
+from wenet.model.user.relationship import Relationship, RelationType, RelationshipPage
+
+
+def json_response(content, status_code: int = 200) -> AsyncResponse:
+    return AsyncResponse(status_code, json.dumps(content).encode())
+
+
+class TestAsyncServiceApiInterface(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.service_api = AsyncServiceApiInterface(AsyncOauth2Client("clientId", "clientSecret", "resourceId", None, token_endpoint_url="tokenEndpointUrl"), "")
+
+    def test_oauth2_base_url(self):
+        self.assertEqual("/api/service", self.service_api._base_url)
+
+    async def test_get_app_details(self):
+        app = AppDTO(None, None, "app_id", None, None)
+        self.service_api._client.get = AsyncMock(return_value=json_response(app.to_repr()))
+        self.assertEqual(app, await self.service_api.get_app_details("app_id"))
+
+    async def test_get_user_profile(self):
+        profile = WeNetUserProfile.empty("user_id")
+        self.service_api._client.get = AsyncMock(return_value=json_response(profile.to_repr()))
+        self.assertEqual(profile, await self.service_api.get_user_profile("user_id"))
+
+    async def test_get_user_relationships(self):
+        relationship = Relationship("app_id", "source_id", "target_id", RelationType.FRIEND, 0.5)
+        self.service_api._client.get = AsyncMock(return_value=json_response(RelationshipPage(0, 1, [relationship]).to_repr()))
+        self.assertEqual([relationship], await self.service_api.get_user_relationships("source_id"))
+
+    async def test_get_opened_tasks_of_user(self):
+        task = Task("task_id", None, None, "", "user_id", "app_id", None, TaskGoal("", ""))
+        self.service_api._client.get = AsyncMock(return_value=json_response(TaskPage(0, 1, [task]).to_repr()))
+        self.assertEqual([task], await self.service_api.get_opened_tasks_of_user("user_id", "app_id"))
+
+    async def test_create_task_bad_request(self):
+        task = Task("task_id", None, None, "", "", "app_id", None, TaskGoal("", ""))
+        self.service_api._client.post = AsyncMock(return_value=json_response(None, status_code=400))
+        with self.assertRaises(BadRequest):
+            await self.service_api.create_task(task)
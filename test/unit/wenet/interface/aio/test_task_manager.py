@@ -0,0 +1,53 @@
+from __future__ import absolute_import, annotations
+
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from wenet.interface.aio.client import AsyncApikeyClient, AsyncResponse
+from wenet.interface.aio.task_manager import AsyncTaskManagerInterface
+from wenet.interface.exceptions import AuthenticationException, NotFound
+from wenet.model.task.task import TaskPage, Task, TaskGoal
+from wenet.model.task.transaction import TaskTransactionPage, TaskTransaction
+
+import json
+
+
+def json_response(content, status_code: int = 200) -> AsyncResponse:
+    return AsyncResponse(status_code, json.dumps(content).encode())
+
+
+class TestAsyncTaskManagerInterface(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.task_manager = AsyncTaskManagerInterface(AsyncApikeyClient("apikey"), "")
+
+    async def test_get_all_tasks(self):
+        task = Task("task_id", None, None, "", "", "app_id", None, TaskGoal("", ""))
+        self.task_manager._client.get = AsyncMock(return_value=json_response(TaskPage(0, 1, [task]).to_repr()))
+        self.assertEqual([task], await self.task_manager.get_all_tasks(app_id="app_id"))
+
+    async def test_get_all_tasks_unauthorized(self):
+        self.task_manager._client.get = AsyncMock(return_value=json_response(None, status_code=401))
+        with self.assertRaises(AuthenticationException):
+            await self.task_manager.get_all_tasks(app_id="app_id")
+
+    async def test_get_all_transactions(self):
+        transaction = TaskTransaction("transaction_id", "task_id", "", 1, 1, "", None)
+        self.task_manager._client.get = AsyncMock(return_value=json_response(TaskTransactionPage(0, 1, [transaction]).to_repr()))
+        self.assertEqual([transaction], await self.task_manager.get_all_transactions(app_id="app_id"))
+
+    async def test_get_task(self):
+        task = Task("task_id", None, None, "", "", "app_id", None, TaskGoal("", ""))
+        self.task_manager._client.get = AsyncMock(return_value=json_response(task.to_repr()))
+        self.assertEqual(task, await self.task_manager.get_task("task_id"))
+
+    async def test_get_task_not_found(self):
+        self.task_manager._client.get = AsyncMock(return_value=json_response(None, status_code=404))
+        with self.assertRaises(NotFound):
+            await self.task_manager.get_task("task_id")
+
+    async def test_create_task(self):
+        task = Task("task_id", None, None, "", "", "", None, TaskGoal("", ""))
+        self.task_manager._client.post = AsyncMock(return_value=json_response(task.to_repr()))
+        self.assertEqual(task, await self.task_manager.create_task(task))
@@ -0,0 +1,43 @@
+from __future__ import absolute_import, annotations
+
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from wenet.interface.aio.client import AsyncApikeyClient
+from wenet.interface.aio.hub import AsyncHubInterface
+from wenet.interface.aio.ilog import AsyncIlogInterface
+from wenet.interface.aio.incentive_server import AsyncIncentiveServerInterface
+from wenet.interface.aio.logger import AsyncLoggerInterface
+from wenet.interface.aio.profile_manager import AsyncProfileManagerInterface
+from wenet.interface.aio.service_api import AsyncServiceApiInterface
+from wenet.interface.aio.task_manager import AsyncTaskManagerInterface
+from wenet.interface.aio.wenet import AsyncWeNet
+from wenet.interface.circuit_breaker import CircuitBreakerRegistry
+from wenet.interface.client import RetryPolicy
+
+
+class TestAsyncWeNet(IsolatedAsyncioTestCase):
+
+    async def test_build(self):
+        client = AsyncApikeyClient("apikey")
+        client.close = AsyncMock()
+        async with AsyncWeNet.build(client, platform_url="") as wenet:
+            self.assertIsInstance(wenet.service_api, AsyncServiceApiInterface)
+            self.assertIsInstance(wenet.profile_manager, AsyncProfileManagerInterface)
+            self.assertIsInstance(wenet.incentive_server, AsyncIncentiveServerInterface)
+            self.assertIsInstance(wenet.task_manager, AsyncTaskManagerInterface)
+            self.assertIsInstance(wenet.logger, AsyncLoggerInterface)
+            self.assertIsInstance(wenet.hub, AsyncHubInterface)
+            self.assertIsInstance(wenet.ilog, AsyncIlogInterface)
+            self.assertEqual("/task_manager", wenet.task_manager._base_url)
+
+        client.close.assert_awaited()
+
+    async def test_build_with_circuit_breakers(self):
+        registry = CircuitBreakerRegistry()
+        wenet = AsyncWeNet.build(AsyncApikeyClient("apikey"), platform_url="url", circuit_breakers=registry, retry_policy=RetryPolicy())
+        self.assertIs(registry.get("url/logger"), wenet.logger.circuit_breaker)
+        self.assertIs(registry.get("url/task_manager"), wenet.task_manager.circuit_breaker)
+        self.assertIsNot(wenet.logger.circuit_breaker, wenet.task_manager.circuit_breaker)
+        self.assertIsNotNone(AsyncWeNet.build(AsyncApikeyClient("apikey")).hub.circuit_breaker)
+        self.assertIsNone(AsyncWeNet.build(AsyncApikeyClient("apikey"), circuit_breakers=None).hub.circuit_breaker)
@@ -0,0 +1,39 @@
+from __future__ import absolute_import, annotations
+
+from typing import Any, Callable, List, Optional
+
+from test.unit.wenet.interface.mock.response import MockResponse
+
+
+class MockPagedServer:
+    """
+    A fake paginated listing, serving the slice of the items selected by the offset and limit query parameters.
+    It is meant to be the side effect of a mocked `get` of a client, e.g. `client.get = Mock(side_effect=MockPagedServer(tasks, TaskPage))`.
+    """
+
+    def __init__(self,
+                 items: List[Any],
+                 build_page: Callable[[int, int, List[Any]], Any],
+                 default_limit: int = 10,
+                 matches: Optional[Callable[[Any, dict], bool]] = None
+                 ) -> None:
+        """
+        Args:
+            items: all the items of the listing
+            build_page: the page class (or any function) building a page from its offset, the total of the matching items and the items of the page
+            default_limit: the page size when the request has no limit
+            matches: the function telling if an item matches the query parameters of the request, by default all the items match
+        """
+        self.items = items
+        self.build_page = build_page
+        self.default_limit = default_limit
+        self.matches = matches
+
+    def __call__(self, url: str, query_params: Optional[dict] = None, headers: Optional[dict] = None) -> MockResponse:
+        query_params = query_params if query_params is not None else {}
+        items = [item for item in self.items if self.matches(item, query_params)] if self.matches is not None else self.items
+        offset = query_params.get("offset", 0)
+        limit = query_params.get("limit", self.default_limit)
+        response = MockResponse(self.build_page(offset, len(items), items[offset:offset + limit]).to_repr())
+        response.status_code = 200
+        return response
@@ -0,0 +1,92 @@
+from __future__ import absolute_import, annotations
+
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from test.unit.wenet.interface.test_pagination import MockListing, MockTimedListing
+from wenet.interface.checkpoint import Checkpoint, export_all, export_all_in_windows, merge_intervals, subtract_intervals
+from wenet.storage.cache import InMemoryCache
+from wenet.storage.state import CacheStateStore
+
+
+class FailingSink:
+
+    def __init__(self, max_calls: int) -> None:
+        self.max_calls = max_calls
+        self.items = []
+        self.calls = 0
+
+    def __call__(self, items: list) -> None:
+        self.calls += 1
+        if self.calls > self.max_calls:
+            raise ValueError("unexpected error")
+        self.items.extend(items)
+
+
+class TestCheckpoint(TestCase):
+
+    def test_fingerprint(self):
+        self.assertEqual(Checkpoint.fingerprint({"app_id": "app_id", "creation_from": datetime.fromtimestamp(1000), "task_id": None}),
+                         Checkpoint.fingerprint({"creation_from": datetime.fromtimestamp(1000), "app_id": "app_id"}))
+        self.assertNotEqual(Checkpoint.fingerprint({"app_id": "app_id"}), Checkpoint.fingerprint({"app_id": "other_app_id"}))
+
+    def test_load_different_query(self):
+        checkpoint = Checkpoint(CacheStateStore(InMemoryCache()), "crawl")
+        checkpoint.save("fingerprint", {"offset": 10})
+        self.assertEqual({"offset": 10}, checkpoint.load("fingerprint"))
+        self.assertIsNone(checkpoint.load("other_fingerprint"))
+
+        checkpoint.clear()
+        self.assertIsNone(checkpoint.load("fingerprint"))
+
+    def test_intervals(self):
+        self.assertEqual([(0, 20), (30, 40)], merge_intervals([(11, 20), (30, 40), (0, 10), (35, 36)]))
+        self.assertEqual([(0, 10), (21, 29), (41, 50)], subtract_intervals(0, 50, [(11, 20), (30, 40)]))
+        self.assertEqual([(21, 25)], subtract_intervals(5, 25, [(0, 20)]))
+        self.assertEqual([], subtract_intervals(5, 15, [(0, 20)]))
+        self.assertEqual([(0, 50)], subtract_intervals(0, 50, []))
+
+
+class TestExportAll(TestCase):
+
+    def setUp(self) -> None:
+        self.checkpoint = Checkpoint(CacheStateStore(InMemoryCache()), "crawl")
+
+    def test_export_all_resumed(self):
+        listing = MockListing(list(range(45)))
+        sink = FailingSink(2)
+        with self.assertRaises(ValueError):
+            export_all(listing.fetch_page, lambda page: page.items, sink, self.checkpoint, "fingerprint", limit=10)
+        self.assertEqual({"offset": 20}, self.checkpoint.load("fingerprint"))
+
+        listing.offsets = []
+        sink.max_calls = 10
+        self.assertEqual(25, export_all(listing.fetch_page, lambda page: page.items, sink, self.checkpoint, "fingerprint", limit=10))
+        self.assertEqual(list(range(45)), sink.items)
+        self.assertEqual([20, 30, 40], listing.offsets)
+        self.assertIsNone(self.checkpoint.load("fingerprint"))
+
+    def test_export_all_different_query(self):
+        listing = MockListing(list(range(25)))
+        self.checkpoint.save("other_fingerprint", {"offset": 20})
+        sink = FailingSink(10)
+        self.assertEqual(25, export_all(listing.fetch_page, lambda page: page.items, sink, self.checkpoint, "fingerprint", limit=10))
+        self.assertEqual([0, 10, 20], listing.offsets)
+
+    def test_export_all_in_windows_resumed(self):
+        listing = MockTimedListing(list(range(1000, 1040)))
+        sink = FailingSink(2)
+        with self.assertRaises(ValueError):
+            export_all_in_windows(listing.fetch_page, lambda page: page.items, sink, self.checkpoint, "fingerprint",
+                                  datetime.fromtimestamp(1000), datetime.fromtimestamp(1039), timedelta(seconds=10), limit=20, max_workers=1)
+        completed = self.checkpoint.load("fingerprint")["completed"]
+        self.assertEqual(20, sum(interval_to - interval_from + 1 for interval_from, interval_to in completed))
+
+        listing.windows = []
+        sink.max_calls = 10
+        self.assertEqual(20, export_all_in_windows(listing.fetch_page, lambda page: page.items, sink, self.checkpoint, "fingerprint",
+                                                   datetime.fromtimestamp(1000), datetime.fromtimestamp(1039), timedelta(seconds=10), limit=20))
+        self.assertEqual(listing.items, sorted(sink.items, key=lambda item: item[1]))
+        self.assertEqual(subtract_intervals(1000, 1039, [tuple(interval) for interval in completed]), merge_intervals([(window_from, window_to) for window_from, window_to, _ in listing.windows]))
+        self.assertEqual(2, len(listing.windows))
+        self.assertIsNone(self.checkpoint.load("fingerprint"))
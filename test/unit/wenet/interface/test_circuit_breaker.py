@@ -0,0 +1,118 @@
+from __future__ import absolute_import, annotations
+
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import requests
+
+from test.unit.wenet.interface.mock.response import MockResponse
+from wenet.interface.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from wenet.interface.exceptions import ApiException, CircuitOpenError, RefreshTokenExpiredError, RateLimitExceeded
+
+
+class TestCircuitBreaker(TestCase):
+
+    @staticmethod
+    def _response(status_code: int) -> MockResponse:
+        response = MockResponse({})
+        response.status_code = status_code
+        return response
+
+    def test_open_on_failure_rate(self):
+        circuit_breaker = CircuitBreaker("component", failure_rate_threshold=0.5, minimum_calls=4, window_size=4)
+        for status_code in [200, 502, 200]:
+            circuit_breaker.call(lambda: self._response(status_code))
+        self.assertEqual(CircuitBreaker.CLOSED, circuit_breaker.state)
+
+        circuit_breaker.call(lambda: self._response(503))
+        self.assertEqual(CircuitBreaker.OPEN, circuit_breaker.state)
+        self.assertEqual(0.5, circuit_breaker.failure_rate)
+
+        request = Mock()
+        with self.assertRaises(CircuitOpenError) as context:
+            circuit_breaker.call(request)
+        self.assertIsInstance(context.exception, ApiException)
+        self.assertEqual(503, context.exception.http_status_code)
+        self.assertEqual("component", context.exception.component)
+        request.assert_not_called()
+
+    def test_client_errors_are_not_failures(self):
+        circuit_breaker = CircuitBreaker("component", minimum_calls=2, window_size=2)
+        for _ in range(4):
+            circuit_breaker.call(lambda: self._response(404))
+        self.assertEqual(CircuitBreaker.CLOSED, circuit_breaker.state)
+
+    def test_exceptions_are_failures(self):
+        circuit_breaker = CircuitBreaker("component", minimum_calls=2, window_size=2)
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                circuit_breaker.call(Mock(side_effect=requests.ConnectionError()))
+        self.assertEqual(CircuitBreaker.OPEN, circuit_breaker.state)
+
+    def test_client_side_exceptions_are_not_failures(self):
+        circuit_breaker = CircuitBreaker("component", minimum_calls=2, window_size=2)
+        for error in [RefreshTokenExpiredError(), ValueError(), RateLimitExceeded("GET", "url"), ApiException(400, "bad request")]:
+            with self.assertRaises(type(error)):
+                circuit_breaker.call(Mock(side_effect=error))
+        self.assertEqual(CircuitBreaker.CLOSED, circuit_breaker.state)
+        self.assertEqual(0, circuit_breaker.to_repr()["calls"])
+
+        with self.assertRaises(ApiException):
+            circuit_breaker.call(Mock(side_effect=ApiException(500, "error")))
+        self.assertEqual(1, circuit_breaker.to_repr()["calls"])
+
+    @patch("wenet.interface.circuit_breaker.time.monotonic")
+    def test_half_open_slot_released(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        circuit_breaker = CircuitBreaker("component", minimum_calls=1, window_size=1, open_timeout=30)
+        circuit_breaker.call(lambda: self._response(502))
+
+        mock_monotonic.return_value = 131
+        with self.assertRaises(KeyboardInterrupt):
+            circuit_breaker.call(Mock(side_effect=KeyboardInterrupt()))
+        with self.assertRaises(RefreshTokenExpiredError):
+            circuit_breaker.call(Mock(side_effect=RefreshTokenExpiredError()))
+        self.assertEqual(CircuitBreaker.HALF_OPEN, circuit_breaker.state)
+        self.assertEqual(200, circuit_breaker.call(lambda: self._response(200)).status_code)
+        self.assertEqual(CircuitBreaker.CLOSED, circuit_breaker.state)
+
+    @patch("wenet.interface.circuit_breaker.time.monotonic")
+    def test_half_open_probe(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        circuit_breaker = CircuitBreaker("component", minimum_calls=1, window_size=1, open_timeout=30)
+        circuit_breaker.call(lambda: self._response(502))
+        self.assertEqual(CircuitBreaker.OPEN, circuit_breaker.state)
+
+        mock_monotonic.return_value = 131
+        self.assertEqual(CircuitBreaker.HALF_OPEN, circuit_breaker.state)
+        circuit_breaker.allow_request()
+        with self.assertRaises(CircuitOpenError):
+            circuit_breaker.allow_request()
+        circuit_breaker.record_failure()
+        self.assertEqual(CircuitBreaker.OPEN, circuit_breaker.state)
+
+        mock_monotonic.return_value = 162
+        self.assertEqual(200, circuit_breaker.call(lambda: self._response(200)).status_code)
+        self.assertEqual(CircuitBreaker.CLOSED, circuit_breaker.state)
+        self.assertEqual(0, circuit_breaker.failure_rate)
+
+    def test_to_repr(self):
+        circuit_breaker = CircuitBreaker("component")
+        circuit_breaker.call(lambda: self._response(200))
+        self.assertEqual({"name": "component", "state": "closed", "failureRate": 0.0, "calls": 1, "openedAt": None}, circuit_breaker.to_repr())
+
+
+class TestCircuitBreakerRegistry(TestCase):
+
+    def test_get(self):
+        registry = CircuitBreakerRegistry(minimum_calls=1, window_size=1)
+        circuit_breaker = registry.get("url/logger")
+        self.assertIs(circuit_breaker, registry.get("url/logger"))
+        self.assertIsNot(circuit_breaker, registry.get("url/task_manager"))
+        self.assertEqual(1, circuit_breaker.minimum_calls)
+
+        circuit_breaker.record_failure()
+        self.assertEqual({"url/logger": "open", "url/task_manager": "closed"}, registry.get_states())
+
+        registry.reset()
+        self.assertEqual({"url/logger": "closed", "url/task_manager": "closed"}, registry.get_states())
@@ -0,0 +1,424 @@
+from __future__ import absolute_import, annotations
+
+import gzip
+import json
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import requests
+from requests import Response, Session
+
+from test.unit.wenet.interface.mock.response import MockResponse
+from wenet.interface.client import ApikeyClient, CodecResponse, NoAuthenticationClient, RestClient, Oauth2Client, RetryPolicy
+from wenet.interface.exceptions import RefreshTokenExpiredError
+from wenet.storage.cache import BoundedInMemoryCache, InMemoryCache
+
+
+class TestRestClient(TestCase):
+
+    def test_build_session(self):
+        session = RestClient.build_session(pool_connections=3, pool_maxsize=20)
+        adapter = session.get_adapter("https://internetofus.u-hopper.com")
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(20, adapter._pool_maxsize)
+        self.assertIs(adapter, session.get_adapter("http://internetofus.u-hopper.com"))
+        self.assertEqual("keep-alive", session.headers["Connection"])
+
+    def test_build_session_without_keep_alive(self):
+        session = RestClient.build_session(keep_alive=False)
+        self.assertEqual("close", session.headers["Connection"])
+
+    def test_requests_reuse_the_session(self):
+        client = ApikeyClient("apikey")
+        response = MockResponse({})
+        response.status_code = 200
+        client.session.request = Mock(return_value=response)
+
+        client.get("url", query_params={"offset": 0})
+        client.post("url", body={"key": "value"})
+
+        self.assertEqual(2, client.session.request.call_count)
+        method, url = client.session.request.call_args_list[0][0]
+        self.assertEqual("GET", method)
+        self.assertEqual({"offset": 0}, client.session.request.call_args_list[0][1]["params"])
+        self.assertEqual("apikey", client.session.request.call_args_list[0][1]["headers"]["x-wenet-component-apikey"])
+        self.assertEqual({"key": "value"}, json.loads(client.session.request.call_args_list[1][1]["data"]))
+        self.assertEqual("application/json", client.session.request.call_args_list[1][1]["headers"]["Content-Type"])
+
+    def test_response_decoded_with_codec(self):
+        client = NoAuthenticationClient()
+        response = Response()
+        response.status_code = 200
+        response._content = b'{"key": "value"}'
+        response.encoding = "utf-8"
+        client.session.request = Mock(return_value=response)
+
+        response = client.get("url")
+        self.assertIsInstance(response, CodecResponse)
+        self.assertEqual({"key": "value"}, response.json())
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_body_encoded_once(self, mock_sleep):
+        failure = MockResponse({})
+        failure.status_code = 503
+        success = MockResponse({})
+        success.status_code = 200
+        client = NoAuthenticationClient(retry_policy=RetryPolicy())
+        client.session.request = Mock(side_effect=[failure, success])
+
+        with patch("wenet.interface.client.json_codec.dumps", return_value=b"{}") as mock_dumps:
+            client.put("url", body={"key": "value"}, headers={"content-type": "application/json; charset=utf-8"})
+        mock_dumps.assert_called_once_with({"key": "value"})
+        self.assertEqual({"content-type": "application/json; charset=utf-8"}, client.session.request.call_args[1]["headers"])
+
+    def test_request_compression(self):
+        response = MockResponse({})
+        response.status_code = 200
+        body = {"messages": ["message"] * 100}
+
+        client = NoAuthenticationClient(request_compression="gzip", request_compression_threshold=100)
+        client.session.request = Mock(return_value=response)
+        client.post("url", body=body)
+        kwargs = client.session.request.call_args[1]
+        self.assertEqual("gzip", kwargs["headers"]["Content-Encoding"])
+        self.assertEqual(body, json.loads(gzip.decompress(kwargs["data"])))
+
+        client = NoAuthenticationClient(request_compression="deflate", request_compression_threshold=100)
+        client.session.request = Mock(return_value=response)
+        client.post("url", body=body)
+        kwargs = client.session.request.call_args[1]
+        self.assertEqual("deflate", kwargs["headers"]["Content-Encoding"])
+        self.assertEqual(body, json.loads(zlib.decompress(kwargs["data"])))
+
+        client.post("url", body={"messages": []})
+        kwargs = client.session.request.call_args[1]
+        self.assertNotIn("Content-Encoding", kwargs["headers"])
+        self.assertEqual({"messages": []}, json.loads(kwargs["data"]))
+
+        with self.assertRaises(ValueError):
+            RestClient.compress(b"{}", "br")
+
+    def test_compressed_round_trip(self):
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                content = json.dumps({"contentEncoding": self.headers.get("Content-Encoding"), "body": json.loads(body)}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    content = gzip.compress(content)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            body = {"messages": ["message"] * 100}
+            with NoAuthenticationClient(request_compression="gzip", request_compression_threshold=100) as client:
+                response = client.post(f"http://127.0.0.1:{server.server_port}/messages", body=body)
+                self.assertEqual("gzip", response.headers["Content-Encoding"])
+                self.assertEqual({"contentEncoding": "gzip", "body": body}, response.json())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_close_owned_session(self):
+        client = NoAuthenticationClient()
+        client.session.close = Mock()
+        with client:
+            pass
+        client.session.close.assert_called_once()
+
+    def test_close_shared_session(self):
+        session = Session()
+        session.close = Mock()
+        first_client = ApikeyClient("apikey", session=session)
+        second_client = NoAuthenticationClient(session=session)
+        self.assertIs(first_client.session, second_client.session)
+
+        first_client.close()
+        second_client.close()
+        session.close.assert_not_called()
+
+
+class TestRetryPolicy(TestCase):
+
+    @staticmethod
+    def _response(status_code: int, headers: dict = None) -> MockResponse:
+        response = MockResponse({})
+        response.status_code = status_code
+        if headers:
+            response.headers.update(headers)
+        return response
+
+    def test_get_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        self.assertEqual([1, 2, 4, 5], [policy.get_backoff(attempt) for attempt in range(1, 5)])
+
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+        for attempt in range(1, 5):
+            self.assertTrue(0 <= policy.get_backoff(attempt) <= min(5, 2 ** (attempt - 1)))
+
+    def test_get_retry_after(self):
+        self.assertIsNone(RetryPolicy.get_retry_after(self._response(503)))
+        self.assertEqual(3, RetryPolicy.get_retry_after(self._response(503, {"Retry-After": "3"})))
+        self.assertEqual(0, RetryPolicy.get_retry_after(self._response(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})))
+        self.assertIsNone(RetryPolicy.get_retry_after(self._response(503, {"Retry-After": "soon"})))
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_retry_transient_responses(self, mock_sleep):
+        request = Mock(side_effect=[self._response(502), self._response(503), self._response(200)])
+
+        response = RetryPolicy(max_attempts=3, jitter=False).call("GET", request)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, request.call_count)
+        self.assertEqual([0.5, 1], [call[0][0] for call in mock_sleep.call_args_list])
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_return_last_response_when_attempts_are_exhausted(self, mock_sleep):
+        request = Mock(return_value=self._response(503))
+
+        response = RetryPolicy(max_attempts=2).call("GET", request)
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(2, request.call_count)
+        self.assertEqual(1, mock_sleep.call_count)
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_do_not_retry_other_responses(self, mock_sleep):
+        request = Mock(return_value=self._response(500))
+
+        self.assertEqual(500, RetryPolicy().call("GET", request).status_code)
+        request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_do_not_retry_non_idempotent_methods(self, mock_sleep):
+        request = Mock(return_value=self._response(503))
+
+        self.assertEqual(503, RetryPolicy().call("POST", request).status_code)
+        request.assert_called_once()
+
+        request = Mock(side_effect=[self._response(503), self._response(201)])
+        self.assertEqual(201, RetryPolicy(retry_methods=["post"]).call("POST", request).status_code)
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_respect_retry_after(self, mock_sleep):
+        request = Mock(side_effect=[self._response(429, {"Retry-After": "7"}), self._response(200)])
+
+        RetryPolicy(jitter=False).call("GET", request)
+        mock_sleep.assert_called_once_with(7)
+
+        mock_sleep.reset_mock()
+        request = Mock(side_effect=[self._response(429, {"Retry-After": "7"}), self._response(200)])
+        RetryPolicy(jitter=False, respect_retry_after=False).call("GET", request)
+        mock_sleep.assert_called_once_with(0.5)
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_total_timeout(self, mock_sleep):
+        request = Mock(side_effect=[self._response(429, {"Retry-After": "60"}), self._response(200)])
+
+        response = RetryPolicy(total_timeout=10).call("GET", request)
+
+        self.assertEqual(429, response.status_code)
+        mock_sleep.assert_not_called()
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_retry_connection_errors(self, mock_sleep):
+        request = Mock(side_effect=[requests.ConnectionError("reset"), self._response(200)])
+        self.assertEqual(200, RetryPolicy().call("DELETE", request).status_code)
+
+        request = Mock(side_effect=requests.Timeout("timeout"))
+        with self.assertRaises(requests.Timeout):
+            RetryPolicy(max_attempts=2).call("GET", request)
+        self.assertEqual(2, request.call_count)
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_client_with_retry_policy(self, mock_sleep):
+        client = ApikeyClient("apikey", retry_policy=RetryPolicy())
+        client.session.request = Mock(side_effect=[self._response(502), self._response(200)])
+
+        self.assertEqual(200, client.get("url").status_code)
+        self.assertEqual(2, client.session.request.call_count)
+
+
+class TestClientCredentials(TestCase):
+
+    def test_repr(self):
+        credentials = Oauth2Client.ClientCredentials("token", "refresh_token", 100.0)
+        self.assertEqual({"accessToken": "token", "refreshToken": "refresh_token", "expiresAt": 100.0}, credentials.to_repr())
+        self.assertEqual(100.0, Oauth2Client.ClientCredentials.from_repr(credentials.to_repr()).expires_at)
+
+    def test_repr_without_expiration(self):
+        credentials = Oauth2Client.ClientCredentials.from_repr({"accessToken": "token", "refreshToken": "refresh_token"})
+        self.assertIsNone(credentials.expires_at)
+        self.assertFalse(credentials.is_expiring(60))
+        self.assertEqual({"accessToken": "token", "refreshToken": "refresh_token"}, credentials.to_repr())
+
+    def test_from_token_response(self):
+        credentials = Oauth2Client.ClientCredentials.from_token_response({"access_token": "token", "refresh_token": "refresh_token", "expires_in": 3600})
+        self.assertFalse(credentials.is_expiring(60))
+        self.assertTrue(credentials.is_expiring(3600))
+
+
+class TestOauth2Client(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = InMemoryCache()
+        self.cache.cache(Oauth2Client.ClientCredentials("token", "refresh_token").to_repr(), key="resource_id")
+        self.client = Oauth2Client("client_id", "client_secret", "resource_id", self.cache, token_endpoint_url="token_endpoint_url")
+
+    @staticmethod
+    def _token_response(access_token: str, expires_in: int = 3600) -> MockResponse:
+        response = MockResponse({"access_token": access_token, "refresh_token": f"refresh_{access_token}", "expires_in": expires_in})
+        response.status_code = 200
+        return response
+
+    def test_refresh_on_unauthorized(self):
+        unauthorized = MockResponse(None)
+        unauthorized.status_code = 401
+        ok = MockResponse({})
+        ok.status_code = 200
+        self.client.session.request = Mock(side_effect=[unauthorized, ok])
+        self.client.session.post = Mock(return_value=self._token_response("new_token"))
+
+        response = self.client.get("url")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("new_token", self.client.token)
+        self.assertEqual("bearer new_token", self.client.session.request.call_args_list[1][1]["headers"]["authorization"])
+        self.assertEqual("refresh_token", self.client.session.post.call_args[1]["json"]["refresh_token"])
+
+    def test_refresh_token_expired(self):
+        response = MockResponse(None)
+        response.status_code = 400
+        self.client.session.post = Mock(return_value=response)
+
+        with self.assertRaises(RefreshTokenExpiredError):
+            self.client.refresh_access_token()
+
+    def test_refresh_skipped_when_token_already_replaced(self):
+        self.client.session.post = Mock(return_value=self._token_response("new_token"))
+
+        self.client.refresh_access_token(stale_token="old_token")
+
+        self.client.session.post.assert_not_called()
+        self.assertEqual("token", self.client.token)
+
+    def test_concurrent_refreshes_are_coalesced(self):
+        other_client = Oauth2Client("client_id", "client_secret", "resource_id", self.cache, token_endpoint_url="token_endpoint_url")
+        token_requests = []
+
+        def post(url, json):
+            token_requests.append(json)
+            time.sleep(0.05)
+            return self._token_response("new_token")
+
+        self.client.session.post = Mock(side_effect=post)
+        other_client.session.post = Mock(side_effect=post)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit((self.client if i % 2 else other_client).refresh_access_token, "token") for i in range(8)]
+            [future.result() for future in futures]
+
+        self.assertEqual(1, len(token_requests))
+        self.assertEqual("new_token", other_client.token)
+
+    def test_proactive_refresh(self):
+        self.cache.cache(Oauth2Client.ClientCredentials("token", "refresh_token", time.time() + 10).to_repr(), key="resource_id")
+        ok = MockResponse({})
+        ok.status_code = 200
+        self.client.session.request = Mock(return_value=ok)
+        self.client.session.post = Mock(return_value=self._token_response("new_token"))
+
+        self.client.get("url")
+
+        self.client.session.post.assert_called_once()
+        self.client.session.request.assert_called_once()
+        self.assertEqual("bearer new_token", self.client.session.request.call_args[1]["headers"]["authorization"])
+
+    def test_refresh_uses_cache_lock(self):
+        lock = threading.Lock()
+        lock_calls = []
+
+        def cache_lock(key, timeout=30):
+            lock_calls.append((key, timeout))
+            return lock
+
+        self.cache.lock = cache_lock
+        self.client.session.post = Mock(return_value=self._token_response("new_token"))
+
+        self.client.refresh_access_token()
+
+        self.assertEqual([("resource_id", 30)], lock_calls)
+        self.assertFalse(lock.locked())
+
+    def test_default_cache_is_bounded(self):
+        self.assertIsInstance(Oauth2Client("client_id", "client_secret", "resource_id")._cache, BoundedInMemoryCache)
+
+    def test_refresh_locks_are_striped(self):
+        self.assertIs(Oauth2Client._refresh_lock_for("resource_id"), Oauth2Client._refresh_lock_for("resource_id"))
+        locks = {id(Oauth2Client._refresh_lock_for(f"resource_{index}")) for index in range(1000)}
+        self.assertLessEqual(len(locks), Oauth2Client.REFRESH_LOCK_STRIPES)
+
+    def test_credentials_memo(self):
+        ok = MockResponse({})
+        ok.status_code = 200
+        self.client.session.request = Mock(return_value=ok)
+        self.cache.get = Mock(wraps=self.cache.get)
+
+        for _ in range(5):
+            self.client.get("url")
+
+        self.assertEqual(1, self.cache.get.call_count)
+
+    def test_credentials_memo_disabled(self):
+        client = Oauth2Client("client_id", "client_secret", "resource_id", self.cache, token_endpoint_url="token_endpoint_url", credentials_memo_ttl=0)
+        ok = MockResponse({})
+        ok.status_code = 200
+        client.session.request = Mock(return_value=ok)
+        self.cache.get = Mock(wraps=self.cache.get)
+
+        for _ in range(3):
+            client.get("url")
+
+        self.assertEqual(3, self.cache.get.call_count)
+
+    def test_credentials_memo_discarded_when_token_rejected(self):
+        self.assertEqual("token", self.client.token)
+        self.cache.cache(Oauth2Client.ClientCredentials("token_refreshed_elsewhere", "refresh_token").to_repr(), key="resource_id")
+        unauthorized = MockResponse(None)
+        unauthorized.status_code = 401
+        ok = MockResponse({})
+        ok.status_code = 200
+        self.client.session.request = Mock(side_effect=[unauthorized, ok])
+        self.client.session.post = Mock()
+
+        self.client.get("url")
+
+        self.client.session.post.assert_not_called()
+        self.assertEqual("bearer token_refreshed_elsewhere", self.client.session.request.call_args_list[1][1]["headers"]["authorization"])
+
+    def test_credentials_memo_does_not_outlive_refresh_deadline(self):
+        self.cache.cache(Oauth2Client.ClientCredentials("token", "refresh_token", time.time() + 65).to_repr(), key="resource_id")
+        client = Oauth2Client("client_id", "client_secret", "resource_id", self.cache, token_endpoint_url="token_endpoint_url", refresh_margin=60, credentials_memo_ttl=30)
+
+        client._load_client_credential()
+
+        self.assertLessEqual(client._credentials_memo[1] - time.monotonic(), 5)
@@ -0,0 +1,112 @@
+from __future__ import absolute_import, annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import Mock
+
+from test.unit.wenet.interface.mock.client import MockApikeyClient
+from test.unit.wenet.interface.mock.response import MockResponse
+from wenet.interface.coalescer import RequestCoalescer
+from wenet.interface.exceptions import NotFound
+from wenet.interface.profile_manager import ProfileManagerInterface
+from wenet.model.user.profile import WeNetUserProfile
+
+
+class TestRequestCoalescer(TestCase):
+
+    def test_do(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def function():
+            started.set()
+            release.wait(5)
+            return object()
+
+        coalescer = RequestCoalescer()
+        function = Mock(side_effect=function)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(coalescer.do, "key", function)
+            started.wait(5)
+            followers = [executor.submit(coalescer.do, "key", function) for _ in range(4)]
+            time.sleep(0.1)
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+
+        function.assert_called_once()
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({}, coalescer._calls)
+
+        self.assertEqual(1, coalescer.do("key", lambda: 1))
+
+    def test_do_error(self):
+        coalescer = RequestCoalescer()
+        with self.assertRaises(ValueError):
+            coalescer.do("key", Mock(side_effect=ValueError()))
+        self.assertEqual({}, coalescer._calls)
+
+
+class TestCoalescedInterface(TestCase):
+
+    def _get_concurrently(self, profile_manager: ProfileManagerInterface, user_ids: list) -> list:
+        with ThreadPoolExecutor(max_workers=len(user_ids)) as executor:
+            futures = [executor.submit(profile_manager.get_user_profile, user_id) for user_id in user_ids]
+            return [future.exception() or future.result() for future in futures]
+
+    @staticmethod
+    def _slow_get(response: MockResponse, calls: int) -> Mock:
+        barrier = threading.Barrier(calls, timeout=0.2)
+
+        def get(*args, **kwargs):
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            return response
+
+        return Mock(side_effect=get)
+
+    def test_coalesce_requests(self):
+        response = MockResponse(WeNetUserProfile.empty("user_id").to_repr())
+        response.status_code = 200
+        profile_manager = ProfileManagerInterface(MockApikeyClient(), "", coalesce_requests=True)
+        profile_manager._client.get = self._slow_get(response, 5)
+
+        profiles = self._get_concurrently(profile_manager, ["user_id"] * 5)
+
+        profile_manager._client.get.assert_called_once()
+        self.assertTrue(all(profile is profiles[0] for profile in profiles))
+        self.assertEqual(WeNetUserProfile.empty("user_id"), profiles[0])
+
+    def test_coalesce_errors(self):
+        response = MockResponse(None)
+        response.status_code = 404
+        profile_manager = ProfileManagerInterface(MockApikeyClient(), "", coalesce_requests=True)
+        profile_manager._client.get = self._slow_get(response, 3)
+
+        errors = self._get_concurrently(profile_manager, ["user_id"] * 3)
+
+        profile_manager._client.get.assert_called_once()
+        self.assertTrue(all(isinstance(error, NotFound) for error in errors))
+
+    def test_different_requests_are_not_coalesced(self):
+        response = MockResponse(WeNetUserProfile.empty("user_id").to_repr())
+        response.status_code = 200
+        profile_manager = ProfileManagerInterface(MockApikeyClient(), "", coalesce_requests=True)
+        profile_manager._client.get = self._slow_get(response, 3)
+
+        self._get_concurrently(profile_manager, ["user_1", "user_2", "user_3"])
+
+        self.assertEqual(3, profile_manager._client.get.call_count)
+
+    def test_not_coalesced_by_default(self):
+        response = MockResponse(WeNetUserProfile.empty("user_id").to_repr())
+        response.status_code = 200
+        profile_manager = ProfileManagerInterface(MockApikeyClient(), "")
+        profile_manager._client.get = self._slow_get(response, 3)
+
+        self._get_concurrently(profile_manager, ["user_id"] * 3)
+
+        self.assertEqual(3, profile_manager._client.get.call_count)
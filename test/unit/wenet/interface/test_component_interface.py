@@ -1,10 +1,13 @@
 from __future__ import absolute_import, annotations
 
 from unittest import TestCase
+from unittest.mock import Mock, patch
 
 from test.unit.wenet.interface.mock.response import MockResponse
-from wenet.interface.component import ComponentInterface
-from wenet.interface.exceptions import ApiException, BadRequest, AuthenticationException, BadGateway
+from wenet.interface.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from wenet.interface.client import ApikeyClient, RetryPolicy
+from wenet.interface.component import ComponentClient, ComponentInterface
+from wenet.interface.exceptions import ApiException, BadRequest, AuthenticationException, BadGateway, CircuitOpenError
 
 
 class TestComponentInterface(TestCase):
@@ -48,3 +51,56 @@ class TestComponentInterface(TestCase):
         ex = ComponentInterface.get_api_exception_for_response(response)
         self.assertIsInstance(ex, ApiException)
         self.assertEqual(response.status_code, ex.http_status_code)
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_retry_policy(self, mock_sleep):
+        client = ApikeyClient("apikey")
+        failure = MockResponse({})
+        failure.status_code = 503
+        success = MockResponse({})
+        success.status_code = 200
+        client.session.request = Mock(side_effect=[failure, success])
+
+        interface = ComponentInterface(client, "base_url", retry_policy=RetryPolicy())
+        self.assertIsInstance(interface._client, ComponentClient)
+        self.assertIs(client.session, interface._client.session)
+        self.assertEqual({"x-wenet-component-apikey": "apikey"}, interface._client.get_authentication())
+
+        response = interface._client.get("base_url/tasks")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, client.session.request.call_count)
+
+        self.assertIs(client, ComponentInterface(client, "base_url")._client)
+
+    @patch("wenet.interface.client.time.sleep")
+    def test_retry_policy_replaces_the_one_of_the_client(self, mock_sleep):
+        client = ApikeyClient("apikey", retry_policy=RetryPolicy(max_attempts=3))
+        failure = MockResponse({})
+        failure.status_code = 503
+        client.session.request = Mock(return_value=failure)
+
+        interface = ComponentInterface(client, "base_url", retry_policy=RetryPolicy(max_attempts=2))
+        self.assertEqual(503, interface._client.get("base_url/tasks").status_code)
+        self.assertEqual(2, client.session.request.call_count)
+
+        client.session.request.reset_mock()
+        self.assertEqual(503, client.get("base_url/tasks").status_code)
+        self.assertEqual(3, client.session.request.call_count)
+
+    def test_circuit_breaker(self):
+        client = ApikeyClient("apikey")
+        failure = MockResponse({})
+        failure.status_code = 502
+        client.session.request = Mock(return_value=failure)
+
+        registry = CircuitBreakerRegistry(minimum_calls=2, window_size=2)
+        interface = ComponentInterface(client, "base_url", circuit_breakers=registry)
+        self.assertIs(registry.get("base_url"), interface.circuit_breaker)
+        self.assertIsNone(ComponentInterface(client, "base_url").circuit_breaker)
+
+        interface._client.get("base_url/tasks")
+        interface._client.post("base_url/tasks", body={})
+        self.assertEqual(CircuitBreaker.OPEN, interface.circuit_breaker.state)
+        with self.assertRaises(CircuitOpenError):
+            interface._client.get("base_url/tasks")
+        self.assertEqual(2, client.session.request.call_count)
@@ -0,0 +1,101 @@
+from __future__ import absolute_import, annotations
+
+from unittest import TestCase
+
+import requests
+
+from test.unit.wenet.interface.test_pagination import MockListing
+from wenet.interface import pagination
+from wenet.interface.exceptions import ApiException, BadRequest, CircuitOpenError
+from wenet.interface.page_size import AdaptivePageSize
+
+
+class TestAdaptivePageSize(TestCase):
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            AdaptivePageSize(initial_size=5, min_size=10)
+
+    def test_record_page_by_latency(self):
+        page_size = AdaptivePageSize(initial_size=100, target_latency=1.0)
+        page_size.record_page(100, 4.0)
+        self.assertEqual(25, page_size.size)
+        page_size.record_page(25, 0.1)
+        self.assertEqual(50, page_size.size)
+
+    def test_record_page_by_weight(self):
+        page_size = AdaptivePageSize(initial_size=100, max_page_bytes=10000, max_growth=100)
+        page_size.record_page(100, 0.01, size_bytes=100000)
+        self.assertEqual(10, page_size.size)
+
+        page_size = AdaptivePageSize(initial_size=100, max_page_bytes=10000, max_growth=100)
+        page_size.record_page(100, 0.01, size_bytes=2000)
+        self.assertEqual(500, page_size.size)
+
+    def test_record_page_within_bounds(self):
+        page_size = AdaptivePageSize(initial_size=100, min_size=20, max_size=150)
+        page_size.record_page(100, 0.001)
+        self.assertEqual(150, page_size.size)
+        page_size.record_page(150, 100)
+        self.assertEqual(20, page_size.size)
+        page_size.record_page(0, 100)
+        self.assertEqual(20, page_size.size)
+
+    def test_record_failure(self):
+        page_size = AdaptivePageSize(initial_size=40, min_size=10)
+        self.assertTrue(page_size.record_failure())
+        self.assertEqual(20, page_size.size)
+        self.assertTrue(page_size.record_failure())
+        self.assertFalse(page_size.record_failure())
+        self.assertEqual(10, page_size.size)
+
+    def test_is_size_failure(self):
+        self.assertTrue(AdaptivePageSize.is_size_failure(requests.Timeout()))
+        self.assertTrue(AdaptivePageSize.is_size_failure(ApiException(500, "")))
+        self.assertFalse(AdaptivePageSize.is_size_failure(BadRequest("")))
+        self.assertFalse(AdaptivePageSize.is_size_failure(CircuitOpenError("component", 10)))
+
+    def test_fetch_again_smaller_page(self):
+        listing = MockListing(list(range(100)))
+        limits = []
+
+        def fetch_page(offset: int, limit: int):
+            limits.append(limit)
+            if limit > 25:
+                raise requests.Timeout()
+            return listing.fetch_page(offset, limit)
+
+        page_size = AdaptivePageSize(initial_size=100, min_size=10)
+        page, limit = page_size.fetch(fetch_page, lambda page: page.items, 0)
+        self.assertEqual(list(range(25)), page.items)
+        self.assertEqual(25, limit)
+        self.assertEqual([100, 50, 25], limits)
+
+    def test_fetch_failed(self):
+        def fetch_page(offset: int, limit: int):
+            raise requests.Timeout()
+
+        page_size = AdaptivePageSize(initial_size=40, min_size=10)
+        with self.assertRaises(requests.Timeout):
+            page_size.fetch(fetch_page, lambda page: page.items, 0)
+        self.assertEqual(10, page_size.size)
+
+        def fetch_page(offset: int, limit: int):
+            raise BadRequest("")
+
+        page_size = AdaptivePageSize(initial_size=40, min_size=10)
+        with self.assertRaises(BadRequest):
+            page_size.fetch(fetch_page, lambda page: page.items, 0)
+        self.assertEqual(40, page_size.size)
+
+    def test_fetch_all_with_page_size(self):
+        listing = MockListing(list(range(1000)))
+
+        page_size = AdaptivePageSize(initial_size=10, max_size=200, max_page_bytes=1000, get_size=lambda page: 10 * len(page.items))
+        self.assertEqual(list(range(1000)), pagination.fetch_all(listing.fetch_page, lambda page: page.items, page_size=page_size))
+        self.assertEqual([0, 10, 30, 70, 150] + list(range(250, 1000, 100)), listing.offsets)
+
+        listing = MockListing(list(range(1000)))
+        page_size = AdaptivePageSize(initial_size=10, max_size=200, max_page_bytes=1000)
+        self.assertEqual(list(range(1000)), pagination.fetch_all(listing.fetch_page, lambda page: page.items, page_size=page_size))
+        self.assertEqual(200, page_size.size)
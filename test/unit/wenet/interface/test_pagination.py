@@ -0,0 +1,271 @@
+from __future__ import absolute_import, annotations
+
+import threading
+from datetime import datetime, timedelta
+from typing import List
+from unittest import TestCase
+
+from wenet.interface import pagination
+
+
+class MockPage:
+
+    def __init__(self, offset: int, total: int, items: list) -> None:
+        self.offset = offset
+        self.total = total
+        self.items = items
+
+
+class MockListing:
+
+    def __init__(self, items: List[int]) -> None:
+        self.items = items
+        self.offsets = []
+        self._lock = threading.Lock()
+
+    def fetch_page(self, offset: int, limit: int) -> MockPage:
+        with self._lock:
+            self.offsets.append(offset)
+        return MockPage(offset, len(self.items), self.items[offset:offset + limit])
+
+
+class TestIterPages(TestCase):
+
+    def test_iter_pages(self):
+        listing = MockListing(list(range(25)))
+        pages = pagination.iter_pages(listing.fetch_page, lambda page: page.items, limit=10)
+        self.assertEqual([], listing.offsets)
+        self.assertEqual(list(range(10)), next(pages).items)
+        self.assertEqual([0], listing.offsets)
+        self.assertEqual([list(range(10, 20)), list(range(20, 25))], [page.items for page in pages])
+
+    def test_iter_pages_without_limit(self):
+        listing = MockListing(list(range(25)))
+
+        def fetch_page(offset: int, limit: int) -> MockPage:
+            return listing.fetch_page(offset, 10)
+
+        self.assertEqual(list(range(25)), list(pagination.iter_items(fetch_page, lambda page: page.items, limit=None)))
+        self.assertEqual([0, 10, 20], listing.offsets)
+
+    def test_iter_items_empty(self):
+        listing = MockListing([])
+        self.assertEqual([], list(pagination.iter_items(listing.fetch_page, lambda page: page.items)))
+
+    def test_iter_pages_with_prefetch(self):
+        listing = MockListing(list(range(45)))
+        fetched = threading.Semaphore(0)
+
+        def fetch_page(offset: int, limit: int) -> MockPage:
+            page = listing.fetch_page(offset, limit)
+            fetched.release()
+            return page
+
+        pages = pagination.iter_pages(fetch_page, lambda page: page.items, limit=10, prefetch=2)
+        self.assertEqual(list(range(10)), next(pages).items)
+        for _ in range(3):
+            self.assertTrue(fetched.acquire(timeout=1))
+        # while the first page is processed at most two pages are fetched ahead
+        self.assertFalse(fetched.acquire(timeout=0.1))
+        self.assertEqual([0, 10, 20], listing.offsets)
+        self.assertEqual([list(range(10, 20)), list(range(20, 30)), list(range(30, 40)), list(range(40, 45))], [page.items for page in pages])
+        self.assertEqual([0, 10, 20, 30, 40], listing.offsets)
+
+    def test_iter_items_with_prefetch(self):
+        listing = MockListing(list(range(30)))
+        self.assertEqual(list(range(30)), list(pagination.iter_items(listing.fetch_page, lambda page: page.items, limit=10, prefetch=3)))
+        self.assertEqual([0, 10, 20, 30], listing.offsets)
+
+    def test_iter_pages_with_prefetch_error(self):
+        listing = MockListing(list(range(25)))
+
+        def fetch_page(offset: int, limit: int) -> MockPage:
+            if offset > 0:
+                raise ValueError("unexpected error")
+            return listing.fetch_page(offset, limit)
+
+        pages = pagination.iter_pages(fetch_page, lambda page: page.items, limit=10, prefetch=1)
+        self.assertEqual(list(range(10)), next(pages).items)
+        with self.assertRaises(ValueError):
+            next(pages)
+
+    def test_iter_pages_with_prefetch_closed(self):
+        listing = MockListing(list(range(100)))
+        pages = pagination.iter_pages(listing.fetch_page, lambda page: page.items, limit=10, prefetch=1)
+        self.assertEqual(list(range(10)), next(pages).items)
+        pages.close()
+        offsets = len(listing.offsets)
+        self.assertLessEqual(offsets, 3)
+        threading.Event().wait(0.1)
+        self.assertEqual(offsets, len(listing.offsets))
+
+
+class TestIterKeyset(TestCase):
+
+    @staticmethod
+    def build_fetch_page(items: List[tuple], requests: list):
+        def fetch_page(key_from: int, offset: int, limit: int) -> MockPage:
+            requests.append((key_from, offset))
+            # ties are returned in a stable order, as the server does
+            page_items = sorted((item for item in items if key_from is None or item[1] >= key_from), key=lambda item: item[1])
+            return MockPage(offset, len(page_items), page_items[offset:offset + limit])
+
+        return fetch_page
+
+    def test_iter_keyset(self):
+        items = [(f"item_{index}", 1000 + index // 3) for index in range(25)]
+        requests = []
+        iterated_items = list(pagination.iter_keyset(self.build_fetch_page(items, requests), lambda page: page.items, lambda item: item[1], lambda item: item[0], limit=10))
+        self.assertEqual(items, iterated_items)
+        self.assertEqual([(None, 0), (1003, 0), (1006, 0)], requests)
+
+    def test_iter_keyset_with_large_ties(self):
+        items = [(f"item_{index}", 1000) for index in range(25)] + [("item_25", 1001)]
+        requests = []
+        iterated_items = list(pagination.iter_keyset(self.build_fetch_page(items, requests), lambda page: page.items, lambda item: item[1], lambda item: item[0], key_from=1000, limit=10))
+        self.assertEqual(items, iterated_items)
+        self.assertEqual([(1000, 0), (1000, 10), (1000, 20)], requests)
+
+    def test_iter_keyset_with_added_items(self):
+        items = [(f"item_{index}", 1000 + index) for index in range(20)]
+        requests = []
+        iterator = pagination.iter_keyset(self.build_fetch_page(items, requests), lambda page: page.items, lambda item: item[1], lambda item: item[0], limit=10)
+        self.assertEqual(items[:10], [next(iterator) for _ in range(10)])
+        # an item created before the current position does not shift the following pages
+        items.insert(0, ("item_early", 999))
+        self.assertEqual(items[11:], list(iterator))
+
+
+class TestTake(TestCase):
+
+    def test_take(self):
+        listing = MockListing(list(range(100)))
+        items = pagination.iter_items(listing.fetch_page, lambda page: page.items, limit=10)
+        self.assertEqual([21, 23, 25], pagination.take(items, 3, predicate=lambda item: item > 20 and item % 2 == 1))
+        self.assertEqual([0, 10, 20], listing.offsets)
+
+    def test_take_not_enough_items(self):
+        listing = MockListing(list(range(25)))
+        self.assertEqual([20, 24], pagination.take(pagination.iter_items(listing.fetch_page, lambda page: page.items, limit=10), 3, predicate=lambda item: item % 4 == 0 and item >= 20))
+        self.assertEqual([0, 10, 20], listing.offsets)
+
+    def test_take_closes_prefetching_iterator(self):
+        listing = MockListing(list(range(1000)))
+        items = pagination.iter_items(listing.fetch_page, lambda page: page.items, limit=10, prefetch=2)
+        self.assertEqual([0, 1], pagination.take(items, 2))
+        threading.Event().wait(0.1)
+        self.assertLessEqual(len(listing.offsets), 4)
+
+    def test_find_first(self):
+        listing = MockListing(list(range(100)))
+        self.assertEqual(42, pagination.find_first(pagination.iter_items(listing.fetch_page, lambda page: page.items, limit=10), lambda item: item >= 42))
+        self.assertEqual([0, 10, 20, 30, 40], listing.offsets)
+        self.assertIsNone(pagination.find_first(iter([1, 3]), lambda item: item % 2 == 0))
+
+
+class TestFetchAll(TestCase):
+
+    def test_fetch_all_sequentially(self):
+        listing = MockListing(list(range(25)))
+        self.assertEqual(list(range(25)), pagination.fetch_all(listing.fetch_page, lambda page: page.items, limit=10))
+        self.assertEqual([0, 10, 20], listing.offsets)
+
+        listing = MockListing(list(range(20)))
+        self.assertEqual(list(range(5, 20)), pagination.fetch_all(listing.fetch_page, lambda page: page.items, offset=5, limit=10))
+        self.assertEqual([5, 15], listing.offsets)
+
+    def test_fetch_all_in_parallel(self):
+        listing = MockListing(list(range(95)))
+        self.assertEqual(list(range(95)), pagination.fetch_all(listing.fetch_page, lambda page: page.items, limit=10, max_workers=4))
+        self.assertEqual(list(range(0, 100, 10)), sorted(listing.offsets))
+
+    def test_fetch_all_in_parallel_full_last_page(self):
+        listing = MockListing(list(range(30)))
+        self.assertEqual(list(range(30)), pagination.fetch_all(listing.fetch_page, lambda page: page.items, limit=10, max_workers=4))
+        self.assertEqual([0, 10, 20, 30], sorted(listing.offsets))
+
+    def test_fetch_all_in_parallel_single_page(self):
+        listing = MockListing(list(range(5)))
+        self.assertEqual(list(range(5)), pagination.fetch_all(listing.fetch_page, lambda page: page.items, limit=10, max_workers=4))
+        self.assertEqual([0], listing.offsets)
+
+    def test_fetch_all_in_parallel_without_limit(self):
+        listing = MockListing(list(range(25)))
+
+        def fetch_page(offset: int, limit: int) -> MockPage:
+            return listing.fetch_page(offset, 10)
+
+        self.assertEqual(list(range(25)), pagination.fetch_all(fetch_page, lambda page: page.items, limit=None, max_workers=4))
+        self.assertEqual([0, 10, 20], sorted(listing.offsets))
+
+    def test_fetch_all_in_parallel_with_changing_total(self):
+        listing = MockListing(list(range(35)))
+        fetch_page = listing.fetch_page
+
+        def growing_fetch_page(offset: int, limit: int) -> MockPage:
+            page = fetch_page(offset, limit)
+            if offset == 0 and len(listing.items) == 35:
+                listing.items = list(range(45))
+            return page
+
+        self.assertEqual(list(range(45)), pagination.fetch_all(growing_fetch_page, lambda page: page.items, limit=10, max_workers=4))
+
+
+class MockTimedListing:
+
+    def __init__(self, timestamps: List[int]) -> None:
+        self.items = [(f"item_{index}", timestamp) for index, timestamp in enumerate(timestamps)]
+        self.windows = []
+        self._lock = threading.Lock()
+
+    def fetch_page(self, window_from: datetime, window_to: datetime, offset: int, limit: int) -> MockPage:
+        with self._lock:
+            self.windows.append((int(window_from.timestamp()), int(window_to.timestamp()), offset))
+        items = [item for item in self.items if int(window_from.timestamp()) <= item[1] <= int(window_to.timestamp())]
+        return MockPage(offset, len(items), items[offset:offset + limit])
+
+
+class TestFetchAllInWindows(TestCase):
+
+    def test_split_in_windows(self):
+        start = datetime.fromtimestamp(1000)
+        self.assertEqual([(start, start + timedelta(seconds=9)), (start + timedelta(seconds=10), start + timedelta(seconds=15))],
+                         pagination.split_in_windows(start, start + timedelta(seconds=15), timedelta(seconds=10)))
+        with self.assertRaises(ValueError):
+            pagination.split_in_windows(start, start + timedelta(seconds=15), timedelta(milliseconds=10))
+
+    def test_fetch_all_in_windows(self):
+        listing = MockTimedListing(list(range(1000, 1100)))
+        items = pagination.fetch_all_in_windows(listing.fetch_page, lambda page: page.items, lambda item: item[0],
+                                                datetime.fromtimestamp(1000), datetime.fromtimestamp(1099), timedelta(seconds=25), limit=10)
+        self.assertEqual(listing.items, items)
+        self.assertEqual(4 * 3, len(listing.windows))
+        self.assertTrue(all(offset < 25 for _, _, offset in listing.windows))
+
+    def test_fetch_all_in_windows_split(self):
+        listing = MockTimedListing([1000] * 5 + list(range(1001, 1040)) + [1050] * 30)
+        items = pagination.fetch_all_in_windows(listing.fetch_page, lambda page: page.items, lambda item: item[0],
+                                                datetime.fromtimestamp(1000), datetime.fromtimestamp(1059), timedelta(seconds=60), max_window_items=20, limit=10)
+        self.assertEqual(listing.items, items)
+        # the window of a single second is not split even if it is larger than the threshold
+        self.assertIn((1050, 1050, 20), listing.windows)
+        self.assertTrue(all(offset < 20 for window_from, _, offset in listing.windows if window_from != 1050))
+
+    def test_fetch_all_in_windows_deduplicated(self):
+        listing = MockTimedListing(list(range(1000, 1020)))
+
+        def fetch_page(window_from: datetime, window_to: datetime, offset: int, limit: int) -> MockPage:
+            # overlapping windows
+            return listing.fetch_page(window_from - timedelta(seconds=1), window_to, offset, limit)
+
+        items = pagination.fetch_all_in_windows(fetch_page, lambda page: page.items, lambda item: item[0],
+                                                datetime.fromtimestamp(1000), datetime.fromtimestamp(1019), timedelta(seconds=5), limit=10)
+        self.assertEqual(listing.items, items)
+
+    def test_fetch_all_in_windows_error(self):
+        def fetch_page(window_from: datetime, window_to: datetime, offset: int, limit: int) -> MockPage:
+            raise ValueError("unexpected error")
+
+        with self.assertRaises(ValueError):
+            pagination.fetch_all_in_windows(fetch_page, lambda page: page.items, lambda item: item[0],
+                                            datetime.fromtimestamp(1000), datetime.fromtimestamp(1019), timedelta(seconds=5))
@@ -5,7 +5,9 @@ from unittest.mock import Mock
 
 from test.unit.wenet.interface.mock.client import MockApikeyClient
 from test.unit.wenet.interface.mock.response import MockResponse
+from test.unit.wenet.interface.mock.server import MockPagedServer
 from wenet.interface.exceptions import AuthenticationException, NotFound, BadRequest
+from wenet.interface.page_size import AdaptivePageSize
 from wenet.interface.profile_manager import ProfileManagerInterface
 from wenet.model.user.profile import WeNetUserProfile, UserIdentifiersPage, WeNetUserProfilesPage, PatchWeNetUserProfile
 from wenet.model.user.relationship import RelationshipPage, Relationship, RelationType
@@ -157,12 +159,63 @@ class TestProfileManagerInterface(TestCase):
         with self.assertRaises(AuthenticationException):
             self.profile_manager.get_profiles()
 
+    def test_get_profiles_in_parallel(self):
+        profiles = [WeNetUserProfile.empty(f"user_{index}") for index in range(25)]
+
+        self.profile_manager._client.get = Mock(side_effect=MockPagedServer(profiles, WeNetUserProfilesPage))
+        self.assertEqual(profiles, self.profile_manager.get_profiles(max_workers=4))
+        self.assertEqual([0, 10, 20], sorted(call[1]["query_params"]["offset"] for call in self.profile_manager._client.get.call_args_list))
+
+        self.profile_manager._client.get.reset_mock()
+        self.assertEqual(profiles, self.profile_manager.get_profiles(limit=20, max_workers=4))
+        self.assertEqual([0, 20], sorted(call[1]["query_params"]["offset"] for call in self.profile_manager._client.get.call_args_list))
+
+    def test_iter_profiles(self):
+        profiles = [WeNetUserProfile.empty(f"user_{index}") for index in range(5)]
+
+        self.profile_manager._client.get = Mock(side_effect=MockPagedServer(profiles, WeNetUserProfilesPage, default_limit=2))
+        self.assertEqual(profiles, list(self.profile_manager.iter_profiles()))
+        self.assertEqual(3, self.profile_manager._client.get.call_count)
+        self.assertNotIn("limit", self.profile_manager._client.get.call_args[1]["query_params"])
+
+        self.profile_manager._client.get.reset_mock()
+        pages = list(self.profile_manager.iter_profiles(limit=2, pages=True))
+        self.assertEqual([2, 2, 1], [len(page.profiles) for page in pages])
+        self.assertEqual(2, self.profile_manager._client.get.call_args[1]["query_params"]["limit"])
+
+    def test_get_relationships_with_page_size(self):
+        relationship_page = RelationshipPage(0, 1, [Relationship("app_id", "source_id", "target_id", RelationType.FRIEND, 0.5)])
+        self.profile_manager.get_relationship_page = Mock(return_value=relationship_page)
+
+        self.assertEqual(relationship_page.relationships, self.profile_manager.get_relationships(app_id="app_id", page_size=AdaptivePageSize(initial_size=50)))
+        self.assertEqual(50, self.profile_manager.get_relationship_page.call_args[1]["limit"])
+
+    def test_iter_relationships(self):
+        relationship_page = RelationshipPage(0, 1, [Relationship("app_id", "source_id", "target_id", RelationType.FRIEND, 0.5)])
+        self.profile_manager.get_relationship_page = Mock(return_value=relationship_page)
+
+        self.assertEqual(relationship_page.relationships, list(self.profile_manager.iter_relationships(app_id="app_id")))
+        self.profile_manager.get_relationship_page.assert_called_once_with(offset=0, limit=100, headers=None, app_id="app_id", source_id=None, target_id=None,
+                                                                           relation_type=None, weight_from=None, weight_to=None, order=None)
+
     def test_get_profile_user_ids(self):
         response = MockResponse(UserIdentifiersPage(0, 0, []).to_repr())
         response.status_code = 200
         self.profile_manager._client.get = Mock(return_value=response)
         self.assertListEqual([], self.profile_manager.get_profile_user_ids())
 
+    def test_get_profile_user_ids_in_parallel(self):
+        user_ids = [f"user_{index}" for index in range(25)]
+
+        self.profile_manager._client.get = Mock(side_effect=MockPagedServer(user_ids, UserIdentifiersPage))
+        self.assertEqual(user_ids, self.profile_manager.get_profile_user_ids(max_workers=4))
+        self.assertEqual(3, self.profile_manager._client.get.call_count)
+        self.assertTrue(self.profile_manager._client.get.call_args[0][0].endswith("/userIdentifiers"))
+
+        self.profile_manager._client.get.reset_mock()
+        self.assertEqual(user_ids[5:], list(self.profile_manager.iter_profile_user_ids(offset=5, limit=5)))
+        self.assertEqual(5, self.profile_manager._client.get.call_args[1]["query_params"]["limit"])
+
     def test_get_profile_user_ids_exception(self):
         response = MockResponse(None)
         response.status_code = 400
@@ -0,0 +1,125 @@
+from __future__ import absolute_import, annotations
+
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock, patch
+
+from test.unit.wenet.interface.mock.response import MockResponse
+from wenet.interface.client import ApikeyClient
+from wenet.interface.component import ComponentInterface
+from wenet.interface.exceptions import ApiException, RateLimitExceeded
+from wenet.interface.rate_limiter import RateLimiter, RateLimitRule, RedisTokenBucket, TokenBucket
+
+
+class TestTokenBucket(TestCase):
+
+    @patch("wenet.interface.rate_limiter.time.monotonic")
+    def test_try_acquire(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        bucket = TokenBucket(rate=2, capacity=3)
+        self.assertEqual([0, 0, 0], [bucket.try_acquire() for _ in range(3)])
+        self.assertEqual(0.5, bucket.try_acquire())
+
+        mock_monotonic.return_value = 100.5
+        self.assertEqual(0, bucket.try_acquire())
+        self.assertEqual(0.5, bucket.try_acquire())
+
+        mock_monotonic.return_value = 200
+        self.assertEqual(0, bucket.try_acquire(tokens=3))
+
+
+class TestRedisTokenBucket(TestCase):
+
+    def test_try_acquire(self):
+        r = Mock()
+        script = Mock(side_effect=["0", "0.25"])
+        r.register_script.return_value = script
+
+        bucket = RedisTokenBucket(r, "wenet:rate_limit:default", rate=4)
+        self.assertEqual(0, bucket.try_acquire())
+        self.assertEqual(0.25, bucket.try_acquire())
+        script.assert_called_with(keys=["wenet:rate_limit:default"], args=[4, 4, 1])
+
+
+class TestRateLimiter(TestCase):
+
+    def test_rules(self):
+        rate_limiter = RateLimiter(rate=100, rules=[
+            RateLimitRule(r"/profiles/[^/]+$", rate=1, methods=["DELETE"]),
+            RateLimitRule(r"/messages$", rate=2)
+        ], blocking=False)
+
+        self.assertTrue(rate_limiter.acquire("DELETE", "url/profiles/1"))
+        self.assertFalse(rate_limiter.acquire("DELETE", "url/profiles/2"))
+        self.assertTrue(rate_limiter.acquire("GET", "url/profiles/2"))
+        self.assertTrue(rate_limiter.acquire("POST", "url/messages"))
+        self.assertTrue(rate_limiter.acquire("POST", "url/messages"))
+        self.assertFalse(rate_limiter.acquire("POST", "url/messages"))
+
+    def test_unlimited_without_default_rate(self):
+        rate_limiter = RateLimiter(rules=[RateLimitRule(r"/messages$", rate=1)], blocking=False)
+        for _ in range(5):
+            self.assertTrue(rate_limiter.acquire("GET", "url/tasks"))
+
+    @patch("wenet.interface.rate_limiter.time.sleep")
+    def test_blocking_acquire(self, mock_sleep):
+        rate_limiter = RateLimiter(rate=1)
+        rate_limiter._buckets[0][1].try_acquire = Mock(side_effect=[0.4, 0.2, 0])
+
+        self.assertTrue(rate_limiter.acquire("GET", "url"))
+        self.assertEqual([0.4, 0.2], [call[0][0] for call in mock_sleep.call_args_list])
+
+    @patch("wenet.interface.rate_limiter.time.sleep")
+    def test_blocking_acquire_timeout(self, mock_sleep):
+        rate_limiter = RateLimiter(rate=1, timeout=0)
+        rate_limiter._buckets[0][1].try_acquire = Mock(return_value=0.5)
+
+        self.assertFalse(rate_limiter.acquire("GET", "url"))
+        mock_sleep.assert_not_called()
+
+    def test_check(self):
+        rate_limiter = RateLimiter(rate=1, blocking=False)
+        rate_limiter.check("GET", "url")
+        with self.assertRaises(RateLimitExceeded) as context:
+            rate_limiter.check("GET", "url")
+        self.assertIsInstance(context.exception, ApiException)
+        self.assertEqual(429, context.exception.http_status_code)
+
+    def test_client_with_rate_limiter(self):
+        client = ApikeyClient("apikey", rate_limiter=RateLimiter(rate=1, blocking=False))
+        response = MockResponse({})
+        response.status_code = 200
+        client.session.request = Mock(return_value=response)
+
+        client.get("url")
+        with self.assertRaises(RateLimitExceeded):
+            client.get("url")
+        client.session.request.assert_called_once()
+
+    def test_component_interface_with_rate_limiter(self):
+        client = ApikeyClient("apikey")
+        response = MockResponse({})
+        response.status_code = 200
+        client.session.request = Mock(return_value=response)
+
+        interface = ComponentInterface(client, "base_url", rate_limiter=RateLimiter(rate=1, blocking=False))
+        interface._client.get("base_url/tasks")
+        with self.assertRaises(RateLimitExceeded):
+            interface._client.get("base_url/tasks")
+        client.get("base_url/tasks")
+        self.assertEqual(2, client.session.request.call_count)
+
+
+class TestAsyncRateLimiter(IsolatedAsyncioTestCase):
+
+    @patch("wenet.interface.rate_limiter.asyncio.sleep", new_callable=AsyncMock)
+    async def test_acquire_async(self, mock_sleep):
+        rate_limiter = RateLimiter(rate=1)
+        rate_limiter._buckets[0][1].try_acquire = Mock(side_effect=[0.3, 0])
+
+        self.assertTrue(await rate_limiter.acquire_async("GET", "url"))
+        mock_sleep.assert_awaited_once_with(0.3)
+
+        rate_limiter = RateLimiter(rate=1, blocking=False)
+        await rate_limiter.check_async("GET", "url")
+        with self.assertRaises(RateLimitExceeded):
+            await rate_limiter.check_async("GET", "url")
@@ -11,6 +11,7 @@ import pytz
 from test.unit.wenet.generator.user_profile import RelationshipGenerator
 from test.unit.wenet.interface.mock.client import MockOauth2Client
 from test.unit.wenet.interface.mock.response import MockResponse
+from test.unit.wenet.interface.mock.server import MockPagedServer
 from wenet.interface.exceptions import NotFound, BadRequest, AuthenticationException, ApiException
 from wenet.interface.service_api import ServiceApiInterface
 from wenet.model.app import AppDTO
@@ -1254,6 +1255,23 @@ class TestServiceApiInterface(TestCase):
         self.assertEqual(108, len(self.service_api.get_user_relationships("user_id")))
         self.assertEqual(2, self.service_api.get_relationship_page.call_count)
 
+    def test_iter_user_relationships(self):
+        self.service_api.get_relationship_page = Mock(
+            side_effect=[
+                RelationshipGenerator.generate_relationship_page("user_id", 100),
+                RelationshipGenerator.generate_relationship_page("user_id", 8)
+            ]
+        )
+
+        relationships = self.service_api.iter_user_relationships("user_id", relation_type="friend")
+        self.service_api.get_relationship_page.assert_not_called()
+        self.assertEqual(100, len([next(relationships) for _ in range(100)]))
+        self.assertEqual(1, self.service_api.get_relationship_page.call_count)
+        self.assertEqual(8, len(list(relationships)))
+        self.assertEqual(2, self.service_api.get_relationship_page.call_count)
+        self.assertEqual(100, self.service_api.get_relationship_page.call_args[1]["offset"])
+        self.assertEqual("friend", self.service_api.get_relationship_page.call_args[1]["relation_type"])
+
     def test_get_user_relationships_exception(self):
         response = MockResponse(None)
         response.status_code = 500
@@ -1500,6 +1518,25 @@ class TestServiceApiInterface(TestCase):
         with self.assertRaises(AuthenticationException):
             self.service_api.get_all_tasks(app_id="app_id")
 
+    def test_take_tasks(self):
+        tasks = [Task(f"task_{index}", None, None, "type_1" if index % 10 == 9 else "type_2", "requester_id", "app_id", None, TaskGoal("", "")) for index in range(100)]
+
+        self.service_api._client.get = Mock(side_effect=MockPagedServer(tasks, TaskPage))
+        taken_tasks = self.service_api.take_tasks(2, predicate=lambda task: task.task_type_id == "type_1", limit=10, app_id="app_id", has_close_ts=False)
+        self.assertEqual(["task_9", "task_19"], [task.task_id for task in taken_tasks])
+        self.assertEqual(2, self.service_api._client.get.call_count)
+        self.assertEqual({"appId": "app_id", "hasCloseTs": False, "offset": 10, "limit": 10}, self.service_api._client.get.call_args[1]["query_params"])
+
+        self.service_api._client.get.reset_mock()
+        self.assertEqual("task_0", self.service_api.find_first_task(app_id="app_id").task_id)
+        self.assertEqual(1, self.service_api._client.get.call_args[1]["query_params"]["limit"])
+
+    def test_find_first_task_not_found(self):
+        response = MockResponse(TaskPage(0, 0, []).to_repr())
+        response.status_code = 200
+        self.service_api._client.get = Mock(return_value=response)
+        self.assertIsNone(self.service_api.find_first_task(lambda task: True, app_id="app_id"))
+
     def test_get_task_page(self):
         response = MockResponse(TaskPage(0, 1, [Task("task_id", None, None, "", "", "app_id", None, TaskGoal("", ""))]).to_repr())
         response.status_code = 200
@@ -0,0 +1,98 @@
+from __future__ import absolute_import, annotations
+
+from datetime import datetime
+from typing import List, Optional
+from unittest import TestCase
+
+from test.unit.wenet.interface.test_pagination import MockPage
+from wenet.interface.sync import sync_changes
+from wenet.storage.cache import InMemoryCache
+from wenet.storage.state import CacheStateStore
+
+
+class MockChangingListing:
+
+    def __init__(self, update_timestamps: List[int]) -> None:
+        self.items = [(f"item_{index}", update_ts) for index, update_ts in enumerate(update_timestamps)]
+        self.requests = []
+        self.on_fetch = None
+
+    def fetch_page(self, update_from: Optional[datetime], update_to: datetime, offset: int, limit: int) -> MockPage:
+        self.requests.append((int(update_from.timestamp()) if update_from is not None else None, int(update_to.timestamp()), offset))
+        items = sorted((item for item in self.items if (update_from is None or item[1] >= update_from.timestamp()) and item[1] <= update_to.timestamp()), key=lambda item: (item[1], item[0]))
+        page = MockPage(offset, len(items), items[offset:offset + limit])
+        if self.on_fetch is not None:
+            self.on_fetch(self)
+        return page
+
+    def update(self, index: int, update_ts: int) -> None:
+        self.items[index] = (self.items[index][0], update_ts)
+
+
+class TestSyncChanges(TestCase):
+
+    def setUp(self) -> None:
+        self.state_store = CacheStateStore(InMemoryCache())
+
+    def sync(self, listing: MockChangingListing, sink: list, until: int, **kwargs) -> int:
+        return sync_changes(listing.fetch_page, lambda page: page.items, lambda item: item[1], lambda item: item[0], sink.extend, self.state_store, "items",
+                            until=datetime.fromtimestamp(until), limit=10, **kwargs)
+
+    def test_sync_changes(self):
+        listing = MockChangingListing(list(range(1000, 1025)))
+        sink = []
+        self.assertEqual(25, self.sync(listing, sink, 1100))
+        self.assertEqual(listing.items, sink)
+        self.assertEqual({"lastUpdateTs": 1024}, self.state_store.load("items"))
+
+        listing.update(3, 1150)
+        listing.requests = []
+        sink = []
+        self.assertEqual(2, self.sync(listing, sink, 1200))
+        self.assertEqual([("item_24", 1024), ("item_3", 1150)], sink)
+        self.assertEqual((1024, 1200, 0), listing.requests[0])
+        self.assertEqual({"lastUpdateTs": 1150}, self.state_store.load("items"))
+
+    def test_sync_changes_without_changes(self):
+        listing = MockChangingListing([])
+        self.assertEqual(0, self.sync(listing, [], 1100))
+        self.assertIsNone(self.state_store.load("items"))
+
+    def test_sync_changes_updated_during_sync(self):
+        listing = MockChangingListing(list(range(1000, 1015)))
+        sink = []
+
+        def update_first_item(changing_listing: MockChangingListing) -> None:
+            if len(changing_listing.requests) == 1:
+                changing_listing.update(0, 1050)
+
+        listing.on_fetch = update_first_item
+        sync_changes(listing.fetch_page, lambda page: page.items, lambda item: item[1], lambda item: item[0], sink.extend, self.state_store, "items",
+                     until=datetime.fromtimestamp(1100), limit=5)
+        self.assertEqual({f"item_{index}" for index in range(15)}, {item[0] for item in sink})
+        self.assertEqual(("item_0", 1050), sink[-1])
+        self.assertEqual({"lastUpdateTs": 1050}, self.state_store.load("items"))
+
+    def test_sync_changes_since(self):
+        listing = MockChangingListing(list(range(1000, 1025)))
+        sink = []
+        self.assertEqual(5, self.sync(listing, sink, 1100, since=datetime.fromtimestamp(1020)))
+        self.assertEqual(listing.items[20:], sink)
+
+    def test_sync_changes_interrupted(self):
+        listing = MockChangingListing(list(range(1000, 1025)))
+        sink = []
+
+        def failing_sink(items: list) -> None:
+            if len(sink) >= 10:
+                raise ValueError("unexpected error")
+            sink.extend(items)
+
+        with self.assertRaises(ValueError):
+            sync_changes(listing.fetch_page, lambda page: page.items, lambda item: item[1], lambda item: item[0], failing_sink, self.state_store, "items",
+                         until=datetime.fromtimestamp(1100), limit=10)
+        self.assertEqual({"lastUpdateTs": 1009}, self.state_store.load("items"))
+
+        sink = []
+        self.assertEqual(16, self.sync(listing, sink, 1100))
+        self.assertEqual(listing.items[9:], sink)
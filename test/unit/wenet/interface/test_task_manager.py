@@ -1,14 +1,19 @@
 from __future__ import absolute_import, annotations
 
+from datetime import datetime, timedelta
 from unittest import TestCase
 from unittest.mock import Mock
 
 from test.unit.wenet.interface.mock.client import MockApikeyClient
 from test.unit.wenet.interface.mock.response import MockResponse
+from test.unit.wenet.interface.mock.server import MockPagedServer
+from wenet.interface.checkpoint import Checkpoint
 from wenet.interface.exceptions import AuthenticationException, NotFound, BadRequest
 from wenet.interface.task_manager import TaskManagerInterface
 from wenet.model.task.task import TaskPage, Task, TaskGoal
 from wenet.model.task.transaction import TaskTransactionPage, TaskTransaction
+from wenet.storage.cache import InMemoryCache
+from wenet.storage.state import CacheStateStore
 
 
 class TestTaskManagerInterface(TestCase):
@@ -23,6 +28,133 @@ class TestTaskManagerInterface(TestCase):
         self.task_manager._client.get = Mock(return_value=response)
         self.assertEqual([Task("task_id", None, None, "", "", "app_id", None, TaskGoal("", ""))], self.task_manager.get_all_tasks(app_id="app_id"))
 
+    def test_get_all_tasks_in_parallel(self):
+        tasks = [Task(f"task_{index}", None, None, "", "", "app_id", None, TaskGoal("", "")) for index in range(250)]
+
+        self.task_manager._client.get = Mock(side_effect=MockPagedServer(tasks, TaskPage))
+        self.assertEqual(tasks, self.task_manager.get_all_tasks(app_id="app_id", max_workers=3))
+        self.assertEqual(3, self.task_manager._client.get.call_count)
+        self.assertEqual({0, 100, 200}, {call[1]["query_params"]["offset"] for call in self.task_manager._client.get.call_args_list})
+        self.assertTrue(all(call[1]["query_params"]["appId"] == "app_id" for call in self.task_manager._client.get.call_args_list))
+
+    def test_iter_tasks(self):
+        tasks = [Task(f"task_{index}", None, None, "", "", "app_id", None, TaskGoal("", "")) for index in range(25)]
+
+        self.task_manager._client.get = Mock(side_effect=MockPagedServer(tasks, TaskPage))
+        iterator = self.task_manager.iter_tasks(app_id="app_id", limit=10)
+        self.task_manager._client.get.assert_not_called()
+        self.assertEqual(tasks[:3], [next(iterator) for _ in range(3)])
+        self.assertEqual(1, self.task_manager._client.get.call_count)
+        self.assertEqual(tasks[3:], list(iterator))
+        self.assertEqual(3, self.task_manager._client.get.call_count)
+
+        pages = list(self.task_manager.iter_tasks(app_id="app_id", limit=10, pages=True))
+        self.assertEqual([10, 10, 5], [len(page.tasks) for page in pages])
+        self.assertTrue(all(isinstance(page, TaskPage) for page in pages))
+
+    def test_iter_tasks_with_prefetch(self):
+        tasks = [Task(f"task_{index}", None, None, "", "", "app_id", None, TaskGoal("", "")) for index in range(25)]
+
+        self.task_manager._client.get = Mock(side_effect=MockPagedServer(tasks, TaskPage))
+        self.assertEqual(tasks, list(self.task_manager.iter_tasks(app_id="app_id", limit=10, prefetch=2)))
+        self.assertEqual([0, 10, 20], sorted(call[1]["query_params"]["offset"] for call in self.task_manager._client.get.call_args_list))
+
+    def test_iter_tasks_by_creation(self):
+        tasks = [Task(f"task_{index}", 1000 + index, None, "", "", "app_id", None, TaskGoal("", "")) for index in range(15)]
+
+        server = MockPagedServer(tasks, TaskPage, matches=lambda task, query_params: task.creation_ts >= query_params.get("creationFrom", 0))
+        self.task_manager._client.get = Mock(side_effect=server)
+        self.assertEqual(tasks[2:], list(self.task_manager.iter_tasks_by_creation(creation_from=datetime.fromtimestamp(1002), limit=10, app_id="app_id")))
+        query_params = [call[1]["query_params"] for call in self.task_manager._client.get.call_args_list]
+        self.assertEqual([1002, 1011], [params["creationFrom"] for params in query_params])
+        self.assertEqual([0, 0], [params["offset"] for params in query_params])
+        self.assertTrue(all(params["order"] == "_creationTs" and params["appId"] == "app_id" for params in query_params))
+
+        self.task_manager._client.get.reset_mock()
+        self.assertEqual(tasks, list(self.task_manager.iter_tasks_by_creation(order="_creationTs")))
+        with self.assertRaises(ValueError):
+            self.task_manager.iter_tasks_by_creation(order="-_creationTs")
+        with self.assertRaises(ValueError):
+            self.task_manager.sync_tasks(lambda page_tasks: None, CacheStateStore(InMemoryCache()), order="_creationTs")
+
+    def test_crawl_tasks(self):
+        tasks = [Task(f"task_{index}", 1000 + index, None, "", "", "app_id", None, TaskGoal("", "")) for index in range(30)]
+
+        server = MockPagedServer(tasks, TaskPage, matches=lambda task, query_params: query_params["creationFrom"] <= task.creation_ts <= query_params["creationTo"])
+        self.task_manager._client.get = Mock(side_effect=server)
+        crawled_tasks = self.task_manager.crawl_tasks(datetime.fromtimestamp(1000), datetime.fromtimestamp(1029), window=timedelta(seconds=10), app_id="app_id")
+        self.assertEqual(tasks, crawled_tasks)
+        self.assertEqual(3, self.task_manager._client.get.call_count)
+        self.assertTrue(all(call[1]["query_params"]["appId"] == "app_id" for call in self.task_manager._client.get.call_args_list))
+
+    def test_crawl_transactions_by_task_creation(self):
+        response = MockResponse(TaskTransactionPage(0, 1, [TaskTransaction("transaction_id", "task_id", "", 1, 1, "", None)]).to_repr())
+        response.status_code = 200
+        self.task_manager._client.get = Mock(return_value=response)
+
+        transactions = self.task_manager.crawl_transactions(datetime.fromtimestamp(1000), datetime.fromtimestamp(1019), by_task_creation=True, window=timedelta(seconds=10))
+        self.assertEqual(["transaction_id"], [transaction.id for transaction in transactions])
+        self.assertEqual(2, self.task_manager._client.get.call_count)
+        query_params = self.task_manager._client.get.call_args[1]["query_params"]
+        self.assertIn("taskCreationFrom", query_params)
+        self.assertNotIn("creationFrom", query_params)
+
+    def test_export_tasks(self):
+        tasks = [Task(f"task_{index}", None, None, "", "", "app_id", None, TaskGoal("", "")) for index in range(25)]
+
+        self.task_manager._client.get = Mock(side_effect=MockPagedServer(tasks, TaskPage))
+        checkpoint = Checkpoint(CacheStateStore(InMemoryCache()), "tasks")
+        exported_tasks = []
+
+        def sink(page_tasks):
+            if len(exported_tasks) == 10:
+                raise ValueError("unexpected error")
+            exported_tasks.extend(page_tasks)
+
+        with self.assertRaises(ValueError):
+            self.task_manager.export_tasks(sink, checkpoint, limit=10, app_id="app_id")
+        self.assertEqual(10, len(exported_tasks))
+
+        exported_tasks.append(None)
+        self.task_manager._client.get.reset_mock()
+        self.assertEqual(15, self.task_manager.export_tasks(sink, checkpoint, limit=10, app_id="app_id"))
+        self.assertEqual(tasks, exported_tasks[:10] + exported_tasks[11:])
+        self.assertEqual([10, 20], [call[1]["query_params"]["offset"] for call in self.task_manager._client.get.call_args_list])
+
+    def test_export_tasks_in_windows_without_creation_from(self):
+        with self.assertRaises(ValueError):
+            self.task_manager.export_tasks(lambda page_tasks: None, Checkpoint(CacheStateStore(InMemoryCache()), "tasks"), window=timedelta(days=1))
+
+    def test_sync_tasks(self):
+        tasks = [Task(f"task_{index}", 1000, 1000 + index, "", "", "app_id", None, TaskGoal("", "")) for index in range(3)]
+        response = MockResponse(TaskPage(0, 3, tasks).to_repr())
+        response.status_code = 200
+        self.task_manager._client.get = Mock(return_value=response)
+        state_store = CacheStateStore(InMemoryCache())
+        synced_tasks = []
+
+        self.assertEqual(3, self.task_manager.sync_tasks(synced_tasks.extend, state_store, until=datetime.fromtimestamp(1100), app_id="app_id"))
+        self.assertEqual(tasks, synced_tasks)
+        query_params = self.task_manager._client.get.call_args[1]["query_params"]
+        self.assertEqual({"appId": "app_id", "updateTo": 1100, "order": "_lastUpdateTs,id", "offset": 0, "limit": 100}, query_params)
+        self.assertEqual({"lastUpdateTs": 1002}, state_store.load("task_manager:tasks"))
+
+        response = MockResponse(TaskPage(0, 0, []).to_repr())
+        response.status_code = 200
+        self.task_manager._client.get = Mock(return_value=response)
+        self.assertEqual(0, self.task_manager.sync_tasks(synced_tasks.extend, state_store, until=datetime.fromtimestamp(1200), app_id="app_id"))
+        self.assertEqual(1002, self.task_manager._client.get.call_args[1]["query_params"]["updateFrom"])
+        self.assertEqual({"lastUpdateTs": 1002}, state_store.load("task_manager:tasks"))
+
+    def test_iter_transactions(self):
+        transactions = [TaskTransaction(f"transaction_{index}", "task_id", "", 1, 1, "", None) for index in range(3)]
+        response = MockResponse(TaskTransactionPage(0, 3, transactions).to_repr())
+        response.status_code = 200
+        self.task_manager._client.get = Mock(return_value=response)
+
+        self.assertEqual(transactions, list(self.task_manager.iter_transactions(task_id="task_id")))
+        self.assertEqual("task_id", self.task_manager._client.get.call_args[1]["query_params"]["taskId"])
+
     def test_get_all_tasks_exception(self):
         response = MockResponse(None)
         response.status_code = 500
@@ -1,9 +1,12 @@
 from __future__ import absolute_import, annotations
 
 from unittest import TestCase
+from unittest.mock import Mock
 
 from test.unit.wenet.interface.mock.client import MockApikeyClient
 from test.unit.wenet.interface.mock.collector import MockWeNet
+from wenet.interface.circuit_breaker import CircuitBreakerRegistry
+from wenet.interface.client import RetryPolicy
 from wenet.interface.wenet import WeNet
 from wenet.interface.hub import HubInterface
 from wenet.interface.incentive_server import IncentiveServerInterface
@@ -24,3 +27,19 @@ class TestServiceCollector(TestCase):
         self.assertIsInstance(wenet.task_manager, TaskManagerInterface)
         self.assertIsInstance(wenet.logger, LoggerInterface)
         self.assertIsInstance(wenet.hub, HubInterface)
+
+    def test_close(self):
+        client = MockApikeyClient()
+        client.session.close = Mock()
+        with MockWeNet.build(client):
+            pass
+        client.session.close.assert_called()
+
+    def test_build_with_circuit_breakers(self):
+        registry = CircuitBreakerRegistry()
+        wenet = WeNet.build(MockApikeyClient(), platform_url="url", circuit_breakers=registry, retry_policy=RetryPolicy())
+        self.assertIs(registry.get("url/logger"), wenet.logger.circuit_breaker)
+        self.assertIs(registry.get("url/task_manager"), wenet.task_manager.circuit_breaker)
+        self.assertIsNot(wenet.logger.circuit_breaker, wenet.task_manager.circuit_breaker)
+        self.assertIsNotNone(WeNet.build(MockApikeyClient()).hub.circuit_breaker)
+        self.assertIsNone(WeNet.build(MockApikeyClient(), circuit_breakers=None).hub.circuit_breaker)
@@ -1,12 +1,16 @@
 from __future__ import absolute_import, annotations
 
 from json import JSONDecodeError
+from typing import Optional
 from unittest import TestCase
-from unittest.mock import Mock
+import os
+from unittest.mock import Mock, patch
 
 import redis
 
-from wenet.storage.cache import RedisCache, InMemoryCache
+from wenet.storage.cache import BaseCache, RedisCache, InMemoryCache, BoundedInMemoryCache, NearCache
+from wenet.storage.codec import ValueCodec
+from wenet.utils import json_codec
 
 
 class MockRedisCache(RedisCache):
@@ -16,6 +20,34 @@ class MockRedisCache(RedisCache):
         super().__init__(r)
 
 
+class MockBaseCache(BaseCache):
+
+    def __init__(self) -> None:
+        self.entries = {}
+
+    def cache(self, data: dict, key: Optional[str] = None, **kwargs) -> str:
+        self.entries[key] = data
+        return key
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.entries.get(key)
+
+    def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+
+class TestBaseCache(TestCase):
+
+    def test_batch_operations(self):
+        cache = MockBaseCache()
+
+        self.assertEqual(["first", "second"], cache.cache_many({"first": {"index": 1}, "second": {"index": 2}}))
+        self.assertEqual({"first": {"index": 1}}, cache.get_many(["first", "missing"]))
+
+        cache.delete_many(["first", "missing"])
+        self.assertEqual({"second": {"index": 2}}, cache.entries)
+
+
 class TestInMemoryCache(TestCase):
 
     def test_cache_with_id(self):
@@ -63,6 +95,89 @@ class TestInMemoryCache(TestCase):
 
         self.assertEqual(None, result)
 
+    def test_batch_operations(self):
+        cache = InMemoryCache()
+
+        self.assertEqual(["first", "second"], cache.cache_many({"first": {"index": 1}, "second": {"index": 2}}))
+        self.assertEqual({"first": {"index": 1}, "second": {"index": 2}}, cache.get_many(["first", "second", "missing"]))
+
+        cache.delete("first")
+        self.assertIsNone(cache.get("first"))
+        cache.delete_many(["second", "missing"])
+        self.assertEqual({}, cache.get_many(["first", "second"]))
+
+
+class TestBoundedInMemoryCache(TestCase):
+
+    def test_cache_and_get(self):
+        cache = BoundedInMemoryCache()
+        self.assertEqual("key", cache.cache({"key": "value"}, key="key"))
+        self.assertEqual({"key": "value"}, cache.get("key"))
+        self.assertIsNone(cache.get("missing_key"))
+
+        cache._generate_id = Mock(return_value="generated_key")
+        self.assertEqual("generated_key", cache.cache({"key": "other_value"}))
+
+    def test_evict_least_recently_used(self):
+        cache = BoundedInMemoryCache(max_entries=2)
+        cache.cache({"index": 1}, key="first")
+        cache.cache({"index": 2}, key="second")
+        cache.get("first")
+        cache.cache({"index": 3}, key="third")
+
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("second"))
+        self.assertEqual({"index": 1}, cache.get("first"))
+        self.assertEqual({"index": 3}, cache.get("third"))
+
+    def test_evict_by_size(self):
+        cache = BoundedInMemoryCache(max_entries=None, max_bytes=50)
+        cache.cache({"value": "x" * 20}, key="first")
+        cache.cache({"value": "x" * 20}, key="second")
+        self.assertIsNone(cache.get("first"))
+        self.assertIsNotNone(cache.get("second"))
+
+        cache.cache({"value": "x" * 100}, key="large")
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache._bytes)
+
+    def test_replace_entry(self):
+        cache = BoundedInMemoryCache(max_bytes=1000)
+        cache.cache({"value": "x" * 100}, key="key")
+        cache.cache({"value": "x"}, key="key")
+        self.assertEqual(1, len(cache))
+        self.assertEqual(13, cache._bytes)
+
+    def test_ttl(self):
+        cache = BoundedInMemoryCache(default_ttl=60)
+        with patch("wenet.storage.cache.time.monotonic", return_value=1000):
+            cache.cache({"key": "value"}, key="default_ttl")
+            cache.cache({"key": "value"}, key="ttl", ttl=10)
+        with patch("wenet.storage.cache.time.monotonic", return_value=1030):
+            self.assertIsNone(cache.get("ttl"))
+            self.assertEqual({"key": "value"}, cache.get("default_ttl"))
+        with patch("wenet.storage.cache.time.monotonic", return_value=1060):
+            self.assertIsNone(cache.get("default_ttl"))
+        self.assertEqual(0, len(cache))
+
+    def test_batch_operations(self):
+        cache = BoundedInMemoryCache(max_entries=2)
+        with patch("wenet.storage.cache.time.monotonic", return_value=1000):
+            cache.cache({"index": 0}, key="expiring", ttl=10)
+            self.assertEqual(["first", "second"], cache.cache_many({"first": {"index": 1}, "second": {"index": 2}}, ttl=60))
+        self.assertEqual(2, len(cache))
+
+        with patch("wenet.storage.cache.time.monotonic", return_value=1030):
+            self.assertEqual({"first": {"index": 1}, "second": {"index": 2}}, cache.get_many(["expiring", "first", "second"]))
+        with patch("wenet.storage.cache.time.monotonic", return_value=1060):
+            self.assertEqual({}, cache.get_many(["first", "second"]))
+
+        cache.cache_many({"first": {"index": 1}, "second": {"index": 2}})
+        cache.delete("first")
+        self.assertEqual(1, len(cache))
+        cache.delete_many(["second", "missing"])
+        self.assertEqual(0, len(cache))
+
 
 class TestRedisCache(TestCase):
 
@@ -102,9 +217,220 @@ class TestRedisCache(TestCase):
 
         self.assertEqual(None, result)
 
+    def test_lock(self):
+        cache = MockRedisCache()
+        cache._r.lock = Mock(return_value="lock")
+
+        self.assertEqual("lock", cache.lock("key", timeout=5))
+        cache._r.lock.assert_called_once_with("key:lock", timeout=5, blocking_timeout=5, thread_local=False)
+
     def test_get_malformed_data(self):
         cache = MockRedisCache()
         cache._get = Mock(return_value="notAJson")
 
         with self.assertRaises(JSONDecodeError):
             cache.get("key")
+
+    def test_build_from_env_shares_connection_pool(self):
+        with patch.dict(os.environ, {"REDIS_HOST": "redis", "REDIS_MAX_CONNECTIONS": "20", "REDIS_SOCKET_TIMEOUT": "2.5", "REDIS_RETRY_ON_TIMEOUT": "true", "REDIS_HEALTH_CHECK_INTERVAL": "30"}):
+            first_cache = RedisCache.build_from_env()
+            second_cache = RedisCache.build_from_env()
+            other_pool = RedisCache.build_connection_pool_from_env(shared=False)
+
+        pool = first_cache._r.connection_pool
+        self.assertIs(pool, second_cache._r.connection_pool)
+        self.assertIsNot(pool, other_pool)
+        self.assertEqual(20, pool.max_connections)
+        self.assertEqual("redis", pool.connection_kwargs["host"])
+        self.assertEqual(2.5, pool.connection_kwargs["socket_timeout"])
+        self.assertTrue(pool.connection_kwargs["retry_on_timeout"])
+        self.assertEqual(30, pool.connection_kwargs["health_check_interval"])
+
+        with patch.dict(os.environ, {"REDIS_HOST": "other_redis"}):
+            self.assertIsNot(pool, RedisCache.build_connection_pool_from_env())
+
+    def test_build_connection_pool_from_env_with_unix_socket(self):
+        with patch.dict(os.environ, {"REDIS_UNIX_SOCKET_PATH": "/var/run/redis.sock", "REDIS_DB": "2"}):
+            pool = RedisCache.build_connection_pool_from_env(shared=False)
+
+        self.assertIs(redis.UnixDomainSocketConnection, pool.connection_class)
+        self.assertEqual("/var/run/redis.sock", pool.connection_kwargs["path"])
+        self.assertEqual(2, pool.connection_kwargs["db"])
+
+    def test_build_connection_pool_from_env_with_url(self):
+        with patch.dict(os.environ, {"REDIS_URL": "redis://redis:6380/3", "REDIS_HOST": "ignored", "REDIS_MAX_CONNECTIONS": "5"}):
+            pool = RedisCache.build_connection_pool_from_env(shared=False)
+
+        self.assertEqual("redis", pool.connection_kwargs["host"])
+        self.assertEqual(6380, pool.connection_kwargs["port"])
+        self.assertEqual(3, pool.connection_kwargs["db"])
+        self.assertEqual(5, pool.max_connections)
+
+    def test_cache_many(self):
+        cache = MockRedisCache()
+        pipeline = Mock()
+        cache._r.pipeline = Mock(return_value=pipeline)
+
+        self.assertEqual(["first", "second"], cache.cache_many({"first": {"index": 1}, "second": {"index": 2}}, ttl=60))
+        cache._r.pipeline.assert_called_once_with(transaction=False)
+        self.assertEqual(2, pipeline.set.call_count)
+        pipeline.set.assert_any_call("first", json_codec.dumps({"index": 1}), ex=60)
+        pipeline.execute.assert_called_once_with()
+
+        self.assertEqual([], cache.cache_many({}))
+        cache._r.pipeline.assert_called_once()
+
+    def test_get_many(self):
+        cache = MockRedisCache()
+        cache._get_many = Mock(return_value=[b'{"index":1}', None])
+
+        self.assertEqual({"first": {"index": 1}}, cache.get_many(["first", "missing"]))
+        cache._get_many.assert_called_once_with(["first", "missing"])
+        self.assertEqual({}, cache.get_many([]))
+
+    def test_get_many_malformed_data(self):
+        cache = MockRedisCache()
+        cache._get_many = Mock(return_value=["notAJson"])
+
+        with self.assertRaises(JSONDecodeError):
+            cache.get_many(["key"])
+
+    def test_get_many_with_ttl(self):
+        cache = MockRedisCache()
+        pipeline = Mock()
+        pipeline.execute = Mock(return_value=[b'{"index":1}', 10000, None, -2, b'{"index":3}', -1])
+        cache._r.pipeline = Mock(return_value=pipeline)
+
+        self.assertEqual({"first": ({"index": 1}, 10), "third": ({"index": 3}, None)}, cache.get_many_with_ttl(["first", "missing", "third"]))
+        self.assertEqual(3, pipeline.pttl.call_count)
+
+    def test_delete_many(self):
+        cache = MockRedisCache()
+        cache._r.delete = Mock(return_value=2)
+
+        cache.delete_many(["first", "second"])
+        cache._r.delete.assert_called_once_with("first", "second")
+        cache.delete_many([])
+        cache._r.delete.assert_called_once()
+
+    def test_cache_with_codec(self):
+        cache = RedisCache(redis.Redis(), codec=ValueCodec(compression="zlib", compression_threshold=0))
+        cache._set = Mock(return_value=None)
+
+        cache.cache({"key": "value"}, key="key", ttl=10)
+        value = cache._set.call_args[0][1]
+        self.assertEqual(0x89, value[0])
+
+        cache._get = Mock(return_value=value)
+        self.assertEqual({"key": "value"}, cache.get("key"))
+        cache._get = Mock(return_value=b'{"key":"legacy"}')
+        self.assertEqual({"key": "legacy"}, cache.get("key"))
+
+
+class TestNearCache(TestCase):
+
+    def _build_cache(self) -> NearCache:
+        r = Mock()
+        cache = NearCache(InMemoryCache(), r=r, channel="channel")
+        self.on_invalidation = r.pubsub.return_value.subscribe.call_args[1]["channel"]
+        return cache
+
+    def test_get(self):
+        cache = NearCache(InMemoryCache())
+        cache.l2.cache({"key": "value"}, key="key")
+
+        self.assertEqual({"key": "value"}, cache.get("key"))
+        self.assertEqual({"key": "value"}, cache.l1.get("key"))
+        cache.l2.delete("key")
+        self.assertEqual({"key": "value"}, cache.get("key"))
+        self.assertIsNone(cache.get("missing_key"))
+
+    def test_get_many(self):
+        cache = NearCache(InMemoryCache())
+        cache.l1.cache({"index": 1}, key="first")
+        cache.l2.cache_many({"first": {"index": 0}, "second": {"index": 2}})
+
+        self.assertEqual({"first": {"index": 1}, "second": {"index": 2}}, cache.get_many(["first", "second", "missing"]))
+        self.assertEqual({"index": 2}, cache.l1.get("second"))
+
+    def test_cache_publishes_invalidation(self):
+        cache = self._build_cache()
+
+        key = cache.cache({"key": "value"}, key="key", ttl=10)
+        self.assertEqual("key", key)
+        self.assertEqual({"key": "value"}, cache.l2.get("key"))
+        self.assertEqual({"key": "value"}, cache.l1.get("key"))
+        cache._r.publish.assert_called_once_with("channel", json_codec.dumps({"source": cache._id, "keys": ["key"]}))
+
+        cache.delete_many(["key"])
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(2, cache._r.publish.call_count)
+
+    def test_local_copy_does_not_outlive_ttl(self):
+        cache = NearCache(InMemoryCache(), l1=BoundedInMemoryCache(default_ttl=60))
+        with patch("wenet.storage.cache.time.monotonic", return_value=1000):
+            cache.cache({"key": "value"}, key="key", ttl=10)
+        cache.l2.delete("key")
+        with patch("wenet.storage.cache.time.monotonic", return_value=1020):
+            self.assertIsNone(cache.get("key"))
+
+    def test_invalidation(self):
+        cache = self._build_cache()
+        cache.cache_many({"first": {"index": 1}, "second": {"index": 2}})
+
+        self.on_invalidation({"data": json_codec.dumps({"source": cache._id, "keys": ["first"]})})
+        self.assertEqual({"index": 1}, cache.l1.get("first"))
+
+        self.on_invalidation({"data": json_codec.dumps({"source": "other", "keys": ["first"]})})
+        self.assertIsNone(cache.l1.get("first"))
+        self.assertEqual({"index": 2}, cache.l1.get("second"))
+
+        self.on_invalidation({"data": b"notAJson"})
+        self.assertEqual({"index": 2}, cache.l1.get("second"))
+
+    def test_invalidation_during_read(self):
+        cache = self._build_cache()
+        cache.l2.cache({"key": "old_value"}, key="key")
+        l2_get_with_ttl = cache.l2.get_with_ttl
+
+        def get_with_ttl(key: str) -> tuple:
+            result = l2_get_with_ttl(key)
+            self.on_invalidation({"data": json_codec.dumps({"source": "other", "keys": [key]})})
+            return result
+
+        cache.l2.get_with_ttl = get_with_ttl
+        self.assertEqual({"key": "old_value"}, cache.get("key"))
+        self.assertIsNone(cache.l1.get("key"))
+
+        cache.l2.get_with_ttl = l2_get_with_ttl
+        self.assertEqual({"key": "old_value"}, cache.get("key"))
+        self.assertEqual({"key": "old_value"}, cache.l1.get("key"))
+
+    def test_local_copy_does_not_outlive_shared_entry(self):
+        cache = NearCache(BoundedInMemoryCache(), l1=BoundedInMemoryCache(default_ttl=60))
+        with patch("wenet.storage.cache.time.monotonic", return_value=1000):
+            cache.l2.cache({"key": "value"}, key="key", ttl=10)
+            self.assertEqual({"key": "value"}, cache.get("key"))
+            self.assertEqual({"key": {"key": "value"}}, cache.get_many(["key"]))
+        with patch("wenet.storage.cache.time.monotonic", return_value=1020):
+            self.assertIsNone(cache.l1.get("key"))
+
+    def test_lock_bypasses_local_copy(self):
+        cache = NearCache(InMemoryCache())
+        cache.cache({"key": "old_value"}, key="key")
+        cache.l2.cache({"key": "new_value"}, key="key")
+        self.assertEqual({"key": "old_value"}, cache.get("key"))
+
+        with cache.lock("key"):
+            self.assertEqual({"key": "new_value"}, cache.get("key"))
+            self.assertEqual({"key": {"key": "new_value"}}, cache.get_many(["key"]))
+        self.assertEqual({"key": "new_value"}, cache.get("key"))
+
+    def test_close(self):
+        cache = self._build_cache()
+        pubsub = cache._pubsub
+        listener = cache._listener
+
+        cache.close()
+        listener.stop.assert_called_once_with()
+        pubsub.close.assert_called_once_with()
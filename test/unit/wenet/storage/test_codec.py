@@ -0,0 +1,79 @@
+from __future__ import absolute_import, annotations
+
+from json import JSONDecodeError
+from unittest import TestCase, skipIf
+
+from wenet.storage import codec as value_codec
+from wenet.storage.codec import ValueCodec, train_zstd_dictionary
+from wenet.utils import json_codec
+
+
+class TestValueCodec(TestCase):
+
+    def setUp(self) -> None:
+        self.data = {
+            "id": "1",
+            "name": {"first": "Jane", "last": "Doe"},
+            "relationships": [{"userId": str(i), "type": "friend", "weight": 0.5} for i in range(100)]
+        }
+
+    def test_json(self):
+        codec = ValueCodec()
+        value = codec.encode(self.data)
+        self.assertEqual(json_codec.dumps(self.data), value)
+        self.assertEqual(self.data, codec.decode(value))
+
+    def test_legacy_json(self):
+        codec = ValueCodec(compression="zlib")
+        self.assertEqual(self.data, codec.decode(json_codec.dumps(self.data)))
+        self.assertEqual({}, codec.decode("{}"))
+        with self.assertRaises(JSONDecodeError):
+            codec.decode(b"notAJson")
+
+    def test_zlib(self):
+        codec = ValueCodec(compression="zlib", compression_threshold=100)
+        value = codec.encode(self.data)
+        self.assertEqual(0x88 | 0x01, value[0])
+        self.assertLess(len(value), len(json_codec.dumps(self.data)))
+        self.assertEqual(self.data, codec.decode(value))
+        self.assertEqual(self.data, ValueCodec().decode(value))
+
+    def test_compression_threshold(self):
+        codec = ValueCodec(compression="zlib", compression_threshold=100)
+        self.assertEqual(json_codec.dumps({"id": "1"}), codec.encode({"id": "1"}))
+
+    def test_malformed_value(self):
+        codec = ValueCodec()
+        with self.assertRaises(ValueError):
+            codec.decode(bytes([0x88 | 0x01]) + b"notCompressed")
+        with self.assertRaises(ValueError):
+            codec.decode(bytes([0xFF]) + b"unknown")
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            ValueCodec(serializer="pickle")
+        with self.assertRaises(ValueError):
+            ValueCodec(compression="lzma")
+
+    @skipIf(value_codec.msgpack is None, "msgpack is not installed")
+    def test_msgpack(self):
+        codec = ValueCodec(serializer="msgpack", compression="zlib", compression_threshold=100)
+        small_value = codec.encode({"id": "1"})
+        self.assertEqual(0x82, small_value[0])
+        self.assertEqual({"id": "1"}, ValueCodec().decode(small_value))
+        self.assertEqual(self.data, ValueCodec().decode(codec.encode(self.data)))
+
+    @skipIf(value_codec.zstandard is None, "zstandard is not installed")
+    def test_zstd_dictionary(self):
+        samples = [dict(self.data, id=str(i)) for i in range(200)]
+        codec = ValueCodec(compression="zstd", compression_threshold=0, zstd_dictionary=train_zstd_dictionary(samples, size=4096))
+        value = codec.encode(self.data)
+        self.assertEqual(0x80 | 0x18 | 0x01, value[0])
+        self.assertEqual(self.data, codec.decode(value))
+        with self.assertRaises(ValueError):
+            ValueCodec().decode(value)
+
+    @skipIf(value_codec.msgpack is not None, "msgpack is installed")
+    def test_missing_library(self):
+        with self.assertRaises(ValueError):
+            ValueCodec(serializer="msgpack")
@@ -0,0 +1,65 @@
+from __future__ import absolute_import, annotations
+
+import os
+import tempfile
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from wenet.storage.cache import InMemoryCache
+from wenet.storage.state import CacheStateStore, FileStateStore
+
+
+class TestCacheStateStore(TestCase):
+
+    def test_save_and_load(self):
+        cache = InMemoryCache()
+        state_store = CacheStateStore(cache)
+        self.assertIsNone(state_store.load("key"))
+
+        state_store.save("key", {"lastUpdateTs": 1000})
+        self.assertEqual({"lastUpdateTs": 1000}, state_store.load("key"))
+        self.assertEqual({"lastUpdateTs": 1000}, cache.get("wenet:state:key"))
+
+    def test_clear(self):
+        cache = InMemoryCache()
+        state_store = CacheStateStore(cache)
+        state_store.save("key", {"lastUpdateTs": 1000})
+        state_store.clear("key")
+        self.assertIsNone(state_store.load("key"))
+        self.assertIsNone(cache.get("wenet:state:key"))
+
+
+class TestFileStateStore(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "state.json")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        state_store = FileStateStore(self.path)
+        self.assertIsNone(state_store.load("key"))
+
+        state_store.save("key", {"lastUpdateTs": 1000})
+        state_store.save("other_key", {"lastUpdateTs": 2000})
+        self.assertEqual({"lastUpdateTs": 1000}, FileStateStore(self.path).load("key"))
+        self.assertEqual({"lastUpdateTs": 2000}, FileStateStore(self.path).load("other_key"))
+        self.assertEqual(["state.json"], os.listdir(self.directory.name))
+
+    @skipIf(os.name == "nt", "directories cannot be synced on Windows")
+    def test_save_is_synced(self):
+        state_store = FileStateStore(self.path)
+        with patch("wenet.storage.state.os.fsync", wraps=os.fsync) as mock_fsync:
+            state_store.save("key", {"lastUpdateTs": 1000})
+        self.assertEqual(2, mock_fsync.call_count)
+
+    def test_clear(self):
+        state_store = FileStateStore(self.path)
+        state_store.save("key", {"lastUpdateTs": 1000})
+        state_store.save("other_key", {"lastUpdateTs": 2000})
+        state_store.clear("key")
+        state_store.clear("missing_key")
+        self.assertIsNone(state_store.load("key"))
+        self.assertEqual({"lastUpdateTs": 2000}, state_store.load("other_key"))
@@ -0,0 +1,55 @@
+from __future__ import absolute_import, annotations
+
+import os
+from json import JSONDecodeError
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from wenet.utils import json_codec
+from wenet.utils.json_codec import OrjsonCodec, StdlibJsonCodec, UjsonCodec, build_codec
+
+
+class TestJsonCodec(TestCase):
+
+    DATA = {"id": "task_id", "goal": {"name": "Città", "description": None}, "attributes": [1, 2.5, True], "url": "http://host/path"}
+
+    def _test_codec(self, codec: json_codec.JsonCodec):
+        document = codec.dumps(self.DATA)
+        self.assertIsInstance(document, bytes)
+        self.assertEqual(self.DATA, codec.loads(document))
+        self.assertEqual(self.DATA, codec.loads(document.decode("utf-8")))
+        self.assertEqual(self.DATA, StdlibJsonCodec().loads(document))
+        with self.assertRaises(JSONDecodeError):
+            codec.loads(b"notAJson")
+
+    def test_stdlib(self):
+        self._test_codec(StdlibJsonCodec())
+
+    @skipIf(json_codec.orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        self._test_codec(OrjsonCodec())
+
+    @skipIf(json_codec.ujson is None, "ujson is not installed")
+    def test_ujson(self):
+        self._test_codec(UjsonCodec())
+
+    def test_build_codec(self):
+        self.assertIsInstance(build_codec("json"), StdlibJsonCodec)
+        with patch.dict(os.environ):
+            os.environ.pop("WENET_JSON_CODEC", None)
+            if json_codec.orjson is not None:
+                self.assertIsInstance(build_codec(), OrjsonCodec)
+            os.environ["WENET_JSON_CODEC"] = "json"
+            self.assertIsInstance(build_codec(), StdlibJsonCodec)
+        with self.assertRaises(ValueError):
+            build_codec("unknown")
+
+    def test_set_codec(self):
+        codec = json_codec.get_codec()
+        try:
+            json_codec.set_codec("json")
+            self.assertIsInstance(json_codec.get_codec(), StdlibJsonCodec)
+            self.assertEqual(b'{"key":"value"}', json_codec.dumps({"key": "value"}))
+            self.assertEqual({"key": "value"}, json_codec.loads(b'{"key":"value"}'))
+        finally:
+            json_codec.set_codec(codec)